@@ -0,0 +1,72 @@
+"""
+Compare how long each available codec takes to decode large CDP frames.
+
+    python benchmarks/bench_codec.py [--repeat N]
+"""
+import argparse
+import base64
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from chromewhip import codec  # noqa: E402
+from chromewhip.chrome import MAX_PAYLOAD_SIZE_BYTES  # noqa: E402
+
+
+def screenshot_frame(json_codec):
+    # base64 grows the payload by a third, stay just under the frame limit
+    data = base64.b64encode(os.urandom(MAX_PAYLOAD_SIZE_BYTES * 3 // 4 - 1024)).decode()
+    return json_codec.dumps({'id': 1, 'result': {'data': data}})
+
+
+def document_frame(json_codec, nodes=20000):
+    children = [
+        {
+            'nodeId': i,
+            'backendNodeId': i,
+            'nodeType': 1,
+            'nodeName': 'DIV',
+            'localName': 'div',
+            'nodeValue': '',
+            'childNodeCount': 0,
+            'attributes': ['class', 'item-%s' % i, 'data-index', str(i)],
+        }
+        for i in range(2, nodes)
+    ]
+    root = {'nodeId': 1, 'backendNodeId': 1, 'nodeType': 9, 'nodeName': '#document', 'localName': '',
+            'nodeValue': '', 'childNodeCount': len(children), 'children': children}
+    return json_codec.dumps({'id': 2, 'result': {'root': root}})
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    baseline = codec.JSONCodec()
+    frames = {
+        'Page.captureScreenshot': screenshot_frame(baseline),
+        'DOM.getDocument': document_frame(baseline),
+    }
+    codecs = [codec.JSONCodec()]
+    if codec.orjson is not None:
+        codecs.append(codec.OrjsonCodec())
+    else:
+        print('orjson is not installed, only timing the json codec')
+
+    for frame_name, frame in frames.items():
+        print('%s frame, %.1fMB' % (frame_name, len(frame) / 1024 ** 2))
+        timings = {}
+        for c in codecs:
+            timings[c.name] = min(timeit.repeat(lambda: c.loads(frame), number=1, repeat=args.repeat))
+            print('  %-8s %8.2fms' % (c.name, timings[c.name] * 1000))
+        for name, t in timings.items():
+            if name != baseline.name:
+                saved = timings[baseline.name] - t
+                print('  %s saves %.2fms per frame (%.1fx)' % (name, saved * 1000, timings[baseline.name] / t))
+
+
+if __name__ == '__main__':
+    main()
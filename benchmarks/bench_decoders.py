@@ -0,0 +1,139 @@
+"""
+Compare the generated per-command result decoders with the generic `convert_payload` they replaced.
+
+    python benchmarks/bench_decoders.py [--repeat N]
+"""
+import argparse
+import copy
+import os
+import re
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from chromewhip.helpers import ChromeTypeBase  # noqa: E402
+from chromewhip.protocol import dom, network, page, runtime  # noqa: E402
+
+
+def convert_payload(types: dict):
+    """ The generic decoder formerly on `PayloadMixin`, kept here as the baseline. """
+    def convert(result: dict):
+        types_ = copy.copy(types)
+        for name, val in result.items():
+            try:
+                expected_ = types_.pop(name)
+                expected_type_ = expected_['class']
+                many = False
+                if isinstance(expected_type_, list):
+                    expected_type_ = expected_type_[0]
+                    many = True
+            except KeyError:
+                raise KeyError('name %s not in expected payload of %s' % (name, types))
+            if issubclass(expected_type_, ChromeTypeBase):
+                if many:
+                    result[name] = [expected_type_(**v) for v in val]
+                else:
+                    result[name] = expected_type_(**val)
+            elif re.match(r'.*Id$', name) and isinstance(val, str):
+                if many:
+                    result[name] = [expected_type_(v) for v in val]
+                else:
+                    result[name] = expected_type_(val)
+            elif not isinstance(val, expected_type_):
+                raise ValueError('%s is not expected type %s, instead is %s' % (val, expected_type_, val))
+        for rn, rv in types_.items():
+            if not rv.get('optional', False):
+                raise ValueError('expected payload param "%s" is missing!' % rn)
+        return result
+
+    return convert
+
+
+def document_result(nodes):
+    children = [
+        {
+            'nodeId': i,
+            'parentId': 1,
+            'backendNodeId': i,
+            'nodeType': 1,
+            'nodeName': 'DIV',
+            'localName': 'div',
+            'nodeValue': '',
+            'childNodeCount': 0,
+            'attributes': ['class', 'item-%s' % i],
+        }
+        for i in range(2, nodes + 1)
+    ]
+    return {'root': {'nodeId': 1, 'backendNodeId': 1, 'nodeType': 9, 'nodeName': '#document', 'localName': '',
+                     'nodeValue': '', 'childNodeCount': len(children), 'children': children}}
+
+
+CASES = {
+    'DOM.getDocument (1 node)': (
+        dom.DOM.getDocument()[1],
+        convert_payload({'root': {'class': dom.Node, 'optional': False}}),
+        lambda: document_result(1),
+    ),
+    'Runtime.evaluate': (
+        runtime.Runtime.evaluate('document.title')[1],
+        convert_payload({'result': {'class': runtime.RemoteObject, 'optional': False},
+                         'exceptionDetails': {'class': runtime.ExceptionDetails, 'optional': True}}),
+        lambda: {'result': {'type': 'string', 'value': 'Example Domain'}},
+    ),
+    'Page.getLayoutMetrics': (
+        page.Page.getLayoutMetrics()[1],
+        convert_payload({'layoutViewport': {'class': page.LayoutViewport, 'optional': False},
+                         'visualViewport': {'class': page.VisualViewport, 'optional': False},
+                         'contentSize': {'class': dom.Rect, 'optional': False}}),
+        lambda: {'layoutViewport': {'pageX': 0, 'pageY': 0, 'clientWidth': 1024, 'clientHeight': 768},
+                 'visualViewport': {'offsetX': 0, 'offsetY': 0, 'pageX': 0, 'pageY': 0, 'clientWidth': 1024,
+                                    'clientHeight': 768, 'scale': 1},
+                 'contentSize': {'x': 0, 'y': 0, 'width': 1024, 'height': 20000}},
+    ),
+    'Network.getResponseBody': (
+        network.Network.getResponseBody('1000.1')[1],
+        convert_payload({'body': {'class': str, 'optional': False},
+                         'base64Encoded': {'class': bool, 'optional': False}}),
+        lambda: {'body': '<html></html>', 'base64Encoded': False},
+    ),
+}
+
+
+def run(decoder, make_result, repeat, number):
+    if decoder is None:
+        return 0.0
+    best = None
+    for _ in range(repeat):
+        # decoders convert in place, so every run needs fresh results
+        results = [make_result() for _ in range(number)]
+        start = time.perf_counter()
+        for r in results:
+            decoder(r)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / number
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--number', type=int, default=10000)
+    args = parser.parse_args()
+
+    for name, (generated, generic, make_result) in CASES.items():
+        old = run(generic, make_result, args.repeat, args.number)
+        new = run(generated, make_result, args.repeat, args.number)
+        speedup = 'no decoding needed' if not new else '%.1fx' % (old / new)
+        print('%-28s convert_payload %6.2fus  generated %6.2fus  (%s)' % (name, old * 1e6, new * 1e6, speedup))
+
+    # convert_payload only built the root node, the generated decoder types the whole tree
+    result = document_result(10000)
+    new = min(timeit.repeat(lambda: dom.DOM.getDocument()[1](copy.deepcopy(result)), number=1, repeat=args.repeat))
+    copy_only = min(timeit.repeat(lambda: copy.deepcopy(result), number=1, repeat=args.repeat))
+    print('DOM.getDocument (10k nodes) generated, fully typed tree: %.2fms' % ((new - copy_only) * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Measure the cold start cost of chromewhip, each sample in a fresh interpreter.
+
+    python benchmarks/bench_import.py [--repeat N]
+
+Reports the time to `import chromewhip`, to build the app with `setup_app`
+(without launching Chrome), and which protocol modules ended up executed.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+IMPORT_SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+import chromewhip
+elapsed = time.perf_counter() - start
+loaded = sorted(m for m in sys.modules if m.startswith('chromewhip.protocol.')
+                and type(sys.modules[m]).__name__ == 'module')
+print(json.dumps({'elapsed': elapsed, 'loaded': loaded}))
+"""
+
+SETUP_APP_SNIPPET = """
+import json, time
+start = time.perf_counter()
+import chromewhip
+chromewhip.setup_app()
+print(json.dumps({'elapsed': time.perf_counter() - start}))
+"""
+
+
+def sample(snippet):
+    out = subprocess.check_output([sys.executable, '-c', snippet], cwd=ROOT)
+    return json.loads(out.decode().strip().splitlines()[-1])
+
+
+def report(label, snippet, repeat):
+    samples = [sample(snippet) for _ in range(repeat)]
+    timings = [s['elapsed'] * 1000 for s in samples]
+    print('%-20s median %7.1fms  min %7.1fms' % (label, statistics.median(timings), min(timings)))
+    return samples[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    last = report('import chromewhip', IMPORT_SNIPPET, args.repeat)
+    print('%-20s %s' % ('protocol modules', ', '.join(m.rsplit('.', 1)[-1] for m in last['loaded']) or '(none)'))
+    report('setup_app()', SETUP_APP_SNIPPET, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Measure the memory held by a decoded `DOM.getDocument` result.
+
+    python benchmarks/bench_memory.py [--nodes N]
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from chromewhip.protocol import dom  # noqa: E402
+
+
+def document_result(nodes):
+    """ A document with `nodes` elements spread over rows of ten, as nested as a real page. """
+    node_id = 1
+
+    def node(name, children=()):
+        nonlocal node_id
+        node_id += 1
+        n = {'nodeId': node_id, 'parentId': 1, 'backendNodeId': node_id, 'nodeType': 1, 'nodeName': name.upper(),
+             'localName': name, 'nodeValue': '', 'childNodeCount': len(children),
+             'attributes': ['class', 'row-item', 'data-frame', 'A0C3F1D7E1C4'], 'frameId': 'A0C3F1D7E1C4'}
+        if children:
+            n['children'] = list(children)
+        return n
+
+    rows = [node('div', [node('span') for _ in range(9)]) for _ in range(nodes // 10)]
+    return {'root': {'nodeId': 1, 'backendNodeId': 1, 'nodeType': 9, 'nodeName': '#document', 'localName': '',
+                     'nodeValue': '', 'childNodeCount': len(rows), 'children': rows}}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--nodes', type=int, default=10000)
+    args = parser.parse_args()
+
+    _, decode = dom.DOM.getDocument()
+    # frames are decoded from JSON, so every node starts out with its own strings
+    frame = json.dumps(document_result(args.nodes))
+
+    gc.collect()
+    tracemalloc.start()
+    result = decode(json.loads(frame))
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert isinstance(result['root'], dom.Node)
+    print('DOM.getDocument with %s nodes holds %.2fMB, %.0f bytes per node' % (
+        args.nodes, size / 1024 ** 2, size / args.nodes))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""
+Measure how fast the driver gets through a recorded devtools conversation, without a browser.
+
+    python benchmarks/bench_replay.py [--recording render.cdp.jsonl.gz] [--repeat N] [--speed X]
+
+Without a recording, a synthetic render of a resource heavy page is used: a navigation
+followed by ``--requests`` network requests of 4 events each. Each run replays the
+commands of the recording against a `ChromeTab` and reports the time taken and the
+frames received per second. ``--save`` writes the synthetic recording out for reuse.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from chromewhip import chrome, filters, replay  # noqa: E402
+from chromewhip.recorder import RECEIVED, SENT  # noqa: E402
+
+
+def synthetic_recording(requests=2000):
+    """ A navigation to a page loading ``requests`` resources, then reading the page title. """
+    frames = []
+    clock = [0.0]
+
+    def add(direction, message, dt=0.0005):
+        clock[0] += dt
+        frames.append((clock[0], direction, json.dumps(message)))
+
+    for id_, method in enumerate(('Page.enable', 'Network.enable'), 1):
+        add(SENT, {'id': id_, 'method': method, 'params': {}})
+        add(RECEIVED, {'id': id_, 'result': {}})
+    add(SENT, {'id': 3, 'method': 'Page.navigate', 'params': {'url': 'http://example.com'}})
+    add(RECEIVED, {'id': 3, 'result': {'frameId': 'F', 'loaderId': 'L'}})
+    for i in range(requests):
+        request_id = str(i)
+        url = 'http://example.com/static/%s.js' % i
+        add(RECEIVED, {'method': 'Network.requestWillBeSent', 'params': {
+            'requestId': request_id, 'loaderId': 'L', 'documentURL': 'http://example.com', 'timestamp': 1.0,
+            'wallTime': 1.0, 'initiator': {'type': 'parser'}, 'frameId': 'F', 'type': 'Script',
+            'request': {'url': url, 'method': 'GET', 'headers': {'Accept': '*/*'}, 'initialPriority': 'High',
+                        'referrerPolicy': 'no-referrer-when-downgrade'}}})
+        add(RECEIVED, {'method': 'Network.responseReceived', 'params': {
+            'requestId': request_id, 'loaderId': 'L', 'timestamp': 1.1, 'type': 'Script', 'frameId': 'F',
+            'response': {'url': url, 'status': 200, 'statusText': 'OK', 'mimeType': 'application/javascript',
+                         'headers': {'Content-Type': 'application/javascript', 'Content-Length': '1024'},
+                         'connectionReused': True, 'connectionId': 1, 'encodedDataLength': 1200,
+                         'securityState': 'neutral'}}})
+        add(RECEIVED, {'method': 'Network.dataReceived', 'params': {
+            'requestId': request_id, 'timestamp': 1.2, 'dataLength': 1024, 'encodedDataLength': 1200}})
+        add(RECEIVED, {'method': 'Network.loadingFinished', 'params': {
+            'requestId': request_id, 'timestamp': 1.3, 'encodedDataLength': 1200}})
+    add(RECEIVED, {'method': 'Page.frameStoppedLoading', 'params': {'frameId': 'F'}})
+    add(SENT, {'id': 4, 'method': 'Runtime.evaluate', 'params': {'expression': 'document.title'}})
+    add(RECEIVED, {'id': 4, 'result': {'result': {'type': 'string', 'value': 'Example'}}})
+    return replay.Recording(frames, {'synthetic': True, 'requests': requests})
+
+
+async def run(recording, speed):
+    """ Replay ``recording`` once, returning the seconds it took. """
+    async with replay.ReplayServer(recording, speed=speed) as server:
+        tab = chrome.ChromeTab('replay', 'about:blank', server.ws_uri, 'replay')
+        await tab.connect()
+        # a typical consumer, waiting on the responses of one resource type
+        stream = tab.events(where=filters.where('Network.responseReceived', type='Document'))
+        start = time.perf_counter()
+        # the page session of a recording made through `Chrome`
+        for command in recording.commands(recording.sessions()[-1]):
+            await tab.send_command(command)
+        await server.join()
+        elapsed = time.perf_counter() - start
+        stream.close()
+        await tab.disconnect()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--recording', help='recording made with `chromewhip.replay.CDPRecorder`')
+    parser.add_argument('--requests', type=int, default=2000, help='requests of the synthetic recording')
+    parser.add_argument('--save', help='write the synthetic recording to this path')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--speed', type=float, default=None,
+                        help='pace frames like the recording, times this speed, instead of as fast as possible')
+    args = parser.parse_args()
+
+    recording = replay.Recording.load(args.recording) if args.recording else synthetic_recording(args.requests)
+    if args.save:
+        recording.save(args.save)
+    received = sum(1 for frame in recording.frames if frame.direction == RECEIVED)
+
+    loop = asyncio.new_event_loop()
+    timings = [loop.run_until_complete(run(recording, args.speed)) for _ in range(args.repeat)]
+    loop.close()
+
+    median = statistics.median(timings)
+    print('%-20s %s frames, %s received' % ('recording', len(recording), received))
+    print('%-20s median %7.1fms  min %7.1fms' % ('replay', median * 1000, min(timings) * 1000))
+    print('%-20s %9.0f frames/s' % ('throughput', received / median))
+
+
+if __name__ == '__main__':
+    main()
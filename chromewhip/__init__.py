@@ -10,8 +10,9 @@ import time
 from aiohttp import web
 import yaml
 
+from chromewhip import tracing
 from chromewhip.chrome import Chrome
-from chromewhip.middleware import error_middleware
+from chromewhip.middleware import MIDDLEWARES
 from chromewhip.routes import setup_routes
 
 
@@ -25,8 +26,8 @@ DISPLAY = ':99'
 async def on_shutdown(app):
     c = app['chrome-driver']
     if c.is_connected:
-        for tab in c.tabs:
-            await tab.disconnect()
+        await c.disconnect()
+    await tracing.tracer().close()
 
     chrome = app['chrome-process']
     chrome.send_signal(signal.SIGINT)
@@ -102,8 +103,8 @@ def setup_xvfb(settings: Settings, env: dict = None, loop: asyncio.AbstractEvent
     return xvfb
 
 
-def setup_app(loop=None, js_profiles_path=None):
-    app = web.Application(loop=loop, middlewares=[error_middleware])
+def setup_app(loop=None, js_profiles_path=None, adaptive_timeouts=False, expose_flight_records=False):
+    app = web.Application(loop=loop, middlewares=MIDDLEWARES)
 
     js_profiles = {}
 
@@ -119,10 +120,12 @@ def setup_app(loop=None, js_profiles_path=None):
 
     app.on_shutdown.append(on_shutdown)
 
-    c = Chrome(host=HOST, port=PORT)
+    c = Chrome(host=HOST, port=PORT, session_options={'adaptive_timeouts': adaptive_timeouts})
 
     app['chrome-driver'] = c
     app['js-profiles'] = js_profiles
+    # recorded frames hold other clients' cookies and pages, only for debugging a private instance
+    app['expose-flight-records'] = expose_flight_records
 
     setup_routes(app)
 
@@ -139,10 +142,31 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument('--js-profiles-path',
                         help="path to a folder with javascript profiles")
+    parser.add_argument('--trace-file',
+                        help="append spans of sampled requests to this JSON lines file")
+    parser.add_argument('--trace-otlp-endpoint',
+                        help="post spans of sampled requests to this OTLP/HTTP traces endpoint, "
+                             "e.g. http://localhost:4318/v1/traces")
+    parser.add_argument('--trace-sample-rate', type=float, default=0.01,
+                        help="share of requests traced, between 0 and 1")
+    parser.add_argument('--adaptive-timeouts', action='store_true',
+                        help="fail devtools commands after a timeout learnt from their observed latency, "
+                             "rather than only once the request's timeout runs out")
+    parser.add_argument('--expose-flight-records', action='store_true',
+                        help="add the devtools frames leading up to a failure to error responses and serve "
+                             "them at /admin/flight-recorder, they include other requests' pages and cookies")
     args = parser.parse_args(sys.argv[1:])
+    if args.trace_otlp_endpoint:
+        tracing.configure(tracing.OTLPHttpSink(args.trace_otlp_endpoint), sample_rate=args.trace_sample_rate)
+    elif args.trace_file:
+        tracing.configure(tracing.JsonLinesSink(args.trace_file), sample_rate=args.trace_sample_rate)
     kwargs = {}
     if args.js_profiles_path:
         kwargs['js_profiles_path'] = args.js_profiles_path
+    if args.adaptive_timeouts:
+        kwargs['adaptive_timeouts'] = True
+    if args.expose_flight_records:
+        kwargs['expose_flight_records'] = True
 
     loop = asyncio.get_event_loop()
 
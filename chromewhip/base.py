@@ -1,5 +1,6 @@
 # https://stackoverflow.com/questions/30155138/how-can-i-write-asyncio-coroutines-that-optionally-act-as-regular-functions
 import asyncio
+import contextvars
 
 
 class SyncAdder(type):
@@ -29,3 +30,12 @@ class SyncAdder(type):
             meth = getattr(self, func)
             return asyncio.get_event_loop().run_until_complete(meth(*args, **kwargs))
         return sync_func
+
+
+def ensure_background(coro):
+    """ Schedule ``coro`` as a task of its own, outside the context of whoever happens to start it.
+
+    Tasks copy the context they are created in, so a connection's background tasks started by
+    a request would otherwise keep its deadline budget and span for as long as they run.
+    """
+    return contextvars.Context().run(asyncio.ensure_future, coro)
@@ -1,23 +1,76 @@
 import asyncio
 import base64
-import collections
-import importlib
-import json
+import inspect
 import logging
+import time
 from typing import Optional
 
 import aiohttp
 import websockets
-import websockets.protocol
-
-from chromewhip import helpers
-from chromewhip.base import SyncAdder
-from chromewhip.protocol import dom, emulation, page, runtime, target, input, inspector, browser, accessibility, target
+import websockets.exceptions
+import websockets.framing
+
+from chromewhip import deadline, helpers, metrics, tracing
+from chromewhip.base import SyncAdder, ensure_background
+from chromewhip.codec import get_codec
+from chromewhip.events import EventDispatcher, EventStore, FilterIndex, StreamIndex, SubscriptionIndex, \
+    DEFAULT_CALLBACK_BACKLOG, DEFAULT_CALLBACK_CONCURRENCY, DEFAULT_MAX_EVENTS_PER_TYPE, DEFAULT_EVENT_TTL_S, \
+    DEFAULT_STREAM_MAXSIZE, DROP_OLDEST
+from chromewhip import protocol
+from chromewhip.protocol import dom, emulation, page, runtime, target, input, inspector, browser, accessibility
+from chromewhip.recorder import FlightRecorder, DEFAULT_RECORDER_MAX_CHARS, DEFAULT_RECORDER_SIZE, RECEIVED, SENT
 from chromewhip.render_image import ChromeImageRenderer
+from chromewhip.timeouts import AdaptiveTimeouts
 
 TIMEOUT_S = 25
 MAX_PAYLOAD_SIZE_BYTES = 2 ** 23
 MAX_PAYLOAD_SIZE_MB = MAX_PAYLOAD_SIZE_BYTES / 1024 ** 2
+ATTACH_CONCURRENCY = 16
+RECONNECT_BACKOFF_S = 0.1
+RECONNECT_MAX_BACKOFF_S = 5
+RECONNECT_MAX_ATTEMPTS = 10
+# slices of chunked results stay well under the frame limit even if every character is escaped
+CHUNK_SIZE_CHARS = MAX_PAYLOAD_SIZE_BYTES // 8
+CHUNK_BATCH_SIZE = 4
+
+COMMAND_ACK_SECONDS = metrics.REGISTRY.histogram(
+    'chromewhip_command_ack_seconds', 'Time from sending a devtools command to its ack.', ('method',))
+COMMAND_EVENT_SECONDS = metrics.REGISTRY.histogram(
+    'chromewhip_command_event_seconds', 'Time from the ack of a devtools command to the event it awaits.',
+    ('method', 'event'))
+COMMAND_ERRORS = metrics.REGISTRY.counter(
+    'chromewhip_command_errors_total', 'Devtools commands that failed, by error and websocket close code.',
+    ('method', 'error', 'close_code'))
+CONNECTIONS_LOST = metrics.REGISTRY.counter(
+    'chromewhip_connections_lost_total', 'Devtools websockets that closed unexpectedly, by close code.', ('code',))
+RECONNECTS = metrics.REGISTRY.counter(
+    'chromewhip_reconnects_total', 'Devtools websockets re-opened after being lost.')
+TAB_COMMANDS_INFLIGHT = metrics.REGISTRY.gauge(
+    'chromewhip_tab_commands_inflight', 'Devtools commands of a tab awaiting their ack or event.', ('tab',))
+TAB_SEND_QUEUE_DEPTH = metrics.REGISTRY.gauge(
+    'chromewhip_tab_send_queue_depth', 'Messages waiting to be written to the websocket of a tab.', ('tab',))
+TAB_EVENT_STORE_BYTES = metrics.REGISTRY.gauge(
+    'chromewhip_tab_event_store_bytes', 'Approximate size of the events stored for a tab.', ('tab',))
+
+CHUNKED_EVALUATE_JS = """(() => {
+    const value = (%s);
+    if (typeof value !== 'string' || value.length <= %d) {
+        return value;
+    }
+    class ChromewhipChunks {
+        constructor(s) { this.s = s; }
+    }
+    return new ChromewhipChunks(value);
+})()"""
+# slice boundaries are in UTF-16 code units, one falling inside a surrogate pair moves back a unit
+CHUNK_SLICE_JS = """function(start, end) {
+    const s = this.s;
+    const boundary = i => {
+        const c = s.charCodeAt(i - 1);
+        return i > 0 && i < s.length && c >= 0xD800 && c <= 0xDBFF ? i - 1 : i;
+    };
+    return s.slice(boundary(start), boundary(end));
+}"""
 
 
 class ChromewhipException(Exception):
@@ -36,106 +89,516 @@ class JSScriptError(ChromewhipException):
     pass
 
 
-class ChromeTab(metaclass=SyncAdder):
-    def __init__(self, title, url, ws_uri, tab_id):
-        self.id_ = tab_id
-        self._title = title
-        self._url = url
+class TargetClosedError(ChromewhipException):
+    pass
+
+
+class DeadlineExceededError(ChromewhipException, TimeoutError):
+    pass
+
+
+class ConnectionLostError(ChromewhipException):
+    """ The websocket dropped before the command completed, it is safe to send it again. """
+    retriable = True
+
+
+class Connection:
+    """ A devtools websocket, shared by every session attached through it.
+
+    A browser level websocket carries any number of flattened target sessions, which
+    are told apart by the ``sessionId`` of each message. Messages without one belong
+    to the session registered with a `None` session id.
+
+    If the websocket drops, commands in flight fail with `ConnectionLostError` and the
+    connection is re-opened with exponential backoff. The session with a `None` id then
+    replays its domain enables, followed by the ``on_reconnect`` callbacks, which must
+    re-attach any flattened session they want back.
+
+    Callables in ``taps`` are called with the direction and text of every frame written or
+    read, e.g. a `chromewhip.replay.CDPRecorder`.
+
+    :param reconnect: re-open the websocket when it drops
+    :param max_reconnect_attempts: attempts before giving up and closing every session, `None` to retry forever
+    """
+    def __init__(self, ws_uri, codec=None, reconnect=True, backoff_s=RECONNECT_BACKOFF_S,
+                 max_backoff_s=RECONNECT_MAX_BACKOFF_S, max_reconnect_attempts=RECONNECT_MAX_ATTEMPTS):
         self._ws_uri = ws_uri
-        self.target_id = ws_uri.split('/')[-1]
+        self._codec = get_codec(codec)
+        self._reconnect = reconnect
+        self._backoff_s = backoff_s
+        self._max_backoff_s = max_backoff_s
+        self._max_reconnect_attempts = max_reconnect_attempts
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._closing = False
+        self.on_reconnect = []
+        self.taps = []
+        self.reconnects = 0
         self._ws: Optional[websockets.WebSocketClientProtocol] = None
-        self._frame_id = None
-        self._message_id = 0
-        self._current_task: Optional[asyncio.Task] = None
-        self._ack_events = {}
-        self._ack_payloads = {}
-        self._input_events = {}
-        self._trigger_events = {}
-        self._event_payloads = {}
-        self._event_callbacks = collections.defaultdict(list)
-        self._recv_task = None
-        self._log = logging.getLogger('chromewhip.chrome.ChromeTab')
-        self._send_log = logging.getLogger('chromewhip.chrome.ChromeTab.send_handler')
-        self._recv_log = logging.getLogger('chromewhip.chrome.ChromeTab.recv_handler')
+        self._send_queue: Optional[asyncio.Queue] = None
+        self._send_task: Optional[asyncio.Task] = None
+        self._recv_task: Optional[asyncio.Task] = None
+        self._sessions = {}
+        self._log = logging.getLogger('chromewhip.chrome.Connection')
+        self._send_log = logging.getLogger('chromewhip.chrome.Connection.send_handler')
+        self._recv_log = logging.getLogger('chromewhip.chrome.Connection.recv_handler')
 
-    @classmethod
-    async def create_from_json(cls, json_, host, port):
-        ws_url = json_.get('webSocketDebuggerUrl')
-        if not ws_url:
-            tab_id = json_['id']
-            ws_url = 'ws://{}:{}/devtools/page/{}'.format(host, port, tab_id)
-        t = cls(json_['title'], json_['url'], ws_url, json_['id'])
-        await t.connect()
-        return t
+    @property
+    def ws_uri(self):
+        return self._ws_uri
+
+    @property
+    def codec(self):
+        return self._codec
+
+    @property
+    def is_open(self):
+        return self._ws is not None and self._ws.open
+
+    @property
+    def close_code(self):
+        return self._ws.close_code if self._ws is not None else None
+
+    @property
+    def send_queue_depth(self):
+        """ Number of messages waiting to be written to the websocket. """
+        return self._send_queue.qsize() if self._send_queue else 0
+
+    @property
+    def sessions(self):
+        return list(self._sessions.values())
+
+    def add_session(self, session):
+        self._sessions[session.session_id] = session
+
+    def remove_session(self, session):
+        if self._sessions.get(session.session_id) is session:
+            del self._sessions[session.session_id]
 
     async def connect(self):
         self._ws = await websockets.connect(self._ws_uri, max_size=MAX_PAYLOAD_SIZE_BYTES)  # 16MB
-        self._recv_task = asyncio.ensure_future(self.recv_handler())
-        self._log.info('Connected to Chrome tab %s' % self._ws_uri)
-
-    async def disconnect(self):
-        self._log.debug("Disconnecting tab...")
-        if self._current_task and not self._current_task.done() and not self._current_task.cancelled():
-            self._log.warning('Cancelling current task for websocket')
-            self._current_task.cancel()
-            await self._current_task
+        self._send_queue = asyncio.Queue()
+        self._send_task = ensure_background(self.send_handler())
+        self._recv_task = ensure_background(self.recv_handler())
+        self._log.info('Connected to %s' % self._ws_uri)
+
+    async def close(self):
+        """ Flush queued messages, then close the websocket. """
+        self._log.debug('Closing connection to %s...' % self._ws_uri)
+        self._closing = True
+        if self._reconnect_task and not self._reconnect_task.done():
+            self._reconnect_task.cancel()
+            try:
+                await self._reconnect_task
+            except asyncio.CancelledError:
+                pass
+        if self._send_task and not self._send_task.done():
+            try:
+                await asyncio.wait_for(self._send_queue.join(), timeout=TIMEOUT_S)
+            except asyncio.TimeoutError:
+                self._log.warning('Cancelling %s unsent messages for websocket' % self._send_queue.qsize())
+            self._send_task.cancel()
+            await self._send_task
         if self._recv_task:
             self._recv_task.cancel()
             await self._recv_task
 
+    @property
+    def is_reconnecting(self):
+        return self._reconnect_task is not None and not self._reconnect_task.done()
+
+    def enqueue(self, msg):
+        """ Queue an encoded message for the writer, returning a future resolved once it is sent. """
+        sent_future = asyncio.get_event_loop().create_future()
+        self._send_queue.put_nowait((msg, sent_future))
+        return sent_future
+
+    async def _write_batch(self, messages):
+        """ Write ``messages`` to the socket in a single call, a text frame each.
+
+        `websockets.WebSocketClientProtocol.send` writes to the transport once per message. Frames
+        are built the same way here and handed to the transport together, then flow control is
+        waited on as ``send`` does, relying on the internals of the pinned websockets version.
+        """
+        ws = self._ws
+        await ws.ensure_open()
+        chunks = []
+        for msg in messages:
+            frame = websockets.framing.Frame(True, websockets.framing.OP_TEXT, msg.encode('utf-8'))
+            frame.write(chunks.append, mask=ws.is_client, extensions=ws.extensions)
+        ws.transport.writelines(chunks)
+        try:
+            async with ws._drain_lock:
+                await ws._drain()
+        except ConnectionError:
+            ws.fail_connection()
+            await ws.ensure_open()
+
+    async def send_handler(self):
+        """ Write queued messages to the websocket.
+
+        This is the only task writing to the websocket. Every message queued since its last
+        wake-up is written with a single write to the socket, so bursts from many coroutines
+        cost one syscall rather than one per message.
+        """
+        try:
+            while True:
+                batch = [await self._send_queue.get()]
+                while not self._send_queue.empty():
+                    batch.append(self._send_queue.get_nowait())
+                # messages of commands given up on while queued are not sent
+                pending = [(msg, future) for msg, future in batch if not future.done()]
+                try:
+                    if pending:
+                        self._send_log.debug('Writing batch of %s messages...', len(pending))
+                        await self._write_batch([msg for msg, _ in pending])
+                    for msg, future in pending:
+                        if not future.done():
+                            future.set_result(None)
+                        for tap in self.taps:
+                            tap(SENT, msg)
+                except websockets.exceptions.ConnectionClosed as e:
+                    error = ConnectionLostError('Connection to %s lost with code %s' % (self._ws_uri, e.code))
+                    for _, future in pending:
+                        if not future.done():
+                            future.set_exception(error)
+                except asyncio.CancelledError:
+                    for _, future in pending:
+                        future.cancel()
+                    raise
+                except Exception as e:
+                    for _, future in pending:
+                        if not future.done():
+                            future.set_exception(e)
+                finally:
+                    for _ in batch:
+                        self._send_queue.task_done()
+        except asyncio.CancelledError:
+            while not self._send_queue.empty():
+                _, future = self._send_queue.get_nowait()
+                future.cancel()
+                self._send_queue.task_done()
+
     async def recv_handler(self):
+        """ Read messages from the websocket and hand them to the session they belong to. """
         try:
             while True:
                 self._recv_log.debug('Waiting for message...')
-                result = await self._ws.recv()
+                frame = await self._ws.recv()
                 self._recv_log.debug('Received message, processing...')
 
-                if not result:
+                if not frame:
                     self._recv_log.error('Missing message, may have been a connection timeout...')
                     continue
-                result = json.loads(result)
+                size = len(frame)
+                for tap in self.taps:
+                    tap(RECEIVED, frame)
+                try:
+                    result = self._codec.loads(frame)
+                except ValueError:
+                    self._recv_log.exception('Dropping message that cannot be decoded: %.200s' % frame)
+                    continue
 
                 if not isinstance(result, dict):
                     self._recv_log.error('decoded messages is of type "%s" and = "%s"' % (type(result), result))
                     continue
-                if 'id' in result:
-                    self._ack_payloads[result['id']] = result
-                    ack_event = self._ack_events.get(result['id'])
-                    if ack_event is None:
-                        self._recv_log.error('Ignoring ack with id %s as no registered recv' % result['id'])
-                        continue
-                    self._recv_log.debug('Notifying ack event with id=%s' % (result['id']))
-                    ack_event.set()
-
-                elif 'method' in result:
-                    self._recv_log.debug('Received event message!')
-                    event = helpers.json_to_event(result)
-                    self._recv_log.debug('Received a "%s" event , storing against hash and name...' % event.js_name)
-                    hash_ = event.hash_()
-                    self._event_payloads[hash_] = event
-                    self._event_payloads[event.js_name] = event
-
-                    # first, check if any requests are waiting upon it
-                    input_event = self._input_events.get(event.js_name)
-                    if input_event:
-                        self._recv_log.debug('input exists for event name "%s", alerting...' % event.js_name)
-                        input_event.set()
-
-                    trigger_event = self._trigger_events.get(hash_)
-                    if trigger_event:
-                        self._recv_log.debug('trigger exists for hash "%s", alerting...' % hash_)
-                        trigger_event.set()
-
-                    if result['method'] in self._event_callbacks:
-                        self._recv_log.debug('running callbacks for hash "%s", alerting...' % hash_)
-                        for callback in self._event_callbacks:
-                            callback(event)
-                else:
-                    # TODO: deal with invalid state
-                    self._recv_log.info('Invalid message %s, what do i do now?' % result)
+
+                session_id = result.get('sessionId')
+                session = self._sessions.get(session_id)
+                if session is None:
+                    self._recv_log.debug('Ignoring message for unknown session %s' % session_id)
+                    continue
+                await session.handle_message(result, size, frame)
 
         except asyncio.CancelledError:
             await self._ws.close()
+        except websockets.exceptions.ConnectionClosed as e:
+            if self._closing:
+                return
+            self._recv_log.warning('Connection to %s closed with code %s' % (self._ws_uri, e.code))
+            self._connection_lost()
+
+    def _connection_lost(self):
+        error = ConnectionLostError('Connection to %s lost with code %s' % (self._ws_uri, self.close_code))
+        CONNECTIONS_LOST.labels(str(self.close_code)).inc()
+        # unsent messages may be for flattened sessions that will get a new id
+        while not self._send_queue.empty():
+            _, future = self._send_queue.get_nowait()
+            if not future.done():
+                future.set_exception(error)
+                future.exception()
+            self._send_queue.task_done()
+        for session in list(self._sessions.values()):
+            session.connection_lost(error)
+        if self._reconnect:
+            self._reconnect_task = ensure_background(self.reconnect())
+        else:
+            for session in list(self._sessions.values()):
+                session.mark_closed(str(error))
+
+    async def reconnect(self):
+        """ Re-open the websocket with exponential backoff, then resume the sessions.
+
+        Traced as a root span of its own, not as part of whichever request opened the connection.
+        """
+        with tracing.start_span('cdp reconnect', **{'cdp.ws_uri': self._ws_uri}) as span:
+            delay = self._backoff_s
+            attempt = 0
+            while True:
+                attempt += 1
+                try:
+                    self._ws = await websockets.connect(self._ws_uri, max_size=MAX_PAYLOAD_SIZE_BYTES)
+                    break
+                except (OSError, websockets.exceptions.InvalidHandshake) as e:
+                    if self._max_reconnect_attempts is not None and attempt >= self._max_reconnect_attempts:
+                        self._log.error('Giving up reconnecting to %s after %s attempts: %s'
+                                        % (self._ws_uri, attempt, e))
+                        for session in list(self._sessions.values()):
+                            session.mark_closed('Connection to %s lost' % self._ws_uri)
+                        return
+                    self._log.warning('Reconnect attempt %s to %s failed, retrying in %.2fs: %s'
+                                      % (attempt, self._ws_uri, delay, e))
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, self._max_backoff_s)
+            span.set_attribute('cdp.attempts', attempt)
+            self.reconnects += 1
+            RECONNECTS.labels().inc()
+            self._log.info('Reconnected to %s after %s attempts' % (self._ws_uri, attempt))
+            self._recv_task = ensure_background(self.recv_handler())
+
+            # flattened session ids died with the old websocket, callbacks re-attach the ones to keep
+            stale = [session for session_id, session in self._sessions.items() if session_id is not None]
+            for session in stale:
+                self.remove_session(session)
+            root = self._sessions.get(None)
+            if root is not None:
+                await root.resume()
+            for callback in list(self.on_reconnect):
+                try:
+                    await callback()
+                except Exception:
+                    self._log.exception('Reconnect callback %s failed' % callback)
+            for session in stale:
+                if not session.is_ready:
+                    session.mark_closed('Session %s was not re-attached after reconnecting' % session.session_id)
+
+
+class Session(metaclass=SyncAdder):
+    """ A devtools protocol session, sending commands and receiving events over a `Connection`.
+
+    :param connection: transport the session's messages go through
+    :param session_id: id of a flattened target session, `None` for the target the websocket was opened on
+    :param callback_concurrency: event callbacks of the session running at once, see `EventDispatcher`
+    :param callback_backlog: event callback calls waiting to run before the oldest are dropped
+    :param timeouts: latency tracker deriving per-method timeouts, `AdaptiveTimeouts` with a `TIMEOUT_S`
+        ceiling by default
+    :param adaptive_timeouts: if true, commands sent without a timeout get the adaptive timeout of their
+        method, capped by the context's `chromewhip.deadline` budget, so a stuck command fails well
+        before a long request budget runs out. Otherwise they get the budget, or `TIMEOUT_S` without one.
+        Latencies are recorded for `latency_stats` either way.
+    :param recorder_size: number of recent frames kept by the session's `FlightRecorder`, 0 to disable it
+    :param recorder_max_chars: characters kept of each recorded frame
+    """
+    def __init__(self, connection=None, session_id=None, max_events_per_type=DEFAULT_MAX_EVENTS_PER_TYPE,
+                 event_ttl_s=DEFAULT_EVENT_TTL_S, event_type_caps=None,
+                 callback_concurrency=DEFAULT_CALLBACK_CONCURRENCY, callback_backlog=DEFAULT_CALLBACK_BACKLOG,
+                 timeouts=None, adaptive_timeouts=False,
+                 recorder_size=DEFAULT_RECORDER_SIZE, recorder_max_chars=DEFAULT_RECORDER_MAX_CHARS):
+        self._connection: Optional[Connection] = connection
+        self.session_id = session_id
+        self._message_id = 0
+        self._pending = {}
+        # commands sent and not yet acked or given their event
+        self.inflight = 0
+        self._subscriptions = SubscriptionIndex()
+        self._filters = FilterIndex()
+        self._event_store = EventStore(max_per_type=max_events_per_type, ttl_s=event_ttl_s,
+                                       type_caps=event_type_caps)
+        self._streams = StreamIndex()
+        self._dispatcher = EventDispatcher(max_concurrency=callback_concurrency, backlog=callback_backlog)
+        self._handlers = {}
+        self._closed_reason = None
+        self._ready = asyncio.Event()
+        self._ready.set()
+        self._resuming = False
+        self._enabled = []
+        self._timeouts = timeouts if timeouts is not None else AdaptiveTimeouts(ceiling_s=TIMEOUT_S)
+        self._adaptive_timeouts = adaptive_timeouts
+        self._recorder = FlightRecorder(recorder_size, recorder_max_chars)
+        name = type(self).__name__
+        self._log = logging.getLogger('chromewhip.chrome.%s' % name)
+        self._send_log = logging.getLogger('chromewhip.chrome.%s.send' % name)
+        self._recv_log = logging.getLogger('chromewhip.chrome.%s.recv' % name)
+
+    @property
+    def connection(self):
+        return self._connection
+
+    @property
+    def send_queue_depth(self):
+        """ Number of messages waiting to be written to the websocket. """
+        return self._connection.send_queue_depth if self._connection else 0
+
+    @property
+    def is_alive(self):
+        return self._closed_reason is None
+
+    @property
+    def is_ready(self):
+        """ False while the session waits for its connection to come back. """
+        return self._ready.is_set()
+
+    def connection_lost(self, error):
+        """ Fail commands and event waits in flight with ``error``, holding new commands until `resume`. """
+        self._ready.clear()
+        for ack_future in self._pending.values():
+            if not ack_future.done():
+                ack_future.set_exception(error)
+                ack_future.exception()
+        self._pending.clear()
+        self._subscriptions.fail(error)
+        self._filters.fail(error)
+
+    async def resume(self, session_id=None):
+        """ Bring the session back once its connection is re-opened, replaying the domains it had enabled.
+
+        :param session_id: new id of a flattened session re-attached to its target
+        """
+        if self._closed_reason is not None:
+            return
+        if session_id is not None:
+            self.session_id = session_id
+            self._connection.add_session(self)
+        self._resuming = True
+        try:
+            for type in self._enabled:
+                try:
+                    await self._send(*protocol.domain(type).enable())
+                except ChromewhipException as e:
+                    self._log.warning('Could not enable "%s" again after reconnecting: %s' % (type, e))
+        finally:
+            self._resuming = False
+            self._ready.set()
+
+    async def _wait_ready(self, expires_at):
+        if self._ready.is_set() or self._resuming:
+            return
+        self._send_log.debug('Waiting for the connection to come back...')
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=deadline.remaining(expires_at))
+        except asyncio.TimeoutError:
+            raise ConnectionLostError('Connection to %s is still down' % self._connection.ws_uri)
+        self._check_alive()
+
+    @property
+    def closed_reason(self):
+        return self._closed_reason
+
+    def mark_closed(self, reason):
+        """ The target went away, fail commands in flight and any sent from now on with `TargetClosedError`. """
+        if self._closed_reason is not None:
+            return
+        self._log.warning('Session %s closed: %s' % (self.session_id, reason))
+        self._closed_reason = reason
+        # wakes commands waiting on a reconnect, they fail on the closed check
+        self._ready.set()
+        if self._connection:
+            self._connection.remove_session(self)
+        for ack_future in self._pending.values():
+            if not ack_future.done():
+                ack_future.set_exception(TargetClosedError(reason))
+                # retrieved here so futures nobody awaits any more do not log it on collection
+                ack_future.exception()
+        self._pending.clear()
+        self._subscriptions.fail(TargetClosedError(reason))
+        self._filters.fail(TargetClosedError(reason))
+        self._streams.close_all()
+
+    @property
+    def timeouts(self):
+        return self._timeouts
+
+    def latency_stats(self):
+        """ Observed latencies and current timeout per method, see `AdaptiveTimeouts.stats`. """
+        return self._timeouts.stats()
+
+    def _expires_at(self, timeout, latency_keys):
+        """ Deadline of a command sent with ``timeout``, given the methods it is tracked under. """
+        if timeout is None and self._adaptive_timeouts and latency_keys:
+            timeout = max(self._timeouts.timeout(key) for key in latency_keys)
+        return deadline.resolve(timeout, default=TIMEOUT_S)
+
+    def _check_alive(self):
+        if self._closed_reason is not None:
+            raise TargetClosedError(self._closed_reason)
+
+    @property
+    def recorder(self):
+        """ Recent frames sent and received by this session, see `FlightRecorder`. """
+        return self._recorder
+
+    def _command_failed(self, method, error):
+        connection = self._connection
+        close_code = '' if connection is None or connection.is_open else str(connection.close_code)
+        COMMAND_ERRORS.labels(method, type(error).__name__, close_code).inc()
+        if isinstance(error, (DeadlineExceededError, ProtocolError)) and len(self._recorder):
+            # kept on the error, HTTP error responses only include it when flight records are exposed
+            error.flight_record = self._recorder.dump()
+            self._log.warning('Last %s frames of session %s before "%s" failed with %s:\n%s'
+                              % (len(self._recorder), self.session_id, method, error, self._recorder.format()))
+
+    async def handle_message(self, result, size=0, frame=None):
+        """ Resolve the ack or publish the event in a message received for this session.
+
+        :param frame: the message as received, for the flight recorder
+        """
+        if frame is not None:
+            self._recorder.record(RECEIVED, frame)
+        if 'id' in result:
+            ack_future = self._pending.pop(result['id'], None)
+            if ack_future is None or ack_future.done():
+                self._recv_log.error('Ignoring ack with id %s as no registered recv' % result['id'])
+                return
+            self._recv_log.debug('Resolving ack future with id=%s' % (result['id']))
+            ack_future.set_result(result)
+
+        elif 'method' in result:
+            self._recv_log.debug('Received event message!')
+            # decoding into typed objects is left to whoever consumes the event
+            event = helpers.RawEvent(result['method'], result.get('params', {}))
+            for handler in self._handlers.get(event.js_name, ()):
+                try:
+                    handler(event.decode())
+                except Exception:
+                    self._recv_log.exception('Event handler %s failed on "%s"' % (handler, event.js_name))
+            key = event.key_()
+            self._event_store.add(event, key, size)
+
+            # first, check if any requests are waiting upon it
+            self._subscriptions.resolve(event.js_name, event)
+            self._subscriptions.resolve(key, event)
+            self._filters.resolve(event)
+
+            # never waits, the receive loop is shared with every other session of the connection
+            for stream in self._streams.publish(event):
+                self._log.warning('Closed %r, its consumer fell too far behind' % stream)
+
+            if event.js_name in self._dispatcher:
+                self._recv_log.debug('scheduling callbacks for "%s"...', event.js_name)
+                self._dispatcher.dispatch(event)
+        else:
+            # TODO: deal with invalid state
+            self._recv_log.info('Invalid message %s, what do i do now?' % result)
+
+    async def close(self):
+        """ Stop routing messages to this session, failing commands still waiting on an ack. """
+        if self._connection:
+            self._connection.remove_session(self)
+        for ack_future in self._pending.values():
+            ack_future.cancel()
+        self._pending.clear()
+        # let consumers drain what they have buffered, then stop
+        self._streams.close_all()
+        await self._dispatcher.close(timeout=TIMEOUT_S)
 
     @staticmethod
     async def validator(result: dict, types: dict):
@@ -148,127 +611,367 @@ class ChromeTab(metaclass=SyncAdder):
                 raise ValueError('%s is not expected type %s, instead is %s' % (v, type_, type(v)))
         return result
 
-    async def _send(self, request, recv_validator=None, input_event_cls=None, trigger_event_cls=None):
+    def _register(self, request):
+        self._message_id += 1
+        request['id'] = self._message_id
+        ack_future = asyncio.get_event_loop().create_future()
+        self._pending[self._message_id] = ack_future
+        return ack_future
+
+    def _enqueue(self, request):
+        if self.session_id is not None:
+            request['sessionId'] = self.session_id
+        msg = self._connection.codec.dumps(request)
+        self._recorder.record(SENT, msg)
+        self._send_log.info('Sending command = %s' % msg)
+        return msg, self._connection.enqueue(msg)
+
+    async def _write(self, request, expires_at):
+        msg, sent_future = self._enqueue(request)
+        await asyncio.wait_for(sent_future, timeout=deadline.remaining(expires_at))  # send
+        return msg
+
+    async def _wait_for_ack(self, request, ack_future, expires_at, recv_validator=None):
+        self._send_log.debug('Waiting for ack future for id=%s' % request['id'])
+        ack_payload = await asyncio.wait_for(ack_future, timeout=deadline.remaining(expires_at))  # recv
+        self._send_log.debug('Received ack for id=%s' % request['id'])
+
+        # check for errors
+        error = ack_payload.get('error')
+
+        if error:
+            msg = '%s, code %s for id=%s' % (error.get('message', 'Unknown error'), error['code'], request['id'])
+            self._send_log.error(msg)
+            raise ProtocolError(msg)
+
+        if recv_validator:
+            self._send_log.debug('Validating recv payload for id=%s...' % request['id'])
+            ack_payload['result'] = recv_validator(ack_payload['result'])
+            self._send_log.debug('Successful recv validation for id=%s...' % request['id'])
+
+        return ack_payload
+
+    def _timeout_error(self, request, phase):
+        method = request['method']
+        id_ = request['id']
+        if not self._connection.is_open:
+            close_code = self._connection.close_code
+            if close_code == 1002:
+                return ProtocolError('Websocket protocol error occured for "%s" with id=%s' % (method, id_))
+            elif close_code == 1006:
+                return ProtocolError('Incomplete read error occured for "%s" with id=%s' % (method, id_))
+            elif close_code == 1007:
+                return ProtocolError('Unicode decode error occured for "%s" with id=%s' % (method, id_))
+            elif close_code == 1009:
+                return ProtocolError('Recv\'d payload exceeded %sMB for "%s" with id=%s, consider increasing this limit' % (MAX_PAYLOAD_SIZE_MB, method, id_))
+        return DeadlineExceededError('Deadline exceeded waiting for the %s of "%s" with id=%s' % (phase, method, id_))
+
+    async def _send(self, request, recv_validator=None, input_event_cls=None, trigger_event_cls=None, timeout=None):
         """
-        TODO:
-        * clean up of stale events in payloads and asyncio event stores
         :param request:
         :param recv_validator:
         :param input_event_cls:
         :param trigger_event_cls:
+        :param timeout: seconds allowed for sending, the ack and the awaited events altogether, capped by
+            the context's `chromewhip.deadline` budget. Without it, see ``adaptive_timeouts``.
         :return:
         """
-        self._message_id += 1
-        request['id'] = self._message_id
-
-        ack_event = asyncio.Event()
-        self._ack_events[self._message_id] = ack_event
+        self._check_alive()
+        # commands awaiting an event take longer than bare acks, track them apart
+        latency_key = request['method'] if not trigger_event_cls else '%s>%s' % (request['method'],
+                                                                                  trigger_event_cls.js_name)
+        expires_at = self._expires_at(timeout, [latency_key])
+        start = time.monotonic()
+        await self._wait_ready(expires_at)
+        if trigger_event_cls:
+            if not trigger_event_cls.is_hashable:
+                raise ValueError('Trigger event type "%s" as not hashable' % trigger_event_cls.__name__)
 
         if input_event_cls:
             if not input_event_cls.is_hashable:
                 raise ValueError('Input event class "%s" as not hashable' % input_event_cls.__name__)
             # we can already register the input event before sending command
-            input_event = asyncio.Event()
-            self._input_events[input_event_cls.js_name] = input_event
+            input_future = self._subscriptions.subscribe(input_event_cls.js_name)
 
-        if trigger_event_cls:
-            if not trigger_event_cls.is_hashable:
-                raise ValueError('Trigger event type "%s" as not hashable' % trigger_event_cls.__name__)
+        ack_future = self._register(request)
 
         result = {'ack': None, 'event': None}
+        phase = 'send'
+
+        with tracing.start_span('cdp %s' % request['method'], kind=tracing.KIND_CLIENT,
+                                **{'cdp.id': request['id'], 'cdp.session_id': self.session_id}) as span:
+            self.inflight += 1
+            try:
+                sent_at = time.monotonic()
+                msg = await self._write(request, expires_at)
+
+                phase = 'ack'
+                ack_payload = await self._wait_for_ack(request, ack_future, expires_at, recv_validator)
+                result['ack'] = ack_payload
+                acked_at = time.monotonic()
+                COMMAND_ACK_SECONDS.labels(request['method']).observe(acked_at - sent_at)
+                span.add_event('ack')
+
+                phase = 'event'
+
+                if input_event_cls:
+                    name = input_event_cls.js_name
+                    # use latest payload as key is not unique within a single session
+                    event = self._event_store.latest(name)
+                    if not event:
+                        self._send_log.debug('Waiting for event with name "%s"...' % name)
+                        event = await asyncio.wait_for(input_future, timeout=deadline.remaining(expires_at))  # recv
+                    hash_input_dict = event.key_params()
+                else:
+                    hash_input_dict = ack_payload['result']
+
+                if trigger_event_cls:
+                    try:
+                        # TODO: put in a `strict` flag so that we can catch differences between the protocol spec and the
+                        # underlying implementation.
+                        cleaned_hash_input_dict = {k: v for k, v in hash_input_dict.items() if k in trigger_event_cls.hashable}
+                        key = trigger_event_cls.build_key(**cleaned_hash_input_dict)
+                    except TypeError:
+                        raise TypeError(
+                            'Event "{}" hash cannot be built with "{}"'.format(trigger_event_cls.js_name, hash_input_dict)
+                        )
+                    event = self._event_store.get(key)
+                    if not event:
+                        self._send_log.debug('Waiting for event with key "%s"...' % (key,))
+                        trigger_future = self._subscriptions.subscribe(key)
+                        try:
+                            event = await asyncio.wait_for(trigger_future, timeout=deadline.remaining(expires_at))  # recv
+                        finally:
+                            self._subscriptions.unsubscribe(key, trigger_future)
+                    result['event'] = event.decode()
+
+                done_at = time.monotonic()
+                if trigger_event_cls or input_event_cls:
+                    awaited = trigger_event_cls or input_event_cls
+                    COMMAND_EVENT_SECONDS.labels(request['method'], awaited.js_name).observe(done_at - acked_at)
+                    span.add_event('event', **{'cdp.event': awaited.js_name})
+                self._timeouts.observe(latency_key, done_at - start)
+                self._send_log.info('Successfully sent command = %s' % msg)
+                return result
+            except asyncio.TimeoutError:
+                self._send_log.error('Timed out on the %s of command "%s" with id=%s' % (phase, request['method'], request['id']))
+                self._timeouts.expired(latency_key, time.monotonic() - start)
+                error = self._timeout_error(request, phase)
+                self._command_failed(request['method'], error)
+                raise error
+            except ChromewhipException as e:
+                self._command_failed(request['method'], e)
+                raise
+            finally:
+                self.inflight -= 1
+                # covers acks, timeouts and cancellation alike
+                self._pending.pop(request['id'], None)
+                if input_event_cls:
+                    self._subscriptions.unsubscribe(input_event_cls.js_name, input_future)
+
+    async def send_many(self, commands, return_exceptions=True, timeout=None):
+        """ Pipeline independent commands, writing them all before awaiting any ack.
+
+        Acks are collected in whatever order Chrome replies, so a batch costs a single
+        round trip rather than one per command.
+
+        :param commands: commands as built by the protocol classes, e.g. `page.Page.getCookies()`
+        :param return_exceptions: if true, a failed command's exception takes its place in the
+            returned list, otherwise the first failure is raised once the whole batch has completed
+        :param timeout: seconds allowed for the whole batch, see `_send`
+        :return: a result dict per command, in the order given
+        """
+        self._check_alive()
+        expires_at = self._expires_at(timeout, [request['method'] for request, _ in commands])
+        start = time.monotonic()
+        await self._wait_ready(expires_at)
+        batch = []
+        for request, recv_validator in commands:
+            batch.append((request, recv_validator, self._register(request)))
+
+        async def wait_for_ack(request, recv_validator, ack_future):
+            try:
+                ack = await self._wait_for_ack(request, ack_future, expires_at, recv_validator)
+                acked_at = time.monotonic()
+                COMMAND_ACK_SECONDS.labels(request['method']).observe(acked_at - sent_at)
+                self._timeouts.observe(request['method'], acked_at - start)
+                return {'ack': ack, 'event': None}
+            except asyncio.TimeoutError:
+                self._timeouts.expired(request['method'], time.monotonic() - start)
+                error = self._timeout_error(request, 'ack')
+                self._command_failed(request['method'], error)
+                raise error
+            except ChromewhipException as e:
+                self._command_failed(request['method'], e)
+                raise
+
+        with tracing.start_span('cdp batch', kind=tracing.KIND_CLIENT,
+                                **{'cdp.methods': ','.join(request['method'] for request, _, _ in batch),
+                                   'cdp.session_id': self.session_id}):
+            self.inflight += len(batch)
+            try:
+                sent_at = time.monotonic()
+                sent_futures = [self._enqueue(request)[1] for request, _, _ in batch]
+                try:
+                    await asyncio.wait_for(asyncio.gather(*sent_futures), timeout=deadline.remaining(expires_at))  # send
+                except asyncio.TimeoutError:
+                    error = self._timeout_error(batch[0][0], 'send')
+                    self._command_failed(batch[0][0]['method'], error)
+                    raise error
+                results = await asyncio.gather(*[wait_for_ack(*command) for command in batch],
+                                               return_exceptions=True)
+            finally:
+                self.inflight -= len(batch)
+                for request, _, _ in batch:
+                    self._pending.pop(request['id'], None)
+
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return results
 
+    @property
+    def event_store(self):
+        return self._event_store
+
+    def events(self, event_type=None, maxsize=DEFAULT_STREAM_MAXSIZE, overflow=DROP_OLDEST, where=None,
+               backlog=None):
+        """ Subscribe to every event of a type received from now on.
+
+        Use as ``async with tab.events(network.ResponseReceivedEvent) as stream: async for ev in stream``,
+        or close the returned `EventStream` when done with it.
+
+        :param event_type: event class or name, e.g. "Network.responseReceived", can be left out if
+            ``where`` implies it
+        :param maxsize: maximum number of events buffered for the consumer
+        :param overflow: what to do when the buffer is full, see `chromewhip.events.OVERFLOW_POLICIES`
+        :param where: `chromewhip.filters.Filter` on the raw params, other events are neither buffered
+            nor decoded
+        :param backlog: events held past ``maxsize`` by a `BLOCK` stream before it fails, see `EventStream`
+        """
+        name = getattr(event_type, 'js_name', event_type)
+        if name is None:
+            name = getattr(where, 'method', None)
+            if name is None:
+                raise ValueError('An event type is needed unless the filter implies one')
+        return self._streams.open(name, maxsize=maxsize, overflow=overflow, backlog=backlog, where=where)
+
+    async def wait_for(self, where, timeout=None):
+        """ Wait for the next event matching a filter, checked on the raw params of every event received.
+
+        :param where: `chromewhip.filters.Filter`, e.g. ``filters.where('Page.loadEventFired')``
+        :param timeout: seconds to wait, capped by the context's `chromewhip.deadline` budget
+        :return: the decoded event
+        """
+        self._check_alive()
+        expires_at = deadline.resolve(timeout, default=TIMEOUT_S)
+        future = self._filters.subscribe(where)
         try:
-            msg = json.dumps(request, cls=helpers.ChromewhipJSONEncoder)
-            self._send_log.info('Sending command = %s' % msg)
-            self._current_task = asyncio.ensure_future(self._ws.send(msg))
-            await asyncio.wait_for(self._current_task, timeout=TIMEOUT_S)  # send
+            event = await asyncio.wait_for(future, timeout=deadline.remaining(expires_at))
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError('Deadline exceeded waiting for an event matching %r' % (where,))
+        finally:
+            self._filters.unsubscribe(where, future)
+        return event.decode()
 
-            self._send_log.debug('Waiting for ack event set for id=%s' % request['id'])
-            await asyncio.wait_for(ack_event.wait(), timeout=TIMEOUT_S)  # recv
-            self._send_log.debug('Received ack event set for id=%s' % request['id'])
+    @property
+    def dispatcher(self):
+        """ Runs the callbacks registered with `enable`, and keeps their timings. """
+        return self._dispatcher
 
-            ack_payload = self._ack_payloads.get(request['id'])
+    def add_handler(self, name, handler):
+        """ Call ``handler(event)`` with every decoded event ``name`` as soon as it is received.
 
-            if not ack_payload:
-                self._send_log.error('Notified but no payload available for id=%s!' % request['id'])
-                return result
+        Unlike `dispatcher` callbacks, handlers are never dropped under load, they run in the
+        connection's receive loop before the event is published. They must be quick plain
+        functions, for bookkeeping that has to see every event, e.g. `Chrome.targets`.
+        """
+        self._handlers.setdefault(name, []).append(handler)
 
-            # check for errors
-            error = ack_payload.get('error')
-
-            if error:
-                msg = '%s, code %s for id=%s' % (error.get('message', 'Unknown error'), error['code'], request['id'])
-                self._send_log.error(msg)
-                raise ProtocolError(msg)
-
-            if recv_validator:
-                self._send_log.debug('Validating recv payload for id=%s...' % request['id'])
-                ack_result = recv_validator(ack_payload['result'])
-                self._send_log.debug('Successful recv validation for id=%s...' % request['id'])
-                ack_payload['result'] = ack_result
-            else:
-                ack_result = ack_payload['result']
-
-            result['ack'] = ack_payload
-
-            if input_event_cls:
-                hash_ = input_event_cls.js_name
-                # use latest payload as key is not unique within a single session
-                event = self._event_payloads.get(hash_)
-                hash_input_dict = {}
-                if not event:
-                    self._send_log.debug('Waiting for event with hash "%s"...' % hash_)
-                    await asyncio.wait_for(input_event.wait(), timeout=TIMEOUT_S)  # recv
-                    event = self._event_payloads.get(hash_)
-
-                params = event.hash_().split(':')[-1].split(',')
-                for p in params:
-                    kv = p.split('=')
-                    hash_input_dict[kv[0]] = kv[1]
-            else:
-                hash_input_dict = ack_result
-
-            if trigger_event_cls:
-                try:
-                    # TODO: put in a `strict` flag so that we can catch differences between the protocol spec and the
-                    # underlying implementation.
-                    cleaned_hash_input_dict = {k: v for k, v in hash_input_dict.items() if k in trigger_event_cls.hashable}
-                    hash_ = trigger_event_cls.build_hash(**cleaned_hash_input_dict)
-                except TypeError:
-                    raise TypeError(
-                        'Event "{}" hash cannot be built with "{}"'.format(trigger_event_cls.js_name, hash_input_dict)
-                    )
-                event = self._event_payloads.get(hash_)
-                if not event:
-                    self._send_log.debug('Waiting for event with hash "%s"...' % hash_)
-                    trigger_event = asyncio.Event()
-                    self._trigger_events[hash_] = trigger_event
-                    await asyncio.wait_for(trigger_event.wait(), timeout=TIMEOUT_S)  # recv
-                    event = self._event_payloads.get(hash_)
-                result['event'] = event
-
-            self._send_log.info('Successfully sent command = %s' % msg)
-            return result
-        except asyncio.TimeoutError:
-            method = request['method']
-            id_ = request['id']
-            self._send_log.error(msg)
-            if self._ws.state != websockets.protocol.OPEN:
-                close_code = self._ws.close_code
-                if close_code == 1002:
-                    raise ProtocolError('Websocket protocol error occured for "%s" with id=%s' % (method, id_))
-                elif close_code == 1006:
-                    raise ProtocolError('Incomplete read error occured for "%s" with id=%s' % (method, id_))
-                elif close_code == 1007:
-                    raise ProtocolError('Unicode decode error occured for "%s" with id=%s' % (method, id_))
-                elif close_code == 1009:
-                    raise ProtocolError('Recv\'d payload exceeded %sMB for "%s" with id=%s, consider increasing this limit' % (MAX_PAYLOAD_SIZE_MB, method, id_))
-            raise TimeoutError('Unknown cause for timeout to occurs for "%s" with id=%s' % (method, id_))
-
-    async def new_message_handler(self, request):
-        request['id'] = self._message_id
-        await self._ws.send(json.dumps(request))
-        return await self._ws.recv()
+    def remove_handler(self, name, handler):
+        handlers = self._handlers.get(name)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+            if not handlers:
+                del self._handlers[name]
+
+    @property
+    def streams(self):
+        """ Open event streams of this tab. """
+        return list(self._streams)
+
+    async def enable(self, type, methods=None):
+        """ Enable a protocol domain, e.g. "network".
+
+        :param methods: callbacks to run on events of the domain, keyed on event name or class. Callbacks
+            can be functions or coroutine functions and run in their own tasks, see `EventDispatcher`.
+        """
+        domain = protocol.domain(type)
+        if methods:
+            for event_name, callbacks in methods.items():
+                if not isinstance(callbacks, (list, tuple, set)):
+                    callbacks = [callbacks]
+                for callback in callbacks:
+                    self._dispatcher.add(getattr(event_name, 'js_name', event_name), callback)
+        result = await self._send(*domain.enable())
+        # replayed after a reconnect
+        if type not in self._enabled:
+            self._enabled.append(type)
+        return result
+
+    async def send_command(
+        self, command, input_event_type=None, await_on_event_type=None, timeout=None
+    ):
+        return await self._send(
+            *command,
+            input_event_cls=input_event_type,
+            trigger_event_cls=await_on_event_type,
+            timeout=timeout,
+        )
+
+
+class ChromeTab(Session):
+    """ A page target and its devtools session.
+
+    Tabs created by `Chrome` are flattened sessions sharing the browser's websocket. A tab
+    created on its own opens a websocket to ``ws_uri`` when connected.
+    """
+    def __init__(self, title, url, ws_uri, tab_id, codec=None, connection=None, session_id=None, **kwargs):
+        super().__init__(connection, session_id, **kwargs)
+        self.id_ = tab_id
+        self._title = title
+        self._url = url
+        self._ws_uri = ws_uri
+        self.target_id = ws_uri.split('/')[-1]
+        self._codec = codec
+        self._owns_connection = connection is None
+        self._frame_id = None
+
+    @classmethod
+    async def create_from_json(cls, json_, host, port, **kwargs):
+        ws_url = json_.get('webSocketDebuggerUrl')
+        if not ws_url:
+            tab_id = json_['id']
+            ws_url = 'ws://{}:{}/devtools/page/{}'.format(host, port, tab_id)
+        t = cls(json_['title'], json_['url'], ws_url, json_['id'], **kwargs)
+        await t.connect()
+        return t
+
+    async def connect(self):
+        if not self._owns_connection:
+            # attached through the browser connection, nothing to open
+            return
+        self._connection = Connection(self._ws_uri, codec=self._codec)
+        self._connection.add_session(self)
+        await self._connection.connect()
+        self._log.info('Connected to Chrome tab %s' % self._ws_uri)
+
+    async def disconnect(self):
+        self._log.debug("Disconnecting tab...")
+        if self._owns_connection and self._connection:
+            await self._connection.close()
+        await self.close()
 
     @property
     def title(self):
@@ -299,60 +1002,89 @@ class ChromeTab(metaclass=SyncAdder):
         )
         self._viewport_size = width, height
 
-    async def enable(self, type, methods=None):
-        try:
-            module = globals()[type]
-        except KeyError:
-            module = importlib.import_module(
-                'chromewhip.protocol.{}'.format(type)
-            )
-            globals()[type] = module
-        if methods:
-            for event_name, callbacks in methods.items():
-                if not isinstance(callbacks, (list, tuple, set)):
-                    callbacks = [callbacks]
-                self._event_callbacks[event_name].extend(callbacks)
-        return await self._send(*getattr(module, type.title()).enable())
-
-    async def send_command(
-        self, command, input_event_type=None, await_on_event_type=None
-    ):
-        return await self._send(
-            *command,
-            input_event_cls=input_event_type,
-            trigger_event_cls=await_on_event_type,
-        )
-
     async def html(self):
-        result = await self.evaluate('document.documentElement.outerHTML')
+        result = await self.evaluate('document.documentElement.outerHTML', chunked=True)
         value = result['ack']['result']['result'].value
         return value
 
-    async def go(self, url):
+    async def go(self, url, timeout=None):
         """
         Navigate the tab to the URL
+
+        :param timeout: seconds allowed until the frame stops loading
         """
         res = await self.send_command(
             page.Page.navigate(url),
             await_on_event_type=page.FrameStoppedLoadingEvent,
+            timeout=timeout,
         )
         self._frame_id = res['ack']['result']['frameId']
 
-    async def evaluate(self, javascript):
+    async def evaluate(self, javascript, chunked=False):
         """
         Evaluate JavaScript on the page
+
+        :param chunked: fetch string results longer than `CHUNK_SIZE_CHARS` in slices, so no reply
+            exceeds the websocket frame limit. ``javascript`` must then be a single expression.
         """
+        if chunked:
+            javascript = CHUNKED_EVALUATE_JS % (javascript, CHUNK_SIZE_CHARS)
         result = await self.send_command(runtime.Runtime.evaluate(javascript))
+        self.check_evaluate_result(result)
         r = result["ack"]["result"]["result"]
-        if r.subtype == 'error':
+        if chunked and r.className == 'ChromewhipChunks':
+            value = await self._fetch_chunks(r.objectId)
+            result['ack']['result']['result'] = runtime.RemoteObject(type='string', value=value)
+        return result
+
+    async def evaluate_many(self, *javascripts):
+        """ Evaluate independent pieces of JavaScript in one round trip, see `send_many`.
+
+        :raises JSScriptError: if any of them threw, once all are evaluated
+        """
+        results = await self.send_many(
+            [runtime.Runtime.evaluate(javascript) for javascript in javascripts], return_exceptions=False
+        )
+        for result in results:
+            self.check_evaluate_result(result)
+        return results
+
+    @staticmethod
+    def check_evaluate_result(result):
+        """ Raise `JSScriptError` if the script of a `Runtime.evaluate` ``result`` threw an error. """
+        if result["ack"]["result"]["result"].subtype == 'error':
             raise JSScriptError({
                 'reason': 'Runtime.evalulate threw an error',
                 'error': result["ack"]["result"]["exceptionDetails"].to_dict(),
             })
-        return result
+
+    async def _fetch_chunks(self, object_id):
+        """ Read the string held by a `ChromewhipChunks` object slice by slice, then release it. """
+        try:
+            res = await self.send_command(runtime.Runtime.callFunctionOn(
+                'function() { return this.s.length; }', objectId=object_id, returnByValue=True
+            ))
+            length = res['ack']['result']['result'].value
+            starts = list(range(0, length, CHUNK_SIZE_CHARS))
+            self._log.debug('Fetching %s chars in %s chunks' % (length, len(starts)))
+            parts = []
+            for i in range(0, len(starts), CHUNK_BATCH_SIZE):
+                results = await self.send_many([
+                    runtime.Runtime.callFunctionOn(
+                        CHUNK_SLICE_JS,
+                        objectId=object_id,
+                        arguments=[{'value': start}, {'value': start + CHUNK_SIZE_CHARS}],
+                        returnByValue=True,
+                    )
+                    for start in starts[i:i + CHUNK_BATCH_SIZE]
+                ], return_exceptions=False)
+                parts.extend(r['ack']['result']['result'].value for r in results)
+            return ''.join(parts)
+        finally:
+            await self.send_command(runtime.Runtime.releaseObject(object_id))
 
     async def _get_image(
-        self, image_format, width, height, render_all, scale_method, region
+        self, image_format, width, height, render_all, scale_method, region, quality=None
     ):
         old_size = self.viewport_size
         try:
@@ -373,6 +1105,7 @@ class ChromeTab(metaclass=SyncAdder):
                     height=height,
                     scale_method=scale_method,
                     region=region,
+                    quality=quality,
                 )
                 image = await renderer.render()
         finally:
@@ -416,7 +1149,7 @@ class ChromeTab(metaclass=SyncAdder):
             % (width, height, render_all, scale_method, quality, region)
         )
         image = await self._get_image(
-            'JPEG', width, height, render_all, scale_method, region=region
+            'JPEG', width, height, render_all, scale_method, region=region, quality=quality
         )
         return image if b64 else base64.b64decode(image)
 
@@ -440,14 +1173,12 @@ class ChromeTab(metaclass=SyncAdder):
     async def cookies(self):
         """Return cookies for this page."""
         res = await self.send_command(page.Page.getCookies())
-        return [vars(cookie) for cookie in res['ack']['result']['cookies']]
+        return [cookie.to_dict() for cookie in res['ack']['result']['cookies']]
 
     async def js_console(self):
         messages = []
-        for name, event in self._event_payloads.items():
-            if not name.startswith('Log.entryAdded'):
-                continue
-            messages.append('[{source}][{level}] {text}'.format(**vars(event)))
+        for event in self._event_store.events('Log.entryAdded'):
+            messages.append('[{source}][{level}] {text}'.format(**event.decode().entry.to_dict()))
         return messages
 
     def __str__(self):
@@ -458,11 +1189,28 @@ class ChromeTab(metaclass=SyncAdder):
 
 
 class Chrome(metaclass=SyncAdder):
-    def __init__(self, host='localhost', port=9222):
+    """ A Chrome instance, with its page tabs attached as sessions over one browser websocket.
+
+    :param attach_concurrency: maximum number of targets created or attached in one batch
+    :param session_options: keyword arguments of `Session` given to every tab attached, e.g.
+        ``{'max_events_per_type': 100, 'callback_concurrency': 4, 'recorder_size': 0}``
+    """
+    def __init__(self, host='localhost', port=9222, codec=None, attach_concurrency=ATTACH_CONCURRENCY,
+                 session_options=None):
         self._host = host
         self._port = port
+        self._codec = get_codec(codec)
+        self._attach_concurrency = attach_concurrency
+        self._session_options = dict(session_options or {})
         self._url = 'http://%s:%d' % (self.host, self.port)
         self._tabs = []
+        self._targets = {}
+        self._listeners = []
+        self._notifications: Optional[asyncio.Queue] = None
+        self._notify_task: Optional[asyncio.Task] = None
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._connection: Optional[Connection] = None
+        self._browser: Optional[Session] = None
         self.is_connected = False
         self._log = logging.getLogger('chromewhip.chrome.Chrome')
 
@@ -476,19 +1224,191 @@ class Chrome(metaclass=SyncAdder):
                 self._log.error('Unable to fetch tabs! Timeout')
 
     async def attempt_tab_fetch(self):
-        async with aiohttp.ClientSession() as session:
-            async with session.get(self._url + '/json') as resp:
-                tabs = []
-                data = await resp.json()
-                if not len(data):
-                    self._log.warning('Empty data, will attempt to reconnect until able to get pages.')
-                for tab in filter(lambda x: x['type'] == 'page', data):
-                    t = await ChromeTab.create_from_json(tab, self._host, self._port)
-                    tabs.append(t)
-                self._tabs = tabs
-                self._log.debug("Connected to Chrome! Found {} tabs".format(len(self._tabs)))
+        await self._ensure_connection()
+        result = await self._browser.send_command(target.Target.getTargets())
+        target_infos = result['ack']['result']['targetInfos']
+        for target_info in target_infos:
+            self._targets[target_info.targetId] = target_info
+        if not len(target_infos):
+            self._log.warning('Empty data, will attempt to reconnect until able to get pages.')
+        self._tabs = await self._attach_many([
+            (target_info.targetId, target_info.title, target_info.url)
+            for target_info in target_infos if target_info.type == 'page'
+        ])
+        self._log.debug("Connected to Chrome! Found {} tabs".format(len(self._tabs)))
         self.is_connected = True
 
+    async def disconnect(self):
+        """ Detach every tab and close the browser websocket. """
+        for tab in self._tabs:
+            await tab.disconnect()
+        if self._connection:
+            await self._connection.close()
+            await self._browser.close()
+        if self._notify_task:
+            self._notify_task.cancel()
+            await asyncio.gather(self._notify_task, return_exceptions=True)
+            self._notifications = self._notify_task = None
+        if self._http:
+            await self._http.close()
+        self._connection = self._browser = self._http = None
+        self.is_connected = False
+
+    @property
+    def http(self) -> aiohttp.ClientSession:
+        """ HTTP session for the /json endpoints, pooled for the lifetime of the connection. """
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession()
+        return self._http
+
+    async def get_browser_ws_uri(self):
+        async with self.http.get(self._url + '/json/version') as resp:
+            data = await resp.json()
+        return data['webSocketDebuggerUrl']
+
+    async def _ensure_connection(self):
+        if self._connection is not None:
+            return
+        connection = Connection(await self.get_browser_ws_uri(), codec=self._codec)
+        connection.on_reconnect.append(self._reattach)
+        browser_session = Session(connection)
+        connection.add_session(browser_session)
+        await connection.connect()
+        self._connection, self._browser = connection, browser_session
+        for event_cls, handler in (
+            (target.TargetCreatedEvent, self._on_target_created),
+            (target.AttachedToTargetEvent, self._on_attached_to_target),
+            (target.TargetInfoChangedEvent, self._on_target_info_changed),
+            (target.TargetDestroyedEvent, self._on_target_destroyed),
+            (target.TargetCrashedEvent, self._on_target_crashed),
+            (target.DetachedFromTargetEvent, self._on_detached_from_target),
+        ):
+            # the registry must see every event, the dispatcher drops calls under load
+            browser_session.add_handler(event_cls.js_name, handler)
+        await browser_session.send_command(target.Target.setDiscoverTargets(True))
+
+    async def _reattach(self):
+        """ Attach the tabs to their targets again once the browser connection is re-opened. """
+        await self._browser.send_command(target.Target.setDiscoverTargets(True))
+        for batch in self._batches(list(self._tabs)):
+            results = await self._browser.send_many(
+                [target.Target.attachToTarget(tab.id_, flatten=True) for tab in batch]
+            )
+            resumed = []
+            for tab, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    self._drop_tab(tab, 'Could not attach to target %s again: %s' % (tab.id_, result))
+                else:
+                    resumed.append(tab.resume(result['ack']['result']['sessionId']))
+            await asyncio.gather(*resumed)
+
+    @property
+    def targets(self):
+        """ Live targets of the browser keyed on target id, kept up to date from `Target` events. """
+        return dict(self._targets)
+
+    def add_listener(self, callback):
+        """ Register ``callback(event, tab)`` to run on every target event once the registry is updated.
+
+        ``event`` is the decoded `Target` event and ``tab`` the affected attached tab, or `None`. Callbacks
+        can be functions or coroutine functions, e.g. to refill a tab pool as soon as a tab dies. They
+        run one event at a time, in the order the events were received.
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        self._listeners.remove(callback)
+
+    def _tab_for(self, target_id=None, session_id=None):
+        for tab in self._tabs:
+            if tab.id_ == target_id or (session_id is not None and tab.session_id == session_id):
+                return tab
+        return None
+
+    def _drop_tab(self, tab, reason):
+        tab.mark_closed(reason)
+        if tab in self._tabs:
+            self._tabs.remove(tab)
+
+    def _notify(self, event, tab):
+        """ Queue the listener calls for ``event``, made in order by a task of their own. """
+        if not self._listeners:
+            return
+        if self._notifications is None:
+            self._notifications = asyncio.Queue()
+            self._notify_task = ensure_background(self._run_listeners())
+        self._notifications.put_nowait((event, tab))
+
+    async def _run_listeners(self):
+        while True:
+            event, tab = await self._notifications.get()
+            for callback in list(self._listeners):
+                try:
+                    result = callback(event, tab)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception:
+                    self._log.exception('Target listener %s failed on "%s"' % (callback, event.js_name))
+
+    def _on_target_created(self, event):
+        self._targets[event.targetInfo.targetId] = event.targetInfo
+        self._notify(event, None)
+
+    def _on_attached_to_target(self, event):
+        self._targets[event.targetInfo.targetId] = event.targetInfo
+        self._notify(event, self._tab_for(session_id=event.sessionId))
+
+    def _on_target_info_changed(self, event):
+        info = event.targetInfo
+        self._targets[info.targetId] = info
+        tab = self._tab_for(info.targetId)
+        if tab:
+            tab._title, tab._url = info.title, info.url
+        self._notify(event, tab)
+
+    def _on_target_destroyed(self, event):
+        self._targets.pop(event.targetId, None)
+        tab = self._tab_for(event.targetId)
+        if tab:
+            self._drop_tab(tab, 'Target %s was destroyed' % event.targetId)
+        self._notify(event, tab)
+
+    def _on_target_crashed(self, event):
+        self._targets.pop(event.targetId, None)
+        tab = self._tab_for(event.targetId)
+        if tab:
+            self._drop_tab(tab, 'Target %s crashed with status "%s", code %s'
+                           % (event.targetId, event.status, event.errorCode))
+        self._notify(event, tab)
+
+    def _on_detached_from_target(self, event):
+        tab = self._tab_for(session_id=event.sessionId)
+        if tab:
+            self._drop_tab(tab, 'Session %s was detached' % event.sessionId)
+        self._notify(event, tab)
+
+    def _batches(self, items):
+        for i in range(0, len(items), self._attach_concurrency):
+            yield items[i:i + self._attach_concurrency]
+
+    async def _attach_many(self, targets):
+        """ Attach to ``(target_id, title, url)`` targets, pipelining the attach commands of each batch. """
+        tabs = []
+        for batch in self._batches(targets):
+            results = await self._browser.send_many(
+                [target.Target.attachToTarget(target_id, flatten=True) for target_id, _, _ in batch],
+                return_exceptions=False,
+            )
+            for (target_id, title, url), result in zip(batch, results):
+                session_id = result['ack']['result']['sessionId']
+                ws_uri = 'ws://%s:%s/devtools/page/%s' % (self._host, self._port, target_id)
+                tab = ChromeTab(title, url, ws_uri, target_id, connection=self._connection, session_id=session_id,
+                                **self._session_options)
+                self._connection.add_session(tab)
+                self._log.debug('Attached to target %s with session %s' % (target_id, session_id))
+                tabs.append(tab)
+        return tabs
+
     @property
     def host(self):
         return self._host
@@ -501,21 +1421,56 @@ class Chrome(metaclass=SyncAdder):
     def url(self):
         return self._url
 
+    @property
+    def connection(self):
+        """ The browser websocket every tab's session goes through. """
+        return self._connection
+
+    @property
+    def browser_session(self):
+        """ Session on the browser target itself, for `Target` and `Browser` commands. """
+        return self._browser
+
     @property
     def tabs(self):
         if not len(self._tabs):
             raise ValueError('Must call connect_s or connect first!')
         return tuple(self._tabs)
 
-    async def create_tab(self):
-        async with aiohttp.ClientSession() as session:
-            async with session.get(self._url + '/json/new') as resp:
-                data = await resp.json()
-                t = await ChromeTab.create_from_json(data, self._host, self._port)
-                self._tabs.append(t)
-        return t
+    def flight_records(self, tab_id=None):
+        """ Frames recorded by the browser session and each tab, keyed on "browser" and tab id. """
+        sessions = [(tab.id_, tab) for tab in self._tabs]
+        if self._browser is not None:
+            sessions.insert(0, ('browser', self._browser))
+        return {id_: session.recorder.dump() for id_, session in sessions if tab_id is None or id_ == tab_id}
+
+    def collect_metrics(self):
+        """ Refresh the per tab gauges of `chromewhip.metrics.REGISTRY`, ahead of rendering it. """
+        for gauge in (TAB_COMMANDS_INFLIGHT, TAB_SEND_QUEUE_DEPTH, TAB_EVENT_STORE_BYTES):
+            # closed tabs drop out
+            gauge.clear()
+        for tab in self._tabs:
+            TAB_COMMANDS_INFLIGHT.labels(tab.id_).set(tab.inflight)
+            TAB_SEND_QUEUE_DEPTH.labels(tab.id_).set(tab.send_queue_depth)
+            TAB_EVENT_STORE_BYTES.labels(tab.id_).set(tab.event_store.memory_usage)
+
+    async def create_tab(self, url='about:blank'):
+        return (await self.create_tabs(1, url=url))[0]
+
+    async def create_tabs(self, n, url='about:blank'):
+        """ Open ``n`` tabs, creating and attaching them in pipelined batches of ``attach_concurrency``. """
+        await self._ensure_connection()
+        tabs = []
+        for batch in self._batches(range(n)):
+            results = await self._browser.send_many(
+                [target.Target.createTarget(url) for _ in batch], return_exceptions=False
+            )
+            tabs.extend(await self._attach_many([(r['ack']['result']['targetId'], '', url) for r in results]))
+        self._tabs.extend(tabs)
+        return tabs
 
     async def close_tab(self, tab):
         await tab.disconnect()
-        async with aiohttp.ClientSession() as session:
-            await session.get(self._url + f'/json/close/{tab.id_}')
+        await self._browser.send_command(target.Target.closeTarget(tab.id_))
+        if tab in self._tabs:
+            self._tabs.remove(tab)
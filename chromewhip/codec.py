@@ -0,0 +1,58 @@
+import json
+
+from chromewhip.helpers import ChromewhipJSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JSONCodec:
+    """ Encodes commands and decodes frames with the standard library `json` module. """
+    name = 'json'
+
+    def dumps(self, obj) -> str:
+        return json.dumps(obj, cls=ChromewhipJSONEncoder)
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """ `orjson` backed codec, falling back on `ChromewhipJSONEncoder` for protocol objects. """
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError('orjson is not installed, install chromewhip[fast] to use the "orjson" codec')
+        self._default = ChromewhipJSONEncoder().default
+
+    def dumps(self, obj) -> str:
+        # Chrome expects text frames, so hand back a str rather than bytes
+        return orjson.dumps(obj, default=self._default).decode()
+
+    def loads(self, data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects lone surrogate escapes, which Chrome sends for broken page text
+            return json.loads(data)
+
+
+CODECS = {
+    JSONCodec.name: JSONCodec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+
+
+def get_codec(codec=None):
+    """ Resolve a codec from a name or instance, defaulting to the fastest one installed. """
+    if codec is None:
+        codec = OrjsonCodec.name if orjson is not None else JSONCodec.name
+    if isinstance(codec, str):
+        try:
+            return CODECS[codec]()
+        except KeyError:
+            raise ValueError('Unknown codec "%s", must be one of %s' % (codec, ', '.join(CODECS)))
+    return codec
@@ -4,7 +4,8 @@ import json
 import keyword
 import textwrap
 
-from chromewhip.protocol import input
+from chromewhip import tracing
+from chromewhip.protocol import input, page, runtime
 
 
 class Splash:
@@ -36,10 +37,18 @@ class Splash:
         return True if self.request.query.get(param, False) == '1' else False
 
     async def _response(self):
+        url, cookies = await self.tab.send_many(
+            [
+                runtime.Runtime.evaluate('window.location.href'),
+                page.Page.getCookies(),
+            ],
+            return_exceptions=False,
+        )
+        self.tab.check_evaluate_result(url)
         return {
-            'url': await self.evaluate('window.location.href'),
+            'url': url['ack']['result']['result'].value,
             'headers': {'Content-Type': 'application/json'},
-            'cookies': await self.tab.cookies(),
+            'cookies': [c.to_dict() for c in cookies['ack']['result']['cookies']],
             'status': 200,  # TODO: Should it always be 200?
         }
 
@@ -97,6 +106,10 @@ class Splash:
         res = res["ack"]["result"]["result"]
         return res.value
 
+    async def evaluate_many(self, *sources):
+        results = await self.tab.evaluate_many(*sources)
+        return [res['ack']['result']['result'].value for res in results]
+
     async def evaljs(self, source):
         return await self.send_response({'body': await self.evaluate(source)})
 
@@ -126,7 +139,8 @@ class Splash:
             if keyword.iskeyword(action):
                 action = '{}_'.format(action)
             method = getattr(self, action)
-            await method(**command.get('args', {}))
+            with tracing.start_span('splash.%s' % command['action']):
+                await method(**command.get('args', {}))
 
     async def send_response(self, data=None):
         data = data or {}
@@ -0,0 +1,66 @@
+"""
+Context-local deadlines for devtools commands.
+
+A deadline is an absolute `time.monotonic` timestamp. Setting a budget applies to every
+command sent from the current context, e.g. for the whole of an HTTP request:
+
+    with deadline.budget(request_timeout):
+        await tab.go(url)
+        await tab.html()
+
+Budgets nest, an inner budget can only shorten the deadline of the outer one.
+"""
+import contextlib
+import contextvars
+import time
+
+_deadline = contextvars.ContextVar('chromewhip_deadline', default=None)
+
+
+def current():
+    """ The deadline of the current context, or `None`. """
+    return _deadline.get()
+
+
+def resolve(timeout=None, default=None):
+    """ The deadline for a command given its own ``timeout``, capped by the current context's.
+
+    :param timeout: seconds the command may take, `None` to only use the context's deadline
+    :param default: seconds used when neither ``timeout`` nor a context deadline is set
+    """
+    now = time.monotonic()
+    deadline = _deadline.get()
+    if timeout is not None:
+        deadline = now + timeout if deadline is None else min(deadline, now + timeout)
+    elif deadline is None and default is not None:
+        deadline = now + default
+    return deadline
+
+
+def remaining(deadline):
+    """ Seconds left until ``deadline``, never negative, `None` for no deadline. """
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def set_budget(timeout):
+    """ Limit every command sent from the current context to ``timeout`` seconds from now.
+
+    :return: token for `reset`
+    """
+    return _deadline.set(resolve(timeout))
+
+
+def reset(token):
+    _deadline.reset(token)
+
+
+@contextlib.contextmanager
+def budget(timeout):
+    """ Apply a ``timeout`` seconds budget to the commands sent within the block. """
+    token = set_budget(timeout)
+    try:
+        yield _deadline.get()
+    finally:
+        reset(token)
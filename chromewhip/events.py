@@ -0,0 +1,539 @@
+import asyncio
+import collections
+import inspect
+import logging
+import time
+
+from chromewhip import tracing
+from chromewhip.base import ensure_background
+
+DEFAULT_MAX_EVENTS_PER_TYPE = 100
+DEFAULT_EVENT_TTL_S = 60
+SWEEP_INTERVAL_S = 1
+DEFAULT_STREAM_MAXSIZE = 100
+DEFAULT_CALLBACK_CONCURRENCY = 10
+DEFAULT_CALLBACK_BACKLOG = 1000
+
+DROP_OLDEST = 'drop-oldest'
+DROP_NEWEST = 'drop-newest'
+BLOCK = 'block'
+OVERFLOW_POLICIES = (DROP_OLDEST, DROP_NEWEST, BLOCK)
+
+
+class StreamOverflowError(Exception):
+    """ A `BLOCK` event stream fell too far behind to keep every event. """
+
+
+StoredEvent = collections.namedtuple('StoredEvent', ['timestamp', 'name', 'key', 'event', 'size'])
+
+
+class EventStore:
+    """ A bounded store of the events received by a tab.
+
+    Events are kept per type (their ``js_name``) in arrival order, capped at
+    ``max_per_type`` entries, and dropped once older than ``ttl_s``. The latest
+    event seen for a hash key stays reachable through `get` while it is stored.
+
+    :param max_per_type: default cap on stored events per type
+    :param ttl_s: seconds an event is kept for, `None` to keep until evicted by the cap
+    :param type_caps: per-type overrides of ``max_per_type``, keyed on event name
+    """
+    def __init__(self, max_per_type=DEFAULT_MAX_EVENTS_PER_TYPE, ttl_s=DEFAULT_EVENT_TTL_S,
+                 type_caps=None, clock=time.monotonic):
+        self._max_per_type = max_per_type
+        self._ttl_s = ttl_s
+        self._type_caps = dict(type_caps or {})
+        self._clock = clock
+        self._by_name = {}
+        self._by_key = {}
+        self._memory_usage = 0
+        self._last_sweep = clock()
+
+    @property
+    def memory_usage(self):
+        """ Approximate size in bytes of the stored events, as received on the wire. """
+        return self._memory_usage
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._by_name.values())
+
+    def add(self, event, key, size=0):
+        now = self._clock()
+        name = event.js_name
+        entries = self._by_name.get(name)
+        if entries is None:
+            entries = self._by_name[name] = collections.deque()
+        else:
+            self._expire(entries, now)
+            cap = self._type_caps.get(name, self._max_per_type)
+            while entries and len(entries) >= cap:
+                self._evict(entries.popleft())
+        entry = StoredEvent(now, name, key, event, size)
+        entries.append(entry)
+        self._by_key[key] = entry
+        self._memory_usage += size
+        if now - self._last_sweep >= SWEEP_INTERVAL_S:
+            self.sweep(now)
+
+    def get(self, key):
+        """ Return the latest stored event for ``key``, or `None`. """
+        entry = self._by_key.get(key)
+        if entry is None or self._is_expired(entry, self._clock()):
+            return None
+        return entry.event
+
+    def latest(self, name):
+        """ Return the most recent stored event of type ``name``, or `None`. """
+        entries = self._by_name.get(name)
+        if not entries:
+            return None
+        self._expire(entries, self._clock())
+        return entries[-1].event if entries else None
+
+    def events(self, name):
+        """ Return all stored events of type ``name``, oldest first. """
+        entries = self._by_name.get(name)
+        if not entries:
+            return []
+        self._expire(entries, self._clock())
+        return [entry.event for entry in entries]
+
+    def sweep(self, now=None):
+        """ Drop expired events of every type. """
+        now = self._clock() if now is None else now
+        self._last_sweep = now
+        for name, entries in list(self._by_name.items()):
+            self._expire(entries, now)
+            if not entries:
+                del self._by_name[name]
+
+    def clear(self):
+        self._by_name.clear()
+        self._by_key.clear()
+        self._memory_usage = 0
+
+    def _is_expired(self, entry, now):
+        return self._ttl_s is not None and now - entry.timestamp > self._ttl_s
+
+    def _expire(self, entries, now):
+        while entries and self._is_expired(entries[0], now):
+            self._evict(entries.popleft())
+
+    def _evict(self, entry):
+        self._memory_usage -= entry.size
+        if self._by_key.get(entry.key) is entry:
+            del self._by_key[entry.key]
+
+
+class SubscriptionIndex:
+    """ Futures waiting on events, indexed by key.
+
+    Any number of waiters can share a key, all of them are resolved in one
+    pass when a matching event arrives.
+    """
+    def __init__(self):
+        self._waiters = {}
+
+    def __len__(self):
+        return len(self._waiters)
+
+    def __contains__(self, key):
+        return key in self._waiters
+
+    def subscribe(self, key):
+        future = asyncio.get_event_loop().create_future()
+        self._waiters.setdefault(key, []).append(future)
+        return future
+
+    def unsubscribe(self, key, future):
+        waiters = self._waiters.get(key)
+        if not waiters:
+            return
+        try:
+            waiters.remove(future)
+        except ValueError:
+            return
+        if not waiters:
+            del self._waiters[key]
+
+    def fail(self, exc):
+        """ Fail every waiter on any key with ``exc``. """
+        waiters, self._waiters = self._waiters, {}
+        for futures in waiters.values():
+            for future in futures:
+                if not future.done():
+                    future.set_exception(exc)
+                    # waiters that are never awaited should not log the error on collection
+                    future.exception()
+
+    def resolve(self, key, value):
+        """ Resolve every waiter on ``key`` with ``value``, returning how many there were. """
+        waiters = self._waiters.pop(key, None)
+        if not waiters:
+            return 0
+        for future in waiters:
+            if not future.done():
+                future.set_result(value)
+        return len(waiters)
+
+
+class FilterIndex:
+    """ Futures waiting on the next event matching a `chromewhip.filters.Filter`.
+
+    Waiters are indexed on the event name their filter implies, so an event is only
+    checked against the filters that can match it.
+    """
+    def __init__(self):
+        self._waiters = {}
+
+    def __len__(self):
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    def subscribe(self, where):
+        future = asyncio.get_event_loop().create_future()
+        self._waiters.setdefault(where.method, []).append((where, future))
+        return future
+
+    def unsubscribe(self, where, future):
+        waiters = self._waiters.get(where.method)
+        if not waiters:
+            return
+        try:
+            waiters.remove((where, future))
+        except ValueError:
+            return
+        if not waiters:
+            del self._waiters[where.method]
+
+    def fail(self, exc):
+        waiters, self._waiters = self._waiters, {}
+        for pairs in waiters.values():
+            for _, future in pairs:
+                if not future.done():
+                    future.set_exception(exc)
+                    future.exception()
+
+    def resolve(self, event):
+        """ Resolve the waiters whose filter matches ``event``, returning how many there were. """
+        resolved = 0
+        for method in (event.js_name, None):
+            waiters = self._waiters.get(method)
+            if not waiters:
+                continue
+            remaining = []
+            for where, future in waiters:
+                if future.done():
+                    continue
+                if where.matches(event.js_name, event.params):
+                    future.set_result(event)
+                    resolved += 1
+                else:
+                    remaining.append((where, future))
+            if remaining:
+                self._waiters[method] = remaining
+            else:
+                del self._waiters[method]
+        return resolved
+
+
+class EventStream:
+    """ An async iterator over the events of one type, buffered in a bounded queue.
+
+    When the buffer is full a new event is handled according to ``overflow``:
+    `DROP_OLDEST` discards the oldest buffered event and `DROP_NEWEST` discards the
+    new one, counting them in ``dropped``. `BLOCK` loses no event: the receive loop
+    is shared by every tab of the connection and never waits on a consumer, so a
+    full stream holds up to ``backlog`` more events for it, then fails with
+    `StreamOverflowError` once the consumer has read what was buffered. Events are
+    decoded as they are consumed.
+
+    :param name: event name, e.g. "Network.responseReceived"
+    :param maxsize: maximum number of buffered events
+    :param overflow: one of `OVERFLOW_POLICIES`
+    :param backlog: events a `BLOCK` stream holds past ``maxsize`` before failing, ``maxsize`` by default
+    :param on_close: called with the stream once it is closed
+    :param where: `chromewhip.filters.Filter` events must match to be buffered, checked on the raw params
+    """
+    def __init__(self, name, maxsize=DEFAULT_STREAM_MAXSIZE, overflow=DROP_OLDEST, backlog=None, on_close=None,
+                 where=None):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError('Unknown overflow policy "%s", must be one of %s' % (overflow, ', '.join(OVERFLOW_POLICIES)))
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1, got %s' % maxsize)
+        self.name = name
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.backlog = maxsize if backlog is None else backlog
+        self.where = where
+        self.received = 0
+        self.dropped = 0
+        self._on_close = on_close
+        self._buffer = collections.deque()
+        self._readable = asyncio.Event()
+        self._closed = False
+        self._error = None
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def offer(self, event):
+        """ Buffer ``event`` without waiting, returns `False` if it overflowed a `BLOCK` stream. """
+        if self._closed:
+            return True
+        if self.where is not None and not self.where.matches(event.js_name, event.params):
+            return True
+        if len(self._buffer) >= self.maxsize:
+            if self.overflow == BLOCK:
+                if len(self._buffer) >= self.maxsize + self.backlog:
+                    self.dropped += 1
+                    self._error = StreamOverflowError(
+                        'Stream of "%s" fell more than %s events behind' % (self.name, self.maxsize + self.backlog))
+                    self.close(discard=False)
+                    return False
+            else:
+                self.dropped += 1
+                if self.overflow == DROP_NEWEST:
+                    return True
+                self._buffer.popleft()
+        self._buffer.append(event)
+        self.received += 1
+        self._readable.set()
+        return True
+
+    def close(self, discard=True):
+        """ Stop accepting events.
+
+        :param discard: drop buffered events rather than letting the consumer drain them
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if discard:
+            self._buffer.clear()
+        self._readable.set()
+        if self._on_close:
+            self._on_close(self)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self._buffer:
+            if self._closed:
+                if self._error is not None:
+                    raise self._error
+                raise StopAsyncIteration
+            self._readable.clear()
+            await self._readable.wait()
+        return self._buffer.popleft().decode()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __repr__(self):
+        return 'EventStream(%r, maxsize=%s, overflow=%r, buffered=%s, dropped=%s)' % (
+            self.name, self.maxsize, self.overflow, len(self._buffer), self.dropped)
+
+
+class StreamIndex:
+    """ Open event streams, indexed by event name. """
+    def __init__(self):
+        self._streams = {}
+
+    def __len__(self):
+        return sum(len(streams) for streams in self._streams.values())
+
+    def __iter__(self):
+        for streams in list(self._streams.values()):
+            yield from list(streams)
+
+    def open(self, name, **kwargs):
+        stream = EventStream(name, on_close=self._remove, **kwargs)
+        self._streams.setdefault(name, []).append(stream)
+        return stream
+
+    def publish(self, event):
+        """ Offer ``event`` to every stream on its name, returning the streams it overflowed. """
+        streams = self._streams.get(event.js_name)
+        if not streams:
+            return ()
+        return [stream for stream in list(streams) if not stream.offer(event)]
+
+    def close_all(self, discard=False):
+        for stream in list(self):
+            stream.close(discard=discard)
+
+    def _remove(self, stream):
+        streams = self._streams.get(stream.name)
+        if not streams:
+            return
+        try:
+            streams.remove(stream)
+        except ValueError:
+            return
+        if not streams:
+            del self._streams[stream.name]
+
+
+class CallbackStats:
+    """ Call count, failures and time spent in one event callback. """
+    __slots__ = ('calls', 'errors', 'total_s', 'max_s')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+
+    @property
+    def mean_s(self):
+        return self.total_s / self.calls if self.calls else 0.0
+
+    def to_dict(self):
+        return {'calls': self.calls, 'errors': self.errors, 'total_s': self.total_s,
+                'mean_s': self.mean_s, 'max_s': self.max_s}
+
+
+class EventDispatcher:
+    """ Runs the callbacks registered for events outside of the receive loop.
+
+    Callbacks may be plain functions or coroutine functions, they are called with
+    the decoded event. Calls are queued and run by at most ``max_concurrency`` worker
+    tasks per dispatcher, so a slow callback only delays other callbacks. Events are
+    decoded by the workers, one that cannot be decoded is logged and skipped. Once
+    ``backlog`` calls wait for a worker, the oldest waiting call is dropped for each
+    new one, counting them in ``dropped``.
+
+    :param max_concurrency: maximum number of callbacks running at once
+    :param backlog: maximum number of callback calls waiting to run
+    """
+    def __init__(self, max_concurrency=DEFAULT_CALLBACK_CONCURRENCY, backlog=DEFAULT_CALLBACK_BACKLOG):
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1, got %s' % max_concurrency)
+        if backlog < 1:
+            raise ValueError('backlog must be at least 1, got %s' % backlog)
+        self._max_concurrency = max_concurrency
+        self._backlog = backlog
+        self._queue = None
+        self._workers = []
+        self._running = 0
+        self._callbacks = {}
+        self._stats = {}
+        self.dropped = 0
+        self.decode_errors = 0
+        self._log = logging.getLogger('chromewhip.events.EventDispatcher')
+
+    def __contains__(self, name):
+        return name in self._callbacks
+
+    @property
+    def pending(self):
+        """ Number of callback calls waiting or running. """
+        return (self._queue.qsize() if self._queue else 0) + self._running
+
+    def add(self, name, callback):
+        self._callbacks.setdefault(name, []).append(callback)
+
+    def remove(self, name, callback):
+        callbacks = self._callbacks.get(name)
+        if not callbacks:
+            return
+        try:
+            callbacks.remove(callback)
+        except ValueError:
+            return
+        if not callbacks:
+            del self._callbacks[name]
+
+    def callbacks(self, name):
+        return list(self._callbacks.get(name, ()))
+
+    def dispatch(self, event):
+        """ Queue a call of every callback registered on raw ``event``, returning how many were. """
+        callbacks = self._callbacks.get(event.js_name)
+        if not callbacks:
+            return 0
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            # not in the context of the first dispatch, callbacks must not inherit a request's deadline
+            self._workers = [ensure_background(self._work()) for _ in range(self._max_concurrency)]
+        for callback in callbacks:
+            if self._queue.qsize() >= self._backlog:
+                self.dropped += 1
+                self._queue.get_nowait()
+                self._queue.task_done()
+                self._log.warning('Dropped a call waiting for a worker, over %s calls are queued' % self._backlog)
+            self._queue.put_nowait((callback, event))
+        return len(callbacks)
+
+    def stats(self):
+        """ Timings of every callback called so far, keyed on ``id(callback)``. """
+        return {key: stats.to_dict() for key, (_, stats) in self._stats.items()}
+
+    async def join(self):
+        """ Wait for every queued callback call to finish. """
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self, timeout=None):
+        """ Wait up to ``timeout`` seconds for queued callbacks, then cancel the rest. """
+        if self._queue is None:
+            return
+        if timeout and self.pending:
+            try:
+                await asyncio.wait_for(self.join(), timeout=timeout)
+            except asyncio.TimeoutError:
+                self._log.warning('Cancelling %s event callbacks still queued or running' % self.pending)
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._queue = None
+
+    async def _work(self):
+        while True:
+            callback, event = await self._queue.get()
+            self._running += 1
+            try:
+                await self._run(callback, event)
+            finally:
+                self._running -= 1
+                self._queue.task_done()
+
+    async def _run(self, callback, raw_event):
+        name = getattr(callback, '__qualname__', repr(callback))
+        try:
+            event = raw_event.decode()
+        except Exception:
+            self.decode_errors += 1
+            self._log.exception('Could not decode "%s" for event callback %s' % (raw_event.js_name, name))
+            return
+        # callbacks need not be hashable, e.g. ``list.append``, held here so their id stays theirs
+        key = id(callback)
+        if key not in self._stats:
+            self._stats[key] = (callback, CallbackStats())
+        stats = self._stats[key][1]
+        start = time.perf_counter()
+        try:
+            # a root span, the request that caused the event is not known here
+            with tracing.start_span('callback %s' % event.js_name, **{'cdp.callback': name}):
+                result = callback(event)
+                if inspect.isawaitable(result):
+                    await result
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            stats.errors += 1
+            self._log.exception('Event callback %s failed on "%s"' % (name, event.js_name))
+        finally:
+            elapsed = time.perf_counter() - start
+            stats.calls += 1
+            stats.total_s += elapsed
+            stats.max_s = max(stats.max_s, elapsed)
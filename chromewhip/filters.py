@@ -0,0 +1,185 @@
+"""
+Declarative filters on events as received from Chrome.
+
+Filters are checked against an event's method and raw JSON params, so events
+that do not match are never decoded into their typed classes:
+
+    where = filters.Method('Network.responseReceived') & filters.Equals('response.url', url)
+    event = await tab.wait_for(where)
+
+Paths are dotted, list items are addressed by index, e.g. ``'response.headers.Location'``
+or ``'args.0.value'``. A path missing from the params never matches.
+"""
+import re
+
+_MISSING = object()
+
+
+def _split(path):
+    return tuple(int(part) if part.isdigit() else part for part in path.split('.'))
+
+
+def lookup(params, path, default=None):
+    """ Value at a dotted ``path`` of ``params``, or ``default``. """
+    value = _lookup(params, _split(path) if isinstance(path, str) else path)
+    return default if value is _MISSING else value
+
+
+def _lookup(params, parts):
+    value = params
+    for part in parts:
+        try:
+            value = value[part]
+        except (KeyError, IndexError, TypeError):
+            return _MISSING
+    return value
+
+
+class Filter:
+    """ A predicate on an event's method and raw params, combine them with ``&``, ``|`` and ``~``. """
+    __slots__ = ()
+
+    # event name every matching event has, if the filter implies one
+    method = None
+
+    def matches(self, method, params):
+        raise NotImplementedError
+
+    def __call__(self, event):
+        return self.matches(event.js_name, event.params)
+
+    def __and__(self, other):
+        return And(self, other)
+
+    def __or__(self, other):
+        return Or(self, other)
+
+    def __invert__(self):
+        return Not(self)
+
+
+class Method(Filter):
+    """ Events named ``method``, e.g. "Network.responseReceived". """
+    __slots__ = ('method',)
+
+    def __init__(self, method):
+        self.method = getattr(method, 'js_name', method)
+
+    def matches(self, method, params):
+        return method == self.method
+
+    def __repr__(self):
+        return 'Method(%r)' % self.method
+
+
+class _PathFilter(Filter):
+    __slots__ = ('path', '_parts')
+
+    def __init__(self, path):
+        self.path = path
+        self._parts = _split(path)
+
+    def matches(self, method, params):
+        value = _lookup(params, self._parts)
+        return value is not _MISSING and self.test(value)
+
+    def test(self, value):
+        raise NotImplementedError
+
+
+class Equals(_PathFilter):
+    """ Events with ``value`` at ``path``. """
+    __slots__ = ('value',)
+
+    def __init__(self, path, value):
+        super().__init__(path)
+        self.value = value
+
+    def test(self, value):
+        return value == self.value
+
+    def __repr__(self):
+        return 'Equals(%r, %r)' % (self.path, self.value)
+
+
+class Prefix(_PathFilter):
+    """ Events with a string starting with ``prefix`` at ``path``. """
+    __slots__ = ('prefix',)
+
+    def __init__(self, path, prefix):
+        super().__init__(path)
+        self.prefix = prefix
+
+    def test(self, value):
+        return isinstance(value, str) and value.startswith(self.prefix)
+
+    def __repr__(self):
+        return 'Prefix(%r, %r)' % (self.path, self.prefix)
+
+
+class Regex(_PathFilter):
+    """ Events with a string at ``path`` that ``pattern`` is found in, see `re.search`. """
+    __slots__ = ('pattern',)
+
+    def __init__(self, path, pattern):
+        super().__init__(path)
+        self.pattern = re.compile(pattern)
+
+    def test(self, value):
+        return isinstance(value, str) and self.pattern.search(value) is not None
+
+    def __repr__(self):
+        return 'Regex(%r, %r)' % (self.path, self.pattern.pattern)
+
+
+class And(Filter):
+    __slots__ = ('filters', 'method')
+
+    def __init__(self, *filters):
+        self.filters = filters
+        methods = {f.method for f in filters if f.method is not None}
+        self.method = methods.pop() if len(methods) == 1 else None
+
+    def matches(self, method, params):
+        return all(f.matches(method, params) for f in self.filters)
+
+    def __repr__(self):
+        return 'And(%s)' % ', '.join(map(repr, self.filters))
+
+
+class Or(Filter):
+    __slots__ = ('filters', 'method')
+
+    def __init__(self, *filters):
+        self.filters = filters
+        methods = {f.method for f in filters}
+        self.method = methods.pop() if len(methods) == 1 else None
+
+    def matches(self, method, params):
+        return any(f.matches(method, params) for f in self.filters)
+
+    def __repr__(self):
+        return 'Or(%s)' % ', '.join(map(repr, self.filters))
+
+
+class Not(Filter):
+    __slots__ = ('filter',)
+
+    def __init__(self, filter):
+        self.filter = filter
+
+    def matches(self, method, params):
+        return not self.filter.matches(method, params)
+
+    def __repr__(self):
+        return 'Not(%r)' % (self.filter,)
+
+
+def where(method, **fields):
+    """ Shorthand for events named ``method`` with the given top-level param values.
+
+    ``where('Page.frameStoppedLoading', frameId=frame_id)`` is
+    ``Method('Page.frameStoppedLoading') & Equals('frameId', frame_id)``.
+    """
+    filters = [Method(method)] + [Equals(name, value) for name, value in fields.items()]
+    return And(*filters) if len(filters) > 1 else filters[0]
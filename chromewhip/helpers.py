@@ -1,8 +1,8 @@
-import copy
+import inspect
 import json
 import logging
-import re
-import sys
+
+from chromewhip import protocol
 
 
 class PayloadMixin:
@@ -13,56 +13,26 @@ class PayloadMixin:
             "params": {k: v for k, v in params.items() if v is not None},
         }
 
-    @classmethod
-    def convert_payload(cls, types: dict):
-        def convert(result: dict):
-            """
-
-            :param result:
-            :return:
-            """
-            types_ = copy.copy(types)
-            for name, val in result.items():
-                try:
-                    expected_ = types_.pop(name)
-                    expected_type_ = expected_['class']
-                    many = False
-                    if isinstance(expected_type_, list):
-                        expected_type_ = expected_type_[0]
-                        many = True
-                except KeyError:
-                    raise KeyError('name %s not in expected payload of %s' % (name, types))
-                if issubclass(expected_type_, ChromeTypeBase):
-                    if many:
-                        result[name] = [expected_type_(**v) for v in val]
-                    else:
-                        result[name] = expected_type_(**val)
-                elif re.match(r'.*Id$', name) and isinstance(val, str):
-                    if many:
-                        result[name] = [expected_type_(v) for v in val]
-                    else:
-                        result[name] = expected_type_(val)
-                elif not isinstance(val, expected_type_):
-                    raise ValueError('%s is not expected type %s, instead is %s' % (val, expected_type_, val))
-            for rn, rv in types_.items():
-                if not rv.get('optional', False):
-                    raise ValueError('expected payload param "%s" is missing!' % rn)
-            return result
-
-        return convert
-
 
 log = logging.getLogger(__name__)
 
+# "Domain.event" -> event class, filled in as protocol modules are imported
+EVENT_CLASSES = {}
+
 
 class BaseEvent:
     js_name = 'chromewhipBaseEvent'
     hashable = []
     is_hashable = False
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        EVENT_CLASSES[cls.js_name] = cls
 
     def hash_(self):
         hashable_params = {}
-        for k, v in self.__dict__.items():
+        for k, v in self.to_dict().items():
             if k in self.hashable:
                 hashable_params[k] = v
             else:
@@ -78,44 +48,145 @@ class BaseEvent:
         log.debug('generated hash = %s' % h)
         return h
 
+    def to_dict(self):
+        return {k: getattr(self, k) for k in self.__slots__}
+
+    def key_params(self):
+        """ Values of the hashable params of this event, keyed on param name. """
+        params = {}
+        for name in self.hashable:
+            try:
+                params[name] = getattr(self, name)
+            except AttributeError:
+                # ids of nested types, e.g. `frameId` for a `frame` param
+                params[name] = getattr(getattr(self, name[:-2], None), 'id', None)
+        return params
+
+    def key_(self):
+        """ Structured counterpart of `hash_`, cheap to build and compare. """
+        return self.build_key(**self.key_params())
 
-# TODO: how do
-def json_to_event(payload) -> BaseEvent:
+    @classmethod
+    def build_key(cls, **params):
+        try:
+            return (cls.js_name,) + tuple(str(params[name]) for name in cls.hashable)
+        except KeyError as e:
+            raise TypeError('%s key cannot be built without param %s' % (cls.__name__, e))
+
+
+def event_class(method):
+    """ Look up the event class for a "Domain.event" method name, importing its protocol module if needed. """
     try:
-        prot_name, js_event = payload['method'].split('.')
+        return EVENT_CLASSES[method]
     except KeyError:
-        log.error('invalid event JSON, must have a "method" key')
-        return None
+        pass
+    try:
+        prot_name, js_event = method.split('.')
     except ValueError:
-        log.error('invalid method name "%s", must contain a module and event joined with a "."' % payload['method'])
+        log.error('invalid method name "%s", must contain a module and event joined with a "."' % method)
         return None
     module_name = 'chromewhip.protocol.%s' % prot_name.lower()
     try:
-        prot_module = sys.modules[module_name]
-    except KeyError:
-        msg = '"%s" is not available in sys.modules!' % module_name
+        protocol.load(prot_name.lower())
+    except ImportError:
+        msg = '"%s" is not a protocol module!' % module_name
         log.error(msg)
         raise KeyError(msg)
-    py_event_name = '{}{}Event'.format(js_event[0].upper(), js_event[1:])
-    event_cls = getattr(prot_module, py_event_name)
     try:
-        result = event_cls(**payload['params'])
-    except TypeError as e:
+        return EVENT_CLASSES[method]
+    except KeyError:
+        raise AttributeError('"%s" has no event "%s"' % (module_name, js_event))
+
+
+def json_to_event(payload) -> BaseEvent:
+    try:
+        method = payload['method']
+    except KeyError:
+        log.error('invalid event JSON, must have a "method" key')
+        return None
+    event_cls = event_class(method)
+    if event_cls is None:
+        return None
+    try:
+        result = event_cls.from_json(payload.get('params', {}))
+    except (TypeError, KeyError) as e:
         raise TypeError('%s unable to deserialise: %s' % (event_cls.__name__, e))
     return result
 
 
+class RawEvent:
+    """ An event as received from Chrome, decoded into its typed class on first use.
+
+    Key lookups work on the raw params, so events nobody consumes are never decoded.
+    """
+    __slots__ = ('js_name', 'params', '_event')
+
+    def __init__(self, method, params):
+        self.js_name = method
+        self.params = params
+        self._event = None
+
+    @property
+    def hashable(self):
+        event_cls = EVENT_CLASSES.get(self.js_name)
+        if event_cls is None:
+            # first event of a domain nobody has touched yet, load it lazily
+            try:
+                event_cls = event_class(self.js_name)
+            except (KeyError, AttributeError):
+                return []
+        return event_cls.hashable if event_cls else []
+
+    def decode(self) -> BaseEvent:
+        if self._event is None:
+            self._event = json_to_event({'method': self.js_name, 'params': self.params})
+        return self._event
+
+    def key_params(self):
+        params = {}
+        for name in self.hashable:
+            try:
+                params[name] = self.params[name]
+            except KeyError:
+                # ids of nested types, e.g. `frameId` for a `frame` param
+                nested = self.params.get(name[:-2])
+                params[name] = nested.get('id') if isinstance(nested, dict) else None
+        return params
+
+    def key_(self):
+        return (self.js_name,) + tuple(str(v) for v in self.key_params().values())
+
+    def __repr__(self):
+        return 'RawEvent(%r, %r)' % (self.js_name, self.params)
+
+
+def init_known_fields(cls, d):
+    """ Build ``cls`` from ``d``, ignoring fields unknown to this version of the protocol. """
+    params = inspect.signature(cls).parameters
+    return cls(**{k: v for k, v in d.items() if k in params})
+
+
+def _to_json_value(value):
+    if isinstance(value, ChromeTypeBase):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_to_json_value(v) for v in value]
+    return value
+
+
 class ChromeTypeBase:
+    __slots__ = ()
+
     def to_dict(self):
-        return self.__dict__
+        return {k: _to_json_value(getattr(self, k)) for k in self.__slots__}
 
 
 class ChromewhipJSONEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, BaseEvent):
-            return {'method': obj.js_name, 'params': obj.__dict__}
+            return {'method': obj.js_name, 'params': obj.to_dict()}
 
         if isinstance(obj, ChromeTypeBase):
-            return obj.__dict__
+            return {k: getattr(obj, k) for k in obj.__slots__}
 
         return json.JSONEncoder.default(self, obj)
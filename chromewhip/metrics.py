@@ -0,0 +1,170 @@
+"""
+In-process metrics, exposed in the Prometheus text format.
+
+Metrics are registered once on a `Registry`, usually the module level `REGISTRY`,
+and updated from the hot path with a dict lookup and a couple of additions:
+
+    ACK_SECONDS = metrics.REGISTRY.histogram('chromewhip_command_ack_seconds', 'Ack latency', ('method',))
+    ACK_SECONDS.labels('Page.navigate').observe(0.12)
+
+`Registry.render` serializes every metric for a scrape.
+"""
+import bisect
+import math
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0)
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _escape(value):
+    return str(value).replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"')
+
+
+def _format_labels(names, values, extra=''):
+    pairs = ['%s="%s"' % (name, _escape(value)) for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{%s}' % ','.join(pairs) if pairs else ''
+
+
+def _format_value(value):
+    return '+Inf' if value == math.inf else str(value)
+
+
+class _Metric:
+    type = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+
+    def labels(self, *values):
+        """ The child metric for one combination of label values, created on first use. """
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError('%s expects labels %s, got %s' % (self.name, self.labelnames, values))
+            child = self._children[values] = self._new_child()
+        return child
+
+    def remove(self, *values):
+        self._children.pop(values, None)
+
+    def clear(self):
+        self._children.clear()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def samples(self):
+        """ (name suffix, label values, extra label, value) of every child. """
+        raise NotImplementedError
+
+    def render(self):
+        lines = ['# HELP %s %s' % (self.name, self.documentation.replace('\n', ' ')),
+                 '# TYPE %s %s' % (self.name, self.type)]
+        for suffix, values, extra, value in self.samples():
+            lines.append('%s%s%s %s' % (self.name, suffix, _format_labels(self.labelnames, values, extra),
+                                        _format_value(value)))
+        return '\n'.join(lines)
+
+
+class _Value:
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+    def dec(self, amount=1):
+        self.value -= amount
+
+    def set(self, value):
+        self.value = value
+
+
+class Counter(_Metric):
+    type = 'counter'
+
+    def _new_child(self):
+        return _Value()
+
+    def samples(self):
+        for values, child in list(self._children.items()):
+            yield '', values, '', child.value
+
+
+class Gauge(Counter):
+    type = 'gauge'
+
+
+class _HistogramValue:
+    __slots__ = ('bounds', 'counts', 'sum')
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        # the last count is the +Inf bucket
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+
+class Histogram(_Metric):
+    type = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def samples(self):
+        for values, child in list(self._children.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), child.counts):
+                cumulative += count
+                yield '_bucket', values, 'le="%s"' % _format_value(float(bound)), cumulative
+            yield '_sum', values, '', child.sum
+            yield '_count', values, '', cumulative
+
+
+class Registry:
+    """ Metrics rendered together for a scrape, by name. """
+    def __init__(self):
+        self._metrics = {}
+
+    def __contains__(self, name):
+        return name in self._metrics
+
+    def get(self, name):
+        return self._metrics.get(name)
+
+    def register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError('Metric "%s" is already registered' % metric.name)
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self):
+        """ Every metric in the Prometheus text exposition format. """
+        return ''.join(metric.render() + '\n' for metric in self._metrics.values())
+
+
+REGISTRY = Registry()
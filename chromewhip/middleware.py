@@ -4,15 +4,21 @@ import pprint
 
 from aiohttp import web
 
+from chromewhip import tracing
 from chromewhip.chrome import ChromewhipException
+from chromewhip.timing import ServerTiming
 
 
-def json_error(message):
+def json_error(message, frames=None):
     # return web.Response(
     #     body=json.dumps({'error': message}).encode('utf-8'),
     #     content_type='application/json')
     # return web.Response(text=pprint.pformat({'error': message}))
-    return web.Response(text=json.dumps({'error': message}, indent=4))
+    error = {'error': message}
+    if frames:
+        # devtools frames leading up to a timeout or protocol error, see `chromewhip.recorder`
+        error['frames'] = frames
+    return web.Response(text=json.dumps(error, indent=4))
 
 async def error_middleware(app, handler):
     async def middleware_handler(request):
@@ -24,8 +30,38 @@ async def error_middleware(app, handler):
         except web.HTTPException as ex:
             return json_error(ex.reason)
         except ChromewhipException as ex:
-            return json_error(ex.args[0])
+            # frames are those of every client sharing the tab, the session has logged them already
+            frames = getattr(ex, 'flight_record', None) if app.get('expose-flight-records') else None
+            return json_error(ex.args[0], frames)
         except Exception as ex:
             verbose_tb = traceback.format_exc()
             return json_error(verbose_tb)
     return middleware_handler
+
+
+async def server_timing_middleware(app, handler):
+    async def middleware_handler(request):
+        timings = request['timings'] = ServerTiming()
+        response = await handler(request)
+        # streamed responses have sent their headers already
+        if not response.prepared:
+            response.headers['Server-Timing'] = timings.header()
+        return response
+    return middleware_handler
+
+
+async def tracing_middleware(app, handler):
+    async def middleware_handler(request):
+        # continues the trace of a caller sending a W3C `traceparent` header
+        parent = tracing.parse_traceparent(request.headers.get('traceparent'))
+        attributes = {'http.method': request.method, 'http.target': request.path_qs}
+        with tracing.start_span('%s %s' % (request.method, request.path), kind=tracing.KIND_SERVER,
+                                parent=parent, **attributes) as span:
+            response = await handler(request)
+            span.set_attribute('http.status_code', response.status)
+            return response
+    return middleware_handler
+
+
+# outermost first, so error responses get a Server-Timing header too
+MIDDLEWARES = [server_timing_middleware, error_middleware, tracing_middleware]
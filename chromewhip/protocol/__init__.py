@@ -0,0 +1,80 @@
+"""
+Generated Chrome devtools protocol domains, loaded lazily.
+
+``from chromewhip.protocol import page`` hands back a placeholder module that
+is only executed when one of its attributes is first used, so importing
+chromewhip does not pay for the domains a worker never talks to. Generated
+modules import their dependencies the same way, which keeps one domain from
+dragging in the rest.
+"""
+import importlib
+import importlib.util
+import sys
+import types
+
+# module name -> domain class name, mirrors the domains in data/*_protocol.json
+DOMAINS = {
+    name.lower(): name for name in (
+        'Accessibility', 'Animation', 'ApplicationCache', 'Audits', 'Browser', 'CSS', 'CacheStorage',
+        'Console', 'DOM', 'DOMDebugger', 'DOMSnapshot', 'DOMStorage', 'Database', 'Debugger',
+        'DeviceOrientation', 'Emulation', 'HeadlessExperimental', 'HeapProfiler', 'IO', 'IndexedDB',
+        'Input', 'Inspector', 'LayerTree', 'Log', 'Memory', 'Network', 'Overlay', 'Page', 'Performance',
+        'Profiler', 'Runtime', 'Schema', 'Security', 'ServiceWorker', 'Storage', 'SystemInfo', 'Target',
+        'Tethering', 'Tracing',
+    )
+}
+
+
+def lazy_import(name):
+    """ Return the protocol module ``name``, deferring its execution until first attribute access. """
+    fullname = '%s.%s' % (__name__, name)
+    try:
+        return sys.modules[fullname]
+    except KeyError:
+        pass
+    spec = importlib.util.find_spec(fullname)
+    if spec is None:
+        raise ImportError('"%s" is not a protocol module!' % fullname, name=fullname)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[fullname] = module
+    loader.exec_module(module)
+    globals()[name] = module
+    return module
+
+
+def load(name):
+    """ Return the protocol module ``name``, fully executed. """
+    module = importlib.import_module('%s.%s' % (__name__, name))
+    # any attribute access finishes a lazy import
+    module.__dict__
+    return module
+
+
+def domain(name):
+    """ Return the domain class for a module name, e.g. ``domain('dom')`` is ``dom.DOM``. """
+    try:
+        class_name = DOMAINS[name.lower()]
+    except KeyError:
+        raise ValueError('Unknown protocol domain "%s", must be one of %s' % (name, ', '.join(sorted(DOMAINS))))
+    return getattr(load(class_name.lower()), class_name)
+
+
+def loaded():
+    """ Names of the protocol modules that have actually been executed. """
+    prefix = __name__ + '.'
+    return sorted(
+        fullname[len(prefix):] for fullname, module in list(sys.modules.items())
+        if fullname.startswith(prefix) and type(module) is types.ModuleType
+    )
+
+
+def __getattr__(name):
+    # PEP 562, makes `from chromewhip.protocol import x` lazy for submodules
+    if name.startswith('__'):
+        raise AttributeError(name)
+    try:
+        return lazy_import(name)
+    except ImportError:
+        raise AttributeError('module "%s" has no attribute "%s"' % (__name__, name))
@@ -7,11 +7,13 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
+
 from chromewhip.protocol import dom as DOM
 
 # AXNodeId: Unique accessibility node identifier.
@@ -28,6 +30,8 @@ AXValueNativeSourceType = str
 
 # AXValueSource: A single source for a computed AX property.
 class AXValueSource(ChromeTypeBase):
+    __slots__ = ('type', 'value', 'attribute', 'attributeValue', 'superseded', 'nativeSource', 'nativeSourceValue', 'invalid', 'invalidReason')
+
     def __init__(self,
                  type: Union['AXValueSourceType'],
                  value: Optional['AXValue'] = None,
@@ -50,9 +54,25 @@ class AXValueSource(ChromeTypeBase):
         self.invalid = invalid
         self.invalidReason = invalidReason
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.value is not None:
+            obj.value = AXValue.from_json(obj.value)
+        if obj.attributeValue is not None:
+            obj.attributeValue = AXValue.from_json(obj.attributeValue)
+        if obj.nativeSourceValue is not None:
+            obj.nativeSourceValue = AXValue.from_json(obj.nativeSourceValue)
+        return obj
+
 
 # AXRelatedNode: 
 class AXRelatedNode(ChromeTypeBase):
+    __slots__ = ('backendDOMNodeId', 'idref', 'text')
+
     def __init__(self,
                  backendDOMNodeId: Union['DOM.BackendNodeId'],
                  idref: Optional['str'] = None,
@@ -63,9 +83,19 @@ class AXRelatedNode(ChromeTypeBase):
         self.idref = idref
         self.text = text
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # AXProperty: 
 class AXProperty(ChromeTypeBase):
+    __slots__ = ('name', 'value')
+
     def __init__(self,
                  name: Union['AXPropertyName'],
                  value: Union['AXValue'],
@@ -74,9 +104,20 @@ class AXProperty(ChromeTypeBase):
         self.name = name
         self.value = value
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.value = AXValue.from_json(obj.value)
+        return obj
+
 
 # AXValue: A single computed AX property.
 class AXValue(ChromeTypeBase):
+    __slots__ = ('type', 'value', 'relatedNodes', 'sources')
+
     def __init__(self,
                  type: Union['AXValueType'],
                  value: Optional['Any'] = None,
@@ -89,12 +130,26 @@ class AXValue(ChromeTypeBase):
         self.relatedNodes = relatedNodes
         self.sources = sources
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.relatedNodes is not None:
+            obj.relatedNodes = [AXRelatedNode.from_json(i0) for i0 in obj.relatedNodes]
+        if obj.sources is not None:
+            obj.sources = [AXValueSource.from_json(i0) for i0 in obj.sources]
+        return obj
+
 
 # AXPropertyName: Values of AXProperty name: from 'busy' to 'roledescription' - states which apply to every AXnode, from 'live' to 'root' - attributes which apply to nodes in live regions, from'autocomplete' to 'valuetext' - attributes which apply to widgets, from 'checked' to 'selected'- states which apply to widgets, from 'activedescendant' to 'owns' - relationships betweenelements other than parent/child/sibling.
 AXPropertyName = str
 
 # AXNode: A node in the accessibility tree.
 class AXNode(ChromeTypeBase):
+    __slots__ = ('nodeId', 'ignored', 'ignoredReasons', 'role', 'name', 'description', 'value', 'properties', 'childIds', 'backendDOMNodeId')
+
     def __init__(self,
                  nodeId: Union['AXNodeId'],
                  ignored: Union['bool'],
@@ -119,6 +174,29 @@ class AXNode(ChromeTypeBase):
         self.childIds = childIds
         self.backendDOMNodeId = backendDOMNodeId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.nodeId = intern(obj.nodeId)
+        if obj.ignoredReasons is not None:
+            obj.ignoredReasons = [AXProperty.from_json(i0) for i0 in obj.ignoredReasons]
+        if obj.role is not None:
+            obj.role = AXValue.from_json(obj.role)
+        if obj.name is not None:
+            obj.name = AXValue.from_json(obj.name)
+        if obj.description is not None:
+            obj.description = AXValue.from_json(obj.description)
+        if obj.value is not None:
+            obj.value = AXValue.from_json(obj.value)
+        if obj.properties is not None:
+            obj.properties = [AXProperty.from_json(i0) for i0 in obj.properties]
+        if obj.childIds is not None:
+            obj.childIds = [intern(i0) for i0 in obj.childIds]
+        return obj
+
 
 class Accessibility(PayloadMixin):
     """ 
@@ -147,11 +225,11 @@ class Accessibility(PayloadMixin):
                 "objectId": objectId,
                 "fetchRelatives": fetchRelatives,
             }),
-            cls.convert_payload({
-                "nodes": {
-                    "class": [AXNode],
-                    "optional": False
-                },
-            })
+            _decode_getPartialAXTree
         )
 
+
+
+def _decode_getPartialAXTree(result):
+    result['nodes'] = [AXNode.from_json(i0) for i0 in result['nodes']]
+    return result
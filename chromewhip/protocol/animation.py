@@ -7,16 +7,20 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
+
 from chromewhip.protocol import runtime as Runtime
 from chromewhip.protocol import dom as DOM
 
 # Animation: Animation instance.
 class Animation(ChromeTypeBase):
+    __slots__ = ('id', 'name', 'pausedState', 'playState', 'playbackRate', 'startTime', 'currentTime', 'type', 'source', 'cssId')
+
     def __init__(self,
                  id: Union['str'],
                  name: Union['str'],
@@ -41,9 +45,21 @@ class Animation(ChromeTypeBase):
         self.source = source
         self.cssId = cssId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.source is not None:
+            obj.source = AnimationEffect.from_json(obj.source)
+        return obj
+
 
 # AnimationEffect: AnimationEffect instance
 class AnimationEffect(ChromeTypeBase):
+    __slots__ = ('delay', 'endDelay', 'iterationStart', 'iterations', 'duration', 'direction', 'fill', 'backendNodeId', 'keyframesRule', 'easing')
+
     def __init__(self,
                  delay: Union['float'],
                  endDelay: Union['float'],
@@ -68,9 +84,21 @@ class AnimationEffect(ChromeTypeBase):
         self.keyframesRule = keyframesRule
         self.easing = easing
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.keyframesRule is not None:
+            obj.keyframesRule = KeyframesRule.from_json(obj.keyframesRule)
+        return obj
+
 
 # KeyframesRule: Keyframes Rule
 class KeyframesRule(ChromeTypeBase):
+    __slots__ = ('name', 'keyframes')
+
     def __init__(self,
                  keyframes: Union['[KeyframeStyle]'],
                  name: Optional['str'] = None,
@@ -79,9 +107,20 @@ class KeyframesRule(ChromeTypeBase):
         self.name = name
         self.keyframes = keyframes
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.keyframes = [KeyframeStyle.from_json(i0) for i0 in obj.keyframes]
+        return obj
+
 
 # KeyframeStyle: Keyframe Style
 class KeyframeStyle(ChromeTypeBase):
+    __slots__ = ('offset', 'easing')
+
     def __init__(self,
                  offset: Union['str'],
                  easing: Union['str'],
@@ -90,6 +129,14 @@ class KeyframeStyle(ChromeTypeBase):
         self.offset = offset
         self.easing = easing
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 class Animation(PayloadMixin):
     """ 
@@ -126,12 +173,7 @@ class Animation(PayloadMixin):
             cls.build_send_payload("getCurrentTime", {
                 "id": id,
             }),
-            cls.convert_payload({
-                "currentTime": {
-                    "class": float,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -141,12 +183,7 @@ class Animation(PayloadMixin):
         return (
             cls.build_send_payload("getPlaybackRate", {
             }),
-            cls.convert_payload({
-                "playbackRate": {
-                    "class": float,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -176,12 +213,7 @@ class Animation(PayloadMixin):
             cls.build_send_payload("resolveAnimation", {
                 "animationId": animationId,
             }),
-            cls.convert_payload({
-                "remoteObject": {
-                    "class": Runtime.RemoteObject,
-                    "optional": False
-                },
-            })
+            _decode_resolveAnimation
         )
 
     @classmethod
@@ -262,19 +294,31 @@ class Animation(PayloadMixin):
 
 
 
+def _decode_resolveAnimation(result):
+    result['remoteObject'] = Runtime.RemoteObject.from_json(result['remoteObject'])
+    return result
+
+
 class AnimationCanceledEvent(BaseEvent):
 
     js_name = 'Animation.animationCanceled'
     hashable = ['id']
     is_hashable = True
+    __slots__ = ('id',)
 
     def __init__(self,
                  id: Union['str', dict],
                  ):
-        if isinstance(id, dict):
-            id = str(**id)
         self.id = id
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, id):
         kwargs = locals()
@@ -290,14 +334,21 @@ class AnimationCreatedEvent(BaseEvent):
     js_name = 'Animation.animationCreated'
     hashable = ['id']
     is_hashable = True
+    __slots__ = ('id',)
 
     def __init__(self,
                  id: Union['str', dict],
                  ):
-        if isinstance(id, dict):
-            id = str(**id)
         self.id = id
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, id):
         kwargs = locals()
@@ -313,14 +364,23 @@ class AnimationStartedEvent(BaseEvent):
     js_name = 'Animation.animationStarted'
     hashable = ['animationId']
     is_hashable = True
+    __slots__ = ('animation',)
 
     def __init__(self,
                  animation: Union['Animation', dict],
                  ):
         if isinstance(animation, dict):
-            animation = Animation(**animation)
+            animation = Animation.from_json(animation)
         self.animation = animation
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, animationId):
         kwargs = locals()
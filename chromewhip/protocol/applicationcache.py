@@ -7,14 +7,18 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
 
+
 # ApplicationCacheResource: Detailed application cache resource information.
 class ApplicationCacheResource(ChromeTypeBase):
+    __slots__ = ('url', 'size', 'type')
+
     def __init__(self,
                  url: Union['str'],
                  size: Union['int'],
@@ -25,9 +29,19 @@ class ApplicationCacheResource(ChromeTypeBase):
         self.size = size
         self.type = type
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # ApplicationCache: Detailed application cache information.
 class ApplicationCache(ChromeTypeBase):
+    __slots__ = ('manifestURL', 'size', 'creationTime', 'updateTime', 'resources')
+
     def __init__(self,
                  manifestURL: Union['str'],
                  size: Union['float'],
@@ -42,9 +56,20 @@ class ApplicationCache(ChromeTypeBase):
         self.updateTime = updateTime
         self.resources = resources
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.resources = [ApplicationCacheResource.from_json(i0) for i0 in obj.resources]
+        return obj
+
 
 # FrameWithManifest: Frame identifier - manifest URL pair.
 class FrameWithManifest(ChromeTypeBase):
+    __slots__ = ('frameId', 'manifestURL', 'status')
+
     def __init__(self,
                  frameId: Union['Page.FrameId'],
                  manifestURL: Union['str'],
@@ -55,6 +80,15 @@ class FrameWithManifest(ChromeTypeBase):
         self.manifestURL = manifestURL
         self.status = status
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.frameId = intern(obj.frameId)
+        return obj
+
 
 class ApplicationCache(PayloadMixin):
     """ 
@@ -81,12 +115,7 @@ class ApplicationCache(PayloadMixin):
             cls.build_send_payload("getApplicationCacheForFrame", {
                 "frameId": frameId,
             }),
-            cls.convert_payload({
-                "applicationCache": {
-                    "class": ApplicationCache,
-                    "optional": False
-                },
-            })
+            _decode_getApplicationCacheForFrame
         )
 
     @classmethod
@@ -97,12 +126,7 @@ associated with some application cache.
         return (
             cls.build_send_payload("getFramesWithManifests", {
             }),
-            cls.convert_payload({
-                "frameIds": {
-                    "class": [FrameWithManifest],
-                    "optional": False
-                },
-            })
+            _decode_getFramesWithManifests
         )
 
     @classmethod
@@ -117,37 +141,46 @@ associated with some application cache.
             cls.build_send_payload("getManifestForFrame", {
                 "frameId": frameId,
             }),
-            cls.convert_payload({
-                "manifestURL": {
-                    "class": str,
-                    "optional": False
-                },
-            })
+            None
         )
 
 
 
+def _decode_getApplicationCacheForFrame(result):
+    result['applicationCache'] = ApplicationCache.from_json(result['applicationCache'])
+    return result
+
+
+def _decode_getFramesWithManifests(result):
+    result['frameIds'] = [FrameWithManifest.from_json(i0) for i0 in result['frameIds']]
+    return result
+
+
 class ApplicationCacheStatusUpdatedEvent(BaseEvent):
 
-    js_name = 'Applicationcache.applicationCacheStatusUpdated'
+    js_name = 'ApplicationCache.applicationCacheStatusUpdated'
     hashable = ['frameId']
     is_hashable = True
+    __slots__ = ('frameId', 'manifestURL', 'status')
 
     def __init__(self,
                  frameId: Union['Page.FrameId', dict],
                  manifestURL: Union['str', dict],
                  status: Union['int', dict],
                  ):
-        if isinstance(frameId, dict):
-            frameId = Page.FrameId(**frameId)
         self.frameId = frameId
-        if isinstance(manifestURL, dict):
-            manifestURL = str(**manifestURL)
         self.manifestURL = manifestURL
-        if isinstance(status, dict):
-            status = int(**status)
         self.status = status
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.frameId = intern(obj.frameId)
+        return obj
+
     @classmethod
     def build_hash(cls, frameId):
         kwargs = locals()
@@ -160,17 +193,24 @@ class ApplicationCacheStatusUpdatedEvent(BaseEvent):
 
 class NetworkStateUpdatedEvent(BaseEvent):
 
-    js_name = 'Applicationcache.networkStateUpdated'
+    js_name = 'ApplicationCache.networkStateUpdated'
     hashable = []
     is_hashable = False
+    __slots__ = ('isNowOnline',)
 
     def __init__(self,
                  isNowOnline: Union['bool', dict],
                  ):
-        if isinstance(isNowOnline, dict):
-            isNowOnline = bool(**isNowOnline)
         self.isNowOnline = isNowOnline
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -7,11 +7,13 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
+
 from chromewhip.protocol import network as Network
 
 class Audits(PayloadMixin):
@@ -42,19 +44,6 @@ applies to images.
                 "quality": quality,
                 "sizeOnly": sizeOnly,
             }),
-            cls.convert_payload({
-                "body": {
-                    "class": str,
-                    "optional": True
-                },
-                "originalSize": {
-                    "class": int,
-                    "optional": False
-                },
-                "encodedSize": {
-                    "class": int,
-                    "optional": False
-                },
-            })
+            None
         )
 
@@ -7,12 +7,14 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
 
+
 # WindowID: 
 WindowID = int
 
@@ -21,6 +23,8 @@ WindowState = str
 
 # Bounds: Browser window bounds information
 class Bounds(ChromeTypeBase):
+    __slots__ = ('left', 'top', 'width', 'height', 'windowState')
+
     def __init__(self,
                  left: Optional['int'] = None,
                  top: Optional['int'] = None,
@@ -35,9 +39,19 @@ class Bounds(ChromeTypeBase):
         self.height = height
         self.windowState = windowState
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # Bucket: Chrome histogram bucket.
 class Bucket(ChromeTypeBase):
+    __slots__ = ('low', 'high', 'count')
+
     def __init__(self,
                  low: Union['int'],
                  high: Union['int'],
@@ -48,9 +62,19 @@ class Bucket(ChromeTypeBase):
         self.high = high
         self.count = count
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # Histogram: Chrome histogram.
 class Histogram(ChromeTypeBase):
+    __slots__ = ('name', 'sum', 'count', 'buckets')
+
     def __init__(self,
                  name: Union['str'],
                  sum: Union['int'],
@@ -63,6 +87,15 @@ class Histogram(ChromeTypeBase):
         self.count = count
         self.buckets = buckets
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.buckets = [Bucket.from_json(i0) for i0 in obj.buckets]
+        return obj
+
 
 class Browser(PayloadMixin):
     """ The Browser domain defines methods and events for browser managing.
@@ -84,28 +117,7 @@ class Browser(PayloadMixin):
         return (
             cls.build_send_payload("getVersion", {
             }),
-            cls.convert_payload({
-                "protocolVersion": {
-                    "class": str,
-                    "optional": False
-                },
-                "product": {
-                    "class": str,
-                    "optional": False
-                },
-                "revision": {
-                    "class": str,
-                    "optional": False
-                },
-                "userAgent": {
-                    "class": str,
-                    "optional": False
-                },
-                "jsVersion": {
-                    "class": str,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -116,12 +128,7 @@ class Browser(PayloadMixin):
         return (
             cls.build_send_payload("getBrowserCommandLine", {
             }),
-            cls.convert_payload({
-                "arguments": {
-                    "class": [],
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -142,12 +149,7 @@ all histograms.
                 "query": query,
                 "delta": delta,
             }),
-            cls.convert_payload({
-                "histograms": {
-                    "class": [Histogram],
-                    "optional": False
-                },
-            })
+            _decode_getHistograms
         )
 
     @classmethod
@@ -166,12 +168,7 @@ all histograms.
                 "name": name,
                 "delta": delta,
             }),
-            cls.convert_payload({
-                "histogram": {
-                    "class": Histogram,
-                    "optional": False
-                },
-            })
+            _decode_getHistogram
         )
 
     @classmethod
@@ -186,12 +183,7 @@ all histograms.
             cls.build_send_payload("getWindowBounds", {
                 "windowId": windowId,
             }),
-            cls.convert_payload({
-                "bounds": {
-                    "class": Bounds,
-                    "optional": False
-                },
-            })
+            _decode_getWindowBounds
         )
 
     @classmethod
@@ -206,16 +198,7 @@ all histograms.
             cls.build_send_payload("getWindowForTarget", {
                 "targetId": targetId,
             }),
-            cls.convert_payload({
-                "windowId": {
-                    "class": WindowID,
-                    "optional": False
-                },
-                "bounds": {
-                    "class": Bounds,
-                    "optional": False
-                },
-            })
+            _decode_getWindowForTarget
         )
 
     @classmethod
@@ -238,3 +221,23 @@ with 'left', 'top', 'width' or 'height'. Leaves unspecified fields unchanged.
             None
         )
 
+
+
+def _decode_getHistograms(result):
+    result['histograms'] = [Histogram.from_json(i0) for i0 in result['histograms']]
+    return result
+
+
+def _decode_getHistogram(result):
+    result['histogram'] = Histogram.from_json(result['histogram'])
+    return result
+
+
+def _decode_getWindowBounds(result):
+    result['bounds'] = Bounds.from_json(result['bounds'])
+    return result
+
+
+def _decode_getWindowForTarget(result):
+    result['bounds'] = Bounds.from_json(result['bounds'])
+    return result
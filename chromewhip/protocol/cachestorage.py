@@ -7,17 +7,21 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
 
+
 # CacheId: Unique identifier of the Cache object.
 CacheId = str
 
 # DataEntry: Data entry.
 class DataEntry(ChromeTypeBase):
+    __slots__ = ('requestURL', 'requestMethod', 'requestHeaders', 'responseTime', 'responseStatus', 'responseStatusText', 'responseHeaders')
+
     def __init__(self,
                  requestURL: Union['str'],
                  requestMethod: Union['str'],
@@ -36,9 +40,21 @@ class DataEntry(ChromeTypeBase):
         self.responseStatusText = responseStatusText
         self.responseHeaders = responseHeaders
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.requestHeaders = [Header.from_json(i0) for i0 in obj.requestHeaders]
+        obj.responseHeaders = [Header.from_json(i0) for i0 in obj.responseHeaders]
+        return obj
+
 
 # Cache: Cache identifier.
 class Cache(ChromeTypeBase):
+    __slots__ = ('cacheId', 'securityOrigin', 'cacheName')
+
     def __init__(self,
                  cacheId: Union['CacheId'],
                  securityOrigin: Union['str'],
@@ -49,9 +65,20 @@ class Cache(ChromeTypeBase):
         self.securityOrigin = securityOrigin
         self.cacheName = cacheName
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.cacheId = intern(obj.cacheId)
+        return obj
+
 
 # Header: 
 class Header(ChromeTypeBase):
+    __slots__ = ('name', 'value')
+
     def __init__(self,
                  name: Union['str'],
                  value: Union['str'],
@@ -60,15 +87,33 @@ class Header(ChromeTypeBase):
         self.name = name
         self.value = value
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # CachedResponse: Cached response
 class CachedResponse(ChromeTypeBase):
+    __slots__ = ('body',)
+
     def __init__(self,
                  body: Union['str'],
                  ):
 
         self.body = body
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 class CacheStorage(PayloadMixin):
     """ 
@@ -119,12 +164,7 @@ class CacheStorage(PayloadMixin):
             cls.build_send_payload("requestCacheNames", {
                 "securityOrigin": securityOrigin,
             }),
-            cls.convert_payload({
-                "caches": {
-                    "class": [Cache],
-                    "optional": False
-                },
-            })
+            _decode_requestCacheNames
         )
 
     @classmethod
@@ -143,12 +183,7 @@ class CacheStorage(PayloadMixin):
                 "cacheId": cacheId,
                 "requestURL": requestURL,
             }),
-            cls.convert_payload({
-                "response": {
-                    "class": CachedResponse,
-                    "optional": False
-                },
-            })
+            _decode_requestCachedResponse
         )
 
     @classmethod
@@ -171,15 +206,21 @@ class CacheStorage(PayloadMixin):
                 "skipCount": skipCount,
                 "pageSize": pageSize,
             }),
-            cls.convert_payload({
-                "cacheDataEntries": {
-                    "class": [DataEntry],
-                    "optional": False
-                },
-                "hasMore": {
-                    "class": bool,
-                    "optional": False
-                },
-            })
+            _decode_requestEntries
         )
 
+
+
+def _decode_requestCacheNames(result):
+    result['caches'] = [Cache.from_json(i0) for i0 in result['caches']]
+    return result
+
+
+def _decode_requestCachedResponse(result):
+    result['response'] = CachedResponse.from_json(result['response'])
+    return result
+
+
+def _decode_requestEntries(result):
+    result['cacheDataEntries'] = [DataEntry.from_json(i0) for i0 in result['cacheDataEntries']]
+    return result
@@ -7,15 +7,19 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
+
 from chromewhip.protocol import runtime as Runtime
 
 # ConsoleMessage: Console message.
 class ConsoleMessage(ChromeTypeBase):
+    __slots__ = ('source', 'level', 'text', 'url', 'line', 'column')
+
     def __init__(self,
                  source: Union['str'],
                  level: Union['str'],
@@ -32,6 +36,14 @@ class ConsoleMessage(ChromeTypeBase):
         self.line = line
         self.column = column
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 class Console(PayloadMixin):
     """ This domain is deprecated - use Runtime or Log instead.
@@ -74,14 +86,23 @@ class MessageAddedEvent(BaseEvent):
     js_name = 'Console.messageAdded'
     hashable = []
     is_hashable = False
+    __slots__ = ('message',)
 
     def __init__(self,
                  message: Union['ConsoleMessage', dict],
                  ):
         if isinstance(message, dict):
-            message = ConsoleMessage(**message)
+            message = ConsoleMessage.from_json(message)
         self.message = message
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -7,11 +7,13 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
+
 from chromewhip.protocol import dom as DOM
 
 # StyleSheetId: 
@@ -22,6 +24,8 @@ StyleSheetOrigin = str
 
 # PseudoElementMatches: CSS rule collection for a single pseudo style.
 class PseudoElementMatches(ChromeTypeBase):
+    __slots__ = ('pseudoType', 'matches')
+
     def __init__(self,
                  pseudoType: Union['DOM.PseudoType'],
                  matches: Union['[RuleMatch]'],
@@ -30,9 +34,20 @@ class PseudoElementMatches(ChromeTypeBase):
         self.pseudoType = pseudoType
         self.matches = matches
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.matches = [RuleMatch.from_json(i0) for i0 in obj.matches]
+        return obj
+
 
 # InheritedStyleEntry: Inherited CSS rule collection from ancestor node.
 class InheritedStyleEntry(ChromeTypeBase):
+    __slots__ = ('inlineStyle', 'matchedCSSRules')
+
     def __init__(self,
                  matchedCSSRules: Union['[RuleMatch]'],
                  inlineStyle: Optional['CSSStyle'] = None,
@@ -41,9 +56,22 @@ class InheritedStyleEntry(ChromeTypeBase):
         self.inlineStyle = inlineStyle
         self.matchedCSSRules = matchedCSSRules
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.inlineStyle is not None:
+            obj.inlineStyle = CSSStyle.from_json(obj.inlineStyle)
+        obj.matchedCSSRules = [RuleMatch.from_json(i0) for i0 in obj.matchedCSSRules]
+        return obj
+
 
 # RuleMatch: Match data for a CSS rule.
 class RuleMatch(ChromeTypeBase):
+    __slots__ = ('rule', 'matchingSelectors')
+
     def __init__(self,
                  rule: Union['CSSRule'],
                  matchingSelectors: Union['[]'],
@@ -52,9 +80,20 @@ class RuleMatch(ChromeTypeBase):
         self.rule = rule
         self.matchingSelectors = matchingSelectors
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.rule = CSSRule.from_json(obj.rule)
+        return obj
+
 
 # Value: Data for a simple selector (these are delimited by commas in a selector list).
 class Value(ChromeTypeBase):
+    __slots__ = ('text', 'range')
+
     def __init__(self,
                  text: Union['str'],
                  range: Optional['SourceRange'] = None,
@@ -63,9 +102,21 @@ class Value(ChromeTypeBase):
         self.text = text
         self.range = range
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.range is not None:
+            obj.range = SourceRange.from_json(obj.range)
+        return obj
+
 
 # SelectorList: Selector list data.
 class SelectorList(ChromeTypeBase):
+    __slots__ = ('selectors', 'text')
+
     def __init__(self,
                  selectors: Union['[Value]'],
                  text: Union['str'],
@@ -74,9 +125,20 @@ class SelectorList(ChromeTypeBase):
         self.selectors = selectors
         self.text = text
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.selectors = [Value.from_json(i0) for i0 in obj.selectors]
+        return obj
+
 
 # CSSStyleSheetHeader: CSS stylesheet metainformation.
 class CSSStyleSheetHeader(ChromeTypeBase):
+    __slots__ = ('styleSheetId', 'frameId', 'sourceURL', 'sourceMapURL', 'origin', 'title', 'ownerNode', 'disabled', 'hasSourceURL', 'isInline', 'startLine', 'startColumn', 'length')
+
     def __init__(self,
                  styleSheetId: Union['StyleSheetId'],
                  frameId: Union['Page.FrameId'],
@@ -107,9 +169,21 @@ class CSSStyleSheetHeader(ChromeTypeBase):
         self.startColumn = startColumn
         self.length = length
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.styleSheetId = intern(obj.styleSheetId)
+        obj.frameId = intern(obj.frameId)
+        return obj
+
 
 # CSSRule: CSS rule representation.
 class CSSRule(ChromeTypeBase):
+    __slots__ = ('styleSheetId', 'selectorList', 'origin', 'style', 'media')
+
     def __init__(self,
                  selectorList: Union['SelectorList'],
                  origin: Union['StyleSheetOrigin'],
@@ -124,9 +198,25 @@ class CSSRule(ChromeTypeBase):
         self.style = style
         self.media = media
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.styleSheetId is not None:
+            obj.styleSheetId = intern(obj.styleSheetId)
+        obj.selectorList = SelectorList.from_json(obj.selectorList)
+        obj.style = CSSStyle.from_json(obj.style)
+        if obj.media is not None:
+            obj.media = [CSSMedia.from_json(i0) for i0 in obj.media]
+        return obj
+
 
 # RuleUsage: CSS coverage information.
 class RuleUsage(ChromeTypeBase):
+    __slots__ = ('styleSheetId', 'startOffset', 'endOffset', 'used')
+
     def __init__(self,
                  styleSheetId: Union['StyleSheetId'],
                  startOffset: Union['float'],
@@ -139,9 +229,20 @@ class RuleUsage(ChromeTypeBase):
         self.endOffset = endOffset
         self.used = used
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.styleSheetId = intern(obj.styleSheetId)
+        return obj
+
 
 # SourceRange: Text range within a resource. All numbers are zero-based.
 class SourceRange(ChromeTypeBase):
+    __slots__ = ('startLine', 'startColumn', 'endLine', 'endColumn')
+
     def __init__(self,
                  startLine: Union['int'],
                  startColumn: Union['int'],
@@ -154,9 +255,19 @@ class SourceRange(ChromeTypeBase):
         self.endLine = endLine
         self.endColumn = endColumn
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # ShorthandEntry: 
 class ShorthandEntry(ChromeTypeBase):
+    __slots__ = ('name', 'value', 'important')
+
     def __init__(self,
                  name: Union['str'],
                  value: Union['str'],
@@ -167,9 +278,19 @@ class ShorthandEntry(ChromeTypeBase):
         self.value = value
         self.important = important
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # CSSComputedStyleProperty: 
 class CSSComputedStyleProperty(ChromeTypeBase):
+    __slots__ = ('name', 'value')
+
     def __init__(self,
                  name: Union['str'],
                  value: Union['str'],
@@ -178,9 +299,19 @@ class CSSComputedStyleProperty(ChromeTypeBase):
         self.name = name
         self.value = value
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # CSSStyle: CSS style representation.
 class CSSStyle(ChromeTypeBase):
+    __slots__ = ('styleSheetId', 'cssProperties', 'shorthandEntries', 'cssText', 'range')
+
     def __init__(self,
                  cssProperties: Union['[CSSProperty]'],
                  shorthandEntries: Union['[ShorthandEntry]'],
@@ -195,9 +326,25 @@ class CSSStyle(ChromeTypeBase):
         self.cssText = cssText
         self.range = range
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.styleSheetId is not None:
+            obj.styleSheetId = intern(obj.styleSheetId)
+        obj.cssProperties = [CSSProperty.from_json(i0) for i0 in obj.cssProperties]
+        obj.shorthandEntries = [ShorthandEntry.from_json(i0) for i0 in obj.shorthandEntries]
+        if obj.range is not None:
+            obj.range = SourceRange.from_json(obj.range)
+        return obj
+
 
 # CSSProperty: CSS property declaration data.
 class CSSProperty(ChromeTypeBase):
+    __slots__ = ('name', 'value', 'important', 'implicit', 'text', 'parsedOk', 'disabled', 'range')
+
     def __init__(self,
                  name: Union['str'],
                  value: Union['str'],
@@ -218,9 +365,21 @@ class CSSProperty(ChromeTypeBase):
         self.disabled = disabled
         self.range = range
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.range is not None:
+            obj.range = SourceRange.from_json(obj.range)
+        return obj
+
 
 # CSSMedia: CSS media rule descriptor.
 class CSSMedia(ChromeTypeBase):
+    __slots__ = ('text', 'source', 'sourceURL', 'range', 'styleSheetId', 'mediaList')
+
     def __init__(self,
                  text: Union['str'],
                  source: Union['str'],
@@ -237,9 +396,25 @@ class CSSMedia(ChromeTypeBase):
         self.styleSheetId = styleSheetId
         self.mediaList = mediaList
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.range is not None:
+            obj.range = SourceRange.from_json(obj.range)
+        if obj.styleSheetId is not None:
+            obj.styleSheetId = intern(obj.styleSheetId)
+        if obj.mediaList is not None:
+            obj.mediaList = [MediaQuery.from_json(i0) for i0 in obj.mediaList]
+        return obj
+
 
 # MediaQuery: Media query descriptor.
 class MediaQuery(ChromeTypeBase):
+    __slots__ = ('expressions', 'active')
+
     def __init__(self,
                  expressions: Union['[MediaQueryExpression]'],
                  active: Union['bool'],
@@ -248,9 +423,20 @@ class MediaQuery(ChromeTypeBase):
         self.expressions = expressions
         self.active = active
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.expressions = [MediaQueryExpression.from_json(i0) for i0 in obj.expressions]
+        return obj
+
 
 # MediaQueryExpression: Media query expression descriptor.
 class MediaQueryExpression(ChromeTypeBase):
+    __slots__ = ('value', 'unit', 'feature', 'valueRange', 'computedLength')
+
     def __init__(self,
                  value: Union['float'],
                  unit: Union['str'],
@@ -265,9 +451,21 @@ class MediaQueryExpression(ChromeTypeBase):
         self.valueRange = valueRange
         self.computedLength = computedLength
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.valueRange is not None:
+            obj.valueRange = SourceRange.from_json(obj.valueRange)
+        return obj
+
 
 # PlatformFontUsage: Information about amount of glyphs that were rendered with given font.
 class PlatformFontUsage(ChromeTypeBase):
+    __slots__ = ('familyName', 'isCustomFont', 'glyphCount')
+
     def __init__(self,
                  familyName: Union['str'],
                  isCustomFont: Union['bool'],
@@ -278,9 +476,19 @@ class PlatformFontUsage(ChromeTypeBase):
         self.isCustomFont = isCustomFont
         self.glyphCount = glyphCount
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # FontFace: Properties of a web font: https://www.w3.org/TR/2008/REC-CSS2-20080411/fonts.html#font-descriptions
 class FontFace(ChromeTypeBase):
+    __slots__ = ('fontFamily', 'fontStyle', 'fontVariant', 'fontWeight', 'fontStretch', 'unicodeRange', 'src', 'platformFontFamily')
+
     def __init__(self,
                  fontFamily: Union['str'],
                  fontStyle: Union['str'],
@@ -301,9 +509,19 @@ class FontFace(ChromeTypeBase):
         self.src = src
         self.platformFontFamily = platformFontFamily
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # CSSKeyframesRule: CSS keyframes rule representation.
 class CSSKeyframesRule(ChromeTypeBase):
+    __slots__ = ('animationName', 'keyframes')
+
     def __init__(self,
                  animationName: Union['Value'],
                  keyframes: Union['[CSSKeyframeRule]'],
@@ -312,9 +530,21 @@ class CSSKeyframesRule(ChromeTypeBase):
         self.animationName = animationName
         self.keyframes = keyframes
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.animationName = Value.from_json(obj.animationName)
+        obj.keyframes = [CSSKeyframeRule.from_json(i0) for i0 in obj.keyframes]
+        return obj
+
 
 # CSSKeyframeRule: CSS keyframe rule representation.
 class CSSKeyframeRule(ChromeTypeBase):
+    __slots__ = ('styleSheetId', 'origin', 'keyText', 'style')
+
     def __init__(self,
                  origin: Union['StyleSheetOrigin'],
                  keyText: Union['Value'],
@@ -327,9 +557,23 @@ class CSSKeyframeRule(ChromeTypeBase):
         self.keyText = keyText
         self.style = style
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.styleSheetId is not None:
+            obj.styleSheetId = intern(obj.styleSheetId)
+        obj.keyText = Value.from_json(obj.keyText)
+        obj.style = CSSStyle.from_json(obj.style)
+        return obj
+
 
 # StyleDeclarationEdit: A descriptor of operation to mutate style declaration text.
 class StyleDeclarationEdit(ChromeTypeBase):
+    __slots__ = ('styleSheetId', 'range', 'text')
+
     def __init__(self,
                  styleSheetId: Union['StyleSheetId'],
                  range: Union['SourceRange'],
@@ -340,6 +584,16 @@ class StyleDeclarationEdit(ChromeTypeBase):
         self.range = range
         self.text = text
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.styleSheetId = intern(obj.styleSheetId)
+        obj.range = SourceRange.from_json(obj.range)
+        return obj
+
 
 class CSS(PayloadMixin):
     """ This domain exposes CSS read/write operations. All CSS objects (stylesheets, rules, and styles)
@@ -370,12 +624,7 @@ position specified by `location`.
                 "ruleText": ruleText,
                 "location": location,
             }),
-            cls.convert_payload({
-                "rule": {
-                    "class": CSSRule,
-                    "optional": False
-                },
-            })
+            _decode_addRule
         )
 
     @classmethod
@@ -390,12 +639,7 @@ position specified by `location`.
             cls.build_send_payload("collectClassNames", {
                 "styleSheetId": styleSheetId,
             }),
-            cls.convert_payload({
-                "classNames": {
-                    "class": [],
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -410,12 +654,7 @@ position specified by `location`.
             cls.build_send_payload("createStyleSheet", {
                 "frameId": frameId,
             }),
-            cls.convert_payload({
-                "styleSheetId": {
-                    "class": StyleSheetId,
-                    "optional": False
-                },
-            })
+            _decode_createStyleSheet
         )
 
     @classmethod
@@ -471,24 +710,7 @@ the browser.
             cls.build_send_payload("getBackgroundColors", {
                 "nodeId": nodeId,
             }),
-            cls.convert_payload({
-                "backgroundColors": {
-                    "class": [],
-                    "optional": True
-                },
-                "computedFontSize": {
-                    "class": str,
-                    "optional": True
-                },
-                "computedFontWeight": {
-                    "class": str,
-                    "optional": True
-                },
-                "computedBodyFontSize": {
-                    "class": str,
-                    "optional": True
-                },
-            })
+            None
         )
 
     @classmethod
@@ -503,12 +725,7 @@ the browser.
             cls.build_send_payload("getComputedStyleForNode", {
                 "nodeId": nodeId,
             }),
-            cls.convert_payload({
-                "computedStyle": {
-                    "class": [CSSComputedStyleProperty],
-                    "optional": False
-                },
-            })
+            _decode_getComputedStyleForNode
         )
 
     @classmethod
@@ -524,16 +741,7 @@ attributes) for a DOM node identified by `nodeId`.
             cls.build_send_payload("getInlineStylesForNode", {
                 "nodeId": nodeId,
             }),
-            cls.convert_payload({
-                "inlineStyle": {
-                    "class": CSSStyle,
-                    "optional": True
-                },
-                "attributesStyle": {
-                    "class": CSSStyle,
-                    "optional": True
-                },
-            })
+            _decode_getInlineStylesForNode
         )
 
     @classmethod
@@ -548,32 +756,7 @@ attributes) for a DOM node identified by `nodeId`.
             cls.build_send_payload("getMatchedStylesForNode", {
                 "nodeId": nodeId,
             }),
-            cls.convert_payload({
-                "inlineStyle": {
-                    "class": CSSStyle,
-                    "optional": True
-                },
-                "attributesStyle": {
-                    "class": CSSStyle,
-                    "optional": True
-                },
-                "matchedCSSRules": {
-                    "class": [RuleMatch],
-                    "optional": True
-                },
-                "pseudoElements": {
-                    "class": [PseudoElementMatches],
-                    "optional": True
-                },
-                "inherited": {
-                    "class": [InheritedStyleEntry],
-                    "optional": True
-                },
-                "cssKeyframesRules": {
-                    "class": [CSSKeyframesRule],
-                    "optional": True
-                },
-            })
+            _decode_getMatchedStylesForNode
         )
 
     @classmethod
@@ -583,12 +766,7 @@ attributes) for a DOM node identified by `nodeId`.
         return (
             cls.build_send_payload("getMediaQueries", {
             }),
-            cls.convert_payload({
-                "medias": {
-                    "class": [CSSMedia],
-                    "optional": False
-                },
-            })
+            _decode_getMediaQueries
         )
 
     @classmethod
@@ -604,12 +782,7 @@ node.
             cls.build_send_payload("getPlatformFontsForNode", {
                 "nodeId": nodeId,
             }),
-            cls.convert_payload({
-                "fonts": {
-                    "class": [PlatformFontUsage],
-                    "optional": False
-                },
-            })
+            _decode_getPlatformFontsForNode
         )
 
     @classmethod
@@ -624,12 +797,7 @@ node.
             cls.build_send_payload("getStyleSheetText", {
                 "styleSheetId": styleSheetId,
             }),
-            cls.convert_payload({
-                "text": {
-                    "class": str,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -676,12 +844,7 @@ property
                 "range": range,
                 "keyText": keyText,
             }),
-            cls.convert_payload({
-                "keyText": {
-                    "class": Value,
-                    "optional": False
-                },
-            })
+            _decode_setKeyframeKey
         )
 
     @classmethod
@@ -704,12 +867,7 @@ property
                 "range": range,
                 "text": text,
             }),
-            cls.convert_payload({
-                "media": {
-                    "class": CSSMedia,
-                    "optional": False
-                },
-            })
+            _decode_setMediaText
         )
 
     @classmethod
@@ -732,12 +890,7 @@ property
                 "range": range,
                 "selector": selector,
             }),
-            cls.convert_payload({
-                "selectorList": {
-                    "class": SelectorList,
-                    "optional": False
-                },
-            })
+            _decode_setRuleSelector
         )
 
     @classmethod
@@ -756,12 +909,7 @@ property
                 "styleSheetId": styleSheetId,
                 "text": text,
             }),
-            cls.convert_payload({
-                "sourceMapURL": {
-                    "class": str,
-                    "optional": True
-                },
-            })
+            None
         )
 
     @classmethod
@@ -776,12 +924,7 @@ property
             cls.build_send_payload("setStyleTexts", {
                 "edits": edits,
             }),
-            cls.convert_payload({
-                "styles": {
-                    "class": [CSSStyle],
-                    "optional": False
-                },
-            })
+            _decode_setStyleTexts
         )
 
     @classmethod
@@ -802,12 +945,7 @@ property
         return (
             cls.build_send_payload("stopRuleUsageTracking", {
             }),
-            cls.convert_payload({
-                "ruleUsage": {
-                    "class": [RuleUsage],
-                    "optional": False
-                },
-            })
+            _decode_stopRuleUsageTracking
         )
 
     @classmethod
@@ -818,29 +956,112 @@ instrumentation)
         return (
             cls.build_send_payload("takeCoverageDelta", {
             }),
-            cls.convert_payload({
-                "coverage": {
-                    "class": [RuleUsage],
-                    "optional": False
-                },
-            })
+            _decode_takeCoverageDelta
         )
 
 
 
+def _decode_addRule(result):
+    result['rule'] = CSSRule.from_json(result['rule'])
+    return result
+
+
+def _decode_createStyleSheet(result):
+    result['styleSheetId'] = intern(result['styleSheetId'])
+    return result
+
+
+def _decode_getComputedStyleForNode(result):
+    result['computedStyle'] = [CSSComputedStyleProperty.from_json(i0) for i0 in result['computedStyle']]
+    return result
+
+
+def _decode_getInlineStylesForNode(result):
+    if result.get('inlineStyle') is not None:
+        result['inlineStyle'] = CSSStyle.from_json(result['inlineStyle'])
+    if result.get('attributesStyle') is not None:
+        result['attributesStyle'] = CSSStyle.from_json(result['attributesStyle'])
+    return result
+
+
+def _decode_getMatchedStylesForNode(result):
+    if result.get('inlineStyle') is not None:
+        result['inlineStyle'] = CSSStyle.from_json(result['inlineStyle'])
+    if result.get('attributesStyle') is not None:
+        result['attributesStyle'] = CSSStyle.from_json(result['attributesStyle'])
+    if result.get('matchedCSSRules') is not None:
+        result['matchedCSSRules'] = [RuleMatch.from_json(i0) for i0 in result['matchedCSSRules']]
+    if result.get('pseudoElements') is not None:
+        result['pseudoElements'] = [PseudoElementMatches.from_json(i0) for i0 in result['pseudoElements']]
+    if result.get('inherited') is not None:
+        result['inherited'] = [InheritedStyleEntry.from_json(i0) for i0 in result['inherited']]
+    if result.get('cssKeyframesRules') is not None:
+        result['cssKeyframesRules'] = [CSSKeyframesRule.from_json(i0) for i0 in result['cssKeyframesRules']]
+    return result
+
+
+def _decode_getMediaQueries(result):
+    result['medias'] = [CSSMedia.from_json(i0) for i0 in result['medias']]
+    return result
+
+
+def _decode_getPlatformFontsForNode(result):
+    result['fonts'] = [PlatformFontUsage.from_json(i0) for i0 in result['fonts']]
+    return result
+
+
+def _decode_setKeyframeKey(result):
+    result['keyText'] = Value.from_json(result['keyText'])
+    return result
+
+
+def _decode_setMediaText(result):
+    result['media'] = CSSMedia.from_json(result['media'])
+    return result
+
+
+def _decode_setRuleSelector(result):
+    result['selectorList'] = SelectorList.from_json(result['selectorList'])
+    return result
+
+
+def _decode_setStyleTexts(result):
+    result['styles'] = [CSSStyle.from_json(i0) for i0 in result['styles']]
+    return result
+
+
+def _decode_stopRuleUsageTracking(result):
+    result['ruleUsage'] = [RuleUsage.from_json(i0) for i0 in result['ruleUsage']]
+    return result
+
+
+def _decode_takeCoverageDelta(result):
+    result['coverage'] = [RuleUsage.from_json(i0) for i0 in result['coverage']]
+    return result
+
+
 class FontsUpdatedEvent(BaseEvent):
 
-    js_name = 'Css.fontsUpdated'
+    js_name = 'CSS.fontsUpdated'
     hashable = []
     is_hashable = False
+    __slots__ = ('font',)
 
     def __init__(self,
                  font: Union['FontFace', dict, None] = None,
                  ):
         if isinstance(font, dict):
-            font = FontFace(**font)
+            font = FontFace.from_json(font)
         self.font = font
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -848,13 +1069,18 @@ class FontsUpdatedEvent(BaseEvent):
 
 class MediaQueryResultChangedEvent(BaseEvent):
 
-    js_name = 'Css.mediaQueryResultChanged'
+    js_name = 'CSS.mediaQueryResultChanged'
     hashable = []
     is_hashable = False
+    __slots__ = ()
 
     def __init__(self):
         pass
 
+    @classmethod
+    def from_json(cls, d):
+        return cls()
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -862,17 +1088,26 @@ class MediaQueryResultChangedEvent(BaseEvent):
 
 class StyleSheetAddedEvent(BaseEvent):
 
-    js_name = 'Css.styleSheetAdded'
+    js_name = 'CSS.styleSheetAdded'
     hashable = []
     is_hashable = False
+    __slots__ = ('header',)
 
     def __init__(self,
                  header: Union['CSSStyleSheetHeader', dict],
                  ):
         if isinstance(header, dict):
-            header = CSSStyleSheetHeader(**header)
+            header = CSSStyleSheetHeader.from_json(header)
         self.header = header
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -880,17 +1115,25 @@ class StyleSheetAddedEvent(BaseEvent):
 
 class StyleSheetChangedEvent(BaseEvent):
 
-    js_name = 'Css.styleSheetChanged'
+    js_name = 'CSS.styleSheetChanged'
     hashable = ['styleSheetId']
     is_hashable = True
+    __slots__ = ('styleSheetId',)
 
     def __init__(self,
                  styleSheetId: Union['StyleSheetId', dict],
                  ):
-        if isinstance(styleSheetId, dict):
-            styleSheetId = StyleSheetId(**styleSheetId)
         self.styleSheetId = styleSheetId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.styleSheetId = intern(obj.styleSheetId)
+        return obj
+
     @classmethod
     def build_hash(cls, styleSheetId):
         kwargs = locals()
@@ -903,17 +1146,25 @@ class StyleSheetChangedEvent(BaseEvent):
 
 class StyleSheetRemovedEvent(BaseEvent):
 
-    js_name = 'Css.styleSheetRemoved'
+    js_name = 'CSS.styleSheetRemoved'
     hashable = ['styleSheetId']
     is_hashable = True
+    __slots__ = ('styleSheetId',)
 
     def __init__(self,
                  styleSheetId: Union['StyleSheetId', dict],
                  ):
-        if isinstance(styleSheetId, dict):
-            styleSheetId = StyleSheetId(**styleSheetId)
         self.styleSheetId = styleSheetId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.styleSheetId = intern(obj.styleSheetId)
+        return obj
+
     @classmethod
     def build_hash(cls, styleSheetId):
         kwargs = locals()
@@ -7,17 +7,21 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
 
+
 # DatabaseId: Unique identifier of Database object.
 DatabaseId = str
 
 # Database: Database object.
 class Database(ChromeTypeBase):
+    __slots__ = ('id', 'domain', 'name', 'version')
+
     def __init__(self,
                  id: Union['DatabaseId'],
                  domain: Union['str'],
@@ -30,9 +34,20 @@ class Database(ChromeTypeBase):
         self.name = name
         self.version = version
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.id = intern(obj.id)
+        return obj
+
 
 # Error: Database error.
 class Error(ChromeTypeBase):
+    __slots__ = ('message', 'code')
+
     def __init__(self,
                  message: Union['str'],
                  code: Union['int'],
@@ -41,6 +56,14 @@ class Error(ChromeTypeBase):
         self.message = message
         self.code = code
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 class Database(PayloadMixin):
     """ 
@@ -81,20 +104,7 @@ class Database(PayloadMixin):
                 "databaseId": databaseId,
                 "query": query,
             }),
-            cls.convert_payload({
-                "columnNames": {
-                    "class": [],
-                    "optional": True
-                },
-                "values": {
-                    "class": [],
-                    "optional": True
-                },
-                "sqlError": {
-                    "class": Error,
-                    "optional": True
-                },
-            })
+            _decode_executeSQL
         )
 
     @classmethod
@@ -109,29 +119,39 @@ class Database(PayloadMixin):
             cls.build_send_payload("getDatabaseTableNames", {
                 "databaseId": databaseId,
             }),
-            cls.convert_payload({
-                "tableNames": {
-                    "class": [],
-                    "optional": False
-                },
-            })
+            None
         )
 
 
 
+def _decode_executeSQL(result):
+    if result.get('sqlError') is not None:
+        result['sqlError'] = Error.from_json(result['sqlError'])
+    return result
+
+
 class AddDatabaseEvent(BaseEvent):
 
     js_name = 'Database.addDatabase'
     hashable = ['databaseId']
     is_hashable = True
+    __slots__ = ('database',)
 
     def __init__(self,
                  database: Union['Database', dict],
                  ):
         if isinstance(database, dict):
-            database = Database(**database)
+            database = Database.from_json(database)
         self.database = database
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, databaseId):
         kwargs = locals()
@@ -7,11 +7,13 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
+
 from chromewhip.protocol import runtime as Runtime
 
 # BreakpointId: Breakpoint identifier.
@@ -22,6 +24,8 @@ CallFrameId = str
 
 # Location: Location in the source code.
 class Location(ChromeTypeBase):
+    __slots__ = ('scriptId', 'lineNumber', 'columnNumber')
+
     def __init__(self,
                  scriptId: Union['Runtime.ScriptId'],
                  lineNumber: Union['int'],
@@ -32,9 +36,20 @@ class Location(ChromeTypeBase):
         self.lineNumber = lineNumber
         self.columnNumber = columnNumber
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.scriptId = intern(obj.scriptId)
+        return obj
+
 
 # ScriptPosition: Location in the source code.
 class ScriptPosition(ChromeTypeBase):
+    __slots__ = ('lineNumber', 'columnNumber')
+
     def __init__(self,
                  lineNumber: Union['int'],
                  columnNumber: Union['int'],
@@ -43,9 +58,19 @@ class ScriptPosition(ChromeTypeBase):
         self.lineNumber = lineNumber
         self.columnNumber = columnNumber
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # CallFrame: JavaScript call frame. Array of call frames form the call stack.
 class CallFrame(ChromeTypeBase):
+    __slots__ = ('callFrameId', 'functionName', 'functionLocation', 'location', 'url', 'scopeChain', 'this', 'returnValue')
+
     def __init__(self,
                  callFrameId: Union['CallFrameId'],
                  functionName: Union['str'],
@@ -66,9 +91,27 @@ class CallFrame(ChromeTypeBase):
         self.this = this
         self.returnValue = returnValue
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.callFrameId = intern(obj.callFrameId)
+        if obj.functionLocation is not None:
+            obj.functionLocation = Location.from_json(obj.functionLocation)
+        obj.location = Location.from_json(obj.location)
+        obj.scopeChain = [Scope.from_json(i0) for i0 in obj.scopeChain]
+        obj.this = Runtime.RemoteObject.from_json(obj.this)
+        if obj.returnValue is not None:
+            obj.returnValue = Runtime.RemoteObject.from_json(obj.returnValue)
+        return obj
+
 
 # Scope: Scope description.
 class Scope(ChromeTypeBase):
+    __slots__ = ('type', 'object', 'name', 'startLocation', 'endLocation')
+
     def __init__(self,
                  type: Union['str'],
                  object: Union['Runtime.RemoteObject'],
@@ -83,9 +126,24 @@ class Scope(ChromeTypeBase):
         self.startLocation = startLocation
         self.endLocation = endLocation
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.object = Runtime.RemoteObject.from_json(obj.object)
+        if obj.startLocation is not None:
+            obj.startLocation = Location.from_json(obj.startLocation)
+        if obj.endLocation is not None:
+            obj.endLocation = Location.from_json(obj.endLocation)
+        return obj
+
 
 # SearchMatch: Search match for resource.
 class SearchMatch(ChromeTypeBase):
+    __slots__ = ('lineNumber', 'lineContent')
+
     def __init__(self,
                  lineNumber: Union['float'],
                  lineContent: Union['str'],
@@ -94,9 +152,19 @@ class SearchMatch(ChromeTypeBase):
         self.lineNumber = lineNumber
         self.lineContent = lineContent
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # BreakLocation: 
 class BreakLocation(ChromeTypeBase):
+    __slots__ = ('scriptId', 'lineNumber', 'columnNumber', 'type')
+
     def __init__(self,
                  scriptId: Union['Runtime.ScriptId'],
                  lineNumber: Union['int'],
@@ -109,6 +177,15 @@ class BreakLocation(ChromeTypeBase):
         self.columnNumber = columnNumber
         self.type = type
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.scriptId = intern(obj.scriptId)
+        return obj
+
 
 class Debugger(PayloadMixin):
     """ Debugger domain exposes JavaScript debugging capabilities. It allows setting and removing
@@ -151,12 +228,7 @@ enabled until the result for this command is received.
         return (
             cls.build_send_payload("enable", {
             }),
-            cls.convert_payload({
-                "debuggerId": {
-                    "class": Runtime.UniqueDebuggerId,
-                    "optional": False
-                },
-            })
+            _decode_enable
         )
 
     @classmethod
@@ -206,16 +278,7 @@ execution. Overrides `setPauseOnException` state.
                 "throwOnSideEffect": throwOnSideEffect,
                 "timeout": timeout,
             }),
-            cls.convert_payload({
-                "result": {
-                    "class": Runtime.RemoteObject,
-                    "optional": False
-                },
-                "exceptionDetails": {
-                    "class": Runtime.ExceptionDetails,
-                    "optional": True
-                },
-            })
+            _decode_evaluateOnCallFrame
         )
 
     @classmethod
@@ -240,12 +303,7 @@ of scripts is used as end of range.
                 "end": end,
                 "restrictToFunction": restrictToFunction,
             }),
-            cls.convert_payload({
-                "locations": {
-                    "class": [BreakLocation],
-                    "optional": False
-                },
-            })
+            _decode_getPossibleBreakpoints
         )
 
     @classmethod
@@ -260,12 +318,7 @@ of scripts is used as end of range.
             cls.build_send_payload("getScriptSource", {
                 "scriptId": scriptId,
             }),
-            cls.convert_payload({
-                "scriptSource": {
-                    "class": str,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -280,12 +333,7 @@ of scripts is used as end of range.
             cls.build_send_payload("getStackTrace", {
                 "stackTraceId": stackTraceId,
             }),
-            cls.convert_payload({
-                "stackTrace": {
-                    "class": Runtime.StackTrace,
-                    "optional": False
-                },
-            })
+            _decode_getStackTrace
         )
 
     @classmethod
@@ -340,20 +388,7 @@ of scripts is used as end of range.
             cls.build_send_payload("restartFrame", {
                 "callFrameId": callFrameId,
             }),
-            cls.convert_payload({
-                "callFrames": {
-                    "class": [CallFrame],
-                    "optional": False
-                },
-                "asyncStackTrace": {
-                    "class": Runtime.StackTrace,
-                    "optional": True
-                },
-                "asyncStackTraceId": {
-                    "class": Runtime.StackTraceId,
-                    "optional": True
-                },
-            })
+            _decode_restartFrame
         )
 
     @classmethod
@@ -403,12 +438,7 @@ task were scheduled or another scheduleStepIntoAsync was called.
                 "caseSensitive": caseSensitive,
                 "isRegex": isRegex,
             }),
-            cls.convert_payload({
-                "result": {
-                    "class": [SearchMatch],
-                    "optional": False
-                },
-            })
+            _decode_searchInContent
         )
 
     @classmethod
@@ -483,16 +513,7 @@ breakpoint if this expression evaluates to true.
                 "location": location,
                 "condition": condition,
             }),
-            cls.convert_payload({
-                "breakpointId": {
-                    "class": BreakpointId,
-                    "optional": False
-                },
-                "actualLocation": {
-                    "class": Location,
-                    "optional": False
-                },
-            })
+            _decode_setBreakpoint
         )
 
     @classmethod
@@ -532,16 +553,7 @@ breakpoint if this expression evaluates to true.
                 "columnNumber": columnNumber,
                 "condition": condition,
             }),
-            cls.convert_payload({
-                "breakpointId": {
-                    "class": BreakpointId,
-                    "optional": False
-                },
-                "locations": {
-                    "class": [Location],
-                    "optional": False
-                },
-            })
+            _decode_setBreakpointByUrl
         )
 
     @classmethod
@@ -563,12 +575,7 @@ stop on the breakpoint if this expression evaluates to true.
                 "objectId": objectId,
                 "condition": condition,
             }),
-            cls.convert_payload({
-                "breakpointId": {
-                    "class": BreakpointId,
-                    "optional": False
-                },
-            })
+            _decode_setBreakpointOnFunctionCall
         )
 
     @classmethod
@@ -638,28 +645,7 @@ description without actually modifying the code.
                 "scriptSource": scriptSource,
                 "dryRun": dryRun,
             }),
-            cls.convert_payload({
-                "callFrames": {
-                    "class": [CallFrame],
-                    "optional": True
-                },
-                "stackChanged": {
-                    "class": bool,
-                    "optional": True
-                },
-                "asyncStackTrace": {
-                    "class": Runtime.StackTrace,
-                    "optional": True
-                },
-                "asyncStackTraceId": {
-                    "class": Runtime.StackTraceId,
-                    "optional": True
-                },
-                "exceptionDetails": {
-                    "class": Runtime.ExceptionDetails,
-                    "optional": True
-                },
-            })
+            _decode_setScriptSource
         )
 
     @classmethod
@@ -744,23 +730,96 @@ before next pause.
 
 
 
+def _decode_enable(result):
+    result['debuggerId'] = intern(result['debuggerId'])
+    return result
+
+
+def _decode_evaluateOnCallFrame(result):
+    result['result'] = Runtime.RemoteObject.from_json(result['result'])
+    if result.get('exceptionDetails') is not None:
+        result['exceptionDetails'] = Runtime.ExceptionDetails.from_json(result['exceptionDetails'])
+    return result
+
+
+def _decode_getPossibleBreakpoints(result):
+    result['locations'] = [BreakLocation.from_json(i0) for i0 in result['locations']]
+    return result
+
+
+def _decode_getStackTrace(result):
+    result['stackTrace'] = Runtime.StackTrace.from_json(result['stackTrace'])
+    return result
+
+
+def _decode_restartFrame(result):
+    result['callFrames'] = [CallFrame.from_json(i0) for i0 in result['callFrames']]
+    if result.get('asyncStackTrace') is not None:
+        result['asyncStackTrace'] = Runtime.StackTrace.from_json(result['asyncStackTrace'])
+    if result.get('asyncStackTraceId') is not None:
+        result['asyncStackTraceId'] = Runtime.StackTraceId.from_json(result['asyncStackTraceId'])
+    return result
+
+
+def _decode_searchInContent(result):
+    result['result'] = [SearchMatch.from_json(i0) for i0 in result['result']]
+    return result
+
+
+def _decode_setBreakpoint(result):
+    result['breakpointId'] = intern(result['breakpointId'])
+    result['actualLocation'] = Location.from_json(result['actualLocation'])
+    return result
+
+
+def _decode_setBreakpointByUrl(result):
+    result['breakpointId'] = intern(result['breakpointId'])
+    result['locations'] = [Location.from_json(i0) for i0 in result['locations']]
+    return result
+
+
+def _decode_setBreakpointOnFunctionCall(result):
+    result['breakpointId'] = intern(result['breakpointId'])
+    return result
+
+
+def _decode_setScriptSource(result):
+    if result.get('callFrames') is not None:
+        result['callFrames'] = [CallFrame.from_json(i0) for i0 in result['callFrames']]
+    if result.get('asyncStackTrace') is not None:
+        result['asyncStackTrace'] = Runtime.StackTrace.from_json(result['asyncStackTrace'])
+    if result.get('asyncStackTraceId') is not None:
+        result['asyncStackTraceId'] = Runtime.StackTraceId.from_json(result['asyncStackTraceId'])
+    if result.get('exceptionDetails') is not None:
+        result['exceptionDetails'] = Runtime.ExceptionDetails.from_json(result['exceptionDetails'])
+    return result
+
+
 class BreakpointResolvedEvent(BaseEvent):
 
     js_name = 'Debugger.breakpointResolved'
     hashable = ['breakpointId']
     is_hashable = True
+    __slots__ = ('breakpointId', 'location')
 
     def __init__(self,
                  breakpointId: Union['BreakpointId', dict],
                  location: Union['Location', dict],
                  ):
-        if isinstance(breakpointId, dict):
-            breakpointId = BreakpointId(**breakpointId)
         self.breakpointId = breakpointId
         if isinstance(location, dict):
-            location = Location(**location)
+            location = Location.from_json(location)
         self.location = location
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.breakpointId = intern(obj.breakpointId)
+        return obj
+
     @classmethod
     def build_hash(cls, breakpointId):
         kwargs = locals()
@@ -774,8 +833,9 @@ class BreakpointResolvedEvent(BaseEvent):
 class PausedEvent(BaseEvent):
 
     js_name = 'Debugger.paused'
-    hashable = ['asyncCallStackTraceId', 'asyncStackTraceId']
+    hashable = ['asyncStackTraceId', 'asyncCallStackTraceId']
     is_hashable = True
+    __slots__ = ('callFrames', 'reason', 'data', 'hitBreakpoints', 'asyncStackTrace', 'asyncStackTraceId', 'asyncCallStackTraceId')
 
     def __init__(self,
                  callFrames: Union['[CallFrame]', dict],
@@ -786,30 +846,31 @@ class PausedEvent(BaseEvent):
                  asyncStackTraceId: Union['Runtime.StackTraceId', dict, None] = None,
                  asyncCallStackTraceId: Union['Runtime.StackTraceId', dict, None] = None,
                  ):
-        if isinstance(callFrames, dict):
-            callFrames = [CallFrame](**callFrames)
         self.callFrames = callFrames
-        if isinstance(reason, dict):
-            reason = str(**reason)
         self.reason = reason
-        if isinstance(data, dict):
-            data = dict(**data)
         self.data = data
-        if isinstance(hitBreakpoints, dict):
-            hitBreakpoints = [](**hitBreakpoints)
         self.hitBreakpoints = hitBreakpoints
         if isinstance(asyncStackTrace, dict):
-            asyncStackTrace = Runtime.StackTrace(**asyncStackTrace)
+            asyncStackTrace = Runtime.StackTrace.from_json(asyncStackTrace)
         self.asyncStackTrace = asyncStackTrace
         if isinstance(asyncStackTraceId, dict):
-            asyncStackTraceId = Runtime.StackTraceId(**asyncStackTraceId)
+            asyncStackTraceId = Runtime.StackTraceId.from_json(asyncStackTraceId)
         self.asyncStackTraceId = asyncStackTraceId
         if isinstance(asyncCallStackTraceId, dict):
-            asyncCallStackTraceId = Runtime.StackTraceId(**asyncCallStackTraceId)
+            asyncCallStackTraceId = Runtime.StackTraceId.from_json(asyncCallStackTraceId)
         self.asyncCallStackTraceId = asyncCallStackTraceId
 
     @classmethod
-    def build_hash(cls, asyncCallStackTraceId, asyncStackTraceId):
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.callFrames = [CallFrame.from_json(i0) for i0 in obj.callFrames]
+        return obj
+
+    @classmethod
+    def build_hash(cls, asyncStackTraceId, asyncCallStackTraceId):
         kwargs = locals()
         kwargs.pop('cls')
         serialized_id_params = ','.join(['='.join([p, str(v)]) for p, v in kwargs.items()])
@@ -823,10 +884,15 @@ class ResumedEvent(BaseEvent):
     js_name = 'Debugger.resumed'
     hashable = []
     is_hashable = False
+    __slots__ = ()
 
     def __init__(self):
         pass
 
+    @classmethod
+    def from_json(cls, d):
+        return cls()
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -837,6 +903,7 @@ class ScriptFailedToParseEvent(BaseEvent):
     js_name = 'Debugger.scriptFailedToParse'
     hashable = ['scriptId', 'executionContextId']
     is_hashable = True
+    __slots__ = ('scriptId', 'url', 'startLine', 'startColumn', 'endLine', 'endColumn', 'executionContextId', 'hash', 'executionContextAuxData', 'sourceMapURL', 'hasSourceURL', 'isModule', 'length', 'stackTrace')
 
     def __init__(self,
                  scriptId: Union['Runtime.ScriptId', dict],
@@ -854,49 +921,32 @@ class ScriptFailedToParseEvent(BaseEvent):
                  length: Union['int', dict, None] = None,
                  stackTrace: Union['Runtime.StackTrace', dict, None] = None,
                  ):
-        if isinstance(scriptId, dict):
-            scriptId = Runtime.ScriptId(**scriptId)
         self.scriptId = scriptId
-        if isinstance(url, dict):
-            url = str(**url)
         self.url = url
-        if isinstance(startLine, dict):
-            startLine = int(**startLine)
         self.startLine = startLine
-        if isinstance(startColumn, dict):
-            startColumn = int(**startColumn)
         self.startColumn = startColumn
-        if isinstance(endLine, dict):
-            endLine = int(**endLine)
         self.endLine = endLine
-        if isinstance(endColumn, dict):
-            endColumn = int(**endColumn)
         self.endColumn = endColumn
-        if isinstance(executionContextId, dict):
-            executionContextId = Runtime.ExecutionContextId(**executionContextId)
         self.executionContextId = executionContextId
-        if isinstance(hash, dict):
-            hash = str(**hash)
         self.hash = hash
-        if isinstance(executionContextAuxData, dict):
-            executionContextAuxData = dict(**executionContextAuxData)
         self.executionContextAuxData = executionContextAuxData
-        if isinstance(sourceMapURL, dict):
-            sourceMapURL = str(**sourceMapURL)
         self.sourceMapURL = sourceMapURL
-        if isinstance(hasSourceURL, dict):
-            hasSourceURL = bool(**hasSourceURL)
         self.hasSourceURL = hasSourceURL
-        if isinstance(isModule, dict):
-            isModule = bool(**isModule)
         self.isModule = isModule
-        if isinstance(length, dict):
-            length = int(**length)
         self.length = length
         if isinstance(stackTrace, dict):
-            stackTrace = Runtime.StackTrace(**stackTrace)
+            stackTrace = Runtime.StackTrace.from_json(stackTrace)
         self.stackTrace = stackTrace
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.scriptId = intern(obj.scriptId)
+        return obj
+
     @classmethod
     def build_hash(cls, scriptId, executionContextId):
         kwargs = locals()
@@ -912,6 +962,7 @@ class ScriptParsedEvent(BaseEvent):
     js_name = 'Debugger.scriptParsed'
     hashable = ['scriptId', 'executionContextId']
     is_hashable = True
+    __slots__ = ('scriptId', 'url', 'startLine', 'startColumn', 'endLine', 'endColumn', 'executionContextId', 'hash', 'executionContextAuxData', 'isLiveEdit', 'sourceMapURL', 'hasSourceURL', 'isModule', 'length', 'stackTrace')
 
     def __init__(self,
                  scriptId: Union['Runtime.ScriptId', dict],
@@ -930,52 +981,33 @@ class ScriptParsedEvent(BaseEvent):
                  length: Union['int', dict, None] = None,
                  stackTrace: Union['Runtime.StackTrace', dict, None] = None,
                  ):
-        if isinstance(scriptId, dict):
-            scriptId = Runtime.ScriptId(**scriptId)
         self.scriptId = scriptId
-        if isinstance(url, dict):
-            url = str(**url)
         self.url = url
-        if isinstance(startLine, dict):
-            startLine = int(**startLine)
         self.startLine = startLine
-        if isinstance(startColumn, dict):
-            startColumn = int(**startColumn)
         self.startColumn = startColumn
-        if isinstance(endLine, dict):
-            endLine = int(**endLine)
         self.endLine = endLine
-        if isinstance(endColumn, dict):
-            endColumn = int(**endColumn)
         self.endColumn = endColumn
-        if isinstance(executionContextId, dict):
-            executionContextId = Runtime.ExecutionContextId(**executionContextId)
         self.executionContextId = executionContextId
-        if isinstance(hash, dict):
-            hash = str(**hash)
         self.hash = hash
-        if isinstance(executionContextAuxData, dict):
-            executionContextAuxData = dict(**executionContextAuxData)
         self.executionContextAuxData = executionContextAuxData
-        if isinstance(isLiveEdit, dict):
-            isLiveEdit = bool(**isLiveEdit)
         self.isLiveEdit = isLiveEdit
-        if isinstance(sourceMapURL, dict):
-            sourceMapURL = str(**sourceMapURL)
         self.sourceMapURL = sourceMapURL
-        if isinstance(hasSourceURL, dict):
-            hasSourceURL = bool(**hasSourceURL)
         self.hasSourceURL = hasSourceURL
-        if isinstance(isModule, dict):
-            isModule = bool(**isModule)
         self.isModule = isModule
-        if isinstance(length, dict):
-            length = int(**length)
         self.length = length
         if isinstance(stackTrace, dict):
-            stackTrace = Runtime.StackTrace(**stackTrace)
+            stackTrace = Runtime.StackTrace.from_json(stackTrace)
         self.stackTrace = stackTrace
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.scriptId = intern(obj.scriptId)
+        return obj
+
     @classmethod
     def build_hash(cls, scriptId, executionContextId):
         kwargs = locals()
@@ -7,11 +7,13 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
+
 from chromewhip.protocol import runtime as Runtime
 
 # NodeId: Unique DOM node identifier.
@@ -22,6 +24,8 @@ BackendNodeId = int
 
 # BackendNode: Backend node with a friendly name.
 class BackendNode(ChromeTypeBase):
+    __slots__ = ('nodeType', 'nodeName', 'backendNodeId')
+
     def __init__(self,
                  nodeType: Union['int'],
                  nodeName: Union['str'],
@@ -32,6 +36,14 @@ class BackendNode(ChromeTypeBase):
         self.nodeName = nodeName
         self.backendNodeId = backendNodeId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # PseudoType: Pseudo element type.
 PseudoType = str
@@ -41,6 +53,8 @@ ShadowRootType = str
 
 # Node: DOM interaction is implemented in terms of mirror objects that represent the actual DOM nodes.DOMNode is a base node mirror type.
 class Node(ChromeTypeBase):
+    __slots__ = ('nodeId', 'parentId', 'backendNodeId', 'nodeType', 'nodeName', 'localName', 'nodeValue', 'childNodeCount', 'children', 'attributes', 'documentURL', 'baseURL', 'publicId', 'systemId', 'internalSubset', 'xmlVersion', 'name', 'value', 'pseudoType', 'shadowRootType', 'frameId', 'contentDocument', 'shadowRoots', 'templateContent', 'pseudoElements', 'importedDocument', 'distributedNodes', 'isSVG')
+
     def __init__(self,
                  nodeId: Union['NodeId'],
                  backendNodeId: Union['BackendNodeId'],
@@ -101,9 +115,35 @@ class Node(ChromeTypeBase):
         self.distributedNodes = distributedNodes
         self.isSVG = isSVG
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.children is not None:
+            obj.children = [Node.from_json(i0) for i0 in obj.children]
+        if obj.frameId is not None:
+            obj.frameId = intern(obj.frameId)
+        if obj.contentDocument is not None:
+            obj.contentDocument = Node.from_json(obj.contentDocument)
+        if obj.shadowRoots is not None:
+            obj.shadowRoots = [Node.from_json(i0) for i0 in obj.shadowRoots]
+        if obj.templateContent is not None:
+            obj.templateContent = Node.from_json(obj.templateContent)
+        if obj.pseudoElements is not None:
+            obj.pseudoElements = [Node.from_json(i0) for i0 in obj.pseudoElements]
+        if obj.importedDocument is not None:
+            obj.importedDocument = Node.from_json(obj.importedDocument)
+        if obj.distributedNodes is not None:
+            obj.distributedNodes = [BackendNode.from_json(i0) for i0 in obj.distributedNodes]
+        return obj
+
 
 # RGBA: A structure holding an RGBA color.
 class RGBA(ChromeTypeBase):
+    __slots__ = ('r', 'g', 'b', 'a')
+
     def __init__(self,
                  r: Union['int'],
                  g: Union['int'],
@@ -116,12 +156,22 @@ class RGBA(ChromeTypeBase):
         self.b = b
         self.a = a
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # Quad: An array of quad vertices, x immediately followed by y for each point, points clock-wise.
 Quad = [float]
 
 # BoxModel: Box model.
 class BoxModel(ChromeTypeBase):
+    __slots__ = ('content', 'padding', 'border', 'margin', 'width', 'height', 'shapeOutside')
+
     def __init__(self,
                  content: Union['Quad'],
                  padding: Union['Quad'],
@@ -140,9 +190,21 @@ class BoxModel(ChromeTypeBase):
         self.height = height
         self.shapeOutside = shapeOutside
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.shapeOutside is not None:
+            obj.shapeOutside = ShapeOutsideInfo.from_json(obj.shapeOutside)
+        return obj
+
 
 # ShapeOutsideInfo: CSS Shape Outside details.
 class ShapeOutsideInfo(ChromeTypeBase):
+    __slots__ = ('bounds', 'shape', 'marginShape')
+
     def __init__(self,
                  bounds: Union['Quad'],
                  shape: Union['[]'],
@@ -153,9 +215,19 @@ class ShapeOutsideInfo(ChromeTypeBase):
         self.shape = shape
         self.marginShape = marginShape
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # Rect: Rectangle.
 class Rect(ChromeTypeBase):
+    __slots__ = ('x', 'y', 'width', 'height')
+
     def __init__(self,
                  x: Union['float'],
                  y: Union['float'],
@@ -168,6 +240,14 @@ class Rect(ChromeTypeBase):
         self.width = width
         self.height = height
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 class DOM(PayloadMixin):
     """ This domain exposes DOM read/write operations. Each DOM Node is represented with its mirror object
@@ -190,12 +270,7 @@ corresponding document elements as their child nodes.</p>
             cls.build_send_payload("collectClassNamesFromSubtree", {
                 "nodeId": nodeId,
             }),
-            cls.convert_payload({
-                "classNames": {
-                    "class": [],
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -220,12 +295,7 @@ given anchor.
                 "targetNodeId": targetNodeId,
                 "insertBeforeNodeId": insertBeforeNodeId,
             }),
-            cls.convert_payload({
-                "nodeId": {
-                    "class": NodeId,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -259,12 +329,7 @@ entire subtree or provide an integer larger than 0.
                 "depth": depth,
                 "pierce": pierce,
             }),
-            cls.convert_payload({
-                "node": {
-                    "class": Node,
-                    "optional": False
-                },
-            })
+            _decode_describeNode
         )
 
     @classmethod
@@ -338,12 +403,7 @@ be called for that search.
             cls.build_send_payload("getAttributes", {
                 "nodeId": nodeId,
             }),
-            cls.convert_payload({
-                "attributes": {
-                    "class": [],
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -366,12 +426,7 @@ be called for that search.
                 "backendNodeId": backendNodeId,
                 "objectId": objectId,
             }),
-            cls.convert_payload({
-                "model": {
-                    "class": BoxModel,
-                    "optional": False
-                },
-            })
+            _decode_getBoxModel
         )
 
     @classmethod
@@ -395,12 +450,7 @@ might return multiple quads for inline nodes.
                 "backendNodeId": backendNodeId,
                 "objectId": objectId,
             }),
-            cls.convert_payload({
-                "quads": {
-                    "class": [Quad],
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -421,12 +471,7 @@ entire subtree or provide an integer larger than 0.
                 "depth": depth,
                 "pierce": pierce,
             }),
-            cls.convert_payload({
-                "root": {
-                    "class": Node,
-                    "optional": False
-                },
-            })
+            _decode_getDocument
         )
 
     @classmethod
@@ -447,12 +492,7 @@ entire subtree or provide an integer larger than 0.
                 "depth": depth,
                 "pierce": pierce,
             }),
-            cls.convert_payload({
-                "nodes": {
-                    "class": [Node],
-                    "optional": False
-                },
-            })
+            _decode_getFlattenedDocument
         )
 
     @classmethod
@@ -475,12 +515,7 @@ entire subtree or provide an integer larger than 0.
                 "y": y,
                 "includeUserAgentShadowDOM": includeUserAgentShadowDOM,
             }),
-            cls.convert_payload({
-                "nodeId": {
-                    "class": NodeId,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -503,12 +538,7 @@ entire subtree or provide an integer larger than 0.
                 "backendNodeId": backendNodeId,
                 "objectId": objectId,
             }),
-            cls.convert_payload({
-                "outerHTML": {
-                    "class": str,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -523,12 +553,7 @@ entire subtree or provide an integer larger than 0.
             cls.build_send_payload("getRelayoutBoundary", {
                 "nodeId": nodeId,
             }),
-            cls.convert_payload({
-                "nodeId": {
-                    "class": NodeId,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -552,12 +577,7 @@ identifier.
                 "fromIndex": fromIndex,
                 "toIndex": toIndex,
             }),
-            cls.convert_payload({
-                "nodeIds": {
-                    "class": [NodeId],
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -621,12 +641,7 @@ identifier.
                 "targetNodeId": targetNodeId,
                 "insertBeforeNodeId": insertBeforeNodeId,
             }),
-            cls.convert_payload({
-                "nodeId": {
-                    "class": NodeId,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -646,16 +661,7 @@ identifier.
                 "query": query,
                 "includeUserAgentShadowDOM": includeUserAgentShadowDOM,
             }),
-            cls.convert_payload({
-                "searchId": {
-                    "class": str,
-                    "optional": False
-                },
-                "resultCount": {
-                    "class": int,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -670,12 +676,7 @@ identifier.
             cls.build_send_payload("pushNodeByPathToFrontend", {
                 "path": path,
             }),
-            cls.convert_payload({
-                "nodeId": {
-                    "class": NodeId,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -690,12 +691,7 @@ identifier.
             cls.build_send_payload("pushNodesByBackendIdsToFrontend", {
                 "backendNodeIds": backendNodeIds,
             }),
-            cls.convert_payload({
-                "nodeIds": {
-                    "class": [NodeId],
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -714,12 +710,7 @@ identifier.
                 "nodeId": nodeId,
                 "selector": selector,
             }),
-            cls.convert_payload({
-                "nodeId": {
-                    "class": NodeId,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -738,12 +729,7 @@ identifier.
                 "nodeId": nodeId,
                 "selector": selector,
             }),
-            cls.convert_payload({
-                "nodeIds": {
-                    "class": [NodeId],
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -831,12 +817,7 @@ nodes that form the path from the node to the root are also sent to the client a
             cls.build_send_payload("requestNode", {
                 "objectId": objectId,
             }),
-            cls.convert_payload({
-                "nodeId": {
-                    "class": NodeId,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -859,12 +840,7 @@ nodes that form the path from the node to the root are also sent to the client a
                 "backendNodeId": backendNodeId,
                 "objectGroup": objectGroup,
             }),
-            cls.convert_payload({
-                "object": {
-                    "class": Runtime.RemoteObject,
-                    "optional": False
-                },
-            })
+            _decode_resolveNode
         )
 
     @classmethod
@@ -974,12 +950,7 @@ $x functions).
                 "nodeId": nodeId,
                 "name": name,
             }),
-            cls.convert_payload({
-                "nodeId": {
-                    "class": NodeId,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -1042,37 +1013,60 @@ $x functions).
             cls.build_send_payload("getFrameOwner", {
                 "frameId": frameId,
             }),
-            cls.convert_payload({
-                "nodeId": {
-                    "class": NodeId,
-                    "optional": False
-                },
-            })
+            None
         )
 
 
 
+def _decode_describeNode(result):
+    result['node'] = Node.from_json(result['node'])
+    return result
+
+
+def _decode_getBoxModel(result):
+    result['model'] = BoxModel.from_json(result['model'])
+    return result
+
+
+def _decode_getDocument(result):
+    result['root'] = Node.from_json(result['root'])
+    return result
+
+
+def _decode_getFlattenedDocument(result):
+    result['nodes'] = [Node.from_json(i0) for i0 in result['nodes']]
+    return result
+
+
+def _decode_resolveNode(result):
+    result['object'] = Runtime.RemoteObject.from_json(result['object'])
+    return result
+
+
 class AttributeModifiedEvent(BaseEvent):
 
-    js_name = 'Dom.attributeModified'
+    js_name = 'DOM.attributeModified'
     hashable = ['nodeId']
     is_hashable = True
+    __slots__ = ('nodeId', 'name', 'value')
 
     def __init__(self,
                  nodeId: Union['NodeId', dict],
                  name: Union['str', dict],
                  value: Union['str', dict],
                  ):
-        if isinstance(nodeId, dict):
-            nodeId = NodeId(**nodeId)
         self.nodeId = nodeId
-        if isinstance(name, dict):
-            name = str(**name)
         self.name = name
-        if isinstance(value, dict):
-            value = str(**value)
         self.value = value
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, nodeId):
         kwargs = locals()
@@ -1085,21 +1079,26 @@ class AttributeModifiedEvent(BaseEvent):
 
 class AttributeRemovedEvent(BaseEvent):
 
-    js_name = 'Dom.attributeRemoved'
+    js_name = 'DOM.attributeRemoved'
     hashable = ['nodeId']
     is_hashable = True
+    __slots__ = ('nodeId', 'name')
 
     def __init__(self,
                  nodeId: Union['NodeId', dict],
                  name: Union['str', dict],
                  ):
-        if isinstance(nodeId, dict):
-            nodeId = NodeId(**nodeId)
         self.nodeId = nodeId
-        if isinstance(name, dict):
-            name = str(**name)
         self.name = name
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, nodeId):
         kwargs = locals()
@@ -1112,21 +1111,26 @@ class AttributeRemovedEvent(BaseEvent):
 
 class CharacterDataModifiedEvent(BaseEvent):
 
-    js_name = 'Dom.characterDataModified'
+    js_name = 'DOM.characterDataModified'
     hashable = ['nodeId']
     is_hashable = True
+    __slots__ = ('nodeId', 'characterData')
 
     def __init__(self,
                  nodeId: Union['NodeId', dict],
                  characterData: Union['str', dict],
                  ):
-        if isinstance(nodeId, dict):
-            nodeId = NodeId(**nodeId)
         self.nodeId = nodeId
-        if isinstance(characterData, dict):
-            characterData = str(**characterData)
         self.characterData = characterData
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, nodeId):
         kwargs = locals()
@@ -1139,21 +1143,26 @@ class CharacterDataModifiedEvent(BaseEvent):
 
 class ChildNodeCountUpdatedEvent(BaseEvent):
 
-    js_name = 'Dom.childNodeCountUpdated'
+    js_name = 'DOM.childNodeCountUpdated'
     hashable = ['nodeId']
     is_hashable = True
+    __slots__ = ('nodeId', 'childNodeCount')
 
     def __init__(self,
                  nodeId: Union['NodeId', dict],
                  childNodeCount: Union['int', dict],
                  ):
-        if isinstance(nodeId, dict):
-            nodeId = NodeId(**nodeId)
         self.nodeId = nodeId
-        if isinstance(childNodeCount, dict):
-            childNodeCount = int(**childNodeCount)
         self.childNodeCount = childNodeCount
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, nodeId):
         kwargs = locals()
@@ -1166,25 +1175,30 @@ class ChildNodeCountUpdatedEvent(BaseEvent):
 
 class ChildNodeInsertedEvent(BaseEvent):
 
-    js_name = 'Dom.childNodeInserted'
+    js_name = 'DOM.childNodeInserted'
     hashable = ['parentNodeId', 'previousNodeId']
     is_hashable = True
+    __slots__ = ('parentNodeId', 'previousNodeId', 'node')
 
     def __init__(self,
                  parentNodeId: Union['NodeId', dict],
                  previousNodeId: Union['NodeId', dict],
                  node: Union['Node', dict],
                  ):
-        if isinstance(parentNodeId, dict):
-            parentNodeId = NodeId(**parentNodeId)
         self.parentNodeId = parentNodeId
-        if isinstance(previousNodeId, dict):
-            previousNodeId = NodeId(**previousNodeId)
         self.previousNodeId = previousNodeId
         if isinstance(node, dict):
-            node = Node(**node)
+            node = Node.from_json(node)
         self.node = node
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, parentNodeId, previousNodeId):
         kwargs = locals()
@@ -1197,21 +1211,26 @@ class ChildNodeInsertedEvent(BaseEvent):
 
 class ChildNodeRemovedEvent(BaseEvent):
 
-    js_name = 'Dom.childNodeRemoved'
+    js_name = 'DOM.childNodeRemoved'
     hashable = ['parentNodeId', 'nodeId']
     is_hashable = True
+    __slots__ = ('parentNodeId', 'nodeId')
 
     def __init__(self,
                  parentNodeId: Union['NodeId', dict],
                  nodeId: Union['NodeId', dict],
                  ):
-        if isinstance(parentNodeId, dict):
-            parentNodeId = NodeId(**parentNodeId)
         self.parentNodeId = parentNodeId
-        if isinstance(nodeId, dict):
-            nodeId = NodeId(**nodeId)
         self.nodeId = nodeId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, parentNodeId, nodeId):
         kwargs = locals()
@@ -1224,21 +1243,27 @@ class ChildNodeRemovedEvent(BaseEvent):
 
 class DistributedNodesUpdatedEvent(BaseEvent):
 
-    js_name = 'Dom.distributedNodesUpdated'
+    js_name = 'DOM.distributedNodesUpdated'
     hashable = ['insertionPointId']
     is_hashable = True
+    __slots__ = ('insertionPointId', 'distributedNodes')
 
     def __init__(self,
                  insertionPointId: Union['NodeId', dict],
                  distributedNodes: Union['[BackendNode]', dict],
                  ):
-        if isinstance(insertionPointId, dict):
-            insertionPointId = NodeId(**insertionPointId)
         self.insertionPointId = insertionPointId
-        if isinstance(distributedNodes, dict):
-            distributedNodes = [BackendNode](**distributedNodes)
         self.distributedNodes = distributedNodes
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.distributedNodes = [BackendNode.from_json(i0) for i0 in obj.distributedNodes]
+        return obj
+
     @classmethod
     def build_hash(cls, insertionPointId):
         kwargs = locals()
@@ -1251,13 +1276,18 @@ class DistributedNodesUpdatedEvent(BaseEvent):
 
 class DocumentUpdatedEvent(BaseEvent):
 
-    js_name = 'Dom.documentUpdated'
+    js_name = 'DOM.documentUpdated'
     hashable = []
     is_hashable = False
+    __slots__ = ()
 
     def __init__(self):
         pass
 
+    @classmethod
+    def from_json(cls, d):
+        return cls()
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -1265,17 +1295,24 @@ class DocumentUpdatedEvent(BaseEvent):
 
 class InlineStyleInvalidatedEvent(BaseEvent):
 
-    js_name = 'Dom.inlineStyleInvalidated'
+    js_name = 'DOM.inlineStyleInvalidated'
     hashable = ['nodeIds']
     is_hashable = True
+    __slots__ = ('nodeIds',)
 
     def __init__(self,
                  nodeIds: Union['[NodeId]', dict],
                  ):
-        if isinstance(nodeIds, dict):
-            nodeIds = [NodeId](**nodeIds)
         self.nodeIds = nodeIds
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, nodeIds):
         kwargs = locals()
@@ -1288,21 +1325,28 @@ class InlineStyleInvalidatedEvent(BaseEvent):
 
 class PseudoElementAddedEvent(BaseEvent):
 
-    js_name = 'Dom.pseudoElementAdded'
+    js_name = 'DOM.pseudoElementAdded'
     hashable = ['parentId']
     is_hashable = True
+    __slots__ = ('parentId', 'pseudoElement')
 
     def __init__(self,
                  parentId: Union['NodeId', dict],
                  pseudoElement: Union['Node', dict],
                  ):
-        if isinstance(parentId, dict):
-            parentId = NodeId(**parentId)
         self.parentId = parentId
         if isinstance(pseudoElement, dict):
-            pseudoElement = Node(**pseudoElement)
+            pseudoElement = Node.from_json(pseudoElement)
         self.pseudoElement = pseudoElement
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, parentId):
         kwargs = locals()
@@ -1315,21 +1359,26 @@ class PseudoElementAddedEvent(BaseEvent):
 
 class PseudoElementRemovedEvent(BaseEvent):
 
-    js_name = 'Dom.pseudoElementRemoved'
+    js_name = 'DOM.pseudoElementRemoved'
     hashable = ['parentId', 'pseudoElementId']
     is_hashable = True
+    __slots__ = ('parentId', 'pseudoElementId')
 
     def __init__(self,
                  parentId: Union['NodeId', dict],
                  pseudoElementId: Union['NodeId', dict],
                  ):
-        if isinstance(parentId, dict):
-            parentId = NodeId(**parentId)
         self.parentId = parentId
-        if isinstance(pseudoElementId, dict):
-            pseudoElementId = NodeId(**pseudoElementId)
         self.pseudoElementId = pseudoElementId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, parentId, pseudoElementId):
         kwargs = locals()
@@ -1342,21 +1391,27 @@ class PseudoElementRemovedEvent(BaseEvent):
 
 class SetChildNodesEvent(BaseEvent):
 
-    js_name = 'Dom.setChildNodes'
+    js_name = 'DOM.setChildNodes'
     hashable = ['parentId']
     is_hashable = True
+    __slots__ = ('parentId', 'nodes')
 
     def __init__(self,
                  parentId: Union['NodeId', dict],
                  nodes: Union['[Node]', dict],
                  ):
-        if isinstance(parentId, dict):
-            parentId = NodeId(**parentId)
         self.parentId = parentId
-        if isinstance(nodes, dict):
-            nodes = [Node](**nodes)
         self.nodes = nodes
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.nodes = [Node.from_json(i0) for i0 in obj.nodes]
+        return obj
+
     @classmethod
     def build_hash(cls, parentId):
         kwargs = locals()
@@ -1369,21 +1424,26 @@ class SetChildNodesEvent(BaseEvent):
 
 class ShadowRootPoppedEvent(BaseEvent):
 
-    js_name = 'Dom.shadowRootPopped'
+    js_name = 'DOM.shadowRootPopped'
     hashable = ['hostId', 'rootId']
     is_hashable = True
+    __slots__ = ('hostId', 'rootId')
 
     def __init__(self,
                  hostId: Union['NodeId', dict],
                  rootId: Union['NodeId', dict],
                  ):
-        if isinstance(hostId, dict):
-            hostId = NodeId(**hostId)
         self.hostId = hostId
-        if isinstance(rootId, dict):
-            rootId = NodeId(**rootId)
         self.rootId = rootId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, hostId, rootId):
         kwargs = locals()
@@ -1396,21 +1456,28 @@ class ShadowRootPoppedEvent(BaseEvent):
 
 class ShadowRootPushedEvent(BaseEvent):
 
-    js_name = 'Dom.shadowRootPushed'
+    js_name = 'DOM.shadowRootPushed'
     hashable = ['hostId']
     is_hashable = True
+    __slots__ = ('hostId', 'root')
 
     def __init__(self,
                  hostId: Union['NodeId', dict],
                  root: Union['Node', dict],
                  ):
-        if isinstance(hostId, dict):
-            hostId = NodeId(**hostId)
         self.hostId = hostId
         if isinstance(root, dict):
-            root = Node(**root)
+            root = Node.from_json(root)
         self.root = root
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, hostId):
         kwargs = locals()
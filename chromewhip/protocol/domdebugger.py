@@ -7,19 +7,24 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
+
 from chromewhip.protocol import dom as DOM
 from chromewhip.protocol import debugger as Debugger
+from chromewhip.protocol import runtime as Runtime
 
 # DOMBreakpointType: DOM breakpoint type.
 DOMBreakpointType = str
 
 # EventListener: Object event listener.
 class EventListener(ChromeTypeBase):
+    __slots__ = ('type', 'useCapture', 'passive', 'once', 'scriptId', 'lineNumber', 'columnNumber', 'handler', 'originalHandler', 'backendNodeId')
+
     def __init__(self,
                  type: Union['str'],
                  useCapture: Union['bool'],
@@ -44,6 +49,19 @@ class EventListener(ChromeTypeBase):
         self.originalHandler = originalHandler
         self.backendNodeId = backendNodeId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.scriptId = intern(obj.scriptId)
+        if obj.handler is not None:
+            obj.handler = Runtime.RemoteObject.from_json(obj.handler)
+        if obj.originalHandler is not None:
+            obj.originalHandler = Runtime.RemoteObject.from_json(obj.originalHandler)
+        return obj
+
 
 class DOMDebugger(PayloadMixin):
     """ DOM debugging allows setting breakpoints on particular DOM operations and events. JavaScript
@@ -71,12 +89,7 @@ entire subtree or provide an integer larger than 0.
                 "depth": depth,
                 "pierce": pierce,
             }),
-            cls.convert_payload({
-                "listeners": {
-                    "class": [EventListener],
-                    "optional": False
-                },
-            })
+            _decode_getEventListeners
         )
 
     @classmethod
@@ -216,3 +229,8 @@ EventTarget.
             None
         )
 
+
+
+def _decode_getEventListeners(result):
+    result['listeners'] = [EventListener.from_json(i0) for i0 in result['listeners']]
+    return result
@@ -7,11 +7,13 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
+
 from chromewhip.protocol import css as CSS
 from chromewhip.protocol import dom as DOM
 from chromewhip.protocol import domdebugger as DOMDebugger
@@ -19,6 +21,8 @@ from chromewhip.protocol import page as Page
 
 # DOMNode: A Node in the DOM tree.
 class DOMNode(ChromeTypeBase):
+    __slots__ = ('nodeType', 'nodeName', 'nodeValue', 'textValue', 'inputValue', 'inputChecked', 'optionSelected', 'backendNodeId', 'childNodeIndexes', 'attributes', 'pseudoElementIndexes', 'layoutNodeIndex', 'documentURL', 'baseURL', 'contentLanguage', 'documentEncoding', 'publicId', 'systemId', 'frameId', 'contentDocumentIndex', 'pseudoType', 'shadowRootType', 'isClickable', 'eventListeners', 'currentSourceURL', 'originURL')
+
     def __init__(self,
                  nodeType: Union['int'],
                  nodeName: Union['str'],
@@ -75,9 +79,25 @@ class DOMNode(ChromeTypeBase):
         self.currentSourceURL = currentSourceURL
         self.originURL = originURL
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.attributes is not None:
+            obj.attributes = [NameValue.from_json(i0) for i0 in obj.attributes]
+        if obj.frameId is not None:
+            obj.frameId = intern(obj.frameId)
+        if obj.eventListeners is not None:
+            obj.eventListeners = [DOMDebugger.EventListener.from_json(i0) for i0 in obj.eventListeners]
+        return obj
+
 
 # InlineTextBox: Details of post layout rendered text positions. The exact layout should not be regarded asstable and may change between versions.
 class InlineTextBox(ChromeTypeBase):
+    __slots__ = ('boundingBox', 'startCharacterIndex', 'numCharacters')
+
     def __init__(self,
                  boundingBox: Union['DOM.Rect'],
                  startCharacterIndex: Union['int'],
@@ -88,9 +108,20 @@ class InlineTextBox(ChromeTypeBase):
         self.startCharacterIndex = startCharacterIndex
         self.numCharacters = numCharacters
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.boundingBox = DOM.Rect.from_json(obj.boundingBox)
+        return obj
+
 
 # LayoutTreeNode: Details of an element in the DOM tree with a LayoutObject.
 class LayoutTreeNode(ChromeTypeBase):
+    __slots__ = ('domNodeIndex', 'boundingBox', 'layoutText', 'inlineTextNodes', 'styleIndex', 'paintOrder')
+
     def __init__(self,
                  domNodeIndex: Union['int'],
                  boundingBox: Union['DOM.Rect'],
@@ -107,18 +138,42 @@ class LayoutTreeNode(ChromeTypeBase):
         self.styleIndex = styleIndex
         self.paintOrder = paintOrder
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.boundingBox = DOM.Rect.from_json(obj.boundingBox)
+        if obj.inlineTextNodes is not None:
+            obj.inlineTextNodes = [InlineTextBox.from_json(i0) for i0 in obj.inlineTextNodes]
+        return obj
+
 
 # ComputedStyle: A subset of the full ComputedStyle as defined by the request whitelist.
 class ComputedStyle(ChromeTypeBase):
+    __slots__ = ('properties',)
+
     def __init__(self,
                  properties: Union['[NameValue]'],
                  ):
 
         self.properties = properties
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.properties = [NameValue.from_json(i0) for i0 in obj.properties]
+        return obj
+
 
 # NameValue: A name/value pair.
 class NameValue(ChromeTypeBase):
+    __slots__ = ('name', 'value')
+
     def __init__(self,
                  name: Union['str'],
                  value: Union['str'],
@@ -127,6 +182,14 @@ class NameValue(ChromeTypeBase):
         self.name = name
         self.value = value
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # StringIndex: Index of the string in the strings table.
 StringIndex = int
@@ -136,6 +199,8 @@ ArrayOfStrings = [StringIndex]
 
 # RareStringData: Data that is only present on rare nodes.
 class RareStringData(ChromeTypeBase):
+    __slots__ = ('index', 'value')
+
     def __init__(self,
                  index: Union['[]'],
                  value: Union['[StringIndex]'],
@@ -144,18 +209,38 @@ class RareStringData(ChromeTypeBase):
         self.index = index
         self.value = value
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # RareBooleanData: 
 class RareBooleanData(ChromeTypeBase):
+    __slots__ = ('index',)
+
     def __init__(self,
                  index: Union['[]'],
                  ):
 
         self.index = index
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # RareIntegerData: 
 class RareIntegerData(ChromeTypeBase):
+    __slots__ = ('index', 'value')
+
     def __init__(self,
                  index: Union['[]'],
                  value: Union['[]'],
@@ -164,12 +249,22 @@ class RareIntegerData(ChromeTypeBase):
         self.index = index
         self.value = value
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # Rectangle: 
 Rectangle = [float]
 
 # DocumentSnapshot: Document snapshot.
 class DocumentSnapshot(ChromeTypeBase):
+    __slots__ = ('documentURL', 'baseURL', 'contentLanguage', 'encodingName', 'publicId', 'systemId', 'frameId', 'nodes', 'layout', 'textBoxes')
+
     def __init__(self,
                  documentURL: Union['StringIndex'],
                  baseURL: Union['StringIndex'],
@@ -194,9 +289,22 @@ class DocumentSnapshot(ChromeTypeBase):
         self.layout = layout
         self.textBoxes = textBoxes
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.nodes = NodeTreeSnapshot.from_json(obj.nodes)
+        obj.layout = LayoutTreeSnapshot.from_json(obj.layout)
+        obj.textBoxes = TextBoxSnapshot.from_json(obj.textBoxes)
+        return obj
+
 
 # NodeTreeSnapshot: Table containing nodes.
 class NodeTreeSnapshot(ChromeTypeBase):
+    __slots__ = ('parentIndex', 'nodeType', 'nodeName', 'nodeValue', 'backendNodeId', 'attributes', 'textValue', 'inputValue', 'inputChecked', 'optionSelected', 'contentDocumentIndex', 'pseudoType', 'isClickable', 'currentSourceURL', 'originURL')
+
     def __init__(self,
                  parentIndex: Optional['[]'] = None,
                  nodeType: Optional['[]'] = None,
@@ -231,9 +339,37 @@ class NodeTreeSnapshot(ChromeTypeBase):
         self.currentSourceURL = currentSourceURL
         self.originURL = originURL
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.textValue is not None:
+            obj.textValue = RareStringData.from_json(obj.textValue)
+        if obj.inputValue is not None:
+            obj.inputValue = RareStringData.from_json(obj.inputValue)
+        if obj.inputChecked is not None:
+            obj.inputChecked = RareBooleanData.from_json(obj.inputChecked)
+        if obj.optionSelected is not None:
+            obj.optionSelected = RareBooleanData.from_json(obj.optionSelected)
+        if obj.contentDocumentIndex is not None:
+            obj.contentDocumentIndex = RareIntegerData.from_json(obj.contentDocumentIndex)
+        if obj.pseudoType is not None:
+            obj.pseudoType = RareStringData.from_json(obj.pseudoType)
+        if obj.isClickable is not None:
+            obj.isClickable = RareBooleanData.from_json(obj.isClickable)
+        if obj.currentSourceURL is not None:
+            obj.currentSourceURL = RareStringData.from_json(obj.currentSourceURL)
+        if obj.originURL is not None:
+            obj.originURL = RareStringData.from_json(obj.originURL)
+        return obj
+
 
 # LayoutTreeSnapshot: Details of an element in the DOM tree with a LayoutObject.
 class LayoutTreeSnapshot(ChromeTypeBase):
+    __slots__ = ('nodeIndex', 'styles', 'bounds', 'text')
+
     def __init__(self,
                  nodeIndex: Union['[]'],
                  styles: Union['[ArrayOfStrings]'],
@@ -246,9 +382,19 @@ class LayoutTreeSnapshot(ChromeTypeBase):
         self.bounds = bounds
         self.text = text
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # TextBoxSnapshot: Details of post layout rendered text positions. The exact layout should not be regarded asstable and may change between versions.
 class TextBoxSnapshot(ChromeTypeBase):
+    __slots__ = ('layoutIndex', 'bounds', 'start', 'length')
+
     def __init__(self,
                  layoutIndex: Union['[]'],
                  bounds: Union['[Rectangle]'],
@@ -261,6 +407,14 @@ class TextBoxSnapshot(ChromeTypeBase):
         self.start = start
         self.length = length
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 class DOMSnapshot(PayloadMixin):
     """ This domain facilitates obtaining document snapshots with DOM, layout, and style information.
@@ -312,20 +466,7 @@ flattened.
                 "includePaintOrder": includePaintOrder,
                 "includeUserAgentShadowTree": includeUserAgentShadowTree,
             }),
-            cls.convert_payload({
-                "domNodes": {
-                    "class": [DOMNode],
-                    "optional": False
-                },
-                "layoutTreeNodes": {
-                    "class": [LayoutTreeNode],
-                    "optional": False
-                },
-                "computedStyles": {
-                    "class": [ComputedStyle],
-                    "optional": False
-                },
-            })
+            _decode_getSnapshot
         )
 
     @classmethod
@@ -343,15 +484,18 @@ flattened.
             cls.build_send_payload("captureSnapshot", {
                 "computedStyles": computedStyles,
             }),
-            cls.convert_payload({
-                "documents": {
-                    "class": [DocumentSnapshot],
-                    "optional": False
-                },
-                "strings": {
-                    "class": [],
-                    "optional": False
-                },
-            })
+            _decode_captureSnapshot
         )
 
+
+
+def _decode_getSnapshot(result):
+    result['domNodes'] = [DOMNode.from_json(i0) for i0 in result['domNodes']]
+    result['layoutTreeNodes'] = [LayoutTreeNode.from_json(i0) for i0 in result['layoutTreeNodes']]
+    result['computedStyles'] = [ComputedStyle.from_json(i0) for i0 in result['computedStyles']]
+    return result
+
+
+def _decode_captureSnapshot(result):
+    result['documents'] = [DocumentSnapshot.from_json(i0) for i0 in result['documents']]
+    return result
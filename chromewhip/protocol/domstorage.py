@@ -7,14 +7,18 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
 
+
 # StorageId: DOM Storage identifier.
 class StorageId(ChromeTypeBase):
+    __slots__ = ('securityOrigin', 'isLocalStorage')
+
     def __init__(self,
                  securityOrigin: Union['str'],
                  isLocalStorage: Union['bool'],
@@ -23,6 +27,14 @@ class StorageId(ChromeTypeBase):
         self.securityOrigin = securityOrigin
         self.isLocalStorage = isLocalStorage
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # Item: DOM Storage item.
 Item = [str]
@@ -77,12 +89,7 @@ class DOMStorage(PayloadMixin):
             cls.build_send_payload("getDOMStorageItems", {
                 "storageId": storageId,
             }),
-            cls.convert_payload({
-                "entries": {
-                    "class": [Item],
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -131,9 +138,10 @@ class DOMStorage(PayloadMixin):
 
 class DomStorageItemAddedEvent(BaseEvent):
 
-    js_name = 'Domstorage.domStorageItemAdded'
+    js_name = 'DOMStorage.domStorageItemAdded'
     hashable = ['storageId']
     is_hashable = True
+    __slots__ = ('storageId', 'key', 'newValue')
 
     def __init__(self,
                  storageId: Union['StorageId', dict],
@@ -141,15 +149,19 @@ class DomStorageItemAddedEvent(BaseEvent):
                  newValue: Union['str', dict],
                  ):
         if isinstance(storageId, dict):
-            storageId = StorageId(**storageId)
+            storageId = StorageId.from_json(storageId)
         self.storageId = storageId
-        if isinstance(key, dict):
-            key = str(**key)
         self.key = key
-        if isinstance(newValue, dict):
-            newValue = str(**newValue)
         self.newValue = newValue
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, storageId):
         kwargs = locals()
@@ -162,21 +174,28 @@ class DomStorageItemAddedEvent(BaseEvent):
 
 class DomStorageItemRemovedEvent(BaseEvent):
 
-    js_name = 'Domstorage.domStorageItemRemoved'
+    js_name = 'DOMStorage.domStorageItemRemoved'
     hashable = ['storageId']
     is_hashable = True
+    __slots__ = ('storageId', 'key')
 
     def __init__(self,
                  storageId: Union['StorageId', dict],
                  key: Union['str', dict],
                  ):
         if isinstance(storageId, dict):
-            storageId = StorageId(**storageId)
+            storageId = StorageId.from_json(storageId)
         self.storageId = storageId
-        if isinstance(key, dict):
-            key = str(**key)
         self.key = key
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, storageId):
         kwargs = locals()
@@ -189,9 +208,10 @@ class DomStorageItemRemovedEvent(BaseEvent):
 
 class DomStorageItemUpdatedEvent(BaseEvent):
 
-    js_name = 'Domstorage.domStorageItemUpdated'
+    js_name = 'DOMStorage.domStorageItemUpdated'
     hashable = ['storageId']
     is_hashable = True
+    __slots__ = ('storageId', 'key', 'oldValue', 'newValue')
 
     def __init__(self,
                  storageId: Union['StorageId', dict],
@@ -200,18 +220,20 @@ class DomStorageItemUpdatedEvent(BaseEvent):
                  newValue: Union['str', dict],
                  ):
         if isinstance(storageId, dict):
-            storageId = StorageId(**storageId)
+            storageId = StorageId.from_json(storageId)
         self.storageId = storageId
-        if isinstance(key, dict):
-            key = str(**key)
         self.key = key
-        if isinstance(oldValue, dict):
-            oldValue = str(**oldValue)
         self.oldValue = oldValue
-        if isinstance(newValue, dict):
-            newValue = str(**newValue)
         self.newValue = newValue
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, storageId):
         kwargs = locals()
@@ -224,17 +246,26 @@ class DomStorageItemUpdatedEvent(BaseEvent):
 
 class DomStorageItemsClearedEvent(BaseEvent):
 
-    js_name = 'Domstorage.domStorageItemsCleared'
+    js_name = 'DOMStorage.domStorageItemsCleared'
     hashable = ['storageId']
     is_hashable = True
+    __slots__ = ('storageId',)
 
     def __init__(self,
                  storageId: Union['StorageId', dict],
                  ):
         if isinstance(storageId, dict):
-            storageId = StorageId(**storageId)
+            storageId = StorageId.from_json(storageId)
         self.storageId = storageId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, storageId):
         kwargs = locals()
@@ -7,17 +7,21 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
+
 from chromewhip.protocol import dom as DOM
 from chromewhip.protocol import page as Page
 from chromewhip.protocol import runtime as Runtime
 
 # ScreenOrientation: Screen orientation.
 class ScreenOrientation(ChromeTypeBase):
+    __slots__ = ('type', 'angle')
+
     def __init__(self,
                  type: Union['str'],
                  angle: Union['int'],
@@ -26,6 +30,14 @@ class ScreenOrientation(ChromeTypeBase):
         self.type = type
         self.angle = angle
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # VirtualTimePolicy: advance: If the scheduler runs out of immediate work, the virtual time base may fast forward toallow the next delayed task (if any) to run; pause: The virtual time base may not advance;pauseIfNetworkFetchesPending: The virtual time base may not advance if there are any pendingresource fetches.
 VirtualTimePolicy = str
@@ -40,12 +52,7 @@ class Emulation(PayloadMixin):
         return (
             cls.build_send_payload("canEmulate", {
             }),
-            cls.convert_payload({
-                "result": {
-                    "class": bool,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -357,12 +364,7 @@ Note any previous deferred policy change is superseded.
                 "waitForNavigation": waitForNavigation,
                 "initialVirtualTime": initialVirtualTime,
             }),
-            cls.convert_payload({
-                "virtualTimeTicksBase": {
-                    "class": float,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -416,14 +418,21 @@ class VirtualTimeAdvancedEvent(BaseEvent):
     js_name = 'Emulation.virtualTimeAdvanced'
     hashable = []
     is_hashable = False
+    __slots__ = ('virtualTimeElapsed',)
 
     def __init__(self,
                  virtualTimeElapsed: Union['float', dict],
                  ):
-        if isinstance(virtualTimeElapsed, dict):
-            virtualTimeElapsed = float(**virtualTimeElapsed)
         self.virtualTimeElapsed = virtualTimeElapsed
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -434,10 +443,15 @@ class VirtualTimeBudgetExpiredEvent(BaseEvent):
     js_name = 'Emulation.virtualTimeBudgetExpired'
     hashable = []
     is_hashable = False
+    __slots__ = ()
 
     def __init__(self):
         pass
 
+    @classmethod
+    def from_json(cls, d):
+        return cls()
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -448,14 +462,21 @@ class VirtualTimePausedEvent(BaseEvent):
     js_name = 'Emulation.virtualTimePaused'
     hashable = []
     is_hashable = False
+    __slots__ = ('virtualTimeElapsed',)
 
     def __init__(self,
                  virtualTimeElapsed: Union['float', dict],
                  ):
-        if isinstance(virtualTimeElapsed, dict):
-            virtualTimeElapsed = float(**virtualTimeElapsed)
         self.virtualTimeElapsed = virtualTimeElapsed
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
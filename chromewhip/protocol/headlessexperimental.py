@@ -7,16 +7,20 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
+
 from chromewhip.protocol import page as Page
 from chromewhip.protocol import runtime as Runtime
 
 # ScreenshotParams: Encoding options for a screenshot.
 class ScreenshotParams(ChromeTypeBase):
+    __slots__ = ('format', 'quality')
+
     def __init__(self,
                  format: Optional['str'] = None,
                  quality: Optional['int'] = None,
@@ -25,6 +29,14 @@ class ScreenshotParams(ChromeTypeBase):
         self.format = format
         self.quality = quality
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 class HeadlessExperimental(PayloadMixin):
     """ This domain provides experimental commands only supported in headless mode.
@@ -62,16 +74,7 @@ during renderer initialization. In such a case, no screenshot data will be retur
                 "noDisplayUpdates": noDisplayUpdates,
                 "screenshot": screenshot,
             }),
-            cls.convert_payload({
-                "hasDamage": {
-                    "class": bool,
-                    "optional": False
-                },
-                "screenshotData": {
-                    "class": str,
-                    "optional": True
-                },
-            })
+            None
         )
 
     @classmethod
@@ -98,17 +101,24 @@ during renderer initialization. In such a case, no screenshot data will be retur
 
 class NeedsBeginFramesChangedEvent(BaseEvent):
 
-    js_name = 'Headlessexperimental.needsBeginFramesChanged'
+    js_name = 'HeadlessExperimental.needsBeginFramesChanged'
     hashable = []
     is_hashable = False
+    __slots__ = ('needsBeginFrames',)
 
     def __init__(self,
                  needsBeginFrames: Union['bool', dict],
                  ):
-        if isinstance(needsBeginFrames, dict):
-            needsBeginFrames = bool(**needsBeginFrames)
         self.needsBeginFrames = needsBeginFrames
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -7,11 +7,13 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
+
 from chromewhip.protocol import runtime as Runtime
 
 # HeapSnapshotObjectId: Heap snapshot object id.
@@ -19,6 +21,8 @@ HeapSnapshotObjectId = str
 
 # SamplingHeapProfileNode: Sampling Heap Profile node. Holds callsite information, allocation statistics and child nodes.
 class SamplingHeapProfileNode(ChromeTypeBase):
+    __slots__ = ('callFrame', 'selfSize', 'children')
+
     def __init__(self,
                  callFrame: Union['Runtime.CallFrame'],
                  selfSize: Union['float'],
@@ -29,15 +33,36 @@ class SamplingHeapProfileNode(ChromeTypeBase):
         self.selfSize = selfSize
         self.children = children
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.callFrame = Runtime.CallFrame.from_json(obj.callFrame)
+        obj.children = [SamplingHeapProfileNode.from_json(i0) for i0 in obj.children]
+        return obj
+
 
 # SamplingHeapProfile: Profile.
 class SamplingHeapProfile(ChromeTypeBase):
+    __slots__ = ('head',)
+
     def __init__(self,
                  head: Union['SamplingHeapProfileNode'],
                  ):
 
         self.head = head
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.head = SamplingHeapProfileNode.from_json(obj.head)
+        return obj
+
 
 class HeapProfiler(PayloadMixin):
     """ 
@@ -100,12 +125,7 @@ $x functions).
             cls.build_send_payload("getHeapObjectId", {
                 "objectId": objectId,
             }),
-            cls.convert_payload({
-                "heapSnapshotObjectId": {
-                    "class": HeapSnapshotObjectId,
-                    "optional": False
-                },
-            })
+            _decode_getHeapObjectId
         )
 
     @classmethod
@@ -124,12 +144,7 @@ $x functions).
                 "objectId": objectId,
                 "objectGroup": objectGroup,
             }),
-            cls.convert_payload({
-                "result": {
-                    "class": Runtime.RemoteObject,
-                    "optional": False
-                },
-            })
+            _decode_getObjectByHeapObjectId
         )
 
     @classmethod
@@ -139,12 +154,7 @@ $x functions).
         return (
             cls.build_send_payload("getSamplingProfile", {
             }),
-            cls.convert_payload({
-                "profile": {
-                    "class": SamplingHeapProfile,
-                    "optional": False
-                },
-            })
+            _decode_getSamplingProfile
         )
 
     @classmethod
@@ -185,12 +195,7 @@ default value is 32768 bytes.
         return (
             cls.build_send_payload("stopSampling", {
             }),
-            cls.convert_payload({
-                "profile": {
-                    "class": SamplingHeapProfile,
-                    "optional": False
-                },
-            })
+            _decode_stopSampling
         )
 
     @classmethod
@@ -226,19 +231,46 @@ when the tracking is stopped.
 
 
 
+def _decode_getHeapObjectId(result):
+    result['heapSnapshotObjectId'] = intern(result['heapSnapshotObjectId'])
+    return result
+
+
+def _decode_getObjectByHeapObjectId(result):
+    result['result'] = Runtime.RemoteObject.from_json(result['result'])
+    return result
+
+
+def _decode_getSamplingProfile(result):
+    result['profile'] = SamplingHeapProfile.from_json(result['profile'])
+    return result
+
+
+def _decode_stopSampling(result):
+    result['profile'] = SamplingHeapProfile.from_json(result['profile'])
+    return result
+
+
 class AddHeapSnapshotChunkEvent(BaseEvent):
 
-    js_name = 'Heapprofiler.addHeapSnapshotChunk'
+    js_name = 'HeapProfiler.addHeapSnapshotChunk'
     hashable = []
     is_hashable = False
+    __slots__ = ('chunk',)
 
     def __init__(self,
                  chunk: Union['str', dict],
                  ):
-        if isinstance(chunk, dict):
-            chunk = str(**chunk)
         self.chunk = chunk
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -246,17 +278,24 @@ class AddHeapSnapshotChunkEvent(BaseEvent):
 
 class HeapStatsUpdateEvent(BaseEvent):
 
-    js_name = 'Heapprofiler.heapStatsUpdate'
+    js_name = 'HeapProfiler.heapStatsUpdate'
     hashable = []
     is_hashable = False
+    __slots__ = ('statsUpdate',)
 
     def __init__(self,
                  statsUpdate: Union['[]', dict],
                  ):
-        if isinstance(statsUpdate, dict):
-            statsUpdate = [](**statsUpdate)
         self.statsUpdate = statsUpdate
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -264,21 +303,26 @@ class HeapStatsUpdateEvent(BaseEvent):
 
 class LastSeenObjectIdEvent(BaseEvent):
 
-    js_name = 'Heapprofiler.lastSeenObjectId'
+    js_name = 'HeapProfiler.lastSeenObjectId'
     hashable = ['lastSeenObjectId']
     is_hashable = True
+    __slots__ = ('lastSeenObjectId', 'timestamp')
 
     def __init__(self,
                  lastSeenObjectId: Union['int', dict],
                  timestamp: Union['float', dict],
                  ):
-        if isinstance(lastSeenObjectId, dict):
-            lastSeenObjectId = int(**lastSeenObjectId)
         self.lastSeenObjectId = lastSeenObjectId
-        if isinstance(timestamp, dict):
-            timestamp = float(**timestamp)
         self.timestamp = timestamp
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, lastSeenObjectId):
         kwargs = locals()
@@ -291,25 +335,28 @@ class LastSeenObjectIdEvent(BaseEvent):
 
 class ReportHeapSnapshotProgressEvent(BaseEvent):
 
-    js_name = 'Heapprofiler.reportHeapSnapshotProgress'
+    js_name = 'HeapProfiler.reportHeapSnapshotProgress'
     hashable = []
     is_hashable = False
+    __slots__ = ('done', 'total', 'finished')
 
     def __init__(self,
                  done: Union['int', dict],
                  total: Union['int', dict],
                  finished: Union['bool', dict, None] = None,
                  ):
-        if isinstance(done, dict):
-            done = int(**done)
         self.done = done
-        if isinstance(total, dict):
-            total = int(**total)
         self.total = total
-        if isinstance(finished, dict):
-            finished = bool(**finished)
         self.finished = finished
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -317,13 +364,18 @@ class ReportHeapSnapshotProgressEvent(BaseEvent):
 
 class ResetProfilesEvent(BaseEvent):
 
-    js_name = 'Heapprofiler.resetProfiles'
+    js_name = 'HeapProfiler.resetProfiles'
     hashable = []
     is_hashable = False
+    __slots__ = ()
 
     def __init__(self):
         pass
 
+    @classmethod
+    def from_json(cls, d):
+        return cls()
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
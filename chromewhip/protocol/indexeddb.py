@@ -7,15 +7,19 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
+
 from chromewhip.protocol import runtime as Runtime
 
 # DatabaseWithObjectStores: Database with an array of object stores.
 class DatabaseWithObjectStores(ChromeTypeBase):
+    __slots__ = ('name', 'version', 'objectStores')
+
     def __init__(self,
                  name: Union['str'],
                  version: Union['int'],
@@ -26,9 +30,20 @@ class DatabaseWithObjectStores(ChromeTypeBase):
         self.version = version
         self.objectStores = objectStores
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.objectStores = [ObjectStore.from_json(i0) for i0 in obj.objectStores]
+        return obj
+
 
 # ObjectStore: Object store.
 class ObjectStore(ChromeTypeBase):
+    __slots__ = ('name', 'keyPath', 'autoIncrement', 'indexes')
+
     def __init__(self,
                  name: Union['str'],
                  keyPath: Union['KeyPath'],
@@ -41,9 +56,21 @@ class ObjectStore(ChromeTypeBase):
         self.autoIncrement = autoIncrement
         self.indexes = indexes
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.keyPath = KeyPath.from_json(obj.keyPath)
+        obj.indexes = [ObjectStoreIndex.from_json(i0) for i0 in obj.indexes]
+        return obj
+
 
 # ObjectStoreIndex: Object store index.
 class ObjectStoreIndex(ChromeTypeBase):
+    __slots__ = ('name', 'keyPath', 'unique', 'multiEntry')
+
     def __init__(self,
                  name: Union['str'],
                  keyPath: Union['KeyPath'],
@@ -56,9 +83,20 @@ class ObjectStoreIndex(ChromeTypeBase):
         self.unique = unique
         self.multiEntry = multiEntry
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.keyPath = KeyPath.from_json(obj.keyPath)
+        return obj
+
 
 # Key: Key.
 class Key(ChromeTypeBase):
+    __slots__ = ('type', 'number', 'string', 'date', 'array')
+
     def __init__(self,
                  type: Union['str'],
                  number: Optional['float'] = None,
@@ -73,9 +111,21 @@ class Key(ChromeTypeBase):
         self.date = date
         self.array = array
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.array is not None:
+            obj.array = [Key.from_json(i0) for i0 in obj.array]
+        return obj
+
 
 # KeyRange: Key range.
 class KeyRange(ChromeTypeBase):
+    __slots__ = ('lower', 'upper', 'lowerOpen', 'upperOpen')
+
     def __init__(self,
                  lowerOpen: Union['bool'],
                  upperOpen: Union['bool'],
@@ -88,9 +138,23 @@ class KeyRange(ChromeTypeBase):
         self.lowerOpen = lowerOpen
         self.upperOpen = upperOpen
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.lower is not None:
+            obj.lower = Key.from_json(obj.lower)
+        if obj.upper is not None:
+            obj.upper = Key.from_json(obj.upper)
+        return obj
+
 
 # DataEntry: Data entry.
 class DataEntry(ChromeTypeBase):
+    __slots__ = ('key', 'primaryKey', 'value')
+
     def __init__(self,
                  key: Union['Runtime.RemoteObject'],
                  primaryKey: Union['Runtime.RemoteObject'],
@@ -101,9 +165,22 @@ class DataEntry(ChromeTypeBase):
         self.primaryKey = primaryKey
         self.value = value
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.key = Runtime.RemoteObject.from_json(obj.key)
+        obj.primaryKey = Runtime.RemoteObject.from_json(obj.primaryKey)
+        obj.value = Runtime.RemoteObject.from_json(obj.value)
+        return obj
+
 
 # KeyPath: Key path.
 class KeyPath(ChromeTypeBase):
+    __slots__ = ('type', 'string', 'array')
+
     def __init__(self,
                  type: Union['str'],
                  string: Optional['str'] = None,
@@ -114,6 +191,14 @@ class KeyPath(ChromeTypeBase):
         self.string = string
         self.array = array
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 class IndexedDB(PayloadMixin):
     """ 
@@ -243,16 +328,7 @@ class IndexedDB(PayloadMixin):
                 "pageSize": pageSize,
                 "keyRange": keyRange,
             }),
-            cls.convert_payload({
-                "objectStoreDataEntries": {
-                    "class": [DataEntry],
-                    "optional": False
-                },
-                "hasMore": {
-                    "class": bool,
-                    "optional": False
-                },
-            })
+            _decode_requestData
         )
 
     @classmethod
@@ -271,12 +347,7 @@ class IndexedDB(PayloadMixin):
                 "securityOrigin": securityOrigin,
                 "databaseName": databaseName,
             }),
-            cls.convert_payload({
-                "databaseWithObjectStores": {
-                    "class": DatabaseWithObjectStores,
-                    "optional": False
-                },
-            })
+            _decode_requestDatabase
         )
 
     @classmethod
@@ -291,11 +362,16 @@ class IndexedDB(PayloadMixin):
             cls.build_send_payload("requestDatabaseNames", {
                 "securityOrigin": securityOrigin,
             }),
-            cls.convert_payload({
-                "databaseNames": {
-                    "class": [],
-                    "optional": False
-                },
-            })
+            None
         )
 
+
+
+def _decode_requestData(result):
+    result['objectStoreDataEntries'] = [DataEntry.from_json(i0) for i0 in result['objectStoreDataEntries']]
+    return result
+
+
+def _decode_requestDatabase(result):
+    result['databaseWithObjectStores'] = DatabaseWithObjectStores.from_json(result['databaseWithObjectStores'])
+    return result
@@ -7,14 +7,18 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
 
+
 # TouchPoint: 
 class TouchPoint(ChromeTypeBase):
+    __slots__ = ('x', 'y', 'radiusX', 'radiusY', 'rotationAngle', 'force', 'id')
+
     def __init__(self,
                  x: Union['float'],
                  y: Union['float'],
@@ -33,6 +37,14 @@ class TouchPoint(ChromeTypeBase):
         self.force = force
         self.id = id
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # GestureSourceType: 
 GestureSourceType = str
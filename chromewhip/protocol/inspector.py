@@ -7,12 +7,14 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
 
+
 class Inspector(PayloadMixin):
     """ 
     """
@@ -43,14 +45,21 @@ class DetachedEvent(BaseEvent):
     js_name = 'Inspector.detached'
     hashable = []
     is_hashable = False
+    __slots__ = ('reason',)
 
     def __init__(self,
                  reason: Union['str', dict],
                  ):
-        if isinstance(reason, dict):
-            reason = str(**reason)
         self.reason = reason
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -61,10 +70,15 @@ class TargetCrashedEvent(BaseEvent):
     js_name = 'Inspector.targetCrashed'
     hashable = []
     is_hashable = False
+    __slots__ = ()
 
     def __init__(self):
         pass
 
+    @classmethod
+    def from_json(cls, d):
+        return cls()
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -75,10 +89,15 @@ class TargetReloadedAfterCrashEvent(BaseEvent):
     js_name = 'Inspector.targetReloadedAfterCrash'
     hashable = []
     is_hashable = False
+    __slots__ = ()
 
     def __init__(self):
         pass
 
+    @classmethod
+    def from_json(cls, d):
+        return cls()
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -7,12 +7,14 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
 
+
 # StreamHandle: This is either obtained from another method or specifed as `blob:&lt;uuid&gt;` where`&lt;uuid&gt` is an UUID of a Blob.
 StreamHandle = str
 
@@ -55,20 +57,7 @@ following the last read). Some types of streams may only support sequential read
                 "offset": offset,
                 "size": size,
             }),
-            cls.convert_payload({
-                "base64Encoded": {
-                    "class": bool,
-                    "optional": True
-                },
-                "data": {
-                    "class": str,
-                    "optional": False
-                },
-                "eof": {
-                    "class": bool,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -83,11 +72,6 @@ following the last read). Some types of streams may only support sequential read
             cls.build_send_payload("resolveBlob", {
                 "objectId": objectId,
             }),
-            cls.convert_payload({
-                "uuid": {
-                    "class": str,
-                    "optional": False
-                },
-            })
+            None
         )
 
@@ -7,11 +7,13 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
+
 from chromewhip.protocol import dom as DOM
 
 # LayerId: Unique Layer identifier.
@@ -22,6 +24,8 @@ SnapshotId = str
 
 # ScrollRect: Rectangle where scrolling happens on the main thread.
 class ScrollRect(ChromeTypeBase):
+    __slots__ = ('rect', 'type')
+
     def __init__(self,
                  rect: Union['DOM.Rect'],
                  type: Union['str'],
@@ -30,9 +34,20 @@ class ScrollRect(ChromeTypeBase):
         self.rect = rect
         self.type = type
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.rect = DOM.Rect.from_json(obj.rect)
+        return obj
+
 
 # StickyPositionConstraint: Sticky position constraints.
 class StickyPositionConstraint(ChromeTypeBase):
+    __slots__ = ('stickyBoxRect', 'containingBlockRect', 'nearestLayerShiftingStickyBox', 'nearestLayerShiftingContainingBlock')
+
     def __init__(self,
                  stickyBoxRect: Union['DOM.Rect'],
                  containingBlockRect: Union['DOM.Rect'],
@@ -45,9 +60,25 @@ class StickyPositionConstraint(ChromeTypeBase):
         self.nearestLayerShiftingStickyBox = nearestLayerShiftingStickyBox
         self.nearestLayerShiftingContainingBlock = nearestLayerShiftingContainingBlock
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.stickyBoxRect = DOM.Rect.from_json(obj.stickyBoxRect)
+        obj.containingBlockRect = DOM.Rect.from_json(obj.containingBlockRect)
+        if obj.nearestLayerShiftingStickyBox is not None:
+            obj.nearestLayerShiftingStickyBox = intern(obj.nearestLayerShiftingStickyBox)
+        if obj.nearestLayerShiftingContainingBlock is not None:
+            obj.nearestLayerShiftingContainingBlock = intern(obj.nearestLayerShiftingContainingBlock)
+        return obj
+
 
 # PictureTile: Serialized fragment of layer picture along with its offset within the layer.
 class PictureTile(ChromeTypeBase):
+    __slots__ = ('x', 'y', 'picture')
+
     def __init__(self,
                  x: Union['float'],
                  y: Union['float'],
@@ -58,9 +89,19 @@ class PictureTile(ChromeTypeBase):
         self.y = y
         self.picture = picture
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # Layer: Information about a compositing layer.
 class Layer(ChromeTypeBase):
+    __slots__ = ('layerId', 'parentLayerId', 'backendNodeId', 'offsetX', 'offsetY', 'width', 'height', 'transform', 'anchorX', 'anchorY', 'anchorZ', 'paintCount', 'drawsContent', 'invisible', 'scrollRects', 'stickyPositionConstraint')
+
     def __init__(self,
                  layerId: Union['LayerId'],
                  offsetX: Union['float'],
@@ -97,6 +138,21 @@ class Layer(ChromeTypeBase):
         self.scrollRects = scrollRects
         self.stickyPositionConstraint = stickyPositionConstraint
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.layerId = intern(obj.layerId)
+        if obj.parentLayerId is not None:
+            obj.parentLayerId = intern(obj.parentLayerId)
+        if obj.scrollRects is not None:
+            obj.scrollRects = [ScrollRect.from_json(i0) for i0 in obj.scrollRects]
+        if obj.stickyPositionConstraint is not None:
+            obj.stickyPositionConstraint = StickyPositionConstraint.from_json(obj.stickyPositionConstraint)
+        return obj
+
 
 # PaintProfile: Array of timings, one per paint step.
 PaintProfile = [float]
@@ -116,12 +172,7 @@ class LayerTree(PayloadMixin):
             cls.build_send_payload("compositingReasons", {
                 "layerId": layerId,
             }),
-            cls.convert_payload({
-                "compositingReasons": {
-                    "class": [],
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -156,12 +207,7 @@ class LayerTree(PayloadMixin):
             cls.build_send_payload("loadSnapshot", {
                 "tiles": tiles,
             }),
-            cls.convert_payload({
-                "snapshotId": {
-                    "class": SnapshotId,
-                    "optional": False
-                },
-            })
+            _decode_loadSnapshot
         )
 
     @classmethod
@@ -176,12 +222,7 @@ class LayerTree(PayloadMixin):
             cls.build_send_payload("makeSnapshot", {
                 "layerId": layerId,
             }),
-            cls.convert_payload({
-                "snapshotId": {
-                    "class": SnapshotId,
-                    "optional": False
-                },
-            })
+            _decode_makeSnapshot
         )
 
     @classmethod
@@ -208,12 +249,7 @@ class LayerTree(PayloadMixin):
                 "minDuration": minDuration,
                 "clipRect": clipRect,
             }),
-            cls.convert_payload({
-                "timings": {
-                    "class": [PaintProfile],
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -255,12 +291,7 @@ class LayerTree(PayloadMixin):
                 "toStep": toStep,
                 "scale": scale,
             }),
-            cls.convert_payload({
-                "dataURL": {
-                    "class": str,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -275,33 +306,46 @@ class LayerTree(PayloadMixin):
             cls.build_send_payload("snapshotCommandLog", {
                 "snapshotId": snapshotId,
             }),
-            cls.convert_payload({
-                "commandLog": {
-                    "class": [],
-                    "optional": False
-                },
-            })
+            None
         )
 
 
 
+def _decode_loadSnapshot(result):
+    result['snapshotId'] = intern(result['snapshotId'])
+    return result
+
+
+def _decode_makeSnapshot(result):
+    result['snapshotId'] = intern(result['snapshotId'])
+    return result
+
+
 class LayerPaintedEvent(BaseEvent):
 
-    js_name = 'Layertree.layerPainted'
+    js_name = 'LayerTree.layerPainted'
     hashable = ['layerId']
     is_hashable = True
+    __slots__ = ('layerId', 'clip')
 
     def __init__(self,
                  layerId: Union['LayerId', dict],
                  clip: Union['DOM.Rect', dict],
                  ):
-        if isinstance(layerId, dict):
-            layerId = LayerId(**layerId)
         self.layerId = layerId
         if isinstance(clip, dict):
-            clip = DOM.Rect(**clip)
+            clip = DOM.Rect.from_json(clip)
         self.clip = clip
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.layerId = intern(obj.layerId)
+        return obj
+
     @classmethod
     def build_hash(cls, layerId):
         kwargs = locals()
@@ -314,17 +358,26 @@ class LayerPaintedEvent(BaseEvent):
 
 class LayerTreeDidChangeEvent(BaseEvent):
 
-    js_name = 'Layertree.layerTreeDidChange'
+    js_name = 'LayerTree.layerTreeDidChange'
     hashable = []
     is_hashable = False
+    __slots__ = ('layers',)
 
     def __init__(self,
                  layers: Union['[Layer]', dict, None] = None,
                  ):
-        if isinstance(layers, dict):
-            layers = [Layer](**layers)
         self.layers = layers
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.layers is not None:
+            obj.layers = [Layer.from_json(i0) for i0 in obj.layers]
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
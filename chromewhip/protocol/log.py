@@ -7,16 +7,20 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
+
 from chromewhip.protocol import runtime as Runtime
 from chromewhip.protocol import network as Network
 
 # LogEntry: Log entry.
 class LogEntry(ChromeTypeBase):
+    __slots__ = ('source', 'level', 'text', 'timestamp', 'url', 'lineNumber', 'stackTrace', 'networkRequestId', 'workerId', 'args')
+
     def __init__(self,
                  source: Union['str'],
                  level: Union['str'],
@@ -41,9 +45,25 @@ class LogEntry(ChromeTypeBase):
         self.workerId = workerId
         self.args = args
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.stackTrace is not None:
+            obj.stackTrace = Runtime.StackTrace.from_json(obj.stackTrace)
+        if obj.networkRequestId is not None:
+            obj.networkRequestId = intern(obj.networkRequestId)
+        if obj.args is not None:
+            obj.args = [Runtime.RemoteObject.from_json(i0) for i0 in obj.args]
+        return obj
+
 
 # ViolationSetting: Violation configuration setting.
 class ViolationSetting(ChromeTypeBase):
+    __slots__ = ('name', 'threshold')
+
     def __init__(self,
                  name: Union['str'],
                  threshold: Union['float'],
@@ -52,6 +72,14 @@ class ViolationSetting(ChromeTypeBase):
         self.name = name
         self.threshold = threshold
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 class Log(PayloadMixin):
     """ Provides access to log entries.
@@ -119,14 +147,23 @@ class EntryAddedEvent(BaseEvent):
     js_name = 'Log.entryAdded'
     hashable = []
     is_hashable = False
+    __slots__ = ('entry',)
 
     def __init__(self,
                  entry: Union['LogEntry', dict],
                  ):
         if isinstance(entry, dict):
-            entry = LogEntry(**entry)
+            entry = LogEntry.from_json(entry)
         self.entry = entry
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -7,17 +7,21 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
 
+
 # PressureLevel: Memory pressure level.
 PressureLevel = str
 
 # SamplingProfileNode: Heap profile sample.
 class SamplingProfileNode(ChromeTypeBase):
+    __slots__ = ('size', 'total', 'stack')
+
     def __init__(self,
                  size: Union['float'],
                  total: Union['float'],
@@ -28,15 +32,34 @@ class SamplingProfileNode(ChromeTypeBase):
         self.total = total
         self.stack = stack
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # SamplingProfile: Array of heap profile samples.
 class SamplingProfile(ChromeTypeBase):
+    __slots__ = ('samples',)
+
     def __init__(self,
                  samples: Union['[SamplingProfileNode]'],
                  ):
 
         self.samples = samples
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.samples = [SamplingProfileNode.from_json(i0) for i0 in obj.samples]
+        return obj
+
 
 class Memory(PayloadMixin):
     """ 
@@ -48,20 +71,7 @@ class Memory(PayloadMixin):
         return (
             cls.build_send_payload("getDOMCounters", {
             }),
-            cls.convert_payload({
-                "documents": {
-                    "class": int,
-                    "optional": False
-                },
-                "nodes": {
-                    "class": int,
-                    "optional": False
-                },
-                "jsEventListeners": {
-                    "class": int,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -141,12 +151,7 @@ collected since renderer process startup.
         return (
             cls.build_send_payload("getAllTimeSamplingProfile", {
             }),
-            cls.convert_payload({
-                "profile": {
-                    "class": SamplingProfile,
-                    "optional": False
-                },
-            })
+            _decode_getAllTimeSamplingProfile
         )
 
     @classmethod
@@ -157,12 +162,7 @@ collected since browser process startup.
         return (
             cls.build_send_payload("getBrowserSamplingProfile", {
             }),
-            cls.convert_payload({
-                "profile": {
-                    "class": SamplingProfile,
-                    "optional": False
-                },
-            })
+            _decode_getBrowserSamplingProfile
         )
 
     @classmethod
@@ -173,11 +173,21 @@ collected since browser process startup.
         return (
             cls.build_send_payload("getSamplingProfile", {
             }),
-            cls.convert_payload({
-                "profile": {
-                    "class": SamplingProfile,
-                    "optional": False
-                },
-            })
+            _decode_getSamplingProfile
         )
 
+
+
+def _decode_getAllTimeSamplingProfile(result):
+    result['profile'] = SamplingProfile.from_json(result['profile'])
+    return result
+
+
+def _decode_getBrowserSamplingProfile(result):
+    result['profile'] = SamplingProfile.from_json(result['profile'])
+    return result
+
+
+def _decode_getSamplingProfile(result):
+    result['profile'] = SamplingProfile.from_json(result['profile'])
+    return result
@@ -7,11 +7,13 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
+
 from chromewhip.protocol import debugger as Debugger
 from chromewhip.protocol import runtime as Runtime
 from chromewhip.protocol import security as Security
@@ -46,6 +48,8 @@ CookieSameSite = str
 
 # ResourceTiming: Timing information for the request.
 class ResourceTiming(ChromeTypeBase):
+    __slots__ = ('requestTime', 'proxyStart', 'proxyEnd', 'dnsStart', 'dnsEnd', 'connectStart', 'connectEnd', 'sslStart', 'sslEnd', 'workerStart', 'workerReady', 'sendStart', 'sendEnd', 'pushStart', 'pushEnd', 'receiveHeadersEnd')
+
     def __init__(self,
                  requestTime: Union['float'],
                  proxyStart: Union['float'],
@@ -82,12 +86,22 @@ class ResourceTiming(ChromeTypeBase):
         self.pushEnd = pushEnd
         self.receiveHeadersEnd = receiveHeadersEnd
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # ResourcePriority: Loading priority of a resource request.
 ResourcePriority = str
 
 # Request: HTTP request data.
 class Request(ChromeTypeBase):
+    __slots__ = ('url', 'urlFragment', 'method', 'headers', 'postData', 'hasPostData', 'mixedContentType', 'initialPriority', 'referrerPolicy', 'isLinkPreload')
+
     def __init__(self,
                  url: Union['str'],
                  method: Union['str'],
@@ -112,9 +126,19 @@ class Request(ChromeTypeBase):
         self.referrerPolicy = referrerPolicy
         self.isLinkPreload = isLinkPreload
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # SignedCertificateTimestamp: Details of a signed certificate timestamp (SCT).
 class SignedCertificateTimestamp(ChromeTypeBase):
+    __slots__ = ('status', 'origin', 'logDescription', 'logId', 'timestamp', 'hashAlgorithm', 'signatureAlgorithm', 'signatureData')
+
     def __init__(self,
                  status: Union['str'],
                  origin: Union['str'],
@@ -135,9 +159,19 @@ class SignedCertificateTimestamp(ChromeTypeBase):
         self.signatureAlgorithm = signatureAlgorithm
         self.signatureData = signatureData
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # SecurityDetails: Security details about a request.
 class SecurityDetails(ChromeTypeBase):
+    __slots__ = ('protocol', 'keyExchange', 'keyExchangeGroup', 'cipher', 'mac', 'certificateId', 'subjectName', 'sanList', 'issuer', 'validFrom', 'validTo', 'signedCertificateTimestampList', 'certificateTransparencyCompliance')
+
     def __init__(self,
                  protocol: Union['str'],
                  keyExchange: Union['str'],
@@ -168,6 +202,15 @@ class SecurityDetails(ChromeTypeBase):
         self.signedCertificateTimestampList = signedCertificateTimestampList
         self.certificateTransparencyCompliance = certificateTransparencyCompliance
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.signedCertificateTimestampList = [SignedCertificateTimestamp.from_json(i0) for i0 in obj.signedCertificateTimestampList]
+        return obj
+
 
 # CertificateTransparencyCompliance: Whether the request complied with Certificate Transparency policy.
 CertificateTransparencyCompliance = str
@@ -177,6 +220,8 @@ BlockedReason = str
 
 # Response: HTTP response data.
 class Response(ChromeTypeBase):
+    __slots__ = ('url', 'status', 'statusText', 'headers', 'headersText', 'mimeType', 'requestHeaders', 'requestHeadersText', 'connectionReused', 'connectionId', 'remoteIPAddress', 'remotePort', 'fromDiskCache', 'fromServiceWorker', 'encodedDataLength', 'timing', 'protocol', 'securityState', 'securityDetails')
+
     def __init__(self,
                  url: Union['str'],
                  status: Union['int'],
@@ -219,18 +264,42 @@ class Response(ChromeTypeBase):
         self.securityState = securityState
         self.securityDetails = securityDetails
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.timing is not None:
+            obj.timing = ResourceTiming.from_json(obj.timing)
+        if obj.securityDetails is not None:
+            obj.securityDetails = SecurityDetails.from_json(obj.securityDetails)
+        return obj
+
 
 # WebSocketRequest: WebSocket request data.
 class WebSocketRequest(ChromeTypeBase):
+    __slots__ = ('headers',)
+
     def __init__(self,
                  headers: Union['Headers'],
                  ):
 
         self.headers = headers
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # WebSocketResponse: WebSocket response data.
 class WebSocketResponse(ChromeTypeBase):
+    __slots__ = ('status', 'statusText', 'headers', 'headersText', 'requestHeaders', 'requestHeadersText')
+
     def __init__(self,
                  status: Union['int'],
                  statusText: Union['str'],
@@ -247,9 +316,19 @@ class WebSocketResponse(ChromeTypeBase):
         self.requestHeaders = requestHeaders
         self.requestHeadersText = requestHeadersText
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # WebSocketFrame: WebSocket frame data.
 class WebSocketFrame(ChromeTypeBase):
+    __slots__ = ('opcode', 'mask', 'payloadData')
+
     def __init__(self,
                  opcode: Union['float'],
                  mask: Union['bool'],
@@ -260,9 +339,19 @@ class WebSocketFrame(ChromeTypeBase):
         self.mask = mask
         self.payloadData = payloadData
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # CachedResource: Information about the cached resource.
 class CachedResource(ChromeTypeBase):
+    __slots__ = ('url', 'type', 'response', 'bodySize')
+
     def __init__(self,
                  url: Union['str'],
                  type: Union['Page.ResourceType'],
@@ -275,9 +364,21 @@ class CachedResource(ChromeTypeBase):
         self.response = response
         self.bodySize = bodySize
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.response is not None:
+            obj.response = Response.from_json(obj.response)
+        return obj
+
 
 # Initiator: Information about the request initiator.
 class Initiator(ChromeTypeBase):
+    __slots__ = ('type', 'stack', 'url', 'lineNumber')
+
     def __init__(self,
                  type: Union['str'],
                  stack: Optional['Runtime.StackTrace'] = None,
@@ -290,9 +391,21 @@ class Initiator(ChromeTypeBase):
         self.url = url
         self.lineNumber = lineNumber
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.stack is not None:
+            obj.stack = Runtime.StackTrace.from_json(obj.stack)
+        return obj
+
 
 # Cookie: Cookie object
 class Cookie(ChromeTypeBase):
+    __slots__ = ('name', 'value', 'domain', 'path', 'expires', 'size', 'httpOnly', 'secure', 'session', 'sameSite')
+
     def __init__(self,
                  name: Union['str'],
                  value: Union['str'],
@@ -317,9 +430,19 @@ class Cookie(ChromeTypeBase):
         self.session = session
         self.sameSite = sameSite
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # CookieParam: Cookie parameter object
 class CookieParam(ChromeTypeBase):
+    __slots__ = ('name', 'value', 'url', 'domain', 'path', 'secure', 'httpOnly', 'sameSite', 'expires')
+
     def __init__(self,
                  name: Union['str'],
                  value: Union['str'],
@@ -342,9 +465,19 @@ class CookieParam(ChromeTypeBase):
         self.sameSite = sameSite
         self.expires = expires
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # AuthChallenge: Authorization challenge for HTTP status code 401 or 407.
 class AuthChallenge(ChromeTypeBase):
+    __slots__ = ('source', 'origin', 'scheme', 'realm')
+
     def __init__(self,
                  origin: Union['str'],
                  scheme: Union['str'],
@@ -357,9 +490,19 @@ class AuthChallenge(ChromeTypeBase):
         self.scheme = scheme
         self.realm = realm
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # AuthChallengeResponse: Response to an AuthChallenge.
 class AuthChallengeResponse(ChromeTypeBase):
+    __slots__ = ('response', 'username', 'password')
+
     def __init__(self,
                  response: Union['str'],
                  username: Optional['str'] = None,
@@ -370,12 +513,22 @@ class AuthChallengeResponse(ChromeTypeBase):
         self.username = username
         self.password = password
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # InterceptionStage: Stages of the interception to begin intercepting. Request will intercept before the request issent. Response will intercept after the response is received.
 InterceptionStage = str
 
 # RequestPattern: Request pattern for interception.
 class RequestPattern(ChromeTypeBase):
+    __slots__ = ('urlPattern', 'resourceType', 'interceptionStage')
+
     def __init__(self,
                  urlPattern: Optional['str'] = None,
                  resourceType: Optional['Page.ResourceType'] = None,
@@ -386,9 +539,19 @@ class RequestPattern(ChromeTypeBase):
         self.resourceType = resourceType
         self.interceptionStage = interceptionStage
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # SignedExchangeSignature: Information about a signed exchange signature.https://wicg.github.io/webpackage/draft-yasskin-httpbis-origin-signed-exchanges-impl.html#rfc.section.3.1
 class SignedExchangeSignature(ChromeTypeBase):
+    __slots__ = ('label', 'signature', 'integrity', 'certUrl', 'certSha256', 'validityUrl', 'date', 'expires', 'certificates')
+
     def __init__(self,
                  label: Union['str'],
                  signature: Union['str'],
@@ -411,9 +574,19 @@ class SignedExchangeSignature(ChromeTypeBase):
         self.expires = expires
         self.certificates = certificates
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # SignedExchangeHeader: Information about a signed exchange header.https://wicg.github.io/webpackage/draft-yasskin-httpbis-origin-signed-exchanges-impl.html#cbor-representation
 class SignedExchangeHeader(ChromeTypeBase):
+    __slots__ = ('requestUrl', 'requestMethod', 'responseCode', 'responseHeaders', 'signatures')
+
     def __init__(self,
                  requestUrl: Union['str'],
                  requestMethod: Union['str'],
@@ -428,12 +601,23 @@ class SignedExchangeHeader(ChromeTypeBase):
         self.responseHeaders = responseHeaders
         self.signatures = signatures
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.signatures = [SignedExchangeSignature.from_json(i0) for i0 in obj.signatures]
+        return obj
+
 
 # SignedExchangeErrorField: Field type for a signed exchange related error.
 SignedExchangeErrorField = str
 
 # SignedExchangeError: Information about a signed exchange response.
 class SignedExchangeError(ChromeTypeBase):
+    __slots__ = ('message', 'signatureIndex', 'errorField')
+
     def __init__(self,
                  message: Union['str'],
                  signatureIndex: Optional['int'] = None,
@@ -444,9 +628,19 @@ class SignedExchangeError(ChromeTypeBase):
         self.signatureIndex = signatureIndex
         self.errorField = errorField
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # SignedExchangeInfo: Information about a signed exchange response.
 class SignedExchangeInfo(ChromeTypeBase):
+    __slots__ = ('outerResponse', 'header', 'securityDetails', 'errors')
+
     def __init__(self,
                  outerResponse: Union['Response'],
                  header: Optional['SignedExchangeHeader'] = None,
@@ -459,6 +653,21 @@ class SignedExchangeInfo(ChromeTypeBase):
         self.securityDetails = securityDetails
         self.errors = errors
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.outerResponse = Response.from_json(obj.outerResponse)
+        if obj.header is not None:
+            obj.header = SignedExchangeHeader.from_json(obj.header)
+        if obj.securityDetails is not None:
+            obj.securityDetails = SecurityDetails.from_json(obj.securityDetails)
+        if obj.errors is not None:
+            obj.errors = [SignedExchangeError.from_json(i0) for i0 in obj.errors]
+        return obj
+
 
 class Network(PayloadMixin):
     """ Network domain allows tracking network activities of the page. It exposes information about http,
@@ -471,12 +680,7 @@ file, data and other requests and responses, their headers, bodies, timing, etc.
         return (
             cls.build_send_payload("canClearBrowserCache", {
             }),
-            cls.convert_payload({
-                "result": {
-                    "class": bool,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -486,12 +690,7 @@ file, data and other requests and responses, their headers, bodies, timing, etc.
         return (
             cls.build_send_payload("canClearBrowserCookies", {
             }),
-            cls.convert_payload({
-                "result": {
-                    "class": bool,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -501,12 +700,7 @@ file, data and other requests and responses, their headers, bodies, timing, etc.
         return (
             cls.build_send_payload("canEmulateNetworkConditions", {
             }),
-            cls.convert_payload({
-                "result": {
-                    "class": bool,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -681,12 +875,7 @@ information in the `cookies` field.
         return (
             cls.build_send_payload("getAllCookies", {
             }),
-            cls.convert_payload({
-                "cookies": {
-                    "class": [Cookie],
-                    "optional": False
-                },
-            })
+            _decode_getAllCookies
         )
 
     @classmethod
@@ -701,12 +890,7 @@ information in the `cookies` field.
             cls.build_send_payload("getCertificate", {
                 "origin": origin,
             }),
-            cls.convert_payload({
-                "tableNames": {
-                    "class": [],
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -722,12 +906,7 @@ detailed cookie information in the `cookies` field.
             cls.build_send_payload("getCookies", {
                 "urls": urls,
             }),
-            cls.convert_payload({
-                "cookies": {
-                    "class": [Cookie],
-                    "optional": False
-                },
-            })
+            _decode_getCookies
         )
 
     @classmethod
@@ -742,16 +921,7 @@ detailed cookie information in the `cookies` field.
             cls.build_send_payload("getResponseBody", {
                 "requestId": requestId,
             }),
-            cls.convert_payload({
-                "body": {
-                    "class": str,
-                    "optional": False
-                },
-                "base64Encoded": {
-                    "class": bool,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -766,12 +936,7 @@ detailed cookie information in the `cookies` field.
             cls.build_send_payload("getRequestPostData", {
                 "requestId": requestId,
             }),
-            cls.convert_payload({
-                "postData": {
-                    "class": str,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -786,16 +951,7 @@ detailed cookie information in the `cookies` field.
             cls.build_send_payload("getResponseBodyForInterception", {
                 "interceptionId": interceptionId,
             }),
-            cls.convert_payload({
-                "body": {
-                    "class": str,
-                    "optional": False
-                },
-                "base64Encoded": {
-                    "class": bool,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -813,12 +969,7 @@ is specified.
             cls.build_send_payload("takeResponseBodyForInterceptionAsStream", {
                 "interceptionId": interceptionId,
             }),
-            cls.convert_payload({
-                "stream": {
-                    "class": IO.StreamHandle,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -862,12 +1013,7 @@ attribute, user, password.
                 "caseSensitive": caseSensitive,
                 "isRegex": isRegex,
             }),
-            cls.convert_payload({
-                "result": {
-                    "class": [Debugger.SearchMatch],
-                    "optional": False
-                },
-            })
+            _decode_searchInResponseBody
         )
 
     @classmethod
@@ -960,12 +1106,7 @@ default domain and path values of the created cookie.
                 "sameSite": sameSite,
                 "expires": expires,
             }),
-            cls.convert_payload({
-                "success": {
-                    "class": bool,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -1058,11 +1199,27 @@ continueInterceptedRequest call.
 
 
 
+def _decode_getAllCookies(result):
+    result['cookies'] = [Cookie.from_json(i0) for i0 in result['cookies']]
+    return result
+
+
+def _decode_getCookies(result):
+    result['cookies'] = [Cookie.from_json(i0) for i0 in result['cookies']]
+    return result
+
+
+def _decode_searchInResponseBody(result):
+    result['result'] = [Debugger.SearchMatch.from_json(i0) for i0 in result['result']]
+    return result
+
+
 class DataReceivedEvent(BaseEvent):
 
     js_name = 'Network.dataReceived'
     hashable = ['requestId']
     is_hashable = True
+    __slots__ = ('requestId', 'timestamp', 'dataLength', 'encodedDataLength')
 
     def __init__(self,
                  requestId: Union['RequestId', dict],
@@ -1070,19 +1227,20 @@ class DataReceivedEvent(BaseEvent):
                  dataLength: Union['int', dict],
                  encodedDataLength: Union['int', dict],
                  ):
-        if isinstance(requestId, dict):
-            requestId = RequestId(**requestId)
         self.requestId = requestId
-        if isinstance(timestamp, dict):
-            timestamp = MonotonicTime(**timestamp)
         self.timestamp = timestamp
-        if isinstance(dataLength, dict):
-            dataLength = int(**dataLength)
         self.dataLength = dataLength
-        if isinstance(encodedDataLength, dict):
-            encodedDataLength = int(**encodedDataLength)
         self.encodedDataLength = encodedDataLength
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.requestId = intern(obj.requestId)
+        return obj
+
     @classmethod
     def build_hash(cls, requestId):
         kwargs = locals()
@@ -1098,6 +1256,7 @@ class EventSourceMessageReceivedEvent(BaseEvent):
     js_name = 'Network.eventSourceMessageReceived'
     hashable = ['requestId', 'eventId']
     is_hashable = True
+    __slots__ = ('requestId', 'timestamp', 'eventName', 'eventId', 'data')
 
     def __init__(self,
                  requestId: Union['RequestId', dict],
@@ -1106,22 +1265,21 @@ class EventSourceMessageReceivedEvent(BaseEvent):
                  eventId: Union['str', dict],
                  data: Union['str', dict],
                  ):
-        if isinstance(requestId, dict):
-            requestId = RequestId(**requestId)
         self.requestId = requestId
-        if isinstance(timestamp, dict):
-            timestamp = MonotonicTime(**timestamp)
         self.timestamp = timestamp
-        if isinstance(eventName, dict):
-            eventName = str(**eventName)
         self.eventName = eventName
-        if isinstance(eventId, dict):
-            eventId = str(**eventId)
         self.eventId = eventId
-        if isinstance(data, dict):
-            data = str(**data)
         self.data = data
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.requestId = intern(obj.requestId)
+        return obj
+
     @classmethod
     def build_hash(cls, requestId, eventId):
         kwargs = locals()
@@ -1137,6 +1295,7 @@ class LoadingFailedEvent(BaseEvent):
     js_name = 'Network.loadingFailed'
     hashable = ['requestId']
     is_hashable = True
+    __slots__ = ('requestId', 'timestamp', 'type', 'errorText', 'canceled', 'blockedReason')
 
     def __init__(self,
                  requestId: Union['RequestId', dict],
@@ -1146,25 +1305,22 @@ class LoadingFailedEvent(BaseEvent):
                  canceled: Union['bool', dict, None] = None,
                  blockedReason: Union['BlockedReason', dict, None] = None,
                  ):
-        if isinstance(requestId, dict):
-            requestId = RequestId(**requestId)
         self.requestId = requestId
-        if isinstance(timestamp, dict):
-            timestamp = MonotonicTime(**timestamp)
         self.timestamp = timestamp
-        if isinstance(type, dict):
-            type = Page.ResourceType(**type)
         self.type = type
-        if isinstance(errorText, dict):
-            errorText = str(**errorText)
         self.errorText = errorText
-        if isinstance(canceled, dict):
-            canceled = bool(**canceled)
         self.canceled = canceled
-        if isinstance(blockedReason, dict):
-            blockedReason = BlockedReason(**blockedReason)
         self.blockedReason = blockedReason
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.requestId = intern(obj.requestId)
+        return obj
+
     @classmethod
     def build_hash(cls, requestId):
         kwargs = locals()
@@ -1180,6 +1336,7 @@ class LoadingFinishedEvent(BaseEvent):
     js_name = 'Network.loadingFinished'
     hashable = ['requestId']
     is_hashable = True
+    __slots__ = ('requestId', 'timestamp', 'encodedDataLength', 'shouldReportCorbBlocking')
 
     def __init__(self,
                  requestId: Union['RequestId', dict],
@@ -1187,19 +1344,20 @@ class LoadingFinishedEvent(BaseEvent):
                  encodedDataLength: Union['float', dict],
                  shouldReportCorbBlocking: Union['bool', dict, None] = None,
                  ):
-        if isinstance(requestId, dict):
-            requestId = RequestId(**requestId)
         self.requestId = requestId
-        if isinstance(timestamp, dict):
-            timestamp = MonotonicTime(**timestamp)
         self.timestamp = timestamp
-        if isinstance(encodedDataLength, dict):
-            encodedDataLength = float(**encodedDataLength)
         self.encodedDataLength = encodedDataLength
-        if isinstance(shouldReportCorbBlocking, dict):
-            shouldReportCorbBlocking = bool(**shouldReportCorbBlocking)
         self.shouldReportCorbBlocking = shouldReportCorbBlocking
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.requestId = intern(obj.requestId)
+        return obj
+
     @classmethod
     def build_hash(cls, requestId):
         kwargs = locals()
@@ -1215,6 +1373,7 @@ class RequestInterceptedEvent(BaseEvent):
     js_name = 'Network.requestIntercepted'
     hashable = ['interceptionId', 'frameId']
     is_hashable = True
+    __slots__ = ('interceptionId', 'request', 'frameId', 'resourceType', 'isNavigationRequest', 'isDownload', 'redirectUrl', 'authChallenge', 'responseErrorReason', 'responseStatusCode', 'responseHeaders')
 
     def __init__(self,
                  interceptionId: Union['InterceptionId', dict],
@@ -1229,40 +1388,32 @@ class RequestInterceptedEvent(BaseEvent):
                  responseStatusCode: Union['int', dict, None] = None,
                  responseHeaders: Union['Headers', dict, None] = None,
                  ):
-        if isinstance(interceptionId, dict):
-            interceptionId = InterceptionId(**interceptionId)
         self.interceptionId = interceptionId
         if isinstance(request, dict):
-            request = Request(**request)
+            request = Request.from_json(request)
         self.request = request
-        if isinstance(frameId, dict):
-            frameId = Page.FrameId(**frameId)
         self.frameId = frameId
-        if isinstance(resourceType, dict):
-            resourceType = Page.ResourceType(**resourceType)
         self.resourceType = resourceType
-        if isinstance(isNavigationRequest, dict):
-            isNavigationRequest = bool(**isNavigationRequest)
         self.isNavigationRequest = isNavigationRequest
-        if isinstance(isDownload, dict):
-            isDownload = bool(**isDownload)
         self.isDownload = isDownload
-        if isinstance(redirectUrl, dict):
-            redirectUrl = str(**redirectUrl)
         self.redirectUrl = redirectUrl
         if isinstance(authChallenge, dict):
-            authChallenge = AuthChallenge(**authChallenge)
+            authChallenge = AuthChallenge.from_json(authChallenge)
         self.authChallenge = authChallenge
-        if isinstance(responseErrorReason, dict):
-            responseErrorReason = ErrorReason(**responseErrorReason)
         self.responseErrorReason = responseErrorReason
-        if isinstance(responseStatusCode, dict):
-            responseStatusCode = int(**responseStatusCode)
         self.responseStatusCode = responseStatusCode
-        if isinstance(responseHeaders, dict):
-            responseHeaders = Headers(**responseHeaders)
         self.responseHeaders = responseHeaders
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.interceptionId = intern(obj.interceptionId)
+        obj.frameId = intern(obj.frameId)
+        return obj
+
     @classmethod
     def build_hash(cls, interceptionId, frameId):
         kwargs = locals()
@@ -1278,14 +1429,22 @@ class RequestServedFromCacheEvent(BaseEvent):
     js_name = 'Network.requestServedFromCache'
     hashable = ['requestId']
     is_hashable = True
+    __slots__ = ('requestId',)
 
     def __init__(self,
                  requestId: Union['RequestId', dict],
                  ):
-        if isinstance(requestId, dict):
-            requestId = RequestId(**requestId)
         self.requestId = requestId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.requestId = intern(obj.requestId)
+        return obj
+
     @classmethod
     def build_hash(cls, requestId):
         kwargs = locals()
@@ -1299,8 +1458,9 @@ class RequestServedFromCacheEvent(BaseEvent):
 class RequestWillBeSentEvent(BaseEvent):
 
     js_name = 'Network.requestWillBeSent'
-    hashable = ['loaderId', 'requestId', 'frameId']
+    hashable = ['requestId', 'loaderId', 'frameId']
     is_hashable = True
+    __slots__ = ('requestId', 'loaderId', 'documentURL', 'request', 'timestamp', 'wallTime', 'initiator', 'redirectResponse', 'type', 'frameId', 'hasUserGesture')
 
     def __init__(self,
                  requestId: Union['RequestId', dict],
@@ -1315,42 +1475,38 @@ class RequestWillBeSentEvent(BaseEvent):
                  frameId: Union['Page.FrameId', dict, None] = None,
                  hasUserGesture: Union['bool', dict, None] = None,
                  ):
-        if isinstance(requestId, dict):
-            requestId = RequestId(**requestId)
         self.requestId = requestId
-        if isinstance(loaderId, dict):
-            loaderId = LoaderId(**loaderId)
         self.loaderId = loaderId
-        if isinstance(documentURL, dict):
-            documentURL = str(**documentURL)
         self.documentURL = documentURL
         if isinstance(request, dict):
-            request = Request(**request)
+            request = Request.from_json(request)
         self.request = request
-        if isinstance(timestamp, dict):
-            timestamp = MonotonicTime(**timestamp)
         self.timestamp = timestamp
-        if isinstance(wallTime, dict):
-            wallTime = TimeSinceEpoch(**wallTime)
         self.wallTime = wallTime
         if isinstance(initiator, dict):
-            initiator = Initiator(**initiator)
+            initiator = Initiator.from_json(initiator)
         self.initiator = initiator
         if isinstance(redirectResponse, dict):
-            redirectResponse = Response(**redirectResponse)
+            redirectResponse = Response.from_json(redirectResponse)
         self.redirectResponse = redirectResponse
-        if isinstance(type, dict):
-            type = Page.ResourceType(**type)
         self.type = type
-        if isinstance(frameId, dict):
-            frameId = Page.FrameId(**frameId)
         self.frameId = frameId
-        if isinstance(hasUserGesture, dict):
-            hasUserGesture = bool(**hasUserGesture)
         self.hasUserGesture = hasUserGesture
 
     @classmethod
-    def build_hash(cls, loaderId, requestId, frameId):
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.requestId = intern(obj.requestId)
+        obj.loaderId = intern(obj.loaderId)
+        if obj.frameId is not None:
+            obj.frameId = intern(obj.frameId)
+        return obj
+
+    @classmethod
+    def build_hash(cls, requestId, loaderId, frameId):
         kwargs = locals()
         kwargs.pop('cls')
         serialized_id_params = ','.join(['='.join([p, str(v)]) for p, v in kwargs.items()])
@@ -1364,22 +1520,26 @@ class ResourceChangedPriorityEvent(BaseEvent):
     js_name = 'Network.resourceChangedPriority'
     hashable = ['requestId']
     is_hashable = True
+    __slots__ = ('requestId', 'newPriority', 'timestamp')
 
     def __init__(self,
                  requestId: Union['RequestId', dict],
                  newPriority: Union['ResourcePriority', dict],
                  timestamp: Union['MonotonicTime', dict],
                  ):
-        if isinstance(requestId, dict):
-            requestId = RequestId(**requestId)
         self.requestId = requestId
-        if isinstance(newPriority, dict):
-            newPriority = ResourcePriority(**newPriority)
         self.newPriority = newPriority
-        if isinstance(timestamp, dict):
-            timestamp = MonotonicTime(**timestamp)
         self.timestamp = timestamp
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.requestId = intern(obj.requestId)
+        return obj
+
     @classmethod
     def build_hash(cls, requestId):
         kwargs = locals()
@@ -1395,18 +1555,26 @@ class SignedExchangeReceivedEvent(BaseEvent):
     js_name = 'Network.signedExchangeReceived'
     hashable = ['requestId']
     is_hashable = True
+    __slots__ = ('requestId', 'info')
 
     def __init__(self,
                  requestId: Union['RequestId', dict],
                  info: Union['SignedExchangeInfo', dict],
                  ):
-        if isinstance(requestId, dict):
-            requestId = RequestId(**requestId)
         self.requestId = requestId
         if isinstance(info, dict):
-            info = SignedExchangeInfo(**info)
+            info = SignedExchangeInfo.from_json(info)
         self.info = info
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.requestId = intern(obj.requestId)
+        return obj
+
     @classmethod
     def build_hash(cls, requestId):
         kwargs = locals()
@@ -1420,8 +1588,9 @@ class SignedExchangeReceivedEvent(BaseEvent):
 class ResponseReceivedEvent(BaseEvent):
 
     js_name = 'Network.responseReceived'
-    hashable = ['loaderId', 'requestId', 'frameId']
+    hashable = ['requestId', 'loaderId', 'frameId']
     is_hashable = True
+    __slots__ = ('requestId', 'loaderId', 'timestamp', 'type', 'response', 'frameId')
 
     def __init__(self,
                  requestId: Union['RequestId', dict],
@@ -1431,27 +1600,29 @@ class ResponseReceivedEvent(BaseEvent):
                  response: Union['Response', dict],
                  frameId: Union['Page.FrameId', dict, None] = None,
                  ):
-        if isinstance(requestId, dict):
-            requestId = RequestId(**requestId)
         self.requestId = requestId
-        if isinstance(loaderId, dict):
-            loaderId = LoaderId(**loaderId)
         self.loaderId = loaderId
-        if isinstance(timestamp, dict):
-            timestamp = MonotonicTime(**timestamp)
         self.timestamp = timestamp
-        if isinstance(type, dict):
-            type = Page.ResourceType(**type)
         self.type = type
         if isinstance(response, dict):
-            response = Response(**response)
+            response = Response.from_json(response)
         self.response = response
-        if isinstance(frameId, dict):
-            frameId = Page.FrameId(**frameId)
         self.frameId = frameId
 
     @classmethod
-    def build_hash(cls, loaderId, requestId, frameId):
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.requestId = intern(obj.requestId)
+        obj.loaderId = intern(obj.loaderId)
+        if obj.frameId is not None:
+            obj.frameId = intern(obj.frameId)
+        return obj
+
+    @classmethod
+    def build_hash(cls, requestId, loaderId, frameId):
         kwargs = locals()
         kwargs.pop('cls')
         serialized_id_params = ','.join(['='.join([p, str(v)]) for p, v in kwargs.items()])
@@ -1465,18 +1636,24 @@ class WebSocketClosedEvent(BaseEvent):
     js_name = 'Network.webSocketClosed'
     hashable = ['requestId']
     is_hashable = True
+    __slots__ = ('requestId', 'timestamp')
 
     def __init__(self,
                  requestId: Union['RequestId', dict],
                  timestamp: Union['MonotonicTime', dict],
                  ):
-        if isinstance(requestId, dict):
-            requestId = RequestId(**requestId)
         self.requestId = requestId
-        if isinstance(timestamp, dict):
-            timestamp = MonotonicTime(**timestamp)
         self.timestamp = timestamp
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.requestId = intern(obj.requestId)
+        return obj
+
     @classmethod
     def build_hash(cls, requestId):
         kwargs = locals()
@@ -1492,22 +1669,28 @@ class WebSocketCreatedEvent(BaseEvent):
     js_name = 'Network.webSocketCreated'
     hashable = ['requestId']
     is_hashable = True
+    __slots__ = ('requestId', 'url', 'initiator')
 
     def __init__(self,
                  requestId: Union['RequestId', dict],
                  url: Union['str', dict],
                  initiator: Union['Initiator', dict, None] = None,
                  ):
-        if isinstance(requestId, dict):
-            requestId = RequestId(**requestId)
         self.requestId = requestId
-        if isinstance(url, dict):
-            url = str(**url)
         self.url = url
         if isinstance(initiator, dict):
-            initiator = Initiator(**initiator)
+            initiator = Initiator.from_json(initiator)
         self.initiator = initiator
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.requestId = intern(obj.requestId)
+        return obj
+
     @classmethod
     def build_hash(cls, requestId):
         kwargs = locals()
@@ -1523,22 +1706,26 @@ class WebSocketFrameErrorEvent(BaseEvent):
     js_name = 'Network.webSocketFrameError'
     hashable = ['requestId']
     is_hashable = True
+    __slots__ = ('requestId', 'timestamp', 'errorMessage')
 
     def __init__(self,
                  requestId: Union['RequestId', dict],
                  timestamp: Union['MonotonicTime', dict],
                  errorMessage: Union['str', dict],
                  ):
-        if isinstance(requestId, dict):
-            requestId = RequestId(**requestId)
         self.requestId = requestId
-        if isinstance(timestamp, dict):
-            timestamp = MonotonicTime(**timestamp)
         self.timestamp = timestamp
-        if isinstance(errorMessage, dict):
-            errorMessage = str(**errorMessage)
         self.errorMessage = errorMessage
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.requestId = intern(obj.requestId)
+        return obj
+
     @classmethod
     def build_hash(cls, requestId):
         kwargs = locals()
@@ -1554,22 +1741,28 @@ class WebSocketFrameReceivedEvent(BaseEvent):
     js_name = 'Network.webSocketFrameReceived'
     hashable = ['requestId']
     is_hashable = True
+    __slots__ = ('requestId', 'timestamp', 'response')
 
     def __init__(self,
                  requestId: Union['RequestId', dict],
                  timestamp: Union['MonotonicTime', dict],
                  response: Union['WebSocketFrame', dict],
                  ):
-        if isinstance(requestId, dict):
-            requestId = RequestId(**requestId)
         self.requestId = requestId
-        if isinstance(timestamp, dict):
-            timestamp = MonotonicTime(**timestamp)
         self.timestamp = timestamp
         if isinstance(response, dict):
-            response = WebSocketFrame(**response)
+            response = WebSocketFrame.from_json(response)
         self.response = response
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.requestId = intern(obj.requestId)
+        return obj
+
     @classmethod
     def build_hash(cls, requestId):
         kwargs = locals()
@@ -1585,22 +1778,28 @@ class WebSocketFrameSentEvent(BaseEvent):
     js_name = 'Network.webSocketFrameSent'
     hashable = ['requestId']
     is_hashable = True
+    __slots__ = ('requestId', 'timestamp', 'response')
 
     def __init__(self,
                  requestId: Union['RequestId', dict],
                  timestamp: Union['MonotonicTime', dict],
                  response: Union['WebSocketFrame', dict],
                  ):
-        if isinstance(requestId, dict):
-            requestId = RequestId(**requestId)
         self.requestId = requestId
-        if isinstance(timestamp, dict):
-            timestamp = MonotonicTime(**timestamp)
         self.timestamp = timestamp
         if isinstance(response, dict):
-            response = WebSocketFrame(**response)
+            response = WebSocketFrame.from_json(response)
         self.response = response
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.requestId = intern(obj.requestId)
+        return obj
+
     @classmethod
     def build_hash(cls, requestId):
         kwargs = locals()
@@ -1616,22 +1815,28 @@ class WebSocketHandshakeResponseReceivedEvent(BaseEvent):
     js_name = 'Network.webSocketHandshakeResponseReceived'
     hashable = ['requestId']
     is_hashable = True
+    __slots__ = ('requestId', 'timestamp', 'response')
 
     def __init__(self,
                  requestId: Union['RequestId', dict],
                  timestamp: Union['MonotonicTime', dict],
                  response: Union['WebSocketResponse', dict],
                  ):
-        if isinstance(requestId, dict):
-            requestId = RequestId(**requestId)
         self.requestId = requestId
-        if isinstance(timestamp, dict):
-            timestamp = MonotonicTime(**timestamp)
         self.timestamp = timestamp
         if isinstance(response, dict):
-            response = WebSocketResponse(**response)
+            response = WebSocketResponse.from_json(response)
         self.response = response
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.requestId = intern(obj.requestId)
+        return obj
+
     @classmethod
     def build_hash(cls, requestId):
         kwargs = locals()
@@ -1647,6 +1852,7 @@ class WebSocketWillSendHandshakeRequestEvent(BaseEvent):
     js_name = 'Network.webSocketWillSendHandshakeRequest'
     hashable = ['requestId']
     is_hashable = True
+    __slots__ = ('requestId', 'timestamp', 'wallTime', 'request')
 
     def __init__(self,
                  requestId: Union['RequestId', dict],
@@ -1654,19 +1860,22 @@ class WebSocketWillSendHandshakeRequestEvent(BaseEvent):
                  wallTime: Union['TimeSinceEpoch', dict],
                  request: Union['WebSocketRequest', dict],
                  ):
-        if isinstance(requestId, dict):
-            requestId = RequestId(**requestId)
         self.requestId = requestId
-        if isinstance(timestamp, dict):
-            timestamp = MonotonicTime(**timestamp)
         self.timestamp = timestamp
-        if isinstance(wallTime, dict):
-            wallTime = TimeSinceEpoch(**wallTime)
         self.wallTime = wallTime
         if isinstance(request, dict):
-            request = WebSocketRequest(**request)
+            request = WebSocketRequest.from_json(request)
         self.request = request
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.requestId = intern(obj.requestId)
+        return obj
+
     @classmethod
     def build_hash(cls, requestId):
         kwargs = locals()
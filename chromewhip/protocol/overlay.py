@@ -7,17 +7,21 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
+
 from chromewhip.protocol import dom as DOM
 from chromewhip.protocol import page as Page
 from chromewhip.protocol import runtime as Runtime
 
 # HighlightConfig: Configuration data for the highlighting of page elements.
 class HighlightConfig(ChromeTypeBase):
+    __slots__ = ('showInfo', 'showRulers', 'showExtensionLines', 'displayAsMaterial', 'contentColor', 'paddingColor', 'borderColor', 'marginColor', 'eventTargetColor', 'shapeColor', 'shapeMarginColor', 'selectorList', 'cssGridColor')
+
     def __init__(self,
                  showInfo: Optional['bool'] = None,
                  showRulers: Optional['bool'] = None,
@@ -48,6 +52,30 @@ class HighlightConfig(ChromeTypeBase):
         self.selectorList = selectorList
         self.cssGridColor = cssGridColor
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.contentColor is not None:
+            obj.contentColor = DOM.RGBA.from_json(obj.contentColor)
+        if obj.paddingColor is not None:
+            obj.paddingColor = DOM.RGBA.from_json(obj.paddingColor)
+        if obj.borderColor is not None:
+            obj.borderColor = DOM.RGBA.from_json(obj.borderColor)
+        if obj.marginColor is not None:
+            obj.marginColor = DOM.RGBA.from_json(obj.marginColor)
+        if obj.eventTargetColor is not None:
+            obj.eventTargetColor = DOM.RGBA.from_json(obj.eventTargetColor)
+        if obj.shapeColor is not None:
+            obj.shapeColor = DOM.RGBA.from_json(obj.shapeColor)
+        if obj.shapeMarginColor is not None:
+            obj.shapeMarginColor = DOM.RGBA.from_json(obj.shapeMarginColor)
+        if obj.cssGridColor is not None:
+            obj.cssGridColor = DOM.RGBA.from_json(obj.cssGridColor)
+        return obj
+
 
 # InspectMode: 
 InspectMode = str
@@ -87,12 +115,7 @@ class Overlay(PayloadMixin):
             cls.build_send_payload("getHighlightObjectForTest", {
                 "nodeId": nodeId,
             }),
-            cls.convert_payload({
-                "highlight": {
-                    "class": dict,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -347,14 +370,21 @@ class InspectNodeRequestedEvent(BaseEvent):
     js_name = 'Overlay.inspectNodeRequested'
     hashable = ['backendNodeId']
     is_hashable = True
+    __slots__ = ('backendNodeId',)
 
     def __init__(self,
                  backendNodeId: Union['DOM.BackendNodeId', dict],
                  ):
-        if isinstance(backendNodeId, dict):
-            backendNodeId = DOM.BackendNodeId(**backendNodeId)
         self.backendNodeId = backendNodeId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, backendNodeId):
         kwargs = locals()
@@ -370,14 +400,21 @@ class NodeHighlightRequestedEvent(BaseEvent):
     js_name = 'Overlay.nodeHighlightRequested'
     hashable = ['nodeId']
     is_hashable = True
+    __slots__ = ('nodeId',)
 
     def __init__(self,
                  nodeId: Union['DOM.NodeId', dict],
                  ):
-        if isinstance(nodeId, dict):
-            nodeId = DOM.NodeId(**nodeId)
         self.nodeId = nodeId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, nodeId):
         kwargs = locals()
@@ -393,14 +430,23 @@ class ScreenshotRequestedEvent(BaseEvent):
     js_name = 'Overlay.screenshotRequested'
     hashable = []
     is_hashable = False
+    __slots__ = ('viewport',)
 
     def __init__(self,
                  viewport: Union['Page.Viewport', dict],
                  ):
         if isinstance(viewport, dict):
-            viewport = Page.Viewport(**viewport)
+            viewport = Page.Viewport.from_json(viewport)
         self.viewport = viewport
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -7,11 +7,13 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
+
 from chromewhip.protocol import debugger as Debugger
 from chromewhip.protocol import dom as DOM
 from chromewhip.protocol import network as Network
@@ -26,6 +28,8 @@ FrameId = str
 
 # Frame: Information about the Frame on the page.
 class Frame(ChromeTypeBase):
+    __slots__ = ('id', 'parentId', 'loaderId', 'name', 'url', 'securityOrigin', 'mimeType', 'unreachableUrl')
+
     def __init__(self,
                  id: Union['str'],
                  loaderId: Union['Network.LoaderId'],
@@ -46,9 +50,20 @@ class Frame(ChromeTypeBase):
         self.mimeType = mimeType
         self.unreachableUrl = unreachableUrl
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.loaderId = intern(obj.loaderId)
+        return obj
+
 
 # FrameResource: Information about the Resource on the page.
 class FrameResource(ChromeTypeBase):
+    __slots__ = ('url', 'type', 'mimeType', 'lastModified', 'contentSize', 'failed', 'canceled')
+
     def __init__(self,
                  url: Union['str'],
                  type: Union['ResourceType'],
@@ -67,9 +82,19 @@ class FrameResource(ChromeTypeBase):
         self.failed = failed
         self.canceled = canceled
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # FrameResourceTree: Information about the Frame hierarchy along with their cached resources.
 class FrameResourceTree(ChromeTypeBase):
+    __slots__ = ('frame', 'childFrames', 'resources')
+
     def __init__(self,
                  frame: Union['Frame'],
                  resources: Union['[FrameResource]'],
@@ -80,9 +105,23 @@ class FrameResourceTree(ChromeTypeBase):
         self.childFrames = childFrames
         self.resources = resources
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.frame = Frame.from_json(obj.frame)
+        if obj.childFrames is not None:
+            obj.childFrames = [FrameResourceTree.from_json(i0) for i0 in obj.childFrames]
+        obj.resources = [FrameResource.from_json(i0) for i0 in obj.resources]
+        return obj
+
 
 # FrameTree: Information about the Frame hierarchy.
 class FrameTree(ChromeTypeBase):
+    __slots__ = ('frame', 'childFrames')
+
     def __init__(self,
                  frame: Union['Frame'],
                  childFrames: Optional['[FrameTree]'] = None,
@@ -91,6 +130,17 @@ class FrameTree(ChromeTypeBase):
         self.frame = frame
         self.childFrames = childFrames
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.frame = Frame.from_json(obj.frame)
+        if obj.childFrames is not None:
+            obj.childFrames = [FrameTree.from_json(i0) for i0 in obj.childFrames]
+        return obj
+
 
 # ScriptIdentifier: Unique script identifier.
 ScriptIdentifier = str
@@ -100,6 +150,8 @@ TransitionType = str
 
 # NavigationEntry: Navigation history entry.
 class NavigationEntry(ChromeTypeBase):
+    __slots__ = ('id', 'url', 'userTypedURL', 'title', 'transitionType')
+
     def __init__(self,
                  id: Union['int'],
                  url: Union['str'],
@@ -114,9 +166,19 @@ class NavigationEntry(ChromeTypeBase):
         self.title = title
         self.transitionType = transitionType
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # ScreencastFrameMetadata: Screencast frame metadata.
 class ScreencastFrameMetadata(ChromeTypeBase):
+    __slots__ = ('offsetTop', 'pageScaleFactor', 'deviceWidth', 'deviceHeight', 'scrollOffsetX', 'scrollOffsetY', 'timestamp')
+
     def __init__(self,
                  offsetTop: Union['float'],
                  pageScaleFactor: Union['float'],
@@ -135,12 +197,22 @@ class ScreencastFrameMetadata(ChromeTypeBase):
         self.scrollOffsetY = scrollOffsetY
         self.timestamp = timestamp
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # DialogType: Javascript dialog type.
 DialogType = str
 
 # AppManifestError: Error while paring app manifest.
 class AppManifestError(ChromeTypeBase):
+    __slots__ = ('message', 'critical', 'line', 'column')
+
     def __init__(self,
                  message: Union['str'],
                  critical: Union['int'],
@@ -153,9 +225,19 @@ class AppManifestError(ChromeTypeBase):
         self.line = line
         self.column = column
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # LayoutViewport: Layout viewport position and dimensions.
 class LayoutViewport(ChromeTypeBase):
+    __slots__ = ('pageX', 'pageY', 'clientWidth', 'clientHeight')
+
     def __init__(self,
                  pageX: Union['int'],
                  pageY: Union['int'],
@@ -168,9 +250,19 @@ class LayoutViewport(ChromeTypeBase):
         self.clientWidth = clientWidth
         self.clientHeight = clientHeight
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # VisualViewport: Visual viewport position, dimensions, and scale.
 class VisualViewport(ChromeTypeBase):
+    __slots__ = ('offsetX', 'offsetY', 'pageX', 'pageY', 'clientWidth', 'clientHeight', 'scale')
+
     def __init__(self,
                  offsetX: Union['float'],
                  offsetY: Union['float'],
@@ -189,9 +281,19 @@ class VisualViewport(ChromeTypeBase):
         self.clientHeight = clientHeight
         self.scale = scale
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # Viewport: Viewport for capturing screenshot.
 class Viewport(ChromeTypeBase):
+    __slots__ = ('x', 'y', 'width', 'height', 'scale')
+
     def __init__(self,
                  x: Union['float'],
                  y: Union['float'],
@@ -206,9 +308,19 @@ class Viewport(ChromeTypeBase):
         self.height = height
         self.scale = scale
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # FontFamilies: Generic font families collection.
 class FontFamilies(ChromeTypeBase):
+    __slots__ = ('standard', 'fixed', 'serif', 'sansSerif', 'cursive', 'fantasy', 'pictograph')
+
     def __init__(self,
                  standard: Optional['str'] = None,
                  fixed: Optional['str'] = None,
@@ -227,9 +339,19 @@ class FontFamilies(ChromeTypeBase):
         self.fantasy = fantasy
         self.pictograph = pictograph
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # FontSizes: Default font sizes.
 class FontSizes(ChromeTypeBase):
+    __slots__ = ('standard', 'fixed')
+
     def __init__(self,
                  standard: Optional['int'] = None,
                  fixed: Optional['int'] = None,
@@ -238,6 +360,14 @@ class FontSizes(ChromeTypeBase):
         self.standard = standard
         self.fixed = fixed
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 class Page(PayloadMixin):
     """ Actions and events related to the inspected page belong to the page domain.
@@ -254,12 +384,7 @@ class Page(PayloadMixin):
             cls.build_send_payload("addScriptToEvaluateOnLoad", {
                 "scriptSource": scriptSource,
             }),
-            cls.convert_payload({
-                "identifier": {
-                    "class": ScriptIdentifier,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -274,12 +399,7 @@ class Page(PayloadMixin):
             cls.build_send_payload("addScriptToEvaluateOnNewDocument", {
                 "source": source,
             }),
-            cls.convert_payload({
-                "identifier": {
-                    "class": ScriptIdentifier,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -316,12 +436,7 @@ class Page(PayloadMixin):
                 "clip": clip,
                 "fromSurface": fromSurface,
             }),
-            cls.convert_payload({
-                "data": {
-                    "class": str,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -375,12 +490,7 @@ option, use with caution.
                 "worldName": worldName,
                 "grantUniveralAccess": grantUniveralAccess,
             }),
-            cls.convert_payload({
-                "executionContextId": {
-                    "class": Runtime.ExecutionContextId,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -429,20 +539,7 @@ option, use with caution.
         return (
             cls.build_send_payload("getAppManifest", {
             }),
-            cls.convert_payload({
-                "url": {
-                    "class": str,
-                    "optional": False
-                },
-                "errors": {
-                    "class": [AppManifestError],
-                    "optional": False
-                },
-                "data": {
-                    "class": str,
-                    "optional": True
-                },
-            })
+            _decode_getAppManifest
         )
 
     @classmethod
@@ -453,12 +550,7 @@ information in the `cookies` field.
         return (
             cls.build_send_payload("getCookies", {
             }),
-            cls.convert_payload({
-                "cookies": {
-                    "class": [Network.Cookie],
-                    "optional": False
-                },
-            })
+            _decode_getCookies
         )
 
     @classmethod
@@ -468,12 +560,7 @@ information in the `cookies` field.
         return (
             cls.build_send_payload("getFrameTree", {
             }),
-            cls.convert_payload({
-                "frameTree": {
-                    "class": FrameTree,
-                    "optional": False
-                },
-            })
+            _decode_getFrameTree
         )
 
     @classmethod
@@ -483,20 +570,7 @@ information in the `cookies` field.
         return (
             cls.build_send_payload("getLayoutMetrics", {
             }),
-            cls.convert_payload({
-                "layoutViewport": {
-                    "class": LayoutViewport,
-                    "optional": False
-                },
-                "visualViewport": {
-                    "class": VisualViewport,
-                    "optional": False
-                },
-                "contentSize": {
-                    "class": DOM.Rect,
-                    "optional": False
-                },
-            })
+            _decode_getLayoutMetrics
         )
 
     @classmethod
@@ -506,16 +580,7 @@ information in the `cookies` field.
         return (
             cls.build_send_payload("getNavigationHistory", {
             }),
-            cls.convert_payload({
-                "currentIndex": {
-                    "class": int,
-                    "optional": False
-                },
-                "entries": {
-                    "class": [NavigationEntry],
-                    "optional": False
-                },
-            })
+            _decode_getNavigationHistory
         )
 
     @classmethod
@@ -534,16 +599,7 @@ information in the `cookies` field.
                 "frameId": frameId,
                 "url": url,
             }),
-            cls.convert_payload({
-                "content": {
-                    "class": str,
-                    "optional": False
-                },
-                "base64Encoded": {
-                    "class": bool,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -553,12 +609,7 @@ information in the `cookies` field.
         return (
             cls.build_send_payload("getResourceTree", {
             }),
-            cls.convert_payload({
-                "frameTree": {
-                    "class": FrameResourceTree,
-                    "optional": False
-                },
-            })
+            _decode_getResourceTree
         )
 
     @classmethod
@@ -605,20 +656,7 @@ dialog.
                 "transitionType": transitionType,
                 "frameId": frameId,
             }),
-            cls.convert_payload({
-                "frameId": {
-                    "class": FrameId,
-                    "optional": False
-                },
-                "loaderId": {
-                    "class": Network.LoaderId,
-                    "optional": True
-                },
-                "errorText": {
-                    "class": str,
-                    "optional": True
-                },
-            })
+            _decode_navigate
         )
 
     @classmethod
@@ -715,12 +753,7 @@ in which case the content will be scaled to fit the paper size.
                 "footerTemplate": footerTemplate,
                 "preferCSSPageSize": preferCSSPageSize,
             }),
-            cls.convert_payload({
-                "data": {
-                    "class": str,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -826,12 +859,7 @@ Argument will be ignored if reloading dataURL origin.
                 "caseSensitive": caseSensitive,
                 "isRegex": isRegex,
             }),
-            cls.convert_payload({
-                "result": {
-                    "class": [Debugger.SearchMatch],
-                    "optional": False
-                },
-            })
+            _decode_searchInResource
         )
 
     @classmethod
@@ -1211,19 +1239,70 @@ cross-process navigation.
 
 
 
+def _decode_getAppManifest(result):
+    result['errors'] = [AppManifestError.from_json(i0) for i0 in result['errors']]
+    return result
+
+
+def _decode_getCookies(result):
+    result['cookies'] = [Network.Cookie.from_json(i0) for i0 in result['cookies']]
+    return result
+
+
+def _decode_getFrameTree(result):
+    result['frameTree'] = FrameTree.from_json(result['frameTree'])
+    return result
+
+
+def _decode_getLayoutMetrics(result):
+    result['layoutViewport'] = LayoutViewport.from_json(result['layoutViewport'])
+    result['visualViewport'] = VisualViewport.from_json(result['visualViewport'])
+    result['contentSize'] = DOM.Rect.from_json(result['contentSize'])
+    return result
+
+
+def _decode_getNavigationHistory(result):
+    result['entries'] = [NavigationEntry.from_json(i0) for i0 in result['entries']]
+    return result
+
+
+def _decode_getResourceTree(result):
+    result['frameTree'] = FrameResourceTree.from_json(result['frameTree'])
+    return result
+
+
+def _decode_navigate(result):
+    result['frameId'] = intern(result['frameId'])
+    if result.get('loaderId') is not None:
+        result['loaderId'] = intern(result['loaderId'])
+    return result
+
+
+def _decode_searchInResource(result):
+    result['result'] = [Debugger.SearchMatch.from_json(i0) for i0 in result['result']]
+    return result
+
+
 class DomContentEventFiredEvent(BaseEvent):
 
     js_name = 'Page.domContentEventFired'
     hashable = []
     is_hashable = False
+    __slots__ = ('timestamp',)
 
     def __init__(self,
                  timestamp: Union['Network.MonotonicTime', dict],
                  ):
-        if isinstance(timestamp, dict):
-            timestamp = Network.MonotonicTime(**timestamp)
         self.timestamp = timestamp
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -1232,26 +1311,33 @@ class DomContentEventFiredEvent(BaseEvent):
 class FrameAttachedEvent(BaseEvent):
 
     js_name = 'Page.frameAttached'
-    hashable = ['parentFrameId', 'frameId']
+    hashable = ['frameId', 'parentFrameId']
     is_hashable = True
+    __slots__ = ('frameId', 'parentFrameId', 'stack')
 
     def __init__(self,
                  frameId: Union['FrameId', dict],
                  parentFrameId: Union['FrameId', dict],
                  stack: Union['Runtime.StackTrace', dict, None] = None,
                  ):
-        if isinstance(frameId, dict):
-            frameId = FrameId(**frameId)
         self.frameId = frameId
-        if isinstance(parentFrameId, dict):
-            parentFrameId = FrameId(**parentFrameId)
         self.parentFrameId = parentFrameId
         if isinstance(stack, dict):
-            stack = Runtime.StackTrace(**stack)
+            stack = Runtime.StackTrace.from_json(stack)
         self.stack = stack
 
     @classmethod
-    def build_hash(cls, parentFrameId, frameId):
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.frameId = intern(obj.frameId)
+        obj.parentFrameId = intern(obj.parentFrameId)
+        return obj
+
+    @classmethod
+    def build_hash(cls, frameId, parentFrameId):
         kwargs = locals()
         kwargs.pop('cls')
         serialized_id_params = ','.join(['='.join([p, str(v)]) for p, v in kwargs.items()])
@@ -1265,14 +1351,22 @@ class FrameClearedScheduledNavigationEvent(BaseEvent):
     js_name = 'Page.frameClearedScheduledNavigation'
     hashable = ['frameId']
     is_hashable = True
+    __slots__ = ('frameId',)
 
     def __init__(self,
                  frameId: Union['FrameId', dict],
                  ):
-        if isinstance(frameId, dict):
-            frameId = FrameId(**frameId)
         self.frameId = frameId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.frameId = intern(obj.frameId)
+        return obj
+
     @classmethod
     def build_hash(cls, frameId):
         kwargs = locals()
@@ -1288,14 +1382,22 @@ class FrameDetachedEvent(BaseEvent):
     js_name = 'Page.frameDetached'
     hashable = ['frameId']
     is_hashable = True
+    __slots__ = ('frameId',)
 
     def __init__(self,
                  frameId: Union['FrameId', dict],
                  ):
-        if isinstance(frameId, dict):
-            frameId = FrameId(**frameId)
         self.frameId = frameId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.frameId = intern(obj.frameId)
+        return obj
+
     @classmethod
     def build_hash(cls, frameId):
         kwargs = locals()
@@ -1311,14 +1413,23 @@ class FrameNavigatedEvent(BaseEvent):
     js_name = 'Page.frameNavigated'
     hashable = ['frameId']
     is_hashable = True
+    __slots__ = ('frame',)
 
     def __init__(self,
                  frame: Union['Frame', dict],
                  ):
         if isinstance(frame, dict):
-            frame = Frame(**frame)
+            frame = Frame.from_json(frame)
         self.frame = frame
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, frameId):
         kwargs = locals()
@@ -1334,10 +1445,15 @@ class FrameResizedEvent(BaseEvent):
     js_name = 'Page.frameResized'
     hashable = []
     is_hashable = False
+    __slots__ = ()
 
     def __init__(self):
         pass
 
+    @classmethod
+    def from_json(cls, d):
+        return cls()
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -1348,6 +1464,7 @@ class FrameScheduledNavigationEvent(BaseEvent):
     js_name = 'Page.frameScheduledNavigation'
     hashable = ['frameId']
     is_hashable = True
+    __slots__ = ('frameId', 'delay', 'reason', 'url')
 
     def __init__(self,
                  frameId: Union['FrameId', dict],
@@ -1355,19 +1472,20 @@ class FrameScheduledNavigationEvent(BaseEvent):
                  reason: Union['str', dict],
                  url: Union['str', dict],
                  ):
-        if isinstance(frameId, dict):
-            frameId = FrameId(**frameId)
         self.frameId = frameId
-        if isinstance(delay, dict):
-            delay = float(**delay)
         self.delay = delay
-        if isinstance(reason, dict):
-            reason = str(**reason)
         self.reason = reason
-        if isinstance(url, dict):
-            url = str(**url)
         self.url = url
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.frameId = intern(obj.frameId)
+        return obj
+
     @classmethod
     def build_hash(cls, frameId):
         kwargs = locals()
@@ -1383,14 +1501,22 @@ class FrameStartedLoadingEvent(BaseEvent):
     js_name = 'Page.frameStartedLoading'
     hashable = ['frameId']
     is_hashable = True
+    __slots__ = ('frameId',)
 
     def __init__(self,
                  frameId: Union['FrameId', dict],
                  ):
-        if isinstance(frameId, dict):
-            frameId = FrameId(**frameId)
         self.frameId = frameId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.frameId = intern(obj.frameId)
+        return obj
+
     @classmethod
     def build_hash(cls, frameId):
         kwargs = locals()
@@ -1406,14 +1532,22 @@ class FrameStoppedLoadingEvent(BaseEvent):
     js_name = 'Page.frameStoppedLoading'
     hashable = ['frameId']
     is_hashable = True
+    __slots__ = ('frameId',)
 
     def __init__(self,
                  frameId: Union['FrameId', dict],
                  ):
-        if isinstance(frameId, dict):
-            frameId = FrameId(**frameId)
         self.frameId = frameId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.frameId = intern(obj.frameId)
+        return obj
+
     @classmethod
     def build_hash(cls, frameId):
         kwargs = locals()
@@ -1429,10 +1563,15 @@ class InterstitialHiddenEvent(BaseEvent):
     js_name = 'Page.interstitialHidden'
     hashable = []
     is_hashable = False
+    __slots__ = ()
 
     def __init__(self):
         pass
 
+    @classmethod
+    def from_json(cls, d):
+        return cls()
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -1443,10 +1582,15 @@ class InterstitialShownEvent(BaseEvent):
     js_name = 'Page.interstitialShown'
     hashable = []
     is_hashable = False
+    __slots__ = ()
 
     def __init__(self):
         pass
 
+    @classmethod
+    def from_json(cls, d):
+        return cls()
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -1457,18 +1601,23 @@ class JavascriptDialogClosedEvent(BaseEvent):
     js_name = 'Page.javascriptDialogClosed'
     hashable = []
     is_hashable = False
+    __slots__ = ('result', 'userInput')
 
     def __init__(self,
                  result: Union['bool', dict],
                  userInput: Union['str', dict],
                  ):
-        if isinstance(result, dict):
-            result = bool(**result)
         self.result = result
-        if isinstance(userInput, dict):
-            userInput = str(**userInput)
         self.userInput = userInput
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -1479,6 +1628,7 @@ class JavascriptDialogOpeningEvent(BaseEvent):
     js_name = 'Page.javascriptDialogOpening'
     hashable = []
     is_hashable = False
+    __slots__ = ('url', 'message', 'type', 'hasBrowserHandler', 'defaultPrompt')
 
     def __init__(self,
                  url: Union['str', dict],
@@ -1487,22 +1637,20 @@ class JavascriptDialogOpeningEvent(BaseEvent):
                  hasBrowserHandler: Union['bool', dict],
                  defaultPrompt: Union['str', dict, None] = None,
                  ):
-        if isinstance(url, dict):
-            url = str(**url)
         self.url = url
-        if isinstance(message, dict):
-            message = str(**message)
         self.message = message
-        if isinstance(type, dict):
-            type = DialogType(**type)
         self.type = type
-        if isinstance(hasBrowserHandler, dict):
-            hasBrowserHandler = bool(**hasBrowserHandler)
         self.hasBrowserHandler = hasBrowserHandler
-        if isinstance(defaultPrompt, dict):
-            defaultPrompt = str(**defaultPrompt)
         self.defaultPrompt = defaultPrompt
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -1511,8 +1659,9 @@ class JavascriptDialogOpeningEvent(BaseEvent):
 class LifecycleEventEvent(BaseEvent):
 
     js_name = 'Page.lifecycleEvent'
-    hashable = ['loaderId', 'frameId']
+    hashable = ['frameId', 'loaderId']
     is_hashable = True
+    __slots__ = ('frameId', 'loaderId', 'name', 'timestamp')
 
     def __init__(self,
                  frameId: Union['FrameId', dict],
@@ -1520,21 +1669,23 @@ class LifecycleEventEvent(BaseEvent):
                  name: Union['str', dict],
                  timestamp: Union['Network.MonotonicTime', dict],
                  ):
-        if isinstance(frameId, dict):
-            frameId = FrameId(**frameId)
         self.frameId = frameId
-        if isinstance(loaderId, dict):
-            loaderId = Network.LoaderId(**loaderId)
         self.loaderId = loaderId
-        if isinstance(name, dict):
-            name = str(**name)
         self.name = name
-        if isinstance(timestamp, dict):
-            timestamp = Network.MonotonicTime(**timestamp)
         self.timestamp = timestamp
 
     @classmethod
-    def build_hash(cls, loaderId, frameId):
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.frameId = intern(obj.frameId)
+        obj.loaderId = intern(obj.loaderId)
+        return obj
+
+    @classmethod
+    def build_hash(cls, frameId, loaderId):
         kwargs = locals()
         kwargs.pop('cls')
         serialized_id_params = ','.join(['='.join([p, str(v)]) for p, v in kwargs.items()])
@@ -1548,14 +1699,21 @@ class LoadEventFiredEvent(BaseEvent):
     js_name = 'Page.loadEventFired'
     hashable = []
     is_hashable = False
+    __slots__ = ('timestamp',)
 
     def __init__(self,
                  timestamp: Union['Network.MonotonicTime', dict],
                  ):
-        if isinstance(timestamp, dict):
-            timestamp = Network.MonotonicTime(**timestamp)
         self.timestamp = timestamp
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -1566,18 +1724,24 @@ class NavigatedWithinDocumentEvent(BaseEvent):
     js_name = 'Page.navigatedWithinDocument'
     hashable = ['frameId']
     is_hashable = True
+    __slots__ = ('frameId', 'url')
 
     def __init__(self,
                  frameId: Union['FrameId', dict],
                  url: Union['str', dict],
                  ):
-        if isinstance(frameId, dict):
-            frameId = FrameId(**frameId)
         self.frameId = frameId
-        if isinstance(url, dict):
-            url = str(**url)
         self.url = url
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.frameId = intern(obj.frameId)
+        return obj
+
     @classmethod
     def build_hash(cls, frameId):
         kwargs = locals()
@@ -1593,22 +1757,27 @@ class ScreencastFrameEvent(BaseEvent):
     js_name = 'Page.screencastFrame'
     hashable = ['sessionId']
     is_hashable = True
+    __slots__ = ('data', 'metadata', 'sessionId')
 
     def __init__(self,
                  data: Union['str', dict],
                  metadata: Union['ScreencastFrameMetadata', dict],
                  sessionId: Union['int', dict],
                  ):
-        if isinstance(data, dict):
-            data = str(**data)
         self.data = data
         if isinstance(metadata, dict):
-            metadata = ScreencastFrameMetadata(**metadata)
+            metadata = ScreencastFrameMetadata.from_json(metadata)
         self.metadata = metadata
-        if isinstance(sessionId, dict):
-            sessionId = int(**sessionId)
         self.sessionId = sessionId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, sessionId):
         kwargs = locals()
@@ -1624,14 +1793,21 @@ class ScreencastVisibilityChangedEvent(BaseEvent):
     js_name = 'Page.screencastVisibilityChanged'
     hashable = []
     is_hashable = False
+    __slots__ = ('visible',)
 
     def __init__(self,
                  visible: Union['bool', dict],
                  ):
-        if isinstance(visible, dict):
-            visible = bool(**visible)
         self.visible = visible
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -1642,6 +1818,7 @@ class WindowOpenEvent(BaseEvent):
     js_name = 'Page.windowOpen'
     hashable = []
     is_hashable = False
+    __slots__ = ('url', 'windowName', 'windowFeatures', 'userGesture')
 
     def __init__(self,
                  url: Union['str', dict],
@@ -1649,19 +1826,19 @@ class WindowOpenEvent(BaseEvent):
                  windowFeatures: Union['[]', dict],
                  userGesture: Union['bool', dict],
                  ):
-        if isinstance(url, dict):
-            url = str(**url)
         self.url = url
-        if isinstance(windowName, dict):
-            windowName = str(**windowName)
         self.windowName = windowName
-        if isinstance(windowFeatures, dict):
-            windowFeatures = [](**windowFeatures)
         self.windowFeatures = windowFeatures
-        if isinstance(userGesture, dict):
-            userGesture = bool(**userGesture)
         self.userGesture = userGesture
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -1672,18 +1849,23 @@ class CompilationCacheProducedEvent(BaseEvent):
     js_name = 'Page.compilationCacheProduced'
     hashable = []
     is_hashable = False
+    __slots__ = ('url', 'data')
 
     def __init__(self,
                  url: Union['str', dict],
                  data: Union['str', dict],
                  ):
-        if isinstance(url, dict):
-            url = str(**url)
         self.url = url
-        if isinstance(data, dict):
-            data = str(**data)
         self.data = data
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
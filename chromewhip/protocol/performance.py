@@ -7,14 +7,18 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
 
+
 # Metric: Run-time execution metric.
 class Metric(ChromeTypeBase):
+    __slots__ = ('name', 'value')
+
     def __init__(self,
                  name: Union['str'],
                  value: Union['float'],
@@ -23,6 +27,14 @@ class Metric(ChromeTypeBase):
         self.name = name
         self.value = value
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 class Performance(PayloadMixin):
     """ 
@@ -54,33 +66,39 @@ class Performance(PayloadMixin):
         return (
             cls.build_send_payload("getMetrics", {
             }),
-            cls.convert_payload({
-                "metrics": {
-                    "class": [Metric],
-                    "optional": False
-                },
-            })
+            _decode_getMetrics
         )
 
 
 
+def _decode_getMetrics(result):
+    result['metrics'] = [Metric.from_json(i0) for i0 in result['metrics']]
+    return result
+
+
 class MetricsEvent(BaseEvent):
 
     js_name = 'Performance.metrics'
     hashable = []
     is_hashable = False
+    __slots__ = ('metrics', 'title')
 
     def __init__(self,
                  metrics: Union['[Metric]', dict],
                  title: Union['str', dict],
                  ):
-        if isinstance(metrics, dict):
-            metrics = [Metric](**metrics)
         self.metrics = metrics
-        if isinstance(title, dict):
-            title = str(**title)
         self.title = title
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.metrics = [Metric.from_json(i0) for i0 in obj.metrics]
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
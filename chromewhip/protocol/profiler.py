@@ -7,16 +7,20 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
+
 from chromewhip.protocol import runtime as Runtime
 from chromewhip.protocol import debugger as Debugger
 
 # ProfileNode: Profile node. Holds callsite information, execution statistics and child nodes.
 class ProfileNode(ChromeTypeBase):
+    __slots__ = ('id', 'callFrame', 'hitCount', 'children', 'deoptReason', 'positionTicks')
+
     def __init__(self,
                  id: Union['int'],
                  callFrame: Union['Runtime.CallFrame'],
@@ -33,9 +37,22 @@ class ProfileNode(ChromeTypeBase):
         self.deoptReason = deoptReason
         self.positionTicks = positionTicks
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.callFrame = Runtime.CallFrame.from_json(obj.callFrame)
+        if obj.positionTicks is not None:
+            obj.positionTicks = [PositionTickInfo.from_json(i0) for i0 in obj.positionTicks]
+        return obj
+
 
 # Profile: Profile.
 class Profile(ChromeTypeBase):
+    __slots__ = ('nodes', 'startTime', 'endTime', 'samples', 'timeDeltas')
+
     def __init__(self,
                  nodes: Union['[ProfileNode]'],
                  startTime: Union['float'],
@@ -50,9 +67,20 @@ class Profile(ChromeTypeBase):
         self.samples = samples
         self.timeDeltas = timeDeltas
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.nodes = [ProfileNode.from_json(i0) for i0 in obj.nodes]
+        return obj
+
 
 # PositionTickInfo: Specifies a number of samples attributed to a certain source position.
 class PositionTickInfo(ChromeTypeBase):
+    __slots__ = ('line', 'ticks')
+
     def __init__(self,
                  line: Union['int'],
                  ticks: Union['int'],
@@ -61,9 +89,19 @@ class PositionTickInfo(ChromeTypeBase):
         self.line = line
         self.ticks = ticks
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # CoverageRange: Coverage data for a source range.
 class CoverageRange(ChromeTypeBase):
+    __slots__ = ('startOffset', 'endOffset', 'count')
+
     def __init__(self,
                  startOffset: Union['int'],
                  endOffset: Union['int'],
@@ -74,9 +112,19 @@ class CoverageRange(ChromeTypeBase):
         self.endOffset = endOffset
         self.count = count
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # FunctionCoverage: Coverage data for a JavaScript function.
 class FunctionCoverage(ChromeTypeBase):
+    __slots__ = ('functionName', 'ranges', 'isBlockCoverage')
+
     def __init__(self,
                  functionName: Union['str'],
                  ranges: Union['[CoverageRange]'],
@@ -87,9 +135,20 @@ class FunctionCoverage(ChromeTypeBase):
         self.ranges = ranges
         self.isBlockCoverage = isBlockCoverage
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.ranges = [CoverageRange.from_json(i0) for i0 in obj.ranges]
+        return obj
+
 
 # ScriptCoverage: Coverage data for a JavaScript script.
 class ScriptCoverage(ChromeTypeBase):
+    __slots__ = ('scriptId', 'url', 'functions')
+
     def __init__(self,
                  scriptId: Union['Runtime.ScriptId'],
                  url: Union['str'],
@@ -100,18 +159,40 @@ class ScriptCoverage(ChromeTypeBase):
         self.url = url
         self.functions = functions
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.scriptId = intern(obj.scriptId)
+        obj.functions = [FunctionCoverage.from_json(i0) for i0 in obj.functions]
+        return obj
+
 
 # TypeObject: Describes a type collected during runtime.
 class TypeObject(ChromeTypeBase):
+    __slots__ = ('name',)
+
     def __init__(self,
                  name: Union['str'],
                  ):
 
         self.name = name
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # TypeProfileEntry: Source offset and types for a parameter or return value.
 class TypeProfileEntry(ChromeTypeBase):
+    __slots__ = ('offset', 'types')
+
     def __init__(self,
                  offset: Union['int'],
                  types: Union['[TypeObject]'],
@@ -120,9 +201,20 @@ class TypeProfileEntry(ChromeTypeBase):
         self.offset = offset
         self.types = types
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.types = [TypeObject.from_json(i0) for i0 in obj.types]
+        return obj
+
 
 # ScriptTypeProfile: Type profile data collected during runtime for a JavaScript script.
 class ScriptTypeProfile(ChromeTypeBase):
+    __slots__ = ('scriptId', 'url', 'entries')
+
     def __init__(self,
                  scriptId: Union['Runtime.ScriptId'],
                  url: Union['str'],
@@ -133,6 +225,16 @@ class ScriptTypeProfile(ChromeTypeBase):
         self.url = url
         self.entries = entries
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.scriptId = intern(obj.scriptId)
+        obj.entries = [TypeProfileEntry.from_json(i0) for i0 in obj.entries]
+        return obj
+
 
 class Profiler(PayloadMixin):
     """ 
@@ -165,12 +267,7 @@ garbage collection.
         return (
             cls.build_send_payload("getBestEffortCoverage", {
             }),
-            cls.convert_payload({
-                "result": {
-                    "class": [ScriptCoverage],
-                    "optional": False
-                },
-            })
+            _decode_getBestEffortCoverage
         )
 
     @classmethod
@@ -236,12 +333,7 @@ counters.
         return (
             cls.build_send_payload("stop", {
             }),
-            cls.convert_payload({
-                "profile": {
-                    "class": Profile,
-                    "optional": False
-                },
-            })
+            _decode_stop
         )
 
     @classmethod
@@ -273,12 +365,7 @@ coverage needs to have started.
         return (
             cls.build_send_payload("takePreciseCoverage", {
             }),
-            cls.convert_payload({
-                "result": {
-                    "class": [ScriptCoverage],
-                    "optional": False
-                },
-            })
+            _decode_takePreciseCoverage
         )
 
     @classmethod
@@ -288,21 +375,37 @@ coverage needs to have started.
         return (
             cls.build_send_payload("takeTypeProfile", {
             }),
-            cls.convert_payload({
-                "result": {
-                    "class": [ScriptTypeProfile],
-                    "optional": False
-                },
-            })
+            _decode_takeTypeProfile
         )
 
 
 
+def _decode_getBestEffortCoverage(result):
+    result['result'] = [ScriptCoverage.from_json(i0) for i0 in result['result']]
+    return result
+
+
+def _decode_stop(result):
+    result['profile'] = Profile.from_json(result['profile'])
+    return result
+
+
+def _decode_takePreciseCoverage(result):
+    result['result'] = [ScriptCoverage.from_json(i0) for i0 in result['result']]
+    return result
+
+
+def _decode_takeTypeProfile(result):
+    result['result'] = [ScriptTypeProfile.from_json(i0) for i0 in result['result']]
+    return result
+
+
 class ConsoleProfileFinishedEvent(BaseEvent):
 
     js_name = 'Profiler.consoleProfileFinished'
     hashable = ['id']
     is_hashable = True
+    __slots__ = ('id', 'location', 'profile', 'title')
 
     def __init__(self,
                  id: Union['str', dict],
@@ -310,19 +413,23 @@ class ConsoleProfileFinishedEvent(BaseEvent):
                  profile: Union['Profile', dict],
                  title: Union['str', dict, None] = None,
                  ):
-        if isinstance(id, dict):
-            id = str(**id)
         self.id = id
         if isinstance(location, dict):
-            location = Debugger.Location(**location)
+            location = Debugger.Location.from_json(location)
         self.location = location
         if isinstance(profile, dict):
-            profile = Profile(**profile)
+            profile = Profile.from_json(profile)
         self.profile = profile
-        if isinstance(title, dict):
-            title = str(**title)
         self.title = title
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, id):
         kwargs = locals()
@@ -338,22 +445,27 @@ class ConsoleProfileStartedEvent(BaseEvent):
     js_name = 'Profiler.consoleProfileStarted'
     hashable = ['id']
     is_hashable = True
+    __slots__ = ('id', 'location', 'title')
 
     def __init__(self,
                  id: Union['str', dict],
                  location: Union['Debugger.Location', dict],
                  title: Union['str', dict, None] = None,
                  ):
-        if isinstance(id, dict):
-            id = str(**id)
         self.id = id
         if isinstance(location, dict):
-            location = Debugger.Location(**location)
+            location = Debugger.Location.from_json(location)
         self.location = location
-        if isinstance(title, dict):
-            title = str(**title)
         self.title = title
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, id):
         kwargs = locals()
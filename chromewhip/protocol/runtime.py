@@ -7,12 +7,14 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
 
+
 # ScriptId: Unique script identifier.
 ScriptId = str
 
@@ -24,6 +26,8 @@ UnserializableValue = str
 
 # RemoteObject: Mirror object referencing original JavaScript object.
 class RemoteObject(ChromeTypeBase):
+    __slots__ = ('type', 'subtype', 'className', 'value', 'unserializableValue', 'description', 'objectId', 'preview', 'customPreview')
+
     def __init__(self,
                  type: Union['str'],
                  subtype: Optional['str'] = None,
@@ -46,9 +50,25 @@ class RemoteObject(ChromeTypeBase):
         self.preview = preview
         self.customPreview = customPreview
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.objectId is not None:
+            obj.objectId = intern(obj.objectId)
+        if obj.preview is not None:
+            obj.preview = ObjectPreview.from_json(obj.preview)
+        if obj.customPreview is not None:
+            obj.customPreview = CustomPreview.from_json(obj.customPreview)
+        return obj
+
 
 # CustomPreview: 
 class CustomPreview(ChromeTypeBase):
+    __slots__ = ('header', 'hasBody', 'formatterObjectId', 'bindRemoteObjectFunctionId', 'configObjectId')
+
     def __init__(self,
                  header: Union['str'],
                  hasBody: Union['bool'],
@@ -63,9 +83,23 @@ class CustomPreview(ChromeTypeBase):
         self.bindRemoteObjectFunctionId = bindRemoteObjectFunctionId
         self.configObjectId = configObjectId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.formatterObjectId = intern(obj.formatterObjectId)
+        obj.bindRemoteObjectFunctionId = intern(obj.bindRemoteObjectFunctionId)
+        if obj.configObjectId is not None:
+            obj.configObjectId = intern(obj.configObjectId)
+        return obj
+
 
 # ObjectPreview: Object containing abbreviated remote object value.
 class ObjectPreview(ChromeTypeBase):
+    __slots__ = ('type', 'subtype', 'description', 'overflow', 'properties', 'entries')
+
     def __init__(self,
                  type: Union['str'],
                  overflow: Union['bool'],
@@ -82,9 +116,22 @@ class ObjectPreview(ChromeTypeBase):
         self.properties = properties
         self.entries = entries
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.properties = [PropertyPreview.from_json(i0) for i0 in obj.properties]
+        if obj.entries is not None:
+            obj.entries = [EntryPreview.from_json(i0) for i0 in obj.entries]
+        return obj
+
 
 # PropertyPreview: 
 class PropertyPreview(ChromeTypeBase):
+    __slots__ = ('name', 'type', 'value', 'valuePreview', 'subtype')
+
     def __init__(self,
                  name: Union['str'],
                  type: Union['str'],
@@ -99,9 +146,21 @@ class PropertyPreview(ChromeTypeBase):
         self.valuePreview = valuePreview
         self.subtype = subtype
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.valuePreview is not None:
+            obj.valuePreview = ObjectPreview.from_json(obj.valuePreview)
+        return obj
+
 
 # EntryPreview: 
 class EntryPreview(ChromeTypeBase):
+    __slots__ = ('key', 'value')
+
     def __init__(self,
                  value: Union['ObjectPreview'],
                  key: Optional['ObjectPreview'] = None,
@@ -110,9 +169,22 @@ class EntryPreview(ChromeTypeBase):
         self.key = key
         self.value = value
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.key is not None:
+            obj.key = ObjectPreview.from_json(obj.key)
+        obj.value = ObjectPreview.from_json(obj.value)
+        return obj
+
 
 # PropertyDescriptor: Object property descriptor.
 class PropertyDescriptor(ChromeTypeBase):
+    __slots__ = ('name', 'value', 'writable', 'get', 'set', 'configurable', 'enumerable', 'wasThrown', 'isOwn', 'symbol')
+
     def __init__(self,
                  name: Union['str'],
                  configurable: Union['bool'],
@@ -137,9 +209,27 @@ class PropertyDescriptor(ChromeTypeBase):
         self.isOwn = isOwn
         self.symbol = symbol
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.value is not None:
+            obj.value = RemoteObject.from_json(obj.value)
+        if obj.get is not None:
+            obj.get = RemoteObject.from_json(obj.get)
+        if obj.set is not None:
+            obj.set = RemoteObject.from_json(obj.set)
+        if obj.symbol is not None:
+            obj.symbol = RemoteObject.from_json(obj.symbol)
+        return obj
+
 
 # InternalPropertyDescriptor: Object internal property descriptor. This property isn't normally visible in JavaScript code.
 class InternalPropertyDescriptor(ChromeTypeBase):
+    __slots__ = ('name', 'value')
+
     def __init__(self,
                  name: Union['str'],
                  value: Optional['RemoteObject'] = None,
@@ -148,9 +238,21 @@ class InternalPropertyDescriptor(ChromeTypeBase):
         self.name = name
         self.value = value
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.value is not None:
+            obj.value = RemoteObject.from_json(obj.value)
+        return obj
+
 
 # CallArgument: Represents function call argument. Either remote object id `objectId`, primitive `value`,unserializable primitive value or neither of (for undefined) them should be specified.
 class CallArgument(ChromeTypeBase):
+    __slots__ = ('value', 'unserializableValue', 'objectId')
+
     def __init__(self,
                  value: Optional['Any'] = None,
                  unserializableValue: Optional['UnserializableValue'] = None,
@@ -161,12 +263,24 @@ class CallArgument(ChromeTypeBase):
         self.unserializableValue = unserializableValue
         self.objectId = objectId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.objectId is not None:
+            obj.objectId = intern(obj.objectId)
+        return obj
+
 
 # ExecutionContextId: Id of an execution context.
 ExecutionContextId = int
 
 # ExecutionContextDescription: Description of an isolated world.
 class ExecutionContextDescription(ChromeTypeBase):
+    __slots__ = ('id', 'origin', 'name', 'auxData')
+
     def __init__(self,
                  id: Union['ExecutionContextId'],
                  origin: Union['str'],
@@ -179,9 +293,19 @@ class ExecutionContextDescription(ChromeTypeBase):
         self.name = name
         self.auxData = auxData
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # ExceptionDetails: Detailed information about exception (or error) that was thrown during script compilation orexecution.
 class ExceptionDetails(ChromeTypeBase):
+    __slots__ = ('exceptionId', 'text', 'lineNumber', 'columnNumber', 'scriptId', 'url', 'stackTrace', 'exception', 'executionContextId')
+
     def __init__(self,
                  exceptionId: Union['int'],
                  text: Union['str'],
@@ -204,6 +328,20 @@ class ExceptionDetails(ChromeTypeBase):
         self.exception = exception
         self.executionContextId = executionContextId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.scriptId is not None:
+            obj.scriptId = intern(obj.scriptId)
+        if obj.stackTrace is not None:
+            obj.stackTrace = StackTrace.from_json(obj.stackTrace)
+        if obj.exception is not None:
+            obj.exception = RemoteObject.from_json(obj.exception)
+        return obj
+
 
 # Timestamp: Number of milliseconds since epoch.
 Timestamp = float
@@ -213,6 +351,8 @@ TimeDelta = float
 
 # CallFrame: Stack entry for runtime errors and assertions.
 class CallFrame(ChromeTypeBase):
+    __slots__ = ('functionName', 'scriptId', 'url', 'lineNumber', 'columnNumber')
+
     def __init__(self,
                  functionName: Union['str'],
                  scriptId: Union['ScriptId'],
@@ -227,9 +367,20 @@ class CallFrame(ChromeTypeBase):
         self.lineNumber = lineNumber
         self.columnNumber = columnNumber
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.scriptId = intern(obj.scriptId)
+        return obj
+
 
 # StackTrace: Call frames for assertions or error messages.
 class StackTrace(ChromeTypeBase):
+    __slots__ = ('description', 'callFrames', 'parent', 'parentId')
+
     def __init__(self,
                  callFrames: Union['[CallFrame]'],
                  description: Optional['str'] = None,
@@ -242,12 +393,27 @@ class StackTrace(ChromeTypeBase):
         self.parent = parent
         self.parentId = parentId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.callFrames = [CallFrame.from_json(i0) for i0 in obj.callFrames]
+        if obj.parent is not None:
+            obj.parent = StackTrace.from_json(obj.parent)
+        if obj.parentId is not None:
+            obj.parentId = StackTraceId.from_json(obj.parentId)
+        return obj
+
 
 # UniqueDebuggerId: Unique identifier of current debugger.
 UniqueDebuggerId = str
 
 # StackTraceId: If `debuggerId` is set stack trace comes from another debugger and can be resolved there. Thisallows to track cross-debugger calls. See `Runtime.StackTrace` and `Debugger.paused` for usages.
 class StackTraceId(ChromeTypeBase):
+    __slots__ = ('id', 'debuggerId')
+
     def __init__(self,
                  id: Union['str'],
                  debuggerId: Optional['UniqueDebuggerId'] = None,
@@ -256,6 +422,16 @@ class StackTraceId(ChromeTypeBase):
         self.id = id
         self.debuggerId = debuggerId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        if obj.debuggerId is not None:
+            obj.debuggerId = intern(obj.debuggerId)
+        return obj
+
 
 class Runtime(PayloadMixin):
     """ Runtime domain exposes JavaScript runtime by means of remote evaluation and mirror objects.
@@ -284,16 +460,7 @@ other objects in their object group.
                 "returnByValue": returnByValue,
                 "generatePreview": generatePreview,
             }),
-            cls.convert_payload({
-                "result": {
-                    "class": RemoteObject,
-                    "optional": False
-                },
-                "exceptionDetails": {
-                    "class": ExceptionDetails,
-                    "optional": True
-                },
-            })
+            _decode_awaitPromise
         )
 
     @classmethod
@@ -351,16 +518,7 @@ specified and objectId is, objectGroup will be inherited from object.
                 "executionContextId": executionContextId,
                 "objectGroup": objectGroup,
             }),
-            cls.convert_payload({
-                "result": {
-                    "class": RemoteObject,
-                    "optional": False
-                },
-                "exceptionDetails": {
-                    "class": ExceptionDetails,
-                    "optional": True
-                },
-            })
+            _decode_callFunctionOn
         )
 
     @classmethod
@@ -388,16 +546,7 @@ evaluation will be performed in the context of the inspected page.
                 "persistScript": persistScript,
                 "executionContextId": executionContextId,
             }),
-            cls.convert_payload({
-                "scriptId": {
-                    "class": ScriptId,
-                    "optional": True
-                },
-                "exceptionDetails": {
-                    "class": ExceptionDetails,
-                    "optional": True
-                },
-            })
+            _decode_compileScript
         )
 
     @classmethod
@@ -487,16 +636,7 @@ resolved.
                 "throwOnSideEffect": throwOnSideEffect,
                 "timeout": timeout,
             }),
-            cls.convert_payload({
-                "result": {
-                    "class": RemoteObject,
-                    "optional": False
-                },
-                "exceptionDetails": {
-                    "class": ExceptionDetails,
-                    "optional": True
-                },
-            })
+            _decode_evaluate
         )
 
     @classmethod
@@ -506,12 +646,7 @@ resolved.
         return (
             cls.build_send_payload("getIsolateId", {
             }),
-            cls.convert_payload({
-                "id": {
-                    "class": str,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -522,16 +657,7 @@ It is the total usage of the corresponding isolate not scoped to a particular Ru
         return (
             cls.build_send_payload("getHeapUsage", {
             }),
-            cls.convert_payload({
-                "usedSize": {
-                    "class": float,
-                    "optional": False
-                },
-                "totalSize": {
-                    "class": float,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -561,20 +687,7 @@ returned either.
                 "accessorPropertiesOnly": accessorPropertiesOnly,
                 "generatePreview": generatePreview,
             }),
-            cls.convert_payload({
-                "result": {
-                    "class": [PropertyDescriptor],
-                    "optional": False
-                },
-                "internalProperties": {
-                    "class": [InternalPropertyDescriptor],
-                    "optional": True
-                },
-                "exceptionDetails": {
-                    "class": ExceptionDetails,
-                    "optional": True
-                },
-            })
+            _decode_getProperties
         )
 
     @classmethod
@@ -589,12 +702,7 @@ returned either.
             cls.build_send_payload("globalLexicalScopeNames", {
                 "executionContextId": executionContextId,
             }),
-            cls.convert_payload({
-                "names": {
-                    "class": [],
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -613,12 +721,7 @@ returned either.
                 "prototypeObjectId": prototypeObjectId,
                 "objectGroup": objectGroup,
             }),
-            cls.convert_payload({
-                "objects": {
-                    "class": RemoteObject,
-                    "optional": False
-                },
-            })
+            _decode_queryObjects
         )
 
     @classmethod
@@ -704,16 +807,7 @@ resolved.
                 "generatePreview": generatePreview,
                 "awaitPromise": awaitPromise,
             }),
-            cls.convert_payload({
-                "result": {
-                    "class": RemoteObject,
-                    "optional": False
-                },
-                "exceptionDetails": {
-                    "class": ExceptionDetails,
-                    "optional": True
-                },
-            })
+            _decode_runScript
         )
 
     @classmethod
@@ -817,27 +911,80 @@ unsubscribes current runtime agent from Runtime.bindingCalled notifications.
 
 
 
+def _decode_awaitPromise(result):
+    result['result'] = RemoteObject.from_json(result['result'])
+    if result.get('exceptionDetails') is not None:
+        result['exceptionDetails'] = ExceptionDetails.from_json(result['exceptionDetails'])
+    return result
+
+
+def _decode_callFunctionOn(result):
+    result['result'] = RemoteObject.from_json(result['result'])
+    if result.get('exceptionDetails') is not None:
+        result['exceptionDetails'] = ExceptionDetails.from_json(result['exceptionDetails'])
+    return result
+
+
+def _decode_compileScript(result):
+    if result.get('scriptId') is not None:
+        result['scriptId'] = intern(result['scriptId'])
+    if result.get('exceptionDetails') is not None:
+        result['exceptionDetails'] = ExceptionDetails.from_json(result['exceptionDetails'])
+    return result
+
+
+def _decode_evaluate(result):
+    result['result'] = RemoteObject.from_json(result['result'])
+    if result.get('exceptionDetails') is not None:
+        result['exceptionDetails'] = ExceptionDetails.from_json(result['exceptionDetails'])
+    return result
+
+
+def _decode_getProperties(result):
+    result['result'] = [PropertyDescriptor.from_json(i0) for i0 in result['result']]
+    if result.get('internalProperties') is not None:
+        result['internalProperties'] = [InternalPropertyDescriptor.from_json(i0) for i0 in result['internalProperties']]
+    if result.get('exceptionDetails') is not None:
+        result['exceptionDetails'] = ExceptionDetails.from_json(result['exceptionDetails'])
+    return result
+
+
+def _decode_queryObjects(result):
+    result['objects'] = RemoteObject.from_json(result['objects'])
+    return result
+
+
+def _decode_runScript(result):
+    result['result'] = RemoteObject.from_json(result['result'])
+    if result.get('exceptionDetails') is not None:
+        result['exceptionDetails'] = ExceptionDetails.from_json(result['exceptionDetails'])
+    return result
+
+
 class BindingCalledEvent(BaseEvent):
 
     js_name = 'Runtime.bindingCalled'
     hashable = ['executionContextId']
     is_hashable = True
+    __slots__ = ('name', 'payload', 'executionContextId')
 
     def __init__(self,
                  name: Union['str', dict],
                  payload: Union['str', dict],
                  executionContextId: Union['ExecutionContextId', dict],
                  ):
-        if isinstance(name, dict):
-            name = str(**name)
         self.name = name
-        if isinstance(payload, dict):
-            payload = str(**payload)
         self.payload = payload
-        if isinstance(executionContextId, dict):
-            executionContextId = ExecutionContextId(**executionContextId)
         self.executionContextId = executionContextId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, executionContextId):
         kwargs = locals()
@@ -853,6 +1000,7 @@ class ConsoleAPICalledEvent(BaseEvent):
     js_name = 'Runtime.consoleAPICalled'
     hashable = ['executionContextId']
     is_hashable = True
+    __slots__ = ('type', 'args', 'executionContextId', 'timestamp', 'stackTrace', 'context')
 
     def __init__(self,
                  type: Union['str', dict],
@@ -862,25 +1010,24 @@ class ConsoleAPICalledEvent(BaseEvent):
                  stackTrace: Union['StackTrace', dict, None] = None,
                  context: Union['str', dict, None] = None,
                  ):
-        if isinstance(type, dict):
-            type = str(**type)
         self.type = type
-        if isinstance(args, dict):
-            args = [RemoteObject](**args)
         self.args = args
-        if isinstance(executionContextId, dict):
-            executionContextId = ExecutionContextId(**executionContextId)
         self.executionContextId = executionContextId
-        if isinstance(timestamp, dict):
-            timestamp = Timestamp(**timestamp)
         self.timestamp = timestamp
         if isinstance(stackTrace, dict):
-            stackTrace = StackTrace(**stackTrace)
+            stackTrace = StackTrace.from_json(stackTrace)
         self.stackTrace = stackTrace
-        if isinstance(context, dict):
-            context = str(**context)
         self.context = context
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.args = [RemoteObject.from_json(i0) for i0 in obj.args]
+        return obj
+
     @classmethod
     def build_hash(cls, executionContextId):
         kwargs = locals()
@@ -896,18 +1043,23 @@ class ExceptionRevokedEvent(BaseEvent):
     js_name = 'Runtime.exceptionRevoked'
     hashable = ['exceptionId']
     is_hashable = True
+    __slots__ = ('reason', 'exceptionId')
 
     def __init__(self,
                  reason: Union['str', dict],
                  exceptionId: Union['int', dict],
                  ):
-        if isinstance(reason, dict):
-            reason = str(**reason)
         self.reason = reason
-        if isinstance(exceptionId, dict):
-            exceptionId = int(**exceptionId)
         self.exceptionId = exceptionId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, exceptionId):
         kwargs = locals()
@@ -923,18 +1075,25 @@ class ExceptionThrownEvent(BaseEvent):
     js_name = 'Runtime.exceptionThrown'
     hashable = []
     is_hashable = False
+    __slots__ = ('timestamp', 'exceptionDetails')
 
     def __init__(self,
                  timestamp: Union['Timestamp', dict],
                  exceptionDetails: Union['ExceptionDetails', dict],
                  ):
-        if isinstance(timestamp, dict):
-            timestamp = Timestamp(**timestamp)
         self.timestamp = timestamp
         if isinstance(exceptionDetails, dict):
-            exceptionDetails = ExceptionDetails(**exceptionDetails)
+            exceptionDetails = ExceptionDetails.from_json(exceptionDetails)
         self.exceptionDetails = exceptionDetails
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -945,14 +1104,23 @@ class ExecutionContextCreatedEvent(BaseEvent):
     js_name = 'Runtime.executionContextCreated'
     hashable = ['contextId']
     is_hashable = True
+    __slots__ = ('context',)
 
     def __init__(self,
                  context: Union['ExecutionContextDescription', dict],
                  ):
         if isinstance(context, dict):
-            context = ExecutionContextDescription(**context)
+            context = ExecutionContextDescription.from_json(context)
         self.context = context
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, contextId):
         kwargs = locals()
@@ -968,14 +1136,21 @@ class ExecutionContextDestroyedEvent(BaseEvent):
     js_name = 'Runtime.executionContextDestroyed'
     hashable = ['executionContextId']
     is_hashable = True
+    __slots__ = ('executionContextId',)
 
     def __init__(self,
                  executionContextId: Union['ExecutionContextId', dict],
                  ):
-        if isinstance(executionContextId, dict):
-            executionContextId = ExecutionContextId(**executionContextId)
         self.executionContextId = executionContextId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, executionContextId):
         kwargs = locals()
@@ -991,10 +1166,15 @@ class ExecutionContextsClearedEvent(BaseEvent):
     js_name = 'Runtime.executionContextsCleared'
     hashable = []
     is_hashable = False
+    __slots__ = ()
 
     def __init__(self):
         pass
 
+    @classmethod
+    def from_json(cls, d):
+        return cls()
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -1005,18 +1185,25 @@ class InspectRequestedEvent(BaseEvent):
     js_name = 'Runtime.inspectRequested'
     hashable = []
     is_hashable = False
+    __slots__ = ('object', 'hints')
 
     def __init__(self,
                  object: Union['RemoteObject', dict],
                  hints: Union['dict', dict],
                  ):
         if isinstance(object, dict):
-            object = RemoteObject(**object)
+            object = RemoteObject.from_json(object)
         self.object = object
-        if isinstance(hints, dict):
-            hints = dict(**hints)
         self.hints = hints
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -7,14 +7,18 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
 
+
 # Domain: Description of the protocol domain.
 class Domain(ChromeTypeBase):
+    __slots__ = ('name', 'version')
+
     def __init__(self,
                  name: Union['str'],
                  version: Union['str'],
@@ -23,6 +27,14 @@ class Domain(ChromeTypeBase):
         self.name = name
         self.version = version
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 class Schema(PayloadMixin):
     """ This domain is deprecated.
@@ -34,11 +46,11 @@ class Schema(PayloadMixin):
         return (
             cls.build_send_payload("getDomains", {
             }),
-            cls.convert_payload({
-                "domains": {
-                    "class": [Domain],
-                    "optional": False
-                },
-            })
+            _decode_getDomains
         )
 
+
+
+def _decode_getDomains(result):
+    result['domains'] = [Domain.from_json(i0) for i0 in result['domains']]
+    return result
@@ -7,12 +7,14 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
 
+
 # CertificateId: An internal certificate ID value.
 CertificateId = int
 
@@ -24,6 +26,8 @@ SecurityState = str
 
 # SecurityStateExplanation: An explanation of an factor contributing to the security state.
 class SecurityStateExplanation(ChromeTypeBase):
+    __slots__ = ('securityState', 'title', 'summary', 'description', 'mixedContentType', 'certificate')
+
     def __init__(self,
                  securityState: Union['SecurityState'],
                  title: Union['str'],
@@ -40,9 +44,19 @@ class SecurityStateExplanation(ChromeTypeBase):
         self.mixedContentType = mixedContentType
         self.certificate = certificate
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # InsecureContentStatus: Information about insecure content on the page.
 class InsecureContentStatus(ChromeTypeBase):
+    __slots__ = ('ranMixedContent', 'displayedMixedContent', 'containedMixedForm', 'ranContentWithCertErrors', 'displayedContentWithCertErrors', 'ranInsecureContentStyle', 'displayedInsecureContentStyle')
+
     def __init__(self,
                  ranMixedContent: Union['bool'],
                  displayedMixedContent: Union['bool'],
@@ -61,6 +75,14 @@ class InsecureContentStatus(ChromeTypeBase):
         self.ranInsecureContentStyle = ranInsecureContentStyle
         self.displayedInsecureContentStyle = displayedInsecureContentStyle
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # CertificateErrorAction: The action to take when a certificate error occurs. continue will continue processing therequest and cancel will cancel the request.
 CertificateErrorAction = str
@@ -145,22 +167,25 @@ class CertificateErrorEvent(BaseEvent):
     js_name = 'Security.certificateError'
     hashable = ['eventId']
     is_hashable = True
+    __slots__ = ('eventId', 'errorType', 'requestURL')
 
     def __init__(self,
                  eventId: Union['int', dict],
                  errorType: Union['str', dict],
                  requestURL: Union['str', dict],
                  ):
-        if isinstance(eventId, dict):
-            eventId = int(**eventId)
         self.eventId = eventId
-        if isinstance(errorType, dict):
-            errorType = str(**errorType)
         self.errorType = errorType
-        if isinstance(requestURL, dict):
-            requestURL = str(**requestURL)
         self.requestURL = requestURL
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, eventId):
         kwargs = locals()
@@ -176,6 +201,7 @@ class SecurityStateChangedEvent(BaseEvent):
     js_name = 'Security.securityStateChanged'
     hashable = []
     is_hashable = False
+    __slots__ = ('securityState', 'schemeIsCryptographic', 'explanations', 'insecureContentStatus', 'summary')
 
     def __init__(self,
                  securityState: Union['SecurityState', dict],
@@ -184,22 +210,23 @@ class SecurityStateChangedEvent(BaseEvent):
                  insecureContentStatus: Union['InsecureContentStatus', dict],
                  summary: Union['str', dict, None] = None,
                  ):
-        if isinstance(securityState, dict):
-            securityState = SecurityState(**securityState)
         self.securityState = securityState
-        if isinstance(schemeIsCryptographic, dict):
-            schemeIsCryptographic = bool(**schemeIsCryptographic)
         self.schemeIsCryptographic = schemeIsCryptographic
-        if isinstance(explanations, dict):
-            explanations = [SecurityStateExplanation](**explanations)
         self.explanations = explanations
         if isinstance(insecureContentStatus, dict):
-            insecureContentStatus = InsecureContentStatus(**insecureContentStatus)
+            insecureContentStatus = InsecureContentStatus.from_json(insecureContentStatus)
         self.insecureContentStatus = insecureContentStatus
-        if isinstance(summary, dict):
-            summary = str(**summary)
         self.summary = summary
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.explanations = [SecurityStateExplanation.from_json(i0) for i0 in obj.explanations]
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
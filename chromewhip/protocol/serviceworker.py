@@ -7,14 +7,18 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
 
+
 # ServiceWorkerRegistration: ServiceWorker registration.
 class ServiceWorkerRegistration(ChromeTypeBase):
+    __slots__ = ('registrationId', 'scopeURL', 'isDeleted')
+
     def __init__(self,
                  registrationId: Union['str'],
                  scopeURL: Union['str'],
@@ -25,6 +29,14 @@ class ServiceWorkerRegistration(ChromeTypeBase):
         self.scopeURL = scopeURL
         self.isDeleted = isDeleted
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # ServiceWorkerVersionRunningStatus: 
 ServiceWorkerVersionRunningStatus = str
@@ -34,6 +46,8 @@ ServiceWorkerVersionStatus = str
 
 # ServiceWorkerVersion: ServiceWorker version.
 class ServiceWorkerVersion(ChromeTypeBase):
+    __slots__ = ('versionId', 'registrationId', 'scriptURL', 'runningStatus', 'status', 'scriptLastModified', 'scriptResponseTime', 'controlledClients', 'targetId')
+
     def __init__(self,
                  versionId: Union['str'],
                  registrationId: Union['str'],
@@ -56,9 +70,19 @@ class ServiceWorkerVersion(ChromeTypeBase):
         self.controlledClients = controlledClients
         self.targetId = targetId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # ServiceWorkerErrorMessage: ServiceWorker error message.
 class ServiceWorkerErrorMessage(ChromeTypeBase):
+    __slots__ = ('errorMessage', 'registrationId', 'versionId', 'sourceURL', 'lineNumber', 'columnNumber')
+
     def __init__(self,
                  errorMessage: Union['str'],
                  registrationId: Union['str'],
@@ -75,6 +99,14 @@ class ServiceWorkerErrorMessage(ChromeTypeBase):
         self.lineNumber = lineNumber
         self.columnNumber = columnNumber
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 class ServiceWorker(PayloadMixin):
     """ 
@@ -268,17 +300,26 @@ class ServiceWorker(PayloadMixin):
 
 class WorkerErrorReportedEvent(BaseEvent):
 
-    js_name = 'Serviceworker.workerErrorReported'
+    js_name = 'ServiceWorker.workerErrorReported'
     hashable = []
     is_hashable = False
+    __slots__ = ('errorMessage',)
 
     def __init__(self,
                  errorMessage: Union['ServiceWorkerErrorMessage', dict],
                  ):
         if isinstance(errorMessage, dict):
-            errorMessage = ServiceWorkerErrorMessage(**errorMessage)
+            errorMessage = ServiceWorkerErrorMessage.from_json(errorMessage)
         self.errorMessage = errorMessage
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -286,17 +327,25 @@ class WorkerErrorReportedEvent(BaseEvent):
 
 class WorkerRegistrationUpdatedEvent(BaseEvent):
 
-    js_name = 'Serviceworker.workerRegistrationUpdated'
+    js_name = 'ServiceWorker.workerRegistrationUpdated'
     hashable = []
     is_hashable = False
+    __slots__ = ('registrations',)
 
     def __init__(self,
                  registrations: Union['[ServiceWorkerRegistration]', dict],
                  ):
-        if isinstance(registrations, dict):
-            registrations = [ServiceWorkerRegistration](**registrations)
         self.registrations = registrations
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.registrations = [ServiceWorkerRegistration.from_json(i0) for i0 in obj.registrations]
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -304,17 +353,25 @@ class WorkerRegistrationUpdatedEvent(BaseEvent):
 
 class WorkerVersionUpdatedEvent(BaseEvent):
 
-    js_name = 'Serviceworker.workerVersionUpdated'
+    js_name = 'ServiceWorker.workerVersionUpdated'
     hashable = []
     is_hashable = False
+    __slots__ = ('versions',)
 
     def __init__(self,
                  versions: Union['[ServiceWorkerVersion]', dict],
                  ):
-        if isinstance(versions, dict):
-            versions = [ServiceWorkerVersion](**versions)
         self.versions = versions
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.versions = [ServiceWorkerVersion.from_json(i0) for i0 in obj.versions]
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -7,17 +7,21 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
 
+
 # StorageType: Enum of possible storage types.
 StorageType = str
 
 # UsageForType: Usage for a storage type.
 class UsageForType(ChromeTypeBase):
+    __slots__ = ('storageType', 'usage')
+
     def __init__(self,
                  storageType: Union['StorageType'],
                  usage: Union['float'],
@@ -26,6 +30,14 @@ class UsageForType(ChromeTypeBase):
         self.storageType = storageType
         self.usage = usage
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 class Storage(PayloadMixin):
     """ 
@@ -61,20 +73,7 @@ class Storage(PayloadMixin):
             cls.build_send_payload("getUsageAndQuota", {
                 "origin": origin,
             }),
-            cls.convert_payload({
-                "usage": {
-                    "class": float,
-                    "optional": False
-                },
-                "quota": {
-                    "class": float,
-                    "optional": False
-                },
-                "usageBreakdown": {
-                    "class": [UsageForType],
-                    "optional": False
-                },
-            })
+            _decode_getUsageAndQuota
         )
 
     @classmethod
@@ -139,23 +138,33 @@ class Storage(PayloadMixin):
 
 
 
+def _decode_getUsageAndQuota(result):
+    result['usageBreakdown'] = [UsageForType.from_json(i0) for i0 in result['usageBreakdown']]
+    return result
+
+
 class CacheStorageContentUpdatedEvent(BaseEvent):
 
     js_name = 'Storage.cacheStorageContentUpdated'
     hashable = []
     is_hashable = False
+    __slots__ = ('origin', 'cacheName')
 
     def __init__(self,
                  origin: Union['str', dict],
                  cacheName: Union['str', dict],
                  ):
-        if isinstance(origin, dict):
-            origin = str(**origin)
         self.origin = origin
-        if isinstance(cacheName, dict):
-            cacheName = str(**cacheName)
         self.cacheName = cacheName
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -166,14 +175,21 @@ class CacheStorageListUpdatedEvent(BaseEvent):
     js_name = 'Storage.cacheStorageListUpdated'
     hashable = []
     is_hashable = False
+    __slots__ = ('origin',)
 
     def __init__(self,
                  origin: Union['str', dict],
                  ):
-        if isinstance(origin, dict):
-            origin = str(**origin)
         self.origin = origin
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -184,22 +200,25 @@ class IndexedDBContentUpdatedEvent(BaseEvent):
     js_name = 'Storage.indexedDBContentUpdated'
     hashable = []
     is_hashable = False
+    __slots__ = ('origin', 'databaseName', 'objectStoreName')
 
     def __init__(self,
                  origin: Union['str', dict],
                  databaseName: Union['str', dict],
                  objectStoreName: Union['str', dict],
                  ):
-        if isinstance(origin, dict):
-            origin = str(**origin)
         self.origin = origin
-        if isinstance(databaseName, dict):
-            databaseName = str(**databaseName)
         self.databaseName = databaseName
-        if isinstance(objectStoreName, dict):
-            objectStoreName = str(**objectStoreName)
         self.objectStoreName = objectStoreName
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -210,14 +229,21 @@ class IndexedDBListUpdatedEvent(BaseEvent):
     js_name = 'Storage.indexedDBListUpdated'
     hashable = []
     is_hashable = False
+    __slots__ = ('origin',)
 
     def __init__(self,
                  origin: Union['str', dict],
                  ):
-        if isinstance(origin, dict):
-            origin = str(**origin)
         self.origin = origin
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
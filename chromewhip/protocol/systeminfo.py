@@ -7,14 +7,18 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
 
+
 # GPUDevice: Describes a single graphics processor (GPU).
 class GPUDevice(ChromeTypeBase):
+    __slots__ = ('vendorId', 'deviceId', 'vendorString', 'deviceString')
+
     def __init__(self,
                  vendorId: Union['float'],
                  deviceId: Union['float'],
@@ -27,9 +31,19 @@ class GPUDevice(ChromeTypeBase):
         self.vendorString = vendorString
         self.deviceString = deviceString
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # GPUInfo: Provides information about the GPU(s) on the system.
 class GPUInfo(ChromeTypeBase):
+    __slots__ = ('devices', 'auxAttributes', 'featureStatus', 'driverBugWorkarounds')
+
     def __init__(self,
                  devices: Union['[GPUDevice]'],
                  driverBugWorkarounds: Union['[]'],
@@ -42,6 +56,15 @@ class GPUInfo(ChromeTypeBase):
         self.featureStatus = featureStatus
         self.driverBugWorkarounds = driverBugWorkarounds
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        obj.devices = [GPUDevice.from_json(i0) for i0 in obj.devices]
+        return obj
+
 
 class SystemInfo(PayloadMixin):
     """ The SystemInfo domain defines methods and events for querying low-level system information.
@@ -53,23 +76,11 @@ class SystemInfo(PayloadMixin):
         return (
             cls.build_send_payload("getInfo", {
             }),
-            cls.convert_payload({
-                "gpu": {
-                    "class": GPUInfo,
-                    "optional": False
-                },
-                "modelName": {
-                    "class": str,
-                    "optional": False
-                },
-                "modelVersion": {
-                    "class": str,
-                    "optional": False
-                },
-                "commandLine": {
-                    "class": str,
-                    "optional": False
-                },
-            })
+            _decode_getInfo
         )
 
+
+
+def _decode_getInfo(result):
+    result['gpu'] = GPUInfo.from_json(result['gpu'])
+    return result
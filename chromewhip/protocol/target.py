@@ -7,12 +7,14 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
 
+
 # TargetID: 
 TargetID = str
 
@@ -24,6 +26,8 @@ BrowserContextID = str
 
 # TargetInfo: 
 class TargetInfo(ChromeTypeBase):
+    __slots__ = ('targetId', 'type', 'title', 'url', 'attached', 'openerId', 'browserContextId')
+
     def __init__(self,
                  targetId: Union['TargetID'],
                  type: Union['str'],
@@ -42,9 +46,19 @@ class TargetInfo(ChromeTypeBase):
         self.openerId = openerId
         self.browserContextId = browserContextId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # RemoteLocation: 
 class RemoteLocation(ChromeTypeBase):
+    __slots__ = ('host', 'port')
+
     def __init__(self,
                  host: Union['str'],
                  port: Union['int'],
@@ -53,6 +67,14 @@ class RemoteLocation(ChromeTypeBase):
         self.host = host
         self.port = port
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 class Target(PayloadMixin):
     """ Supports additional targets discovery and allows to attach to them.
@@ -88,12 +110,7 @@ class Target(PayloadMixin):
                 "targetId": targetId,
                 "flatten": flatten,
             }),
-            cls.convert_payload({
-                "sessionId": {
-                    "class": SessionID,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -103,12 +120,7 @@ class Target(PayloadMixin):
         return (
             cls.build_send_payload("attachToBrowserTarget", {
             }),
-            cls.convert_payload({
-                "sessionId": {
-                    "class": SessionID,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -123,12 +135,7 @@ class Target(PayloadMixin):
             cls.build_send_payload("closeTarget", {
                 "targetId": targetId,
             }),
-            cls.convert_payload({
-                "success": {
-                    "class": bool,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -165,12 +172,7 @@ one.
         return (
             cls.build_send_payload("createBrowserContext", {
             }),
-            cls.convert_payload({
-                "browserContextId": {
-                    "class": BrowserContextID,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -180,12 +182,7 @@ one.
         return (
             cls.build_send_payload("getBrowserContexts", {
             }),
-            cls.convert_payload({
-                "browserContextIds": {
-                    "class": [BrowserContextID],
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -217,12 +214,7 @@ not supported on MacOS yet, false by default).
                 "browserContextId": browserContextId,
                 "enableBeginFrameControl": enableBeginFrameControl,
             }),
-            cls.convert_payload({
-                "targetId": {
-                    "class": TargetID,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -272,12 +264,7 @@ beforeunload hooks.
             cls.build_send_payload("getTargetInfo", {
                 "targetId": targetId,
             }),
-            cls.convert_payload({
-                "targetInfo": {
-                    "class": TargetInfo,
-                    "optional": False
-                },
-            })
+            _decode_getTargetInfo
         )
 
     @classmethod
@@ -287,12 +274,7 @@ beforeunload hooks.
         return (
             cls.build_send_payload("getTargets", {
             }),
-            cls.convert_payload({
-                "targetInfos": {
-                    "class": [TargetInfo],
-                    "optional": False
-                },
-            })
+            _decode_getTargets
         )
 
     @classmethod
@@ -374,27 +356,42 @@ to run paused targets.
 
 
 
+def _decode_getTargetInfo(result):
+    result['targetInfo'] = TargetInfo.from_json(result['targetInfo'])
+    return result
+
+
+def _decode_getTargets(result):
+    result['targetInfos'] = [TargetInfo.from_json(i0) for i0 in result['targetInfos']]
+    return result
+
+
 class AttachedToTargetEvent(BaseEvent):
 
     js_name = 'Target.attachedToTarget'
     hashable = ['sessionId']
     is_hashable = True
+    __slots__ = ('sessionId', 'targetInfo', 'waitingForDebugger')
 
     def __init__(self,
                  sessionId: Union['SessionID', dict],
                  targetInfo: Union['TargetInfo', dict],
                  waitingForDebugger: Union['bool', dict],
                  ):
-        if isinstance(sessionId, dict):
-            sessionId = SessionID(**sessionId)
         self.sessionId = sessionId
         if isinstance(targetInfo, dict):
-            targetInfo = TargetInfo(**targetInfo)
+            targetInfo = TargetInfo.from_json(targetInfo)
         self.targetInfo = targetInfo
-        if isinstance(waitingForDebugger, dict):
-            waitingForDebugger = bool(**waitingForDebugger)
         self.waitingForDebugger = waitingForDebugger
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, sessionId):
         kwargs = locals()
@@ -410,18 +407,23 @@ class DetachedFromTargetEvent(BaseEvent):
     js_name = 'Target.detachedFromTarget'
     hashable = ['sessionId', 'targetId']
     is_hashable = True
+    __slots__ = ('sessionId', 'targetId')
 
     def __init__(self,
                  sessionId: Union['SessionID', dict],
                  targetId: Union['TargetID', dict, None] = None,
                  ):
-        if isinstance(sessionId, dict):
-            sessionId = SessionID(**sessionId)
         self.sessionId = sessionId
-        if isinstance(targetId, dict):
-            targetId = TargetID(**targetId)
         self.targetId = targetId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, sessionId, targetId):
         kwargs = locals()
@@ -437,22 +439,25 @@ class ReceivedMessageFromTargetEvent(BaseEvent):
     js_name = 'Target.receivedMessageFromTarget'
     hashable = ['sessionId', 'targetId']
     is_hashable = True
+    __slots__ = ('sessionId', 'message', 'targetId')
 
     def __init__(self,
                  sessionId: Union['SessionID', dict],
                  message: Union['str', dict],
                  targetId: Union['TargetID', dict, None] = None,
                  ):
-        if isinstance(sessionId, dict):
-            sessionId = SessionID(**sessionId)
         self.sessionId = sessionId
-        if isinstance(message, dict):
-            message = str(**message)
         self.message = message
-        if isinstance(targetId, dict):
-            targetId = TargetID(**targetId)
         self.targetId = targetId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, sessionId, targetId):
         kwargs = locals()
@@ -468,14 +473,23 @@ class TargetCreatedEvent(BaseEvent):
     js_name = 'Target.targetCreated'
     hashable = []
     is_hashable = False
+    __slots__ = ('targetInfo',)
 
     def __init__(self,
                  targetInfo: Union['TargetInfo', dict],
                  ):
         if isinstance(targetInfo, dict):
-            targetInfo = TargetInfo(**targetInfo)
+            targetInfo = TargetInfo.from_json(targetInfo)
         self.targetInfo = targetInfo
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -486,14 +500,21 @@ class TargetDestroyedEvent(BaseEvent):
     js_name = 'Target.targetDestroyed'
     hashable = ['targetId']
     is_hashable = True
+    __slots__ = ('targetId',)
 
     def __init__(self,
                  targetId: Union['TargetID', dict],
                  ):
-        if isinstance(targetId, dict):
-            targetId = TargetID(**targetId)
         self.targetId = targetId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, targetId):
         kwargs = locals()
@@ -509,22 +530,25 @@ class TargetCrashedEvent(BaseEvent):
     js_name = 'Target.targetCrashed'
     hashable = ['targetId']
     is_hashable = True
+    __slots__ = ('targetId', 'status', 'errorCode')
 
     def __init__(self,
                  targetId: Union['TargetID', dict],
                  status: Union['str', dict],
                  errorCode: Union['int', dict],
                  ):
-        if isinstance(targetId, dict):
-            targetId = TargetID(**targetId)
         self.targetId = targetId
-        if isinstance(status, dict):
-            status = str(**status)
         self.status = status
-        if isinstance(errorCode, dict):
-            errorCode = int(**errorCode)
         self.errorCode = errorCode
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, targetId):
         kwargs = locals()
@@ -540,14 +564,23 @@ class TargetInfoChangedEvent(BaseEvent):
     js_name = 'Target.targetInfoChanged'
     hashable = []
     is_hashable = False
+    __slots__ = ('targetInfo',)
 
     def __init__(self,
                  targetInfo: Union['TargetInfo', dict],
                  ):
         if isinstance(targetInfo, dict):
-            targetInfo = TargetInfo(**targetInfo)
+            targetInfo = TargetInfo.from_json(targetInfo)
         self.targetInfo = targetInfo
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -7,11 +7,13 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
+
 from chromewhip.protocol import target as Target
 
 class Tethering(PayloadMixin):
@@ -54,18 +56,23 @@ class AcceptedEvent(BaseEvent):
     js_name = 'Tethering.accepted'
     hashable = ['connectionId']
     is_hashable = True
+    __slots__ = ('port', 'connectionId')
 
     def __init__(self,
                  port: Union['int', dict],
                  connectionId: Union['str', dict],
                  ):
-        if isinstance(port, dict):
-            port = int(**port)
         self.port = port
-        if isinstance(connectionId, dict):
-            connectionId = str(**connectionId)
         self.connectionId = connectionId
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls, connectionId):
         kwargs = locals()
@@ -7,11 +7,13 @@ and `data/js_protocol.json` as inputs! Please do not modify this file.
 """
 
 import logging
+from sys import intern
 from typing import Any, Optional, Union
 
-from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase
+from chromewhip.helpers import PayloadMixin, BaseEvent, ChromeTypeBase, init_known_fields
 
 log = logging.getLogger(__name__)
+
 from chromewhip.protocol import io as IO
 
 # MemoryDumpConfig: Configuration for memory dump. Used only when "memory-infra" category is enabled.
@@ -19,6 +21,8 @@ MemoryDumpConfig = dict
 
 # TraceConfig: 
 class TraceConfig(ChromeTypeBase):
+    __slots__ = ('recordMode', 'enableSampling', 'enableSystrace', 'enableArgumentFilter', 'includedCategories', 'excludedCategories', 'syntheticDelays', 'memoryDumpConfig')
+
     def __init__(self,
                  recordMode: Optional['str'] = None,
                  enableSampling: Optional['bool'] = None,
@@ -39,6 +43,14 @@ class TraceConfig(ChromeTypeBase):
         self.syntheticDelays = syntheticDelays
         self.memoryDumpConfig = memoryDumpConfig
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
 
 # StreamCompression: Compression type to use for traces returned via streams.
 StreamCompression = str
@@ -63,12 +75,7 @@ class Tracing(PayloadMixin):
         return (
             cls.build_send_payload("getCategories", {
             }),
-            cls.convert_payload({
-                "categories": {
-                    "class": [],
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -93,16 +100,7 @@ class Tracing(PayloadMixin):
         return (
             cls.build_send_payload("requestMemoryDump", {
             }),
-            cls.convert_payload({
-                "dumpGuid": {
-                    "class": str,
-                    "optional": False
-                },
-                "success": {
-                    "class": bool,
-                    "optional": False
-                },
-            })
+            None
         )
 
     @classmethod
@@ -149,22 +147,25 @@ class BufferUsageEvent(BaseEvent):
     js_name = 'Tracing.bufferUsage'
     hashable = []
     is_hashable = False
+    __slots__ = ('percentFull', 'eventCount', 'value')
 
     def __init__(self,
                  percentFull: Union['float', dict, None] = None,
                  eventCount: Union['float', dict, None] = None,
                  value: Union['float', dict, None] = None,
                  ):
-        if isinstance(percentFull, dict):
-            percentFull = float(**percentFull)
         self.percentFull = percentFull
-        if isinstance(eventCount, dict):
-            eventCount = float(**eventCount)
         self.eventCount = eventCount
-        if isinstance(value, dict):
-            value = float(**value)
         self.value = value
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -175,14 +176,21 @@ class DataCollectedEvent(BaseEvent):
     js_name = 'Tracing.dataCollected'
     hashable = []
     is_hashable = False
+    __slots__ = ('value',)
 
     def __init__(self,
                  value: Union['[]', dict],
                  ):
-        if isinstance(value, dict):
-            value = [](**value)
         self.value = value
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
@@ -193,18 +201,23 @@ class TracingCompleteEvent(BaseEvent):
     js_name = 'Tracing.tracingComplete'
     hashable = []
     is_hashable = False
+    __slots__ = ('stream', 'streamCompression')
 
     def __init__(self,
                  stream: Union['IO.StreamHandle', dict, None] = None,
                  streamCompression: Union['StreamCompression', dict, None] = None,
                  ):
-        if isinstance(stream, dict):
-            stream = IO.StreamHandle(**stream)
         self.stream = stream
-        if isinstance(streamCompression, dict):
-            streamCompression = StreamCompression(**streamCompression)
         self.streamCompression = streamCompression
 
+    @classmethod
+    def from_json(cls, d):
+        try:
+            obj = cls(**d)
+        except TypeError:
+            obj = init_known_fields(cls, d)
+        return obj
+
     @classmethod
     def build_hash(cls):
         raise ValueError('Unable to build hash for non-hashable type')
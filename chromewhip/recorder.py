@@ -0,0 +1,67 @@
+"""
+A flight recorder of the devtools frames a session sent and received last.
+
+Recording a frame keeps a timestamp, its size and its first characters in a fixed
+size ring buffer, cheap enough to leave on in production. The buffer is dumped
+along with timeouts and protocol errors to show what led up to them.
+"""
+import collections
+import time
+
+DEFAULT_RECORDER_SIZE = 128
+DEFAULT_RECORDER_MAX_CHARS = 512
+
+SENT = '>'
+RECEIVED = '<'
+
+
+class FlightRecorder:
+    """ The latest ``size`` frames of a session, each cut to ``max_chars``.
+
+    :param size: number of frames kept, 0 to record nothing
+    :param max_chars: characters kept of each frame
+    """
+    __slots__ = ('size', 'max_chars', 'recorded', '_frames')
+
+    def __init__(self, size=DEFAULT_RECORDER_SIZE, max_chars=DEFAULT_RECORDER_MAX_CHARS):
+        self.size = size
+        self.max_chars = max_chars
+        self.recorded = 0
+        self._frames = collections.deque(maxlen=size)
+
+    def __len__(self):
+        return len(self._frames)
+
+    def record(self, direction, frame):
+        if not self.size:
+            return
+        self.recorded += 1
+        self._frames.append((time.time(), direction, len(frame), frame[:self.max_chars]))
+
+    def clear(self):
+        self._frames.clear()
+
+    def dump(self):
+        """ Recorded frames, oldest first, as JSON serializable dicts. """
+        frames = []
+        for timestamp, direction, size, frame in list(self._frames):
+            if isinstance(frame, bytes):
+                frame = frame.decode('utf-8', errors='replace')
+            frames.append({
+                'time': timestamp,
+                'direction': direction,
+                'size': size,
+                'frame': frame,
+                'truncated': size > len(frame),
+            })
+        return frames
+
+    def format(self):
+        """ Recorded frames as lines of text, for the logs. """
+        lines = []
+        for frame in self.dump():
+            timestamp = time.strftime('%H:%M:%S', time.localtime(frame['time']))
+            lines.append('%s.%03d %s %7d %s%s' % (timestamp, frame['time'] % 1 * 1000, frame['direction'],
+                                                  frame['size'], frame['frame'],
+                                                  '...' if frame['truncated'] else ''))
+        return '\n'.join(lines)
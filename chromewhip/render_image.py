@@ -1,5 +1,57 @@
+import base64
+import io
+import struct
+import zlib
+
 from chromewhip.protocol import page
 
+# captures larger than this are taken in strips, keeping each reply well under the websocket frame limit
+MAX_TILE_PIXELS = 2 ** 20
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+PNG_COLOR_TYPES = {'RGB': 2, 'RGBA': 6}
+PNG_COMPRESS_LEVEL = 6
+
+
+def _png_chunk(tag, data):
+    return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff)
+
+
+class PNGStreamWriter:
+    """ Encodes a PNG from strips of rows as they arrive, holding only the compressed output.
+
+    Rows go unfiltered into a single zlib stream, the header is written once the height is known.
+    """
+    def __init__(self, width, mode, compress_level=PNG_COMPRESS_LEVEL):
+        if mode not in PNG_COLOR_TYPES:
+            raise ValueError('Unsupported PNG mode %s, should be one of %s' % (mode, ', '.join(PNG_COLOR_TYPES)))
+        self.width = width
+        self.mode = mode
+        self.height = 0
+        self._row_bytes = width * len(mode)
+        self._compressor = zlib.compressobj(compress_level)
+        self._idat = []
+
+    def write(self, image):
+        """ Append the rows of a Pillow ``image`` as wide as the PNG. """
+        if image.size[0] != self.width:
+            raise ValueError('Strip is %s pixels wide, expected %s' % (image.size[0], self.width))
+        if image.mode != self.mode:
+            image = image.convert(self.mode)
+        data = image.tobytes()
+        for start in range(0, len(data), self._row_bytes):
+            self._idat.append(self._compressor.compress(b'\x00' + data[start:start + self._row_bytes]))
+        self.height += image.size[1]
+
+    def getvalue(self):
+        self._idat.append(self._compressor.flush())
+        header = struct.pack('>IIBBBBB', self.width, self.height, 8, PNG_COLOR_TYPES[self.mode], 0, 0, 0)
+        return b''.join((
+            PNG_SIGNATURE,
+            _png_chunk(b'IHDR', header),
+            _png_chunk(b'IDAT', b''.join(self._idat)),
+            _png_chunk(b'IEND', b''),
+        ))
+
 
 class ChromeImageRenderer:
     def __init__(
@@ -11,8 +63,10 @@ class ChromeImageRenderer:
         height=None,
         scale_method=None,
         region=None,
+        quality=None,
     ):
         self.tab = tab
+        self.quality = None if quality is None else int(quality)
         self.width = tab.viewport.width if width is None else int(float(width))
         self.height, self.region = int(float(height)), region
         if self.region is not None and self.height:
@@ -62,10 +116,57 @@ class ChromeImageRenderer:
                 ),
             )
         )
+        if (self.region or self.height) and clip.width * clip.height > MAX_TILE_PIXELS:
+            return await self.render_tiles(clip)
         res = await self.tab.send_command(
             page.Page.captureScreenshot(
                 format=self.image_format,
+                quality=self.quality if self.is_jpeg() else None,
                 clip=clip if self.region or self.height else None,
             )
         )
         return res['ack']['result']['data']
+
+    async def render_tiles(self, clip):
+        """ Capture ``clip`` as horizontal strips, encoding each one as it arrives.
+
+        PNGs are streamed strip by strip, so the full page is never held decoded. JPEGs need
+        the whole picture for Pillow's encoder, they are assembled in an RGB buffer.
+        """
+        # Pillow is only needed for tiled captures, keep it off the import path
+        from PIL import Image
+
+        tile_height = max(1, MAX_TILE_PIXELS // int(clip.width))
+        writer = canvas = None
+        offset = tiles = 0
+        y, bottom = clip.y, clip.y + clip.height
+        while y < bottom:
+            height = min(tile_height, bottom - y)
+            res = await self.tab.send_command(
+                page.Page.captureScreenshot(
+                    format='png',
+                    clip=page.Viewport(x=clip.x, y=y, width=clip.width, height=height, scale=clip.scale),
+                )
+            )
+            with Image.open(io.BytesIO(base64.b64decode(res['ack']['result']['data']))) as tile:
+                if self.is_png():
+                    if writer is None:
+                        writer = PNGStreamWriter(tile.size[0], 'RGBA' if 'A' in tile.mode else 'RGB')
+                    writer.write(tile)
+                else:
+                    if canvas is None:
+                        # tiles are in device pixels, which may not match CSS pixels
+                        ratio = tile.size[1] / height
+                        canvas = Image.new('RGB', (tile.size[0], int(round(clip.height * ratio))))
+                    canvas.paste(tile.convert('RGB'), (0, offset))
+                offset += tile.size[1]
+            tiles += 1
+            y += height
+        self.logger.debug('image render: encoded %s tiles of %s rows' % (tiles, tile_height))
+        if writer is not None:
+            return base64.b64encode(writer.getvalue()).decode()
+        canvas = canvas.crop((0, 0, canvas.size[0], offset))
+        out = io.BytesIO()
+        options = {} if self.quality is None else {'quality': self.quality}
+        canvas.save(out, format=self.image_format, **options)
+        return base64.b64encode(out.getvalue()).decode()
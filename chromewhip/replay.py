@@ -0,0 +1,293 @@
+"""
+Record the devtools conversation of a connection, and replay it without a browser.
+
+Record a real render by tapping its connection:
+
+    recorder = replay.CDPRecorder()
+    tab.connection.taps.append(recorder)
+    await tab.go(url)
+    recorder.recording().save('render.cdp.jsonl.gz')
+
+then serve it to the driver from a fake devtools websocket:
+
+    recording = replay.Recording.load('render.cdp.jsonl.gz')
+    async with replay.ReplayServer(recording) as server:
+        tab = ChromeTab('replay', 'about:blank', server.ws_uri, 'replay')
+        await tab.connect()
+        for command in recording.commands(recording.sessions()[-1]):
+            await tab.send_command(command)
+
+The server answers each command with the frames Chrome sent after it in the
+recording, acks rewritten to the id and session the driver used, either as fast
+as possible or paced like the original. It also serves the ``/json/version`` and
+``/json`` discovery endpoints, so `Chrome` can connect to it like to a browser:
+
+    async with replay.ReplayServer(recording) as server:
+        browser = Chrome(server.host, server.port)
+        await browser.connect()
+
+See benchmarks/bench_replay.py.
+"""
+import asyncio
+import collections
+import gzip
+import http
+import json
+import logging
+import time
+
+import websockets
+import websockets.exceptions
+
+from chromewhip.recorder import SENT
+
+FORMAT = 'chromewhip-cdp'
+VERSION = 1
+# https://chromedevtools.github.io/devtools-protocol/, server error
+NOT_RECORDED_ERROR_CODE = -32000
+
+log = logging.getLogger('chromewhip.replay')
+
+Frame = collections.namedtuple('Frame', ['time', 'direction', 'text'])
+
+
+def _open(path, mode):
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+class Recording:
+    """ Frames of one devtools websocket, timed in seconds since it was opened.
+
+    Saved as JSON lines, a header then ``[time, direction, frame]`` per frame, gzipped
+    if the path ends with ".gz".
+    """
+    def __init__(self, frames, metadata=None):
+        self.frames = [Frame(*frame) for frame in frames]
+        self.metadata = dict(metadata or {})
+
+    def __len__(self):
+        return len(self.frames)
+
+    @property
+    def duration_s(self):
+        return self.frames[-1].time if self.frames else 0.0
+
+    def save(self, path):
+        with _open(path, 'w') as f:
+            header = dict(self.metadata, format=FORMAT, version=VERSION, frames=len(self.frames))
+            f.write(json.dumps(header) + '\n')
+            for frame in self.frames:
+                f.write(json.dumps([round(frame.time, 6), frame.direction, frame.text]) + '\n')
+
+    @classmethod
+    def load(cls, path):
+        with _open(path, 'r') as f:
+            header = json.loads(f.readline())
+            if header.get('format') != FORMAT:
+                raise ValueError('%s is not a devtools recording' % path)
+            if header.get('version') != VERSION:
+                raise ValueError('Recording version %s of %s is not supported' % (header.get('version'), path))
+            frames = [json.loads(line) for line in f if line.strip()]
+        for key in ('format', 'version', 'frames'):
+            header.pop(key)
+        return cls(frames, header)
+
+    def sessions(self):
+        """ Ids of the sessions that sent commands, in the order they sent their first, `None` for the
+        target the websocket was opened on. Recorded through `Chrome`, the last is usually the page's.
+        """
+        sessions = []
+        for frame in self.frames:
+            if frame.direction == SENT:
+                session_id = json.loads(frame.text).get('sessionId')
+                if session_id not in sessions:
+                    sessions.append(session_id)
+        return sessions
+
+    def commands(self, session_id=None):
+        """ The commands sent on a session, as ``(request, None)`` for `Session.send_command`. """
+        for frame in self.frames:
+            if frame.direction != SENT:
+                continue
+            request = json.loads(frame.text)
+            if request.get('sessionId') == session_id:
+                yield {'method': request['method'], 'params': request.get('params', {})}, None
+
+    def exchanges(self):
+        """ Frames received before the first command, then each command with the frames received after it. """
+        initial, exchanges = [], []
+        received = initial
+        for frame in self.frames:
+            if frame.direction == SENT:
+                received = []
+                exchanges.append((json.loads(frame.text), frame.time, received))
+            else:
+                received.append((frame.time, frame.text, json.loads(frame.text)))
+        return initial, exchanges
+
+
+class CDPRecorder:
+    """ Records every frame of a connection in full, add it to `Connection.taps`. """
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._start = clock()
+        self.frames = []
+
+    def __call__(self, direction, frame):
+        if isinstance(frame, bytes):
+            frame = frame.decode('utf-8')
+        self.frames.append((self._clock() - self._start, direction, frame))
+
+    def recording(self, **metadata):
+        return Recording(self.frames, metadata)
+
+
+class ReplayServer:
+    """ A devtools websocket answering commands from a `Recording`.
+
+    A command is matched with the next unanswered recorded command of the same method and
+    session, and answered with the frames that followed it. Commands missing from the
+    recording get an error ack. A recorded session is replayed by the first driver session
+    sending one of its commands, so a recording made through `Chrome`'s flattened sessions
+    can be replayed by a standalone `ChromeTab`, and frames are sent on to the driver's
+    session. Frames of recorded sessions that nobody replays are sent as recorded, unless
+    that would hand them to a session replaying another.
+
+    :param speed: pace frames like the recording, 2 for twice as fast, `None` to send them
+        without waiting
+    """
+    def __init__(self, recording, host='localhost', port=0, speed=None):
+        self.recording = recording
+        self.host = host
+        self.port = port
+        self.speed = speed
+        self.replayed = 0
+        self.unmatched = 0
+        self._initial, self._exchanges = recording.exchanges()
+        self._server = None
+        self._tasks = set()
+
+    @property
+    def ws_uri(self):
+        return 'ws://%s:%s/devtools/page/replay' % (self.host, self.port)
+
+    @property
+    def browser_ws_uri(self):
+        return 'ws://%s:%s/devtools/browser/replay' % (self.host, self.port)
+
+    async def start(self):
+        self._server = await websockets.serve(self._handler, self.host, self.port,
+                                              process_request=self._discovery)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def join(self):
+        """ Wait for every paced answer to be sent. """
+        while self._tasks:
+            await asyncio.wait(list(self._tasks))
+
+    async def close(self):
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _discovery(self, path, request_headers):
+        """ Answer the HTTP endpoints Chrome lists its websockets on, other requests are websocket handshakes. """
+        if path == '/json/version':
+            body = {'Browser': 'chromewhip-replay', 'webSocketDebuggerUrl': self.browser_ws_uri}
+        elif path in ('/json', '/json/list'):
+            body = [{'id': 'replay', 'type': 'page', 'title': 'replay',
+                     'url': self.recording.metadata.get('url', 'about:blank'), 'webSocketDebuggerUrl': self.ws_uri}]
+        else:
+            return None
+        return http.HTTPStatus.OK, [('Content-Type', 'application/json')], json.dumps(body).encode()
+
+    def _match(self, pending, session_id, sessions):
+        """ Pop the first of the ``pending`` recorded commands that driver session ``session_id`` replays. """
+        replaying = set(sessions.values())
+        for index in pending:
+            recorded = self._exchanges[index][0].get('sessionId')
+            if recorded in sessions:
+                replays = sessions[recorded] == session_id
+            else:
+                replays = session_id not in replaying
+            if replays:
+                pending.remove(index)
+                return index
+        return None
+
+    async def _handler(self, websocket, path=None):
+        unanswered = collections.defaultdict(collections.deque)
+        for index, (command, _, _) in enumerate(self._exchanges):
+            unanswered[command['method']].append(index)
+        # recorded session id -> id of the driver session replaying it
+        sessions = {}
+        # (recorded session id, recorded command id) -> id the driver sent it with, ids repeat across sessions
+        ids = {}
+
+        await self._emit(websocket, 0.0, self._initial, sessions, ids)
+        try:
+            async for message in websocket:
+                command = json.loads(message)
+                session_id = command.get('sessionId')
+                pending = unanswered.get(command.get('method'))
+                index = self._match(pending, session_id, sessions) if pending else None
+                if index is None:
+                    self.unmatched += 1
+                    log.warning('Command "%s" is not in the recording' % command.get('method'))
+                    error = {'id': command.get('id'), 'error': {
+                        'code': NOT_RECORDED_ERROR_CODE,
+                        'message': 'Command "%s" is not in the recording' % command.get('method')}}
+                    if 'sessionId' in command:
+                        error['sessionId'] = command['sessionId']
+                    await websocket.send(json.dumps(error))
+                    continue
+                recorded, sent_at, received = self._exchanges[index]
+                sessions[recorded.get('sessionId')] = session_id
+                ids[recorded.get('sessionId'), recorded['id']] = command['id']
+                self.replayed += 1
+                if self.speed is None:
+                    await self._emit(websocket, sent_at, received, sessions, ids)
+                else:
+                    task = asyncio.ensure_future(self._emit(websocket, sent_at, received, sessions, ids))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+        except websockets.exceptions.ConnectionClosed:
+            pass
+
+    async def _emit(self, websocket, since, received, sessions, ids):
+        for at, text, message in received:
+            if self.speed is not None and at > since:
+                await asyncio.sleep((at - since) / self.speed)
+                since = at
+            recorded = message.get('sessionId')
+            if recorded in sessions:
+                session_id = sessions[recorded]
+            elif recorded in sessions.values():
+                # e.g. browser frames, the driver's browser session is replaying a page's
+                continue
+            else:
+                session_id = recorded
+            key = (recorded, message['id']) if 'id' in message else None
+            if key in ids or session_id != recorded:
+                message = dict(message)
+                if key in ids:
+                    message['id'] = ids[key]
+                if session_id is None:
+                    message.pop('sessionId', None)
+                else:
+                    message['sessionId'] = session_id
+                text = json.dumps(message)
+            await websocket.send(text)
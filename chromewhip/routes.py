@@ -1,7 +1,9 @@
 from chromewhip.views import (
+    render_flight_recorder,
     render_html,
     render_jpeg,
     render_json,
+    render_metrics,
     render_png,
     stream_json,
 )
@@ -13,3 +15,6 @@ def setup_routes(app):
     app.router.add_get('/render.png', render_png)
     app.router.add_get('/render.jpeg', render_jpeg)
     app.router.add_post('/stream.json', stream_json)
+    app.router.add_get('/metrics', render_metrics)
+    if app.get('expose-flight-records'):
+        app.router.add_get('/admin/flight-recorder', render_flight_recorder)
@@ -0,0 +1,93 @@
+import collections
+import math
+
+DEFAULT_WINDOW = 256
+DEFAULT_PERCENTILE = 0.99
+DEFAULT_FACTOR = 3.0
+DEFAULT_FLOOR_S = 1.0
+DEFAULT_CEILING_S = 25.0
+DEFAULT_MIN_SAMPLES = 20
+
+
+class LatencyWindow:
+    """ The latest ``size`` latencies observed for one method. """
+    __slots__ = ('_samples', '_sorted', 'count', 'expired')
+
+    def __init__(self, size=DEFAULT_WINDOW):
+        self._samples = collections.deque(maxlen=size)
+        self._sorted = None
+        self.count = 0
+        self.expired = 0
+
+    def __len__(self):
+        return len(self._samples)
+
+    def add(self, seconds):
+        self._samples.append(seconds)
+        self._sorted = None
+        self.count += 1
+
+    def percentile(self, q):
+        """ Nearest-rank percentile, ``q`` between 0 and 1. """
+        if not self._samples:
+            return None
+        if self._sorted is None:
+            self._sorted = sorted(self._samples)
+        rank = max(1, math.ceil(q * len(self._sorted)))
+        return self._sorted[rank - 1]
+
+
+class AdaptiveTimeouts:
+    """ Per-method timeouts derived from the latencies observed so far.
+
+    A method's timeout is its ``percentile`` latency times ``factor``, clamped between
+    ``floor_s`` and ``ceiling_s``. Until ``min_samples`` latencies have been seen it is
+    ``ceiling_s``. A command that runs out of time counts as a sample of the time it was
+    given, so a method that turns slow raises its own timeout again.
+
+    :param window: number of latest latencies kept per method
+    """
+    def __init__(self, window=DEFAULT_WINDOW, percentile=DEFAULT_PERCENTILE, factor=DEFAULT_FACTOR,
+                 floor_s=DEFAULT_FLOOR_S, ceiling_s=DEFAULT_CEILING_S, min_samples=DEFAULT_MIN_SAMPLES):
+        if not 0 < percentile <= 1:
+            raise ValueError('percentile must be within (0, 1], got %s' % percentile)
+        if floor_s > ceiling_s:
+            raise ValueError('floor_s %s is greater than ceiling_s %s' % (floor_s, ceiling_s))
+        self.window = window
+        self.percentile = percentile
+        self.factor = factor
+        self.floor_s = floor_s
+        self.ceiling_s = ceiling_s
+        self.min_samples = min_samples
+        self._windows = {}
+
+    def observe(self, method, seconds):
+        window = self._windows.get(method)
+        if window is None:
+            window = self._windows[method] = LatencyWindow(self.window)
+        window.add(seconds)
+
+    def expired(self, method, seconds):
+        """ A command of ``method`` ran out of time after ``seconds``, a lower bound of its latency. """
+        self.observe(method, seconds)
+        self._windows[method].expired += 1
+
+    def timeout(self, method):
+        window = self._windows.get(method)
+        if window is None or len(window) < self.min_samples:
+            return self.ceiling_s
+        return min(self.ceiling_s, max(self.floor_s, window.percentile(self.percentile) * self.factor))
+
+    def stats(self):
+        """ Latency percentiles and the current timeout of every method seen, keyed on method. """
+        return {
+            method: {
+                'count': window.count,
+                'expired': window.expired,
+                'p50_s': window.percentile(0.5),
+                'p99_s': window.percentile(0.99),
+                'max_s': window.percentile(1),
+                'timeout_s': self.timeout(method),
+            }
+            for method, window in self._windows.items()
+        }
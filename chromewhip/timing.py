@@ -0,0 +1,52 @@
+"""
+Phase timings of a render request, reported in a ``Server-Timing`` header.
+
+    timings = request['timings']
+    with timings.phase('go'):
+        await tab.go(url)
+
+https://www.w3.org/TR/server-timing/
+"""
+import contextlib
+import time
+
+
+class ServerTiming:
+    """ Time spent in each named phase of a request, in the order phases first ran.
+
+    A phase that runs more than once accumulates its durations.
+    """
+    def __init__(self, clock=time.perf_counter):
+        self._clock = clock
+        self._start = clock()
+        self._phases = {}
+
+    def __contains__(self, name):
+        return name in self._phases
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.add(name, self._clock() - start)
+
+    def add(self, name, seconds):
+        self._phases[name] = self._phases.get(name, 0.0) + seconds
+
+    @property
+    def total_s(self):
+        """ Seconds since the request started. """
+        return self._clock() - self._start
+
+    def to_dict(self):
+        """ Milliseconds spent per phase. """
+        return {name: round(seconds * 1000, 3) for name, seconds in self._phases.items()}
+
+    def header(self, total=True):
+        """ Value of the ``Server-Timing`` header, e.g. ``go;dur=812.4, wait;dur=1000.2, total;dur=1904.7``. """
+        phases = list(self._phases.items())
+        if total:
+            phases.append(('total', self.total_s))
+        return ', '.join('%s;dur=%.1f' % (name, seconds * 1000) for name, seconds in phases)
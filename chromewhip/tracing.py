@@ -0,0 +1,415 @@
+"""
+Span based tracing of requests down to the devtools commands they send.
+
+The current span lives in a context variable, so it follows a request through
+``await`` and into the tasks it starts. Spans are recorded only for sampled traces,
+the sampling decision is taken once per trace, on its root span:
+
+    tracing.configure(JsonLinesSink('/tmp/chromewhip-traces.jsonl'), sample_rate=0.1)
+
+    with tracing.start_span('render.html', url=url):
+        with tracing.start_span('cdp Page.navigate') as span:
+            ...
+            span.add_event('ack')
+
+Finished spans go to a sink, `JsonLinesSink` appends them to a file and `OTLPHttpSink`
+posts them in batches to an OTLP/HTTP collector, e.g. ``http://localhost:4318/v1/traces``.
+Unless configured, tracing is off and `start_span` hands back a span that records nothing.
+"""
+import asyncio
+import contextvars
+import json
+import logging
+import os
+import random
+import time
+
+import aiohttp
+
+KIND_INTERNAL = 1
+KIND_SERVER = 2
+KIND_CLIENT = 3
+
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+DEFAULT_SERVICE_NAME = 'chromewhip'
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_FLUSH_INTERVAL_S = 5
+DEFAULT_MAX_QUEUE_SIZE = 8192
+
+_current_span = contextvars.ContextVar('chromewhip_span', default=None)
+
+log = logging.getLogger('chromewhip.tracing')
+
+
+def _new_id(n_bytes):
+    return '%0*x' % (n_bytes * 2, random.getrandbits(n_bytes * 8))
+
+
+class _NoopSpan:
+    """ Span that records nothing, handed out while tracing is off or within an unsampled trace. """
+    __slots__ = ()
+
+    trace_id = None
+    span_id = None
+    sampled = False
+
+    def set_attribute(self, key, value):
+        pass
+
+    def add_event(self, name, **attributes):
+        pass
+
+    def set_status(self, code, message=None):
+        pass
+
+    def record_exception(self, exc):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class _UnsampledSpan(_NoopSpan):
+    """ Root of an unsampled trace, current for its block so its children are not sampled again. """
+    __slots__ = ('trace_id', '_token')
+
+    def __init__(self, trace_id):
+        self.trace_id = trace_id
+        self._token = None
+
+    def __enter__(self):
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _current_span.reset(self._token)
+        return False
+
+
+class Span:
+    """ A timed operation of a trace, current for the block it is entered with. """
+    __slots__ = ('tracer', 'name', 'trace_id', 'span_id', 'parent_id', 'kind', 'attributes', 'events',
+                 'status', 'status_message', 'start_ns', 'end_ns', '_token')
+
+    sampled = True
+
+    def __init__(self, tracer, name, trace_id, parent_id=None, kind=KIND_INTERNAL, attributes=None):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = _new_id(8)
+        self.parent_id = parent_id
+        self.kind = kind
+        self.attributes = attributes or {}
+        self.events = []
+        self.status = STATUS_UNSET
+        self.status_message = None
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self._token = None
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def add_event(self, name, **attributes):
+        self.events.append((time.time_ns(), name, attributes))
+
+    def set_status(self, code, message=None):
+        self.status = code
+        self.status_message = message
+
+    def record_exception(self, exc):
+        self.add_event('exception', **{'exception.type': type(exc).__name__, 'exception.message': str(exc)})
+        self.set_status(STATUS_ERROR, '%s: %s' % (type(exc).__name__, exc))
+
+    def end(self):
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+            self.tracer.export(self)
+
+    def __enter__(self):
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _current_span.reset(self._token)
+        if exc is not None and not isinstance(exc, asyncio.CancelledError):
+            self.record_exception(exc)
+        self.end()
+        return False
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'kind': self.kind,
+            'start_ns': self.start_ns,
+            'end_ns': self.end_ns,
+            'attributes': self.attributes,
+            'events': [{'time_ns': t, 'name': name, 'attributes': attributes}
+                       for t, name, attributes in self.events],
+            'status': self.status,
+            'status_message': self.status_message,
+        }
+
+    def __repr__(self):
+        return 'Span(%r, trace_id=%s, span_id=%s)' % (self.name, self.trace_id, self.span_id)
+
+
+class Tracer:
+    """ Starts spans and hands the finished ones of sampled traces to ``sink``.
+
+    :param sink: object with an ``export(span)`` method and a ``close()`` coroutine, `None` disables tracing
+    :param sample_rate: share of traces recorded, between 0 and 1
+    """
+    def __init__(self, sink=None, sample_rate=1.0):
+        if not 0 <= sample_rate <= 1:
+            raise ValueError('sample_rate must be within [0, 1], got %s' % sample_rate)
+        self.sink = sink
+        self.sample_rate = sample_rate
+
+    @property
+    def enabled(self):
+        return self.sink is not None and self.sample_rate > 0
+
+    def start_span(self, name, kind=KIND_INTERNAL, parent=None, **attributes):
+        """ A span child of ``parent``, by default the current span, to be used as a context manager. """
+        if self.sink is None:
+            return NOOP_SPAN
+        if parent is None:
+            parent = _current_span.get()
+            if parent is not None and not parent.sampled:
+                # the unsampled root is current already
+                return NOOP_SPAN
+        elif not parent.sampled:
+            return _UnsampledSpan(parent.trace_id)
+        if parent is None:
+            trace_id = _new_id(16)
+            if self.sample_rate < 1 and random.random() >= self.sample_rate:
+                return _UnsampledSpan(trace_id)
+            return Span(self, name, trace_id, kind=kind, attributes=attributes)
+        return Span(self, name, parent.trace_id, parent.span_id, kind=kind, attributes=attributes)
+
+    def export(self, span):
+        try:
+            self.sink.export(span)
+        except Exception:
+            log.exception('Could not export span %s' % span)
+
+    async def close(self):
+        if self.sink is not None:
+            await self.sink.close()
+
+
+class _BatchSink:
+    """ Queues finished spans and hands them to `send` in batches, off the code ending them.
+
+    Spans are sent once ``batch_size`` of them are queued, or every ``flush_interval_s``.
+    When the destination cannot keep up, spans beyond ``max_queue_size`` are dropped.
+    """
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE, flush_interval_s=DEFAULT_FLUSH_INTERVAL_S,
+                 max_queue_size=DEFAULT_MAX_QUEUE_SIZE):
+        self.batch_size = batch_size
+        self.flush_interval_s = flush_interval_s
+        self.max_queue_size = max_queue_size
+        self.dropped = 0
+        self._queue = []
+        self._lock = None
+        self._flush_task = None
+        self._timer = None
+
+    def export(self, span):
+        if len(self._queue) >= self.max_queue_size:
+            self.dropped += 1
+            return
+        self._queue.append(span)
+        if self._timer is None or self._timer.done():
+            self._timer = asyncio.ensure_future(self._flush_later())
+        if len(self._queue) >= self.batch_size and (self._flush_task is None or self._flush_task.done()):
+            self._flush_task = asyncio.ensure_future(self.flush())
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.flush_interval_s)
+        await self.flush()
+
+    async def flush(self):
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        # batches go out one at a time, in the order their spans ended
+        async with self._lock:
+            while self._queue:
+                spans, self._queue = self._queue[:self.batch_size], self._queue[self.batch_size:]
+                await self.send(spans)
+
+    async def send(self, spans):
+        raise NotImplementedError
+
+    async def close(self):
+        if self._timer is not None:
+            self._timer.cancel()
+        if self._flush_task is not None:
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+        await self.flush()
+
+
+class JsonLinesSink(_BatchSink):
+    """ Appends every finished span to ``path`` as a line of JSON.
+
+    Batches are encoded and written by a worker thread, the event loop never waits on the file.
+    """
+    def __init__(self, path, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self._file = open(path, 'a')
+
+    async def send(self, spans):
+        await asyncio.get_event_loop().run_in_executor(None, self._write, spans)
+
+    def _write(self, spans):
+        try:
+            self._file.write(''.join(json.dumps(span.to_dict(), default=str) + '\n' for span in spans))
+            self._file.flush()
+        except (OSError, TypeError, ValueError) as e:
+            log.warning('Could not write %s spans to %s: %s' % (len(spans), self.path, e))
+
+    async def close(self):
+        await super().close()
+        self._file.close()
+
+
+def _otlp_value(value):
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
+
+
+def _otlp_attributes(attributes):
+    return [{'key': key, 'value': _otlp_value(value)} for key, value in attributes.items() if value is not None]
+
+
+def otlp_span(span):
+    """ ``span`` in the OTLP/JSON encoding. """
+    encoded = {
+        'traceId': span.trace_id,
+        'spanId': span.span_id,
+        'name': span.name,
+        'kind': span.kind,
+        'startTimeUnixNano': str(span.start_ns),
+        'endTimeUnixNano': str(span.end_ns),
+        'attributes': _otlp_attributes(span.attributes),
+        'events': [{'timeUnixNano': str(t), 'name': name, 'attributes': _otlp_attributes(attributes)}
+                   for t, name, attributes in span.events],
+        'status': {'code': span.status},
+    }
+    if span.parent_id:
+        encoded['parentSpanId'] = span.parent_id
+    if span.status_message:
+        encoded['status']['message'] = span.status_message
+    return encoded
+
+
+class OTLPHttpSink(_BatchSink):
+    """ Posts finished spans in batches to an OTLP/HTTP collector, as JSON.
+
+    Spans are sent once ``batch_size`` of them are queued, or every ``flush_interval_s``.
+    When the collector cannot keep up, spans beyond ``max_queue_size`` are dropped.
+
+    :param endpoint: traces endpoint of the collector, e.g. "http://localhost:4318/v1/traces"
+    """
+    def __init__(self, endpoint, service_name=DEFAULT_SERVICE_NAME, batch_size=DEFAULT_BATCH_SIZE,
+                 flush_interval_s=DEFAULT_FLUSH_INTERVAL_S, max_queue_size=DEFAULT_MAX_QUEUE_SIZE):
+        super().__init__(batch_size, flush_interval_s, max_queue_size)
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self._http = None
+
+    def payload(self, spans):
+        return {
+            'resourceSpans': [{
+                'resource': {'attributes': _otlp_attributes({'service.name': self.service_name,
+                                                              'process.pid': os.getpid()})},
+                'scopeSpans': [{
+                    'scope': {'name': 'chromewhip'},
+                    'spans': [otlp_span(span) for span in spans],
+                }],
+            }],
+        }
+
+    async def send(self, spans):
+        if self._http is None:
+            self._http = aiohttp.ClientSession()
+        try:
+            async with self._http.post(self.endpoint, json=self.payload(spans)) as resp:
+                if resp.status >= 300:
+                    log.warning('Collector at %s rejected %s spans with status %s'
+                                % (self.endpoint, len(spans), resp.status))
+        except aiohttp.ClientError as e:
+            log.warning('Could not send %s spans to %s: %s' % (len(spans), self.endpoint, e))
+
+    async def close(self):
+        await super().close()
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+
+
+def parse_traceparent(header):
+    """ Parent span of a W3C ``traceparent`` header, `None` if it is missing or malformed. """
+    try:
+        version, trace_id, span_id, flags = header.strip().split('-')
+        int(trace_id, 16)
+        int(span_id, 16)
+        sampled = bool(int(flags, 16) & 1)
+    except (AttributeError, ValueError):
+        return None
+    if len(trace_id) != 32 or len(span_id) != 16 or version == 'ff':
+        return None
+    return _RemoteSpan(trace_id, span_id, sampled)
+
+
+class _RemoteSpan:
+    """ Parent of the spans of a request traced upstream. """
+    __slots__ = ('trace_id', 'span_id', 'sampled')
+
+    def __init__(self, trace_id, span_id, sampled=True):
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.sampled = sampled
+
+
+_tracer = Tracer()
+
+
+def configure(sink=None, sample_rate=1.0):
+    """ Replace the tracer used by `start_span`, returning it. """
+    global _tracer
+    _tracer = Tracer(sink, sample_rate)
+    return _tracer
+
+
+def tracer():
+    return _tracer
+
+
+def current_span():
+    return _current_span.get()
+
+
+def start_span(name, kind=KIND_INTERNAL, parent=None, **attributes):
+    """ Start a span with the configured tracer, see `Tracer.start_span`. """
+    return _tracer.start_span(name, kind=kind, parent=parent, **attributes)
@@ -6,6 +6,7 @@ import logging
 from bs4 import BeautifulSoup
 from aiohttp import web
 
+from chromewhip import deadline, metrics
 from chromewhip.commands import Splash
 from chromewhip.protocol import page, emulation, browser, dom, runtime
 
@@ -13,6 +14,34 @@ BS = functools.partial(BeautifulSoup, features="lxml")
 
 log = logging.getLogger('chromewhip.views')
 
+# https://splash.readthedocs.io/en/stable/api.html#render-html, `timeout` defaults to 30s and may not exceed 90s
+DEFAULT_TIMEOUT_S = 30
+MAX_TIMEOUT_S = 90
+
+
+def request_budget(timeout):
+    """ Bound every command sent within the block by the ``timeout`` the client asked for.
+
+    The budget is reset on the way out, keep-alive requests run one after the other in the
+    same task and must not inherit it.
+    """
+    try:
+        timeout = float(timeout) if timeout is not None else DEFAULT_TIMEOUT_S
+    except ValueError:
+        raise web.HTTPBadRequest(reason='timeout must be a number of seconds')
+    if not 0 < timeout <= MAX_TIMEOUT_S:
+        raise web.HTTPBadRequest(reason='timeout must be greater than 0 and at most %s' % MAX_TIMEOUT_S)
+    return deadline.budget(timeout)
+
+
+def with_request_budget(handler):
+    """ Run ``handler`` within the budget of the request's ``timeout`` query param. """
+    @functools.wraps(handler)
+    async def budgeted(request):
+        with request_budget(request.query.get('timeout')):
+            return await handler(request)
+    return budgeted
+
 
 async def get_image(request, tab, format, **kwargs):
     render_all = tab.get_bool('render_all')
@@ -47,69 +76,96 @@ async def _go(request: web.Request):
     # TODO: potentially validate and verify js source for errors and security concerrns
     js_source = request.query.get('js_source', None)
 
+    timings = request['timings']
     tab = Splash(request)
-    await tab.initialize()
-    await tab.go(url)
-    await asyncio.sleep(wait_s)
+    with timings.phase('initialize'):
+        await tab.initialize()
+    with timings.phase('go'):
+        await tab.go(url)
+    with timings.phase('wait'):
+        await asyncio.sleep(min(wait_s, deadline.remaining(deadline.current())))
     if js_profile_name:
-        await tab.evaljs(js_profiles[js_profile_name])
+        with timings.phase('js'):
+            await tab.evaljs(js_profiles[js_profile_name])
 
     if js_source:
-        await tab.evaljs(js_source)
+        with timings.phase('js'):
+            await tab.evaljs(js_source)
 
     return tab
 
 
+@with_request_budget
 async def render_html(request: web.Request):
     # https://splash.readthedocs.io/en/stable/api.html#render-html
     tab = await _go(request)
-    return web.Response(text=BS((await tab.html()).decode()).prettify())
+    timings = request['timings']
+    with timings.phase('capture'):
+        html = await tab.html()
+    with timings.phase('serialize'):
+        text = BS(html.decode()).prettify()
+    return web.Response(text=text)
 
 
+@with_request_budget
 async def render_png(request: web.Request):
     # https://splash.readthedocs.io/en/stable/api.html#render-png
     tab = await _go(request)
 
-    output = get_image(request, tab, 'png')
+    with request['timings'].phase('capture'):
+        output = await get_image(request, tab, 'png')
     return web.Response(body=output, content_type='image/png')
 
 
+@with_request_budget
 async def render_jpeg(request: web.Request):
     # https://splash.readthedocs.io/en/stable/api.html#render-png
     tab = await _go(request)
 
-    output = get_image(request, tab, 'jpeg')
+    with request['timings'].phase('capture'):
+        output = await get_image(request, tab, 'jpeg')
     return web.Response(body=output, content_type='image/jpeg')
 
 
+@with_request_budget
 async def render_json(request: web.Request):
     # https://splash.readthedocs.io/en/stable/api.html#render-png
     tab = await _go(request)
+    timings = request['timings']
 
-    response = {
-        'url': (await tab.evaljs('window.location.href'))['body'],
-        'geometry': [0, 0] + list(tab.viewport_size),
-        'requestedUrl': request.query.get('url'),
-        'title': (await tab.evaljs('document.title'))['body'],
-    }
-    if tab.get_bool('html'):
-        response['html'] = (await tab.html())['body']
-    if tab.get_bool('png'):
-        response['png'] = await get_image(request, tab, 'png', b64=True)
-    if tab.get_bool('jpeg'):
-        response['jpeg'] = await get_image(request, tab, 'jpeg', b64=True)
-    if tab.get_bool('cookies'):
-        response['cookies'] = (await tab.cookies())['body']
-    if tab.get_bool('iframes'):
-        pass
-    if tab.get_bool('har'):
-        pass
-    if tab.get_bool('console'):
-        response['console'] = (await tab.console())['body']
-    if tab.get_bool('history'):
-        response['history'] = (await tab.history())['body']
+    with timings.phase('capture'):
+        url, title = await tab.evaluate_many(
+            'window.location.href', 'document.title'
+        )
+        response = {
+            'url': url,
+            'geometry': [0, 0] + list(tab.viewport_size),
+            'requestedUrl': request.query.get('url'),
+            'title': title,
+        }
+        if tab.get_bool('html'):
+            response['html'] = (await tab.html())['body']
+        if tab.get_bool('png'):
+            response['png'] = await get_image(request, tab, 'png', b64=True)
+        if tab.get_bool('jpeg'):
+            response['jpeg'] = await get_image(request, tab, 'jpeg', b64=True)
+        if tab.get_bool('cookies'):
+            response['cookies'] = (await tab.cookies())['body']
+        if tab.get_bool('iframes'):
+            pass
+        if tab.get_bool('har'):
+            pass
+        if tab.get_bool('console'):
+            response['console'] = (await tab.console())['body']
+        if tab.get_bool('history'):
+            response['history'] = (await tab.history())['body']
+    if tab.get_bool('timings'):
+        # milliseconds per phase up to here, serialization is only in the header
+        response['timings'] = timings.to_dict()
+    with timings.phase('serialize'):
+        body = json.dumps(response)
     return web.Response(
-        body=json.dumps(response), content_type='application/json'
+        body=body, content_type='application/json'
     )
 
 
@@ -125,15 +181,34 @@ async def stream_json(request: web.Request):
     if not script:
         return web.HTTPBadRequest(reason='no script provided')
     wait_s = float(request.query.get('wait') or commands.get('wait') or 0)
-    try:
-        async with sse_response(request, response_cls=SSEResponse) as response:
-            tab = Splash(request, response)
-            await tab.initialize()
-            await tab.go(url)
-            await asyncio.sleep(wait_s)
-            await tab.run(script)
-    except:
-        import traceback
-
-        traceback.print_exc()
+    timings = request['timings']
+    with request_budget(request.query.get('timeout') or commands.get('timeout')):
+        try:
+            async with sse_response(request, response_cls=SSEResponse) as response:
+                tab = Splash(request, response)
+                with timings.phase('initialize'):
+                    await tab.initialize()
+                with timings.phase('go'):
+                    await tab.go(url)
+                with timings.phase('wait'):
+                    await asyncio.sleep(min(wait_s, deadline.remaining(deadline.current())))
+                with timings.phase('script'):
+                    await tab.run(script)
+                if tab.get_bool('timings'):
+                    # the headers went out before any phase ran, send the breakdown as a last event
+                    await response.send_json(timings.to_dict(), event='timings')
+        except:
+            import traceback
+
+            traceback.print_exc()
     return response
+
+
+async def render_metrics(request: web.Request):
+    request.app['chrome-driver'].collect_metrics()
+    return web.Response(body=metrics.REGISTRY.render().encode(), headers={'Content-Type': metrics.CONTENT_TYPE})
+
+
+async def render_flight_recorder(request: web.Request):
+    records = request.app['chrome-driver'].flight_records(tab_id=request.query.get('tab'))
+    return web.Response(body=json.dumps(records), content_type='application/json')
@@ -114,13 +114,91 @@ for k, v in processed_data.items():
         for event in domain.get('events', []):
             p_names = [p['name'] for p in event.get('parameters', [])]
             p_refs = [(p['name'], p['$ref']) for p in event.get('parameters', []) if p.get('$ref')]
-            h_names = set(filter(lambda n: 'id' in n or 'Id' in n, p_names))
+            # keep parameter order so that regenerating is deterministic
+            h_names = [n for n in p_names if 'id' in n or 'Id' in n]
             for pn, pr in p_refs:
-                if pr in hashable_objs:
-                    h_names.add(pn + 'Id')
-            event['hashable'] = list(h_names)
+                if pr in hashable_objs and pn + 'Id' not in h_names:
+                    h_names.append(pn + 'Id')
+            event['hashable'] = h_names
             event['is_hashable'] = len(event['hashable']) > 0
 
+# third run, resolve every $ref at generation time so that each type, event and command gets a
+# decoder specialised to its fields
+types_by_domain = {}
+for prot in processed_data.values():
+    for domain in prot['domains']:
+        types_by_domain[domain['domain']] = {t['id']: t for t in domain.get('types', [])}
+
+
+def resolve_ref(ref, domain_name):
+    ref_domain, _, type_id = ref.rpartition('.')
+    ref_domain = ref_domain or domain_name
+    return ref_domain, types_by_domain[ref_domain][type_id]
+
+
+def decode_expr(prop, domain_name, value, imports, ref_domain_name=None, depth=0):
+    """
+    :param domain_name: domain of the module the expression is generated for
+    :param ref_domain_name: domain that relative `$ref`s in `prop` belong to, if not `domain_name`
+    :return: a python expression converting the JSON `value` of `prop` to its python type, or `None` if the JSON
+    value can be used as is
+    """
+    ref_domain_name = ref_domain_name or domain_name
+    if '$ref' in prop:
+        ref_domain, type_obj = resolve_ref(prop['$ref'], ref_domain_name)
+        if ref_domain == domain_name:
+            cls_name = type_obj['id']
+        else:
+            cls_name = '%s.%s' % (ref_domain, type_obj['id'])
+        if type_obj['type'] in ('object', 'py_chrome_identifier'):
+            if ref_domain != domain_name:
+                imports.add(ref_domain)
+            if type_obj['type'] == 'object':
+                return '%s.from_json(%s)' % (cls_name, value)
+            return '%s(%s)' % (cls_name, value)
+        elif type_obj['type'] == 'str' and type_obj['id'].endswith('Id'):
+            # ids repeat across many objects and events, share a single copy of each
+            return 'intern(%s)' % value
+        elif type_obj['type'].startswith('['):
+            array = {'type': 'array', 'items': type_obj['items']}
+            return decode_expr(array, domain_name, value, imports, ref_domain, depth)
+        return None
+    elif prop.get('type') == 'array':
+        item_var = 'i%s' % depth
+        item_expr = decode_expr(prop['items'], domain_name, item_var, imports, ref_domain_name, depth + 1)
+        if item_expr is None:
+            return None
+        return '[%s for %s in %s]' % (item_expr, item_var, value)
+    return None
+
+
+def set_py_decoder(prop, domain_name, imports, source='d'):
+    """ Sets the expression converting `prop` as read from the JSON dict `source` """
+    prop['py_decoder'] = decode_expr(prop, domain_name, '%s[%r]' % (source, prop['name']), imports)
+
+
+for prot in processed_data.values():
+    for domain in prot['domains']:
+        name = domain['domain']
+        imports = set()
+        for type_obj in domain.get('types', []):
+            for prop in type_obj.get('properties', []):
+                set_py_decoder(prop, name, imports)
+        for event in domain.get('events', []):
+            for prop in event.get('parameters', []):
+                set_py_decoder(prop, name, imports)
+            # params of a single object type, their `__init__` decodes them when given a dict
+            event['decoded_by_init'] = [
+                prop['name'] for prop in event.get('parameters', [])
+                if prop['py_decoder'] and prop['py_decoder'].endswith('.from_json(d[%r])' % prop['name'])
+            ]
+        for command in domain.get('commands', []):
+            for prop in command.get('returns', []):
+                set_py_decoder(prop, name, imports, source='result')
+            command['has_decoder'] = any(r['py_decoder'] for r in command.get('returns', []))
+        dependencies = domain.get('dependencies', [])
+        domain['imports'] = dependencies + sorted(imports - set(dependencies))
+
 # finally write to file
 t = Template(open(template_fp).read(), trim_blocks=True, lstrip_blocks=True)
 test_f = open(test_script_fp, 'w')
@@ -7,4 +7,4 @@ echo "Starting VNC server..."
 x11vnc -forever -shared -rfbport 5900 -display $DISPLAY &
 
 echo "Starting Chromewhip..."
-python3.6 -m chromewhip.__init__ --js-profiles-path /usr/jsprofiles
+python3.7 -m chromewhip.__init__ --js-profiles-path /usr/jsprofiles
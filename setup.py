@@ -40,7 +40,7 @@ setup(
 
         'License :: OSI Approved :: MIT License',
 
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.7',
     ],
 
     # What does your project relate to?
@@ -50,6 +50,9 @@ setup(
     # simple. Or you can use find_packages().
     packages=find_packages(exclude=['contrib', 'docs', 'tests']),
 
+    # contextvars carries deadlines and trace spans across awaits
+    python_requires='>=3.7',
+
     # Alternatively, if you want to distribute just a my_module.py, uncomment
     # this:
     #   py_modules=["my_module"],
@@ -59,7 +62,7 @@ setup(
     # requirements files see:
     # https://packaging.python.org/en/latest/requirements.html
     install_requires=[
-        'aiohttp==2.2.0', 'websockets==3.3', 'beautifulsoup4==4.6.0', 'lxml==3.8.0',
+        'aiohttp==3.4.4', 'websockets==8.1', 'beautifulsoup4==4.6.0', 'lxml==3.8.0',
         'pyyaml==3.12', 'Pillow==4.2.1'
     ],
 
@@ -69,7 +72,8 @@ setup(
     # $ pip install -e .[dev,test]
     extras_require={
         'dev': ['Jinja2==2.9.6', 'jsonpatch==1.16'],
-        'test': ['pytest-asyncio==0.6.9'],
+        'test': ['pytest-asyncio==0.10.0'],
+        'fast': ['orjson'],
     },
 
     # To provide executable scripts, use entry points in preference to the
@@ -9,8 +9,9 @@ import websockets
 from websockets.exceptions import ConnectionClosed
 
 
-from chromewhip import chrome, helpers
+from chromewhip import chrome, deadline, events, filters, helpers, metrics, tracing
 from chromewhip.protocol import page, network
+from chromewhip.timeouts import AdaptiveTimeouts
 
 TEST_HOST = 'localhost'
 TEST_PORT = 32322
@@ -106,7 +107,7 @@ def init_test_server(triggers: dict, initial_msgs: [dict] = None, expected: queu
 
                 log.debug('replying with payload "%s"' % response_stream)
                 for r in response_stream:
-                    if isinstance(r, int):
+                    if isinstance(r, (int, float)):
                         await asyncio.sleep(r)
                     else:
                         await websocket.send(json.dumps(r, cls=helpers.ChromewhipJSONEncoder))
@@ -298,3 +299,838 @@ async def xtest_can_register_callback_on_devtools_event(event_loop, chrome_tab):
 
     server.close()
     await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_send_command_removes_pending_entry_once_acked(event_loop, chrome_tab):
+    msg_id = 4
+    url = 'http://example.com'
+
+    chrome_tab._message_id = msg_id - 1
+    p = page.Page.navigate(url)
+
+    triggers = {
+        msg_id: [{'id': msg_id, 'result': {'frameId': '3228.1'}}]
+    }
+
+    test_server = init_test_server(triggers)
+    start_server = websockets.serve(test_server, TEST_HOST, TEST_PORT)
+    server = await start_server
+    await chrome_tab.connect()
+
+    result = await chrome_tab.send_command(p)
+    assert result['ack']['id'] == msg_id
+    assert chrome_tab._pending == {}
+
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_send_command_removes_pending_entry_when_cancelled(event_loop, chrome_tab):
+    msg_id = 4
+    url = 'http://example.com'
+
+    chrome_tab._message_id = msg_id - 1
+    p = page.Page.navigate(url)
+
+    # never ack the command
+    triggers = {
+        msg_id: [1]
+    }
+
+    test_server = init_test_server(triggers)
+    start_server = websockets.serve(test_server, TEST_HOST, TEST_PORT)
+    server = await start_server
+    await chrome_tab.connect()
+
+    task = asyncio.ensure_future(chrome_tab.send_command(p))
+    await asyncio.sleep(0.2)
+    assert list(chrome_tab._pending) == [msg_id]
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert chrome_tab._pending == {}
+
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_commands_can_await_on_same_event(event_loop, chrome_tab):
+    msg_id = 4
+    frame_id = '3228.1'
+    url = 'http://example.com'
+
+    chrome_tab._message_id = msg_id - 1
+    fsle = page.FrameStoppedLoadingEvent(frame_id)
+
+    triggers = {
+        msg_id: [{'id': msg_id, 'result': {'frameId': frame_id}}],
+        msg_id + 1: [{'id': msg_id + 1, 'result': {'frameId': frame_id}}, 1, fsle],
+    }
+
+    test_server = init_test_server(triggers)
+    start_server = websockets.serve(test_server, TEST_HOST, TEST_PORT)
+    server = await start_server
+    await chrome_tab.connect()
+
+    results = await asyncio.gather(
+        chrome_tab.send_command(page.Page.navigate(url), await_on_event_type=page.FrameStoppedLoadingEvent),
+        chrome_tab.send_command(page.Page.navigate(url), await_on_event_type=page.FrameStoppedLoadingEvent),
+    )
+    for result in results:
+        assert isinstance(result['event'], page.FrameStoppedLoadingEvent)
+        assert result['event'].frameId == frame_id
+    assert len(chrome_tab._subscriptions) == 0
+
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_send_many_collects_acks_out_of_order_with_errors_per_command(event_loop, chrome_tab):
+    msg_id = 4
+    chrome_tab._message_id = msg_id - 1
+
+    error_ack = {'id': msg_id, 'error': {'code': -32000, 'message': 'Cannot navigate to invalid URL'}}
+    history_ack = {'id': msg_id + 1, 'result': {'currentIndex': 0, 'entries': []}}
+    triggers = {
+        # only reply once both commands have been written
+        msg_id: [0],
+        msg_id + 1: [history_ack, error_ack],
+    }
+
+    test_server = init_test_server(triggers)
+    start_server = websockets.serve(test_server, TEST_HOST, TEST_PORT)
+    server = await start_server
+    await chrome_tab.connect()
+
+    navigate, history = await chrome_tab.send_many([
+        page.Page.navigate('not a url'),
+        page.Page.getNavigationHistory(),
+    ])
+    assert isinstance(navigate, chrome.ProtocolError)
+    assert history['ack']['result']['entries'] == []
+    assert chrome_tab._pending == {}
+
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_evaluate_many_raises_script_errors(event_loop, chrome_tab):
+    msg_id = 4
+    chrome_tab._message_id = msg_id - 1
+
+    title_ack = {'id': msg_id, 'result': {'result': {'type': 'string', 'value': 'Example'}}}
+    thrown_ack = {'id': msg_id + 1, 'result': {
+        'result': {'type': 'object', 'subtype': 'error', 'className': 'ReferenceError'},
+        'exceptionDetails': {'exceptionId': 1, 'text': 'Uncaught', 'lineNumber': 0, 'columnNumber': 0},
+    }}
+    triggers = {
+        msg_id: [title_ack],
+        msg_id + 1: [thrown_ack],
+    }
+
+    test_server = init_test_server(triggers)
+    start_server = websockets.serve(test_server, TEST_HOST, TEST_PORT)
+    server = await start_server
+    await chrome_tab.connect()
+
+    with pytest.raises(chrome.JSScriptError):
+        await chrome_tab.evaluate_many('document.title', 'missing.property')
+    assert chrome_tab._pending == {}
+
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_commands_share_single_writer(event_loop, chrome_tab):
+    msg_id = 4
+    count = 20
+    chrome_tab._message_id = msg_id - 1
+
+    triggers = {
+        i: [{'id': i, 'result': {'currentIndex': 0, 'entries': []}}]
+        for i in range(msg_id, msg_id + count)
+    }
+
+    test_server = init_test_server(triggers)
+    start_server = websockets.serve(test_server, TEST_HOST, TEST_PORT)
+    server = await start_server
+    await chrome_tab.connect()
+
+    transport = chrome_tab.connection._ws.transport
+    writes = []
+    write = transport.write
+    transport.write = lambda data: writes.append(data) or write(data)
+
+    commands = [chrome_tab.send_command(page.Page.getNavigationHistory()) for _ in range(count)]
+    tasks = [asyncio.ensure_future(c) for c in commands]
+    await asyncio.sleep(0)
+    assert chrome_tab.send_queue_depth == count
+    results = await asyncio.gather(*tasks)
+    assert sorted(r['ack']['id'] for r in results) == list(triggers)
+    assert chrome_tab.send_queue_depth == 0
+    # the whole burst went out in one write to the socket
+    assert len(writes) == 1
+
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_disconnect_flushes_queued_messages(event_loop, chrome_tab):
+    msg_id = 4
+    chrome_tab._message_id = msg_id - 1
+
+    triggers = {
+        msg_id: [0],
+    }
+
+    test_server = init_test_server(triggers)
+    start_server = websockets.serve(test_server, TEST_HOST, TEST_PORT)
+    server = await start_server
+    await chrome_tab.connect()
+
+    request, _ = page.Page.getNavigationHistory()
+    chrome_tab._register(request)
+    _, sent_future = chrome_tab._enqueue(request)
+    await chrome_tab.disconnect()
+    assert sent_future.done() and sent_future.exception() is None
+
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_events_streams_received_events_until_disconnect(event_loop, chrome_tab):
+    triggers = {
+        1: [{'method': 'Network.loadingFinished',
+             'params': {'requestId': str(i), 'timestamp': 1.0, 'encodedDataLength': 10.0}}
+            for i in range(5)] + [{'id': 1, 'result': {}}],
+    }
+    test_server = init_test_server(triggers)
+    start_server = websockets.serve(test_server, TEST_HOST, TEST_PORT)
+    server = await start_server
+    await chrome_tab.connect()
+
+    stream = chrome_tab.events(network.LoadingFinishedEvent, maxsize=3)
+    assert chrome_tab.streams == [stream]
+    await chrome_tab.send_command(network.Network.enable())
+    await chrome_tab.disconnect()
+
+    received = [event.requestId async for event in stream]
+    assert received == ['2', '3', '4']
+    assert stream.dropped == 2
+    assert chrome_tab.streams == []
+
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_full_blocking_stream_does_not_stall_acks(event_loop, chrome_tab):
+    triggers = {
+        1: [{'method': 'Network.loadingFinished',
+             'params': {'requestId': str(i), 'timestamp': 1.0, 'encodedDataLength': 10.0}}
+            for i in range(3)] + [{'id': 1, 'result': {}}],
+        2: [{'id': 2, 'result': {'currentIndex': 0, 'entries': []}}],
+    }
+    test_server = init_test_server(triggers)
+    start_server = websockets.serve(test_server, TEST_HOST, TEST_PORT)
+    server = await start_server
+    await chrome_tab.connect()
+
+    stream = chrome_tab.events(network.LoadingFinishedEvent, maxsize=1, overflow=events.BLOCK, backlog=2)
+    await chrome_tab.send_command(network.Network.enable())
+    received = []
+    async for event in stream:
+        received.append(event.requestId)
+        if len(received) == 1:
+            with deadline.budget(1):
+                await chrome_tab.send_command(page.Page.getNavigationHistory())
+        if len(received) == 3:
+            break
+    assert received == ['0', '1', '2']
+    assert stream.dropped == 0
+
+    # past its backlog the stream fails rather than silently losing events
+    overflowing = chrome_tab.events(network.LoadingFinishedEvent, maxsize=1, overflow=events.BLOCK, backlog=1)
+    chrome_tab._message_id = 0
+    await chrome_tab.send_command(network.Network.enable())
+    with pytest.raises(events.StreamOverflowError):
+        [event async for event in overflowing]
+    assert overflowing.dropped == 1
+
+    await chrome_tab.disconnect()
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_resolves_on_first_event_matching_filter(event_loop, chrome_tab):
+    triggers = {
+        1: [{'method': 'Network.loadingFinished',
+             'params': {'requestId': str(i), 'timestamp': 1.0, 'encodedDataLength': 10.0}}
+            for i in range(5)] + [{'id': 1, 'result': {}}],
+    }
+    test_server = init_test_server(triggers)
+    start_server = websockets.serve(test_server, TEST_HOST, TEST_PORT)
+    server = await start_server
+    await chrome_tab.connect()
+
+    stream = chrome_tab.events(where=filters.where(network.LoadingFinishedEvent) & filters.Regex('requestId', '[13]'))
+    waiter = asyncio.ensure_future(chrome_tab.wait_for(filters.where('Network.loadingFinished', requestId='3')))
+    await asyncio.sleep(0)
+    await chrome_tab.send_command(network.Network.enable())
+
+    assert (await waiter).requestId == '3'
+    await chrome_tab.disconnect()
+    assert [event.requestId async for event in stream] == ['1', '3']
+
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_enable_runs_only_callbacks_registered_for_the_event(event_loop, chrome_tab):
+    triggers = {
+        1: [{'method': 'Page.frameStoppedLoading', 'params': {'frameId': '3228.1'}},
+            {'method': 'Page.loadEventFired', 'params': {'timestamp': 1.0}},
+            {'id': 1, 'result': {}}],
+    }
+    test_server = init_test_server(triggers)
+    start_server = websockets.serve(test_server, TEST_HOST, TEST_PORT)
+    server = await start_server
+    await chrome_tab.connect()
+
+    stopped, loaded = [], []
+
+    async def on_stopped(event):
+        stopped.append(event)
+
+    await chrome_tab.enable('page', methods={
+        page.FrameStoppedLoadingEvent: on_stopped,
+        'Page.loadEventFired': [loaded.append],
+    })
+    await chrome_tab.dispatcher.join()
+    assert [e.frameId for e in stopped] == ['3228.1']
+    assert [type(e) for e in loaded] == [page.LoadEventFiredEvent]
+
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_undecodable_event_does_not_reach_the_receive_loop(event_loop):
+    session = chrome.Session()
+    seen = []
+    session.dispatcher.add('Page.frameStoppedLoading', seen.append)
+
+    await session.handle_message({'method': 'Page.frameStoppedLoading', 'params': {}})
+    await session.handle_message({'method': 'Page.frameStoppedLoading', 'params': {'frameId': '1'}})
+    await session.dispatcher.join()
+    assert session.dispatcher.decode_errors == 1
+    assert [e.frameId for e in seen] == ['1']
+    await session.close()
+
+
+def init_browser_server(targets, connections, methods=None, destroy_on_navigate=(), drop_on_first_navigate=False):
+    """ A browser websocket answering `Target` commands and navigating flattened sessions. """
+    async def browser_server(websocket, path):
+        connections.append(path)
+        async for msg in websocket:
+            obj = json.loads(msg)
+            id_, method, session_id = obj['id'], obj['method'], obj.get('sessionId')
+            if methods is not None:
+                methods.append(method)
+            if method == 'Target.getTargets':
+                reply = {'targetInfos': targets}
+            elif method == 'Target.attachToTarget':
+                assert obj['params'] == {'targetId': obj['params']['targetId'], 'flatten': True}
+                reply = {'sessionId': 'session-%s' % obj['params']['targetId']}
+            elif method == 'Target.createTarget':
+                reply = {'targetId': 'T%s' % id_}
+            elif method == 'Target.setDiscoverTargets':
+                reply = {}
+            elif method == 'Page.navigate' and drop_on_first_navigate and len(connections) == 1:
+                await websocket.close(code=1011)
+                return
+            elif method == 'Page.navigate' and session_id in destroy_on_navigate:
+                # the target goes away without ever acking
+                target_id = session_id.split('-')[-1]
+                await websocket.send(json.dumps({'method': 'Target.targetDestroyed', 'params': {'targetId': target_id}}))
+                continue
+            elif method == 'Page.navigate':
+                assert session_id
+                frame_id = '%s.1' % session_id
+                # events for another session first, they must not leak across tabs
+                for other in ('session-other', session_id):
+                    await websocket.send(json.dumps({'method': 'Page.frameStoppedLoading', 'sessionId': other,
+                                                     'params': {'frameId': '%s.1' % other}}))
+                reply = {'frameId': frame_id, 'loaderId': '1'}
+            else:
+                pytest.fail('unexpected browser command %s' % method)
+            payload = {'id': id_, 'result': reply}
+            if session_id:
+                payload['sessionId'] = session_id
+            await websocket.send(json.dumps(payload))
+    return browser_server
+
+
+@pytest.mark.asyncio
+async def test_chrome_multiplexes_tabs_over_one_browser_websocket(event_loop):
+    targets = [
+        {'targetId': tid, 'type': type_, 'title': tid, 'url': 'about:blank', 'attached': False}
+        for tid, type_ in (('A', 'page'), ('B', 'page'), ('W', 'service_worker'))
+    ]
+    connections = []
+    server = await websockets.serve(init_browser_server(targets, connections), TEST_HOST, TEST_PORT)
+
+    browser = chrome.Chrome(host=TEST_HOST, port=TEST_PORT)
+
+    async def get_browser_ws_uri():
+        return 'ws://%s:%s/devtools/browser/1' % (TEST_HOST, TEST_PORT)
+    browser.get_browser_ws_uri = get_browser_ws_uri
+
+    await browser.connect()
+    tab_a, tab_b = browser.tabs
+    assert (tab_a.session_id, tab_b.session_id) == ('session-A', 'session-B')
+    assert tab_a.connection is tab_b.connection is browser.connection
+
+    await asyncio.gather(tab_a.go('http://example.com'), tab_b.go('http://example.com'))
+    assert (tab_a.frame_id, tab_b.frame_id) == ('session-A.1', 'session-B.1')
+    assert [e.params['frameId'] for e in tab_a.event_store.events('Page.frameStoppedLoading')] == ['session-A.1']
+    assert connections == ['/devtools/browser/1']
+
+    await browser.disconnect()
+    assert browser.connection is None
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_create_tabs_pipelines_batches_of_attach_concurrency(event_loop):
+    connections, methods = [], []
+    server = await websockets.serve(init_browser_server([], connections, methods), TEST_HOST, TEST_PORT)
+
+    browser = chrome.Chrome(host=TEST_HOST, port=TEST_PORT, attach_concurrency=2,
+                            session_options={'recorder_size': 0, 'adaptive_timeouts': True})
+
+    async def get_browser_ws_uri():
+        return 'ws://%s:%s/devtools/browser/1' % (TEST_HOST, TEST_PORT)
+    browser.get_browser_ws_uri = get_browser_ws_uri
+
+    tabs = await browser.create_tabs(5)
+    assert len(tabs) == len(set(tab.session_id for tab in tabs)) == 5
+    assert browser.tabs == tuple(tabs)
+    assert all(tab.recorder.size == 0 and tab._adaptive_timeouts for tab in tabs)
+    create, attach = 'Target.createTarget', 'Target.attachToTarget'
+    assert methods == ['Target.setDiscoverTargets'] + [create, create, attach, attach] * 2 + [create, attach]
+    assert len(connections) == 1
+
+    await browser.disconnect()
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_destroyed_target_fails_commands_fast_and_notifies_listeners(event_loop):
+    targets = [{'targetId': tid, 'type': 'page', 'title': tid, 'url': 'about:blank', 'attached': False}
+               for tid in ('A', 'B')]
+    server = await websockets.serve(init_browser_server(targets, [], destroy_on_navigate={'session-A'}),
+                                    TEST_HOST, TEST_PORT)
+
+    browser = chrome.Chrome(host=TEST_HOST, port=TEST_PORT)
+
+    async def get_browser_ws_uri():
+        return 'ws://%s:%s/devtools/browser/1' % (TEST_HOST, TEST_PORT)
+    browser.get_browser_ws_uri = get_browser_ws_uri
+
+    notified = asyncio.Queue()
+    browser.add_listener(lambda event, tab: notified.put_nowait((event.js_name, tab)))
+
+    await browser.connect()
+    assert sorted(browser.targets) == ['A', 'B']
+    tab_a, tab_b = browser.tabs
+
+    with pytest.raises(chrome.TargetClosedError):
+        await asyncio.wait_for(tab_a.go('http://example.com'), timeout=1)
+    assert await asyncio.wait_for(notified.get(), timeout=1) == ('Target.targetDestroyed', tab_a)
+    assert not tab_a.is_alive
+    assert browser.tabs == (tab_b,)
+    assert sorted(browser.targets) == ['B']
+    with pytest.raises(chrome.TargetClosedError):
+        await tab_a.send_command(page.Page.reload())
+
+    await tab_b.go('http://example.com')
+    assert tab_b.frame_id == 'session-B.1'
+
+    await browser.disconnect()
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_target_registry_sees_every_event_while_callbacks_are_dropped(event_loop):
+    targets = [{'targetId': 'A', 'type': 'page', 'title': 'A', 'url': 'about:blank', 'attached': False}]
+    server = await websockets.serve(init_browser_server(targets, []), TEST_HOST, TEST_PORT)
+    browser = chrome.Chrome(host=TEST_HOST, port=TEST_PORT)
+
+    async def get_browser_ws_uri():
+        return 'ws://%s:%s/devtools/browser/1' % (TEST_HOST, TEST_PORT)
+    browser.get_browser_ws_uri = get_browser_ws_uri
+    await browser.connect()
+
+    # a stuck callback on the browser session, its dispatcher drops calls past the backlog
+    stuck = asyncio.Event()
+
+    async def wait(event):
+        await stuck.wait()
+    session = browser.browser_session
+    session.dispatcher.add('Target.targetCreated', wait)
+    count = events.DEFAULT_CALLBACK_BACKLOG + 100
+    for i in range(count):
+        info = {'targetId': 'T%s' % i, 'type': 'page', 'title': '', 'url': 'about:blank', 'attached': False}
+        await session.handle_message({'method': 'Target.targetCreated', 'params': {'targetInfo': info}})
+    for i in range(count):
+        await session.handle_message({'method': 'Target.targetDestroyed', 'params': {'targetId': 'T%s' % i}})
+    await session.handle_message({'method': 'Target.targetDestroyed', 'params': {'targetId': 'A'}})
+
+    assert session.dispatcher.dropped > 0
+    assert browser.targets == {}
+    assert not browser._tabs
+
+    stuck.set()
+    await browser.disconnect()
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_html_is_fetched_in_chunks_when_larger_than_chunk_size(event_loop, chrome_tab, monkeypatch):
+    monkeypatch.setattr(chrome, 'CHUNK_SIZE_CHARS', 4)
+    monkeypatch.setattr(chrome, 'CHUNK_BATCH_SIZE', 2)
+    html = '<html>chunked</html>'
+    slices = [html[i:i + 4] for i in range(0, len(html), 4)]
+
+    def by_value(id_, value):
+        return {'id': id_, 'result': {'result': {'type': 'string', 'value': value}}}
+
+    triggers = {
+        1: [{'id': 1, 'result': {'result': {'type': 'object', 'className': 'ChromewhipChunks', 'objectId': 'obj-1'}}}],
+        2: [{'id': 2, 'result': {'result': {'type': 'number', 'value': len(html)}}}],
+        # slices are requested two at a time and may be acked out of order
+        3: [0], 4: [by_value(4, slices[1]), by_value(3, slices[0])],
+        5: [by_value(5, slices[2])], 6: [by_value(6, slices[3])],
+        7: [by_value(7, slices[4])],
+        8: [{'id': 8, 'result': {}}],
+    }
+    test_server = init_test_server(triggers)
+    start_server = websockets.serve(test_server, TEST_HOST, TEST_PORT)
+    server = await start_server
+    await chrome_tab.connect()
+
+    assert await chrome_tab.html() == html
+
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_one_deadline_covers_ack_and_event_phases(event_loop, chrome_tab):
+    triggers = {
+        # acks after half the budget, the awaited event never comes
+        1: [0.3, {'id': 1, 'result': {'frameId': '3228.1', 'loaderId': '1'}}],
+    }
+    test_server = init_test_server(triggers)
+    start_server = websockets.serve(test_server, TEST_HOST, TEST_PORT)
+    server = await start_server
+    await chrome_tab.connect()
+
+    start = event_loop.time()
+    with deadline.budget(0.6):
+        with pytest.raises(chrome.DeadlineExceededError, match='event of "Page.navigate"'):
+            await chrome_tab.go('http://example.com', timeout=30)
+    assert event_loop.time() - start < 1
+    assert chrome_tab._pending == {}
+
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_commands_record_latency_errors_and_inflight(event_loop, chrome_tab):
+    triggers = {
+        1: [{'id': 1, 'result': {'frameId': '3228.1', 'loaderId': '1'}},
+            {'method': 'Page.frameStoppedLoading', 'params': {'frameId': '3228.1'}}],
+        # acked, the awaited event never comes
+        2: [{'id': 2, 'result': {'frameId': '3228.2', 'loaderId': '2'}}],
+    }
+    test_server = init_test_server(triggers)
+    start_server = websockets.serve(test_server, TEST_HOST, TEST_PORT)
+    server = await start_server
+    await chrome_tab.connect()
+
+    acks = chrome.COMMAND_ACK_SECONDS.labels('Page.navigate')
+    events = chrome.COMMAND_EVENT_SECONDS.labels('Page.navigate', 'Page.frameStoppedLoading')
+    errors = chrome.COMMAND_ERRORS.labels('Page.navigate', 'DeadlineExceededError', '')
+    acks_before, events_before, errors_before = sum(acks.counts), sum(events.counts), errors.value
+
+    await chrome_tab.go('http://example.com')
+    assert chrome_tab.inflight == 0
+    with pytest.raises(chrome.DeadlineExceededError):
+        await chrome_tab.go('http://example.com', timeout=0.3)
+    assert chrome_tab.inflight == 0
+
+    assert sum(acks.counts) - acks_before == 2
+    assert sum(events.counts) - events_before == 1
+    assert errors.value - errors_before == 1
+    exposition = metrics.REGISTRY.render()
+    assert '# TYPE chromewhip_command_ack_seconds histogram' in exposition
+    assert 'chromewhip_command_ack_seconds_bucket{method="Page.navigate",le="+Inf"}' in exposition
+
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_commands_are_traced_within_the_current_span(event_loop, chrome_tab):
+    triggers = {
+        1: [{'id': 1, 'result': {'frameId': '3228.1', 'loaderId': '1'}},
+            {'method': 'Page.frameStoppedLoading', 'params': {'frameId': '3228.1'}}],
+    }
+    test_server = init_test_server(triggers)
+    start_server = websockets.serve(test_server, TEST_HOST, TEST_PORT)
+    server = await start_server
+    await chrome_tab.connect()
+
+    spans = []
+    tracing.configure(type('ListSink', (), {'export': lambda self, span: spans.append(span)})())
+    try:
+        with tracing.start_span('GET /render.html') as request_span:
+            await chrome_tab.go('http://example.com')
+    finally:
+        tracing.configure()
+
+    command, _ = spans
+    assert command.name == 'cdp Page.navigate'
+    assert command.parent_id == request_span.span_id
+    assert [name for _, name, _ in command.events] == ['ack', 'event']
+
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_deadline_error_carries_the_frames_leading_up_to_it(event_loop, chrome_tab):
+    triggers = {
+        1: [{'id': 1, 'result': {'frameId': '3228.1', 'loaderId': '1'}}],
+    }
+    test_server = init_test_server(triggers)
+    start_server = websockets.serve(test_server, TEST_HOST, TEST_PORT)
+    server = await start_server
+    await chrome_tab.connect()
+
+    with pytest.raises(chrome.DeadlineExceededError) as exc_info:
+        await chrome_tab.go('http://example.com', timeout=0.2)
+    sent, received = exc_info.value.flight_record
+    assert sent['direction'] == '>' and '"Page.navigate"' in sent['frame']
+    assert received['direction'] == '<' and '"loaderId"' in received['frame']
+
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_adaptive_timeout_detects_stuck_command_early(event_loop):
+    tab = chrome.ChromeTab('test', 'about:blank', f'ws://{TEST_HOST}:{TEST_PORT}', '123',
+                           timeouts=AdaptiveTimeouts(min_samples=3, factor=2, floor_s=0.2), adaptive_timeouts=True)
+
+    def ack(id_):
+        return {'id': id_, 'result': {}}
+
+    triggers = {1: [ack(1)], 2: [ack(2)], 3: [ack(3)], 4: [2, ack(4)]}
+    test_server = init_test_server(triggers)
+    server = await websockets.serve(test_server, TEST_HOST, TEST_PORT)
+    await tab.connect()
+
+    for _ in range(3):
+        await tab.send_command(page.Page.reload())
+    assert tab.latency_stats()['Page.reload']['timeout_s'] == 0.2
+
+    start = event_loop.time()
+    # a request budget far longer than the learnt timeout does not delay detection
+    with deadline.budget(30):
+        with pytest.raises(chrome.DeadlineExceededError):
+            await tab.send_command(page.Page.reload())
+    assert event_loop.time() - start < 1
+    # the expiry counts as a sample, so the method's timeout backs off
+    stats = tab.latency_stats()['Page.reload']
+    assert stats['expired'] == 1 and stats['timeout_s'] >= 0.4
+
+    await tab.disconnect()
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_request_budget_overrides_default_timeout(event_loop, chrome_tab, monkeypatch):
+    monkeypatch.setattr(chrome, 'TIMEOUT_S', 0.1)
+    test_server = init_test_server({1: [0.3, {'id': 1, 'result': {}}]})
+    server = await websockets.serve(test_server, TEST_HOST, TEST_PORT)
+    await chrome_tab.connect()
+
+    # e.g. a Splash client asking for a timeout longer than the default
+    with deadline.budget(5):
+        result = await chrome_tab.send_command(page.Page.reload())
+    assert result['ack'] == {'id': 1, 'result': {}}
+
+    await chrome_tab.disconnect()
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_undecodable_frames_do_not_end_the_receive_loop(event_loop, chrome_tab):
+    async def server(websocket, path):
+        async for msg in websocket:
+            obj = json.loads(msg)
+            # a lone surrogate, as sent for broken page text, then a frame no codec can read
+            await websocket.send('{"method": "Log.entryAdded", "params": {"entry": {"source": "javascript", '
+                                 '"level": "info", "text": "broken \\ud83d", "timestamp": 1}}}')
+            await websocket.send('{"id": ')
+            await websocket.send(json.dumps({'id': obj['id'], 'result': {}}))
+
+    server = await websockets.serve(server, TEST_HOST, TEST_PORT)
+    await chrome_tab.connect()
+    await chrome_tab.send_command(page.Page.reload(), timeout=2)
+    await chrome_tab.send_command(page.Page.reload(), timeout=2)
+    event = chrome_tab.event_store.latest('Log.entryAdded')
+    assert event.params['entry']['text'] == 'broken \ud83d'
+
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_dropped_connection_fails_in_flight_commands_and_reconnects(event_loop, chrome_tab):
+    received = []
+
+    async def flaky_server(websocket, path):
+        async for msg in websocket:
+            obj = json.loads(msg)
+            received.append(obj['method'])
+            if obj['method'] == 'Page.reload' and received.count('Page.reload') == 1:
+                await websocket.close(code=1011)
+                return
+            await websocket.send(json.dumps({'id': obj['id'], 'result': {}}))
+
+    server = await websockets.serve(flaky_server, TEST_HOST, TEST_PORT)
+    await chrome_tab.connect()
+    await chrome_tab.enable('page')
+
+    start = event_loop.time()
+    with pytest.raises(chrome.ConnectionLostError) as exc_info:
+        await chrome_tab.send_command(page.Page.reload())
+    assert exc_info.value.retriable
+    assert event_loop.time() - start < 1
+
+    # held until the connection is back and the page domain enabled again
+    await chrome_tab.send_command(page.Page.reload())
+    assert received == ['Page.enable', 'Page.reload', 'Page.enable', 'Page.reload']
+    assert chrome_tab.connection.reconnects == 1
+    assert chrome_tab._pending == {}
+
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_reconnect_outlives_the_budget_of_the_request_that_connected(event_loop, chrome_tab):
+    received, sockets = [], []
+
+    async def server(websocket, path):
+        sockets.append(websocket)
+        async for msg in websocket:
+            obj = json.loads(msg)
+            received.append(obj['method'])
+            await websocket.send(json.dumps({'id': obj['id'], 'result': {}}))
+
+    server = await websockets.serve(server, TEST_HOST, TEST_PORT)
+    with deadline.budget(0.5):
+        await chrome_tab.connect()
+        await chrome_tab.enable('page')
+    await asyncio.sleep(0.6)
+
+    await sockets[0].close(code=1011)
+    while not (chrome_tab.connection.reconnects and chrome_tab.is_ready):
+        await asyncio.sleep(0.01)
+    assert received == ['Page.enable', 'Page.enable']
+    await chrome_tab.send_command(page.Page.reload())
+
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_reconnect_is_traced_apart_from_the_request_that_connected(event_loop, chrome_tab):
+    sockets = []
+
+    async def server(websocket, path):
+        sockets.append(websocket)
+        async for msg in websocket:
+            await websocket.send(json.dumps({'id': json.loads(msg)['id'], 'result': {}}))
+
+    server = await websockets.serve(server, TEST_HOST, TEST_PORT)
+    spans = []
+    tracing.configure(type('ListSink', (), {'export': lambda self, span: spans.append(span)})())
+    try:
+        with tracing.start_span('GET /render.html') as request_span:
+            await chrome_tab.connect()
+            await chrome_tab.enable('page')
+        await sockets[0].close(code=1011)
+        while not (chrome_tab.connection.reconnects and chrome_tab.is_ready):
+            await asyncio.sleep(0.01)
+    finally:
+        tracing.configure()
+
+    enable, _, resume, reconnect = spans
+    assert enable.parent_id == request_span.span_id
+    assert reconnect.name == 'cdp reconnect' and reconnect.parent_id is None
+    assert reconnect.trace_id != request_span.trace_id
+    assert resume.name == 'cdp Page.enable' and resume.parent_id == reconnect.span_id
+
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_chrome_reattaches_tabs_after_browser_connection_drops(event_loop):
+    targets = [{'targetId': 'A', 'type': 'page', 'title': 'A', 'url': 'about:blank', 'attached': False}]
+    connections, methods = [], []
+    server = await websockets.serve(init_browser_server(targets, connections, methods, drop_on_first_navigate=True),
+                                    TEST_HOST, TEST_PORT)
+
+    browser = chrome.Chrome(host=TEST_HOST, port=TEST_PORT)
+
+    async def get_browser_ws_uri():
+        return 'ws://%s:%s/devtools/browser/1' % (TEST_HOST, TEST_PORT)
+    browser.get_browser_ws_uri = get_browser_ws_uri
+
+    await browser.connect()
+    tab, = browser.tabs
+    with pytest.raises(chrome.ConnectionLostError):
+        await tab.go('http://example.com')
+    await tab.go('http://example.com')
+
+    assert len(connections) == 2
+    assert methods.count('Target.attachToTarget') == 2
+    assert tab.is_alive and tab.frame_id == 'session-A.1'
+
+    await browser.disconnect()
+    server.close()
+    await server.wait_closed()
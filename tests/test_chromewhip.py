@@ -40,3 +40,11 @@ async def xtest_render_html_with_js_profile(event_loop):
     assert resp.status == 200
     text = await resp.text()
     assert expected == text
+
+
+def test_flight_recorder_route_is_only_served_when_exposed(event_loop):
+    def paths(app):
+        return {resource.get_info().get('path') for resource in app.router.resources()}
+
+    assert '/admin/flight-recorder' not in paths(setup_app(loop=event_loop))
+    assert '/admin/flight-recorder' in paths(setup_app(loop=event_loop, expose_flight_records=True))
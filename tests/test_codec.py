@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+from chromewhip import codec
+from chromewhip.protocol import page
+
+AVAILABLE_CODECS = [name for name, cls in codec.CODECS.items() if name != 'orjson' or codec.orjson is not None]
+
+
+@pytest.mark.parametrize('name', AVAILABLE_CODECS)
+def test_codec_encodes_protocol_objects(name):
+    c = codec.get_codec(name)
+    request, _ = page.Page.setDeviceMetricsOverride(width=10, height=20, deviceScaleFactor=0.0, mobile=False)
+    request['params']['viewport'] = page.Viewport(x=0, y=0, width=10, height=20, scale=1)
+    msg = c.dumps(request)
+    assert isinstance(msg, str)
+    assert json.loads(msg)['params']['viewport'] == {'x': 0, 'y': 0, 'width': 10, 'height': 20, 'scale': 1}
+
+
+@pytest.mark.parametrize('name', AVAILABLE_CODECS)
+def test_codec_round_trips_events(name):
+    c = codec.get_codec(name)
+    f = page.Frame('3635.1', 'test', 'http://example.com', 'test', 'text/html')
+    decoded = c.loads(c.dumps(page.FrameNavigatedEvent(f)))
+    assert decoded['method'] == 'Page.frameNavigated'
+    assert decoded['params']['frame']['id'] == '3635.1'
+
+
+@pytest.mark.parametrize('name', AVAILABLE_CODECS)
+def test_codec_decodes_lone_surrogates(name):
+    c = codec.get_codec(name)
+    decoded = c.loads('{"method": "Log.entryAdded", "params": {"text": "broken \\ud83d text"}}')
+    assert decoded['params']['text'] == 'broken \ud83d text'
+
+
+def test_get_codec_rejects_unknown_names():
+    with pytest.raises(ValueError):
+        codec.get_codec('yaml')
+
+
+def test_get_codec_passes_instances_through():
+    c = codec.JSONCodec()
+    assert codec.get_codec(c) is c
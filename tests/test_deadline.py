@@ -0,0 +1,49 @@
+import asyncio
+import time
+from unittest import mock
+
+import pytest
+from aiohttp import web
+
+from chromewhip import deadline, views
+
+
+def test_resolve_defaults_only_without_any_deadline():
+    assert deadline.resolve() is None
+    assert deadline.resolve(default=5) - time.monotonic() > 4
+
+
+def test_budgets_nest_and_only_shorten_the_deadline():
+    with deadline.budget(10) as outer:
+        assert deadline.current() == outer
+        with deadline.budget(60) as inner:
+            assert inner == outer
+        with deadline.budget(1) as inner:
+            assert inner < outer
+            # a command's own timeout is capped by the context's too
+            assert deadline.resolve(timeout=30, default=25) == inner
+        assert deadline.current() == outer
+    assert deadline.current() is None
+
+
+def test_remaining_is_never_negative():
+    assert deadline.remaining(time.monotonic() - 1) == 0.0
+    assert deadline.remaining(None) is None
+
+
+@pytest.mark.asyncio
+async def test_request_budget_does_not_outlive_the_request(event_loop):
+    remaining = []
+
+    @views.with_request_budget
+    async def handler(request):
+        await asyncio.sleep(0.2)
+        remaining.append(deadline.remaining(deadline.current()))
+
+    # keep-alive requests are handled one after the other in the same task
+    await handler(mock.Mock(query={'timeout': '0.1'}))
+    await handler(mock.Mock(query={'timeout': '30'}))
+    assert remaining[0] == 0.0 and remaining[1] > 29
+    assert deadline.current() is None
+    with pytest.raises(web.HTTPBadRequest):
+        views.request_budget('91')
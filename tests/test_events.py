@@ -0,0 +1,259 @@
+import asyncio
+
+import pytest
+
+from chromewhip import deadline, helpers, tracing
+from chromewhip.events import EventDispatcher, EventStore, StreamIndex, SubscriptionIndex, StreamOverflowError, \
+    BLOCK, DROP_NEWEST, DROP_OLDEST
+from chromewhip.protocol import page
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _stopped_loading(frame_id):
+    event = page.FrameStoppedLoadingEvent(frame_id)
+    return event, event.key_()
+
+
+def test_event_store_caps_events_per_type():
+    store = EventStore(max_per_type=2)
+    for frame_id in ('1', '2', '3'):
+        store.add(*_stopped_loading(frame_id), size=10)
+    assert [e.frameId for e in store.events('Page.frameStoppedLoading')] == ['2', '3']
+    assert store.get(page.FrameStoppedLoadingEvent.build_key(frameId='1')) is None
+    assert store.get(page.FrameStoppedLoadingEvent.build_key(frameId='3')).frameId == '3'
+    assert store.memory_usage == 20
+
+
+def test_event_store_type_caps_override_default():
+    store = EventStore(max_per_type=5, type_caps={'Page.frameStoppedLoading': 1})
+    for frame_id in ('1', '2'):
+        store.add(*_stopped_loading(frame_id))
+    assert len(store) == 1
+    assert store.latest('Page.frameStoppedLoading').frameId == '2'
+
+
+def test_event_store_expires_events_after_ttl():
+    clock = FakeClock()
+    store = EventStore(ttl_s=10, clock=clock)
+    store.add(*_stopped_loading('1'), size=5)
+    clock.now = 5
+    assert store.latest('Page.frameStoppedLoading').frameId == '1'
+    clock.now = 11
+    assert store.latest('Page.frameStoppedLoading') is None
+    assert store.get(page.FrameStoppedLoadingEvent.build_key(frameId='1')) is None
+    store.sweep()
+    assert len(store) == 0
+    assert store.memory_usage == 0
+
+
+@pytest.mark.asyncio
+async def test_subscription_index_resolves_all_waiters_on_key(event_loop):
+    index = SubscriptionIndex()
+    event, key = _stopped_loading('1')
+    first = index.subscribe(key)
+    second = index.subscribe(key)
+    other = index.subscribe(page.FrameStoppedLoadingEvent.build_key(frameId='2'))
+
+    assert index.resolve(key, event) == 2
+    assert (await first) is event
+    assert (await second) is event
+    assert not other.done()
+    assert key not in index
+
+
+@pytest.mark.asyncio
+async def test_subscription_index_unsubscribe_drops_empty_keys(event_loop):
+    index = SubscriptionIndex()
+    future = index.subscribe('Page.frameStoppedLoading')
+    index.unsubscribe('Page.frameStoppedLoading', future)
+    assert len(index) == 0
+    assert index.resolve('Page.frameStoppedLoading', None) == 0
+
+
+def _raw_stopped_loading(frame_id):
+    return helpers.RawEvent('Page.frameStoppedLoading', {'frameId': frame_id})
+
+
+async def _drain(stream):
+    return [event.frameId async for event in stream]
+
+
+@pytest.mark.asyncio
+async def test_event_stream_drop_oldest_keeps_latest_events(event_loop):
+    stream = StreamIndex().open('Page.frameStoppedLoading', maxsize=2, overflow=DROP_OLDEST)
+    for i in range(4):
+        assert stream.offer(_raw_stopped_loading(str(i)))
+    stream.close(discard=False)
+    assert await _drain(stream) == ['2', '3']
+    assert stream.dropped == 2
+
+
+@pytest.mark.asyncio
+async def test_event_stream_drop_newest_keeps_earliest_events(event_loop):
+    stream = StreamIndex().open('Page.frameStoppedLoading', maxsize=2, overflow=DROP_NEWEST)
+    for i in range(4):
+        assert stream.offer(_raw_stopped_loading(str(i)))
+    stream.close(discard=False)
+    assert await _drain(stream) == ['0', '1']
+    assert stream.dropped == 2
+
+
+@pytest.mark.asyncio
+async def test_event_stream_block_holds_a_backlog_then_fails(event_loop):
+    streams = StreamIndex()
+    stream = streams.open('Page.frameStoppedLoading', maxsize=1, overflow=BLOCK, backlog=1)
+    assert not streams.publish(_raw_stopped_loading('0'))
+    # held for the consumer without waiting on it
+    assert not streams.publish(_raw_stopped_loading('1'))
+    assert (await stream.__anext__()).frameId == '0'
+    assert not streams.publish(_raw_stopped_loading('2'))
+    assert streams.publish(_raw_stopped_loading('3')) == [stream]
+
+    assert stream.closed and len(streams) == 0
+    assert [(await stream.__anext__()).frameId for _ in range(2)] == ['1', '2']
+    with pytest.raises(StreamOverflowError):
+        await stream.__anext__()
+    assert stream.dropped == 1
+
+
+@pytest.mark.asyncio
+async def test_event_stream_close_unsubscribes(event_loop):
+    streams = StreamIndex()
+    async with streams.open('Page.frameStoppedLoading', maxsize=1, overflow=BLOCK) as stream:
+        stream.offer(_raw_stopped_loading('0'))
+    assert stream.closed
+    assert len(streams) == 0
+    assert not streams.publish(_raw_stopped_loading('2'))
+
+
+@pytest.mark.asyncio
+async def test_event_dispatcher_runs_sync_and_async_callbacks_off_the_caller(event_loop):
+    dispatcher = EventDispatcher(max_concurrency=1)
+    seen = []
+    release = asyncio.Event()
+
+    async def slow(event):
+        await release.wait()
+        seen.append(('slow', event.frameId))
+
+    def fast(event):
+        seen.append(('fast', event.frameId))
+
+    dispatcher.add('Page.frameStoppedLoading', slow)
+    dispatcher.add('Page.frameStoppedLoading', fast)
+    assert dispatcher.dispatch(_raw_stopped_loading('1')) == 2
+    assert dispatcher.dispatch(helpers.RawEvent('Page.loadEventFired', {'timestamp': 1.0})) == 0
+    # nothing runs inline, and the slow callback holds the only slot
+    assert seen == []
+    await asyncio.sleep(0)
+    assert seen == [] and dispatcher.pending == 2
+
+    release.set()
+    await dispatcher.join()
+    assert seen == [('slow', '1'), ('fast', '1')]
+    stats = dispatcher.stats()
+    assert stats[id(slow)]['calls'] == 1
+    assert stats[id(fast)]['max_s'] >= 0
+    await dispatcher.close()
+
+
+@pytest.mark.asyncio
+async def test_event_dispatcher_counts_errors_and_cancels_on_close(event_loop):
+    dispatcher = EventDispatcher()
+
+    def broken(event):
+        raise RuntimeError('boom')
+
+    async def forever(event):
+        await asyncio.sleep(60)
+
+    dispatcher.add('Page.frameStoppedLoading', broken)
+    dispatcher.add('Page.frameStoppedLoading', forever)
+    dispatcher.dispatch(_raw_stopped_loading('1'))
+    await dispatcher.close(timeout=0.05)
+    assert dispatcher.pending == 0
+    assert dispatcher.stats()[id(broken)]['errors'] == 1
+
+
+@pytest.mark.asyncio
+async def test_event_dispatcher_skips_undecodable_events_and_keys_stats_on_callback(event_loop):
+    dispatcher = EventDispatcher()
+    seen = []
+    first, second = (lambda event: seen.append(('first', event.frameId))), (lambda event: seen.append('second'))
+    dispatcher.add('Page.frameStoppedLoading', first)
+    dispatcher.add('Page.frameStoppedLoading', second)
+
+    # missing its required frameId, raises on decoding
+    dispatcher.dispatch(helpers.RawEvent('Page.frameStoppedLoading', {}))
+    dispatcher.dispatch(_raw_stopped_loading('1'))
+    await dispatcher.join()
+
+    assert dispatcher.decode_errors == 2
+    assert seen == [('first', '1'), 'second']
+    assert set(dispatcher.stats()) == {id(first), id(second)}
+    await dispatcher.close()
+
+
+@pytest.mark.asyncio
+async def test_event_dispatcher_drops_oldest_calls_past_backlog(event_loop):
+    dispatcher = EventDispatcher(max_concurrency=1, backlog=2)
+    release = asyncio.Event()
+    seen = []
+
+    async def slow(event):
+        await release.wait()
+        seen.append(event.frameId)
+
+    dispatcher.add('Page.frameStoppedLoading', slow)
+    dispatcher.dispatch(_raw_stopped_loading('1'))
+    await asyncio.sleep(0)
+    for frame_id in ('2', '3', '4', '5'):
+        dispatcher.dispatch(_raw_stopped_loading(frame_id))
+    assert dispatcher.pending == 3 and dispatcher.dropped == 2
+
+    release.set()
+    await dispatcher.join()
+    assert seen == ['1', '4', '5']
+    await dispatcher.close()
+
+
+@pytest.mark.asyncio
+async def test_event_dispatcher_callbacks_do_not_inherit_the_dispatching_context(event_loop):
+    dispatcher = EventDispatcher()
+    budgets = []
+    dispatcher.add('Page.frameStoppedLoading', lambda event: budgets.append(deadline.current()))
+
+    with deadline.budget(0.01):
+        dispatcher.dispatch(_raw_stopped_loading('1'))
+    await asyncio.sleep(0.02)
+    dispatcher.dispatch(_raw_stopped_loading('2'))
+    await dispatcher.join()
+    assert budgets == [None, None]
+    await dispatcher.close()
+
+
+@pytest.mark.asyncio
+async def test_event_dispatcher_traces_callbacks_as_root_spans(event_loop):
+    dispatcher = EventDispatcher()
+    spans, current = [], []
+    dispatcher.add('Page.frameStoppedLoading', lambda event: current.append(tracing.current_span()))
+    tracing.configure(type('ListSink', (), {'export': lambda self, span: spans.append(span)})())
+    try:
+        with tracing.start_span('GET /render.html') as request_span:
+            dispatcher.dispatch(_raw_stopped_loading('1'))
+        await dispatcher.join()
+    finally:
+        tracing.configure()
+
+    _, callback_span = spans
+    assert current == [callback_span]
+    assert callback_span.name == 'callback Page.frameStoppedLoading'
+    assert callback_span.parent_id is None and callback_span.trace_id != request_span.trace_id
+    await dispatcher.close()
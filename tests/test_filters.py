@@ -0,0 +1,59 @@
+import pytest
+
+from chromewhip import filters, helpers
+from chromewhip.events import FilterIndex, EventStream
+
+RESPONSE = {
+    'requestId': '7',
+    'type': 'Document',
+    'response': {'url': 'http://example.com/index.html', 'status': 200, 'headers': {'Server': 'nginx'}},
+    'args': [{'value': 'a'}, {'value': 'b'}],
+}
+
+
+def test_path_filters_match_raw_params():
+    method = 'Network.responseReceived'
+    assert filters.Method(method).matches(method, RESPONSE)
+    assert filters.Equals('response.status', 200).matches(method, RESPONSE)
+    assert filters.Equals('args.1.value', 'b').matches(method, RESPONSE)
+    assert filters.Prefix('response.url', 'http://example.com/').matches(method, RESPONSE)
+    assert filters.Regex('response.headers.Server', r'^ngin').matches(method, RESPONSE)
+    assert not filters.Equals('response.missing', None).matches(method, RESPONSE)
+    assert not filters.Prefix('response.status', '2').matches(method, RESPONSE)
+    assert not filters.Equals('args.5.value', 'b').matches(method, RESPONSE)
+    assert filters.lookup(RESPONSE, 'response.headers.Server') == 'nginx'
+
+
+def test_combined_filters_keep_the_method_they_imply():
+    where = filters.where('Network.responseReceived', requestId='7') & filters.Prefix('response.url', 'http')
+    assert where.method == 'Network.responseReceived'
+    assert where.matches('Network.responseReceived', RESPONSE)
+    assert not (~where).matches('Network.responseReceived', RESPONSE)
+    assert not where.matches('Network.requestWillBeSent', RESPONSE)
+    either = filters.Method('Page.loadEventFired') | filters.Method('Page.domContentEventFired')
+    assert either.method is None
+    assert either.matches('Page.domContentEventFired', {})
+
+
+@pytest.mark.asyncio
+async def test_filter_index_resolves_only_matching_waiters_without_decoding(event_loop):
+    index = FilterIndex()
+    wanted = index.subscribe(filters.where('Network.responseReceived', requestId='7'))
+    other = index.subscribe(filters.where('Network.responseReceived', requestId='8'))
+    any_status = index.subscribe(filters.Equals('response.status', 200))
+
+    event = helpers.RawEvent('Network.responseReceived', RESPONSE)
+    assert index.resolve(event) == 2
+    assert wanted.result() is any_status.result() is event
+    assert not other.done()
+    assert len(index) == 1
+    assert event._event is None
+
+
+@pytest.mark.asyncio
+async def test_stream_only_buffers_matching_events(event_loop):
+    stream = EventStream('Page.frameStoppedLoading', where=filters.Prefix('frameId', 'main'))
+    for frame_id in ('main.1', 'child.1', 'main.2'):
+        stream.offer(helpers.RawEvent('Page.frameStoppedLoading', {'frameId': frame_id}))
+    stream.close(discard=False)
+    assert [event.frameId async for event in stream] == ['main.1', 'main.2']
@@ -1,4 +1,7 @@
+import copy
 import json
+import subprocess
+import sys
 
 import pytest
 
@@ -50,3 +53,124 @@ def test_build_hash_from_event_cls():
     assert hash == "Page.frameNavigated:frameId=3"
 
 
+
+
+def test_key_from_concrete_event():
+    f = page.Frame(3, 'test', 'http://example.com', 'test', 'text/html')
+    fe = page.FrameNavigatedEvent(f)
+    assert fe.key_() == ('Page.frameNavigated', '3')
+    assert fe.key_() == page.FrameNavigatedEvent.build_key(frameId=3)
+
+
+def test_build_key_requires_hashable_params():
+    with pytest.raises(TypeError):
+        page.FrameNavigatedEvent.build_key(loaderId=3)
+
+
+def test_raw_event_key_matches_decoded_event_key():
+    valid_payload = {"method": "Page.frameNavigated", "params": {
+        "frame": {"id": "3635.1", "loaderId": "3635.1", "url": "http://httpbin.org/html",
+                  "securityOrigin": "http://httpbin.org", "mimeType": "text/html"}}}
+
+    raw = helpers.RawEvent(valid_payload['method'], valid_payload['params'])
+    assert raw._event is None
+    assert raw.key_() == ('Page.frameNavigated', '3635.1')
+    event = raw.decode()
+    assert isinstance(event, page.FrameNavigatedEvent)
+    assert raw.key_() == event.key_()
+    assert raw.decode() is event
+
+
+def test_decoding_leaves_raw_params_untouched():
+    from chromewhip.protocol import network
+
+    timing = {'requestTime': 1.0, 'proxyStart': -1, 'proxyEnd': -1, 'dnsStart': 0, 'dnsEnd': 1,
+              'connectStart': 1, 'connectEnd': 2, 'sslStart': -1, 'sslEnd': -1, 'workerStart': -1,
+              'workerReady': -1, 'sendStart': 2, 'sendEnd': 3, 'pushStart': 0, 'pushEnd': 0,
+              'receiveHeadersEnd': 4}
+    params = {'requestId': '1000.1', 'loaderId': '1', 'timestamp': 1.0, 'type': 'Document', 'response': {
+        'url': 'http://example.com', 'status': 200, 'statusText': 'OK', 'headers': {}, 'mimeType': 'text/html',
+        'connectionReused': False, 'connectionId': 1, 'encodedDataLength': 10, 'securityState': 'neutral',
+        'timing': timing}}
+    raw_params = copy.deepcopy(params)
+
+    event = helpers.RawEvent('Network.responseReceived', params).decode()
+    assert isinstance(event.response.timing, network.ResourceTiming)
+    assert params == raw_params
+    assert helpers.RawEvent('Network.responseReceived', params).decode().response.timing.dnsEnd == 1
+
+
+def test_event_class_registry_uses_wire_method_names():
+    from chromewhip.protocol import dom
+
+    assert helpers.event_class('Page.frameNavigated') is page.FrameNavigatedEvent
+    assert helpers.event_class('DOM.setChildNodes') is dom.SetChildNodesEvent
+    assert helpers.event_class('Log.entryAdded').__name__ == 'EntryAddedEvent'
+
+
+def test_generated_result_decoder_types_nested_fields():
+    from chromewhip.protocol import dom
+
+    _, decode = dom.DOM.getDocument()
+    result = decode({'root': {'nodeId': 1, 'backendNodeId': 1, 'nodeType': 9, 'nodeName': '#document',
+                              'localName': '', 'nodeValue': '', 'children': [
+                                  {'nodeId': 2, 'backendNodeId': 2, 'nodeType': 1, 'nodeName': 'HTML',
+                                   'localName': 'html', 'nodeValue': ''}]}})
+    assert isinstance(result['root'], dom.Node)
+    assert isinstance(result['root'].children[0], dom.Node)
+    assert result['root'].children[0].localName == 'html'
+    assert result['root'].to_dict()['children'][0]['nodeId'] == 2
+
+
+def test_generated_decoder_ignores_unknown_fields():
+    f = page.Frame.from_json({'id': '1', 'loaderId': '2', 'url': 'http://example.com', 'securityOrigin': 'x',
+                              'mimeType': 'text/html', 'someNewField': True})
+    assert f.url == 'http://example.com'
+    assert not hasattr(f, 'someNewField')
+
+
+def test_commands_without_typed_results_skip_decoding():
+    from chromewhip.protocol import network
+
+    _, decode = network.Network.getResponseBody('1000.1')
+    assert decode is None
+
+
+def test_generated_types_and_events_use_slots():
+    f = page.Frame(1, 'test', 'http://example.com', 'test', 'text/html')
+    fe = page.FrameNavigatedEvent(f)
+    assert not hasattr(f, '__dict__')
+    assert not hasattr(fe, '__dict__')
+    assert f.to_dict()['url'] == 'http://example.com'
+    assert fe.to_dict() == {'frame': f}
+
+
+def test_decoded_identifiers_are_interned():
+    _, decode = page.Page.navigate('http://example.com')
+    frame_id = ''.join(['3228', '.1'])
+    result = decode({'frameId': frame_id, 'loaderId': '1'})
+    assert result['frameId'] is sys.intern('3228.1')
+
+
+def test_importing_chromewhip_executes_no_protocol_modules():
+    code = ('import chromewhip\n'
+            'from chromewhip import protocol\n'
+            'assert protocol.loaded() == [], protocol.loaded()\n'
+            'from chromewhip.protocol import page\n'
+            'page.Page.navigate\n'
+            'assert protocol.loaded() == ["page"], protocol.loaded()\n'
+            'assert protocol.domain("dom").__name__ == "DOM"\n')
+    subprocess.check_call([sys.executable, '-c', code])
+
+
+def test_raw_event_loads_its_domain_for_keys():
+    from chromewhip import protocol
+    event = helpers.RawEvent('Tracing.tracingComplete', {})
+    assert event.key_() == ('Tracing.tracingComplete',)
+    assert 'tracing' in protocol.loaded()
+
+
+def test_unknown_protocol_domain():
+    from chromewhip import protocol
+    with pytest.raises(ValueError):
+        protocol.domain('nope')
@@ -0,0 +1,41 @@
+import pytest
+
+from chromewhip import metrics
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = metrics.Registry()
+    latency = registry.histogram('latency_seconds', 'Latency.', ('method',), buckets=(0.1, 1))
+    for seconds in (0.05, 0.1, 0.5, 3):
+        latency.labels('Page.navigate').observe(seconds)
+
+    assert registry.render().splitlines() == [
+        '# HELP latency_seconds Latency.',
+        '# TYPE latency_seconds histogram',
+        'latency_seconds_bucket{method="Page.navigate",le="0.1"} 2',
+        'latency_seconds_bucket{method="Page.navigate",le="1.0"} 3',
+        'latency_seconds_bucket{method="Page.navigate",le="+Inf"} 4',
+        'latency_seconds_sum{method="Page.navigate"} 3.65',
+        'latency_seconds_count{method="Page.navigate"} 4',
+    ]
+
+
+def test_counters_and_gauges_escape_label_values():
+    registry = metrics.Registry()
+    errors = registry.counter('errors_total', 'Errors.', ('error',))
+    errors.labels('say "hi"').inc()
+    errors.labels('say "hi"').inc(2)
+    registry.gauge('up', 'Up.').labels().set(1)
+
+    lines = registry.render().splitlines()
+    assert 'errors_total{error="say \\"hi\\""} 3' in lines
+    assert 'up 1' in lines
+
+
+def test_labels_and_names_are_checked():
+    registry = metrics.Registry()
+    errors = registry.counter('errors_total', 'Errors.', ('error', 'code'))
+    with pytest.raises(ValueError):
+        errors.labels('ProtocolError')
+    with pytest.raises(ValueError):
+        registry.gauge('errors_total', 'Again.')
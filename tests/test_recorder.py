@@ -0,0 +1,20 @@
+from chromewhip.recorder import FlightRecorder, RECEIVED, SENT
+
+
+def test_keeps_latest_frames_truncated():
+    recorder = FlightRecorder(size=2, max_chars=10)
+    recorder.record(SENT, '{"id": 1, "method": "Page.navigate"}')
+    recorder.record(RECEIVED, '{"id": 1}')
+    recorder.record(RECEIVED, b'{"method": "Page.loadEventFired"}')
+
+    first, second = recorder.dump()
+    assert (first['direction'], first['frame'], first['truncated']) == (RECEIVED, '{"id": 1}', False)
+    assert (second['size'], second['frame'], second['truncated']) == (33, '{"method":', True)
+    assert recorder.recorded == 3
+    assert recorder.format().splitlines()[1].endswith('{"method":...')
+
+
+def test_size_zero_records_nothing():
+    recorder = FlightRecorder(size=0)
+    recorder.record(SENT, '{}')
+    assert len(recorder) == 0 and recorder.dump() == []
@@ -0,0 +1,77 @@
+import base64
+import io
+import logging
+
+import pytest
+
+from chromewhip import render_image
+from chromewhip.protocol import page
+
+Image = pytest.importorskip('PIL.Image')
+
+log = logging.getLogger(__name__)
+
+
+class TileTab:
+    """ Answers captureScreenshot with a solid strip whose colour encodes the clip's y offset. """
+    def __init__(self):
+        self.clips = []
+
+    async def send_command(self, command):
+        request, _ = command
+        clip = request['params']['clip']
+        self.clips.append(clip)
+        tile = Image.new('RGB', (int(clip.width), int(clip.height)), (int(clip.y) % 256, 0, 0))
+        out = io.BytesIO()
+        tile.save(out, format='PNG')
+        return {'ack': {'result': {'data': base64.b64encode(out.getvalue()).decode()}}}
+
+
+@pytest.mark.asyncio
+async def test_large_captures_are_tiled_and_stitched(event_loop, monkeypatch):
+    monkeypatch.setattr(render_image, 'MAX_TILE_PIXELS', 100 * 30)
+    tab = TileTab()
+    renderer = render_image.ChromeImageRenderer(tab, log, image_format='png', width=100, height=70)
+
+    data = await renderer.render()
+
+    assert [(c.y, c.height) for c in tab.clips] == [(0, 30), (30, 30), (60, 10)]
+    with Image.open(io.BytesIO(base64.b64decode(data))) as image:
+        assert image.size == (100, 70)
+        assert image.getpixel((0, 29))[0] == 0
+        assert image.getpixel((0, 30))[0] == 30
+        assert image.getpixel((0, 69))[0] == 60
+
+
+@pytest.mark.asyncio
+async def test_small_captures_are_taken_in_one_go(event_loop):
+    tab = TileTab()
+    renderer = render_image.ChromeImageRenderer(tab, log, image_format='png', width=100, height=70)
+    await renderer.render()
+    assert len(tab.clips) == 1
+    assert isinstance(tab.clips[0], page.Viewport)
+
+
+@pytest.mark.asyncio
+async def test_tiled_jpeg_captures_honour_quality(event_loop, monkeypatch):
+    monkeypatch.setattr(render_image, 'MAX_TILE_PIXELS', 100 * 30)
+    sizes = []
+    for quality in (10, 95):
+        tab = TileTab()
+        renderer = render_image.ChromeImageRenderer(tab, log, image_format='jpeg', width=100, height=70,
+                                                    quality=quality)
+        data = base64.b64decode(await renderer.render())
+        with Image.open(io.BytesIO(data)) as image:
+            assert (image.format, image.size) == ('JPEG', (100, 70))
+        sizes.append(len(data))
+    assert sizes[0] < sizes[1]
+
+
+def test_png_stream_writer_matches_the_strips_written():
+    writer = render_image.PNGStreamWriter(4, 'RGBA')
+    for y, colour in ((2, (255, 0, 0, 255)), (3, (0, 0, 255, 128))):
+        writer.write(Image.new('RGBA', (4, y), colour))
+    with Image.open(io.BytesIO(writer.getvalue())) as image:
+        assert (image.mode, image.size) == ('RGBA', (4, 5))
+        assert image.getpixel((3, 1)) == (255, 0, 0, 255)
+        assert image.getpixel((0, 4)) == (0, 0, 255, 128)
@@ -0,0 +1,127 @@
+import json
+
+import pytest
+import websockets
+
+from chromewhip import chrome, replay
+from chromewhip.protocol import runtime
+from chromewhip.recorder import RECEIVED, SENT
+
+
+def _recording():
+    navigate = {'id': 7, 'method': 'Page.navigate', 'params': {'url': 'http://example.com'}}
+    return replay.Recording([
+        (0.0, RECEIVED, json.dumps({'method': 'Page.loadEventFired', 'params': {'timestamp': 1.0}})),
+        (0.1, SENT, json.dumps(navigate)),
+        (0.2, RECEIVED, json.dumps({'id': 7, 'result': {'frameId': 'F', 'loaderId': 'L'}})),
+        (0.3, RECEIVED, json.dumps({'method': 'Page.frameStoppedLoading', 'params': {'frameId': 'F'}})),
+    ], {'url': 'http://example.com'})
+
+
+def test_recording_round_trips_through_gzipped_file(tmp_path):
+    path = str(tmp_path / 'render.cdp.jsonl.gz')
+    _recording().save(path)
+    recording = replay.Recording.load(path)
+
+    assert recording.metadata == {'url': 'http://example.com'}
+    assert recording.frames == _recording().frames
+    assert list(recording.commands()) == [({'method': 'Page.navigate', 'params': {'url': 'http://example.com'}}, None)]
+
+
+@pytest.mark.asyncio
+async def test_replay_answers_driver_with_rewritten_ack_ids(event_loop):
+    async with replay.ReplayServer(_recording(), speed=10) as server:
+        tab = chrome.ChromeTab('replay', 'about:blank', server.ws_uri, 'replay')
+        await tab.connect()
+        recorder = replay.CDPRecorder()
+        tab.connection.taps.append(recorder)
+        tab._message_id = 41
+
+        await tab.go('http://example.com')
+        assert tab.frame_id == 'F'
+        assert tab.event_store.latest('Page.loadEventFired') is not None
+        with pytest.raises(chrome.ProtocolError, match='not in the recording'):
+            await tab.send_command(runtime.Runtime.evaluate('1 + 1'))
+        await tab.disconnect()
+
+    assert (server.replayed, server.unmatched) == (1, 1)
+    sent = [json.loads(text) for _, direction, text in recorder.frames if direction == SENT]
+    acks = [json.loads(text) for _, direction, text in recorder.frames if direction == RECEIVED and '"id"' in text]
+    assert [m['id'] for m in sent] == [m['id'] for m in acks] == [42, 43]
+
+
+@pytest.mark.asyncio
+async def test_replay_rewrites_ack_ids_per_session(event_loop):
+    def navigate(session_id):
+        return json.dumps({'id': 1, 'sessionId': session_id, 'method': 'Page.navigate', 'params': {'url': 'x'}})
+
+    def ack(session_id):
+        return json.dumps({'id': 1, 'sessionId': session_id, 'result': {'frameId': session_id}})
+
+    # both sessions numbered their first command 1
+    recording = replay.Recording([
+        (0.0, SENT, navigate('A')), (0.5, RECEIVED, ack('A')),
+        (0.6, SENT, navigate('B')), (0.7, RECEIVED, ack('B')),
+    ])
+    async with replay.ReplayServer(recording, speed=10) as server:
+        async with websockets.connect(server.ws_uri) as websocket:
+            for id_, session_id in ((10, 'A'), (20, 'B')):
+                await websocket.send(json.dumps({'id': id_, 'sessionId': session_id, 'method': 'Page.navigate',
+                                                 'params': {'url': 'x'}}))
+            acks = [json.loads(await websocket.recv()) for _ in range(2)]
+
+    assert sorted((a['sessionId'], a['id']) for a in acks) == [('A', 10), ('B', 20)]
+
+
+def _flattened_recording():
+    """ A render through `Chrome`, the page attached as flattened session S1 of the browser websocket. """
+    messages = [
+        (SENT, {'id': 1, 'method': 'Target.setDiscoverTargets', 'params': {'discover': True}}),
+        (RECEIVED, {'id': 1, 'result': {}}),
+        (SENT, {'id': 2, 'method': 'Target.getTargets', 'params': {}}),
+        (RECEIVED, {'id': 2, 'result': {'targetInfos': [
+            {'targetId': 'T1', 'type': 'page', 'title': 'T1', 'url': 'about:blank', 'attached': False}]}}),
+        (SENT, {'id': 3, 'method': 'Target.attachToTarget', 'params': {'targetId': 'T1', 'flatten': True}}),
+        (RECEIVED, {'method': 'Target.attachedToTarget', 'params': {'sessionId': 'S1', 'waitingForDebugger': False,
+                    'targetInfo': {'targetId': 'T1', 'type': 'page', 'title': 'T1', 'url': 'about:blank',
+                                   'attached': True}}}),
+        (RECEIVED, {'id': 3, 'result': {'sessionId': 'S1'}}),
+        (SENT, {'id': 1, 'sessionId': 'S1', 'method': 'Page.navigate', 'params': {'url': 'http://example.com'}}),
+        (RECEIVED, {'id': 1, 'sessionId': 'S1', 'result': {'frameId': 'F', 'loaderId': 'L'}}),
+        (RECEIVED, {'method': 'Target.targetInfoChanged', 'params': {'targetInfo': {
+            'targetId': 'T1', 'type': 'page', 'title': 'Example', 'url': 'http://example.com', 'attached': True}}}),
+        (RECEIVED, {'sessionId': 'S1', 'method': 'Page.frameStoppedLoading', 'params': {'frameId': 'F'}}),
+    ]
+    return replay.Recording([(i * 0.01, direction, json.dumps(m)) for i, (direction, m) in enumerate(messages)])
+
+
+@pytest.mark.asyncio
+async def test_chrome_replays_a_flattened_session_recording(event_loop):
+    async with replay.ReplayServer(_flattened_recording()) as server:
+        browser = chrome.Chrome(server.host, server.port)
+        await browser.connect()
+        tab, = browser.tabs
+        await tab.go('http://example.com')
+        assert (tab.session_id, tab.frame_id) == ('S1', 'F')
+        await browser.disconnect()
+    assert (server.replayed, server.unmatched) == (4, 0)
+
+
+@pytest.mark.asyncio
+async def test_standalone_tab_replays_the_page_session_of_a_flattened_recording(event_loop):
+    recording = _flattened_recording()
+    assert recording.sessions() == [None, 'S1']
+    async with replay.ReplayServer(recording) as server:
+        tab = chrome.ChromeTab('replay', 'about:blank', server.ws_uri, 'replay')
+        await tab.connect()
+        recorder = replay.CDPRecorder()
+        tab.connection.taps.append(recorder)
+
+        await tab.go('http://example.com', timeout=2)
+        assert tab.frame_id == 'F'
+        await tab.disconnect()
+
+    assert (server.replayed, server.unmatched) == (1, 0)
+    received = [json.loads(text) for _, direction, text in recorder.frames if direction == RECEIVED]
+    # nothing of the browser session reaches the tab, the page's frames come without a session id
+    assert all('sessionId' not in m and not m.get('method', '').startswith('Target.') for m in received)
@@ -0,0 +1,49 @@
+import pytest
+
+from chromewhip.timeouts import AdaptiveTimeouts, LatencyWindow
+
+
+def test_latency_window_keeps_latest_samples_only():
+    window = LatencyWindow(size=4)
+    for seconds in (10, 1, 2, 3, 4):
+        window.add(seconds)
+    assert len(window) == 4
+    assert window.count == 5
+    assert window.percentile(1) == 4
+    assert window.percentile(0.5) == 2
+
+
+def test_timeout_is_ceiling_until_enough_samples():
+    timeouts = AdaptiveTimeouts(min_samples=3, factor=2, floor_s=0.5, ceiling_s=25)
+    timeouts.observe('Runtime.evaluate', 1.0)
+    timeouts.observe('Runtime.evaluate', 2.0)
+    assert timeouts.timeout('Runtime.evaluate') == 25
+    timeouts.observe('Runtime.evaluate', 3.0)
+    assert timeouts.timeout('Runtime.evaluate') == 6.0
+    assert timeouts.timeout('Page.captureScreenshot') == 25
+
+
+def test_timeout_is_clamped_between_floor_and_ceiling():
+    timeouts = AdaptiveTimeouts(min_samples=1, factor=3, floor_s=1, ceiling_s=10)
+    timeouts.observe('fast', 0.001)
+    timeouts.observe('slow', 20)
+    assert timeouts.timeout('fast') == 1
+    assert timeouts.timeout('slow') == 10
+    stats = timeouts.stats()
+    assert stats['fast']['count'] == 1
+    assert stats['slow']['timeout_s'] == 10
+
+
+def test_floor_above_ceiling_is_rejected():
+    with pytest.raises(ValueError):
+        AdaptiveTimeouts(floor_s=10, ceiling_s=1)
+
+
+def test_expired_commands_raise_the_timeout_again():
+    timeouts = AdaptiveTimeouts(min_samples=2, factor=2, floor_s=0.1, ceiling_s=25)
+    for _ in range(2):
+        timeouts.observe('Page.navigate', 0.1)
+    assert timeouts.timeout('Page.navigate') == 0.2
+    timeouts.expired('Page.navigate', 0.2)
+    assert timeouts.timeout('Page.navigate') == 0.4
+    assert timeouts.stats()['Page.navigate']['expired'] == 1
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from chromewhip.chrome import ProtocolError
+from chromewhip.middleware import MIDDLEWARES, server_timing_middleware
+from chromewhip.timing import ServerTiming
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_phases_accumulate_in_first_run_order():
+    clock = FakeClock()
+    timings = ServerTiming(clock=clock)
+    for name, seconds in (('go', 0.5), ('js', 0.02), ('go', 0.25)):
+        with timings.phase(name):
+            clock.now += seconds
+
+    assert timings.to_dict() == {'go': 750.0, 'js': 20.0}
+    assert timings.header() == 'go;dur=750.0, js;dur=20.0, total;dur=770.0'
+    assert timings.header(total=False) == 'go;dur=750.0, js;dur=20.0'
+
+
+@pytest.mark.asyncio
+async def test_middleware_sets_server_timing_header(event_loop):
+    async def handler(request):
+        with request['timings'].phase('wait'):
+            await asyncio.sleep(0.01)
+        return web.Response(text='ok')
+
+    app = web.Application(middlewares=[server_timing_middleware])
+    app.router.add_get('/', handler)
+    client = TestClient(TestServer(app))
+    await client.start_server()
+    try:
+        resp = await client.get('/')
+        header = resp.headers['Server-Timing']
+    finally:
+        await client.close()
+
+    wait, total = header.split(', ')
+    assert wait.startswith('wait;dur=') and float(wait.split('=')[1]) >= 10
+    assert total.startswith('total;dur=')
+
+
+@pytest.mark.asyncio
+async def test_error_responses_get_server_timing_header(event_loop):
+    async def handler(request):
+        with request['timings'].phase('go'):
+            raise ProtocolError('Cannot navigate to invalid URL')
+
+    app = web.Application(middlewares=MIDDLEWARES)
+    app.router.add_get('/', handler)
+    client = TestClient(TestServer(app))
+    await client.start_server()
+    try:
+        resp = await client.get('/')
+        body = await resp.json(content_type=None)
+        header = resp.headers['Server-Timing']
+    finally:
+        await client.close()
+
+    assert body == {'error': 'Cannot navigate to invalid URL'}
+    assert header.startswith('go;dur=')
+
+
+@pytest.mark.asyncio
+async def test_error_responses_leave_out_flight_records_unless_exposed(event_loop):
+    async def handler(request):
+        error = ProtocolError('Cannot navigate to invalid URL')
+        error.flight_record = [{'time': 0.0, 'direction': '<', 'size': 18, 'frame': 'Set-Cookie: secret',
+                               'truncated': False}]
+        raise error
+
+    bodies = []
+    for expose in (False, True):
+        app = web.Application(middlewares=MIDDLEWARES)
+        app['expose-flight-records'] = expose
+        app.router.add_get('/', handler)
+        client = TestClient(TestServer(app))
+        await client.start_server()
+        try:
+            bodies.append(await (await client.get('/')).json(content_type=None))
+        finally:
+            await client.close()
+
+    hidden, exposed = bodies
+    assert hidden == {'error': 'Cannot navigate to invalid URL'}
+    assert exposed['frames'][0]['frame'] == 'Set-Cookie: secret'
@@ -0,0 +1,137 @@
+import asyncio
+import json
+import threading
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from chromewhip import tracing
+
+
+class ListSink:
+    def __init__(self):
+        self.spans = []
+
+    def export(self, span):
+        self.spans.append(span)
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def sink():
+    sink = ListSink()
+    tracing.configure(sink)
+    yield sink
+    tracing.configure()
+
+
+@pytest.mark.asyncio
+async def test_spans_nest_across_awaits_and_tasks(event_loop, sink):
+    async def child():
+        with tracing.start_span('child'):
+            await asyncio.sleep(0)
+
+    with tracing.start_span('root', kind=tracing.KIND_SERVER) as root:
+        await asyncio.ensure_future(child())
+        with pytest.raises(ValueError):
+            with tracing.start_span('failing'):
+                raise ValueError('boom')
+    assert tracing.current_span() is None
+
+    child_span, failing, root_span = sink.spans
+    assert root_span is root and root.parent_id is None
+    assert {child_span.trace_id, failing.trace_id} == {root.trace_id}
+    assert child_span.parent_id == failing.parent_id == root.span_id
+    assert failing.status == tracing.STATUS_ERROR
+    assert failing.events[0][1] == 'exception'
+
+
+def test_sampling_is_decided_once_per_trace(sink):
+    tracing.configure(sink, sample_rate=0)
+    with tracing.start_span('root'):
+        with tracing.start_span('child') as child:
+            child.add_event('ignored')
+    assert sink.spans == []
+
+    tracing.configure(None)
+    assert tracing.start_span('off') is tracing.NOOP_SPAN
+
+
+def test_traceparent_continues_upstream_trace(sink):
+    parent = tracing.parse_traceparent('00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01')
+    with tracing.start_span('request', parent=parent):
+        pass
+    span, = sink.spans
+    assert (span.trace_id, span.parent_id) == ('0af7651916cd43dd8448eb211c80319c', 'b7ad6b7169203331')
+
+    unsampled = tracing.parse_traceparent('00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-00')
+    with tracing.start_span('request', parent=unsampled):
+        with tracing.start_span('child'):
+            pass
+    assert len(sink.spans) == 1
+    assert tracing.parse_traceparent('garbage') is None
+    assert tracing.parse_traceparent(None) is None
+
+
+def test_json_lines_sink_appends_a_span_per_line(event_loop, tmp_path):
+    path = str(tmp_path / 'spans.jsonl')
+    tracer = tracing.Tracer(tracing.JsonLinesSink(path))
+    with tracer.start_span('root', url='http://example.com'):
+        with tracer.start_span('child'):
+            pass
+    event_loop.run_until_complete(tracer.close())
+
+    child, root = [json.loads(line) for line in open(path)]
+    assert child['parent_id'] == root['span_id']
+    assert root['attributes'] == {'url': 'http://example.com'}
+
+
+@pytest.mark.asyncio
+async def test_json_lines_sink_writes_batches_off_the_event_loop(event_loop, tmp_path):
+    path = str(tmp_path / 'spans.jsonl')
+    sink = tracing.JsonLinesSink(path, batch_size=2, flush_interval_s=60)
+    threads = []
+    write = sink._write
+    sink._write = lambda spans: threads.append(threading.current_thread()) or write(spans)
+    tracer = tracing.Tracer(sink)
+
+    for name in ('a', 'b', 'c'):
+        with tracer.start_span(name):
+            pass
+    # ending a span never touches the file
+    assert open(path).read() == ''
+    await tracer.close()
+
+    assert [json.loads(line)['name'] for line in open(path)] == ['a', 'b', 'c']
+    assert len(threads) == 2 and threading.main_thread() not in threads
+
+
+@pytest.mark.asyncio
+async def test_otlp_sink_posts_batches_to_collector(event_loop):
+    received = []
+
+    async def collect(request):
+        received.append(await request.json())
+        return web.json_response({})
+
+    app = web.Application()
+    app.router.add_post('/v1/traces', collect)
+    server = TestServer(app)
+    await server.start_server()
+
+    sink = tracing.OTLPHttpSink(str(server.make_url('/v1/traces')), batch_size=2)
+    tracer = tracing.Tracer(sink)
+    for i in range(3):
+        with tracer.start_span('span-%s' % i, attempt=i):
+            pass
+    await tracer.close()
+    await server.close()
+
+    batches = [payload['resourceSpans'][0]['scopeSpans'][0]['spans'] for payload in received]
+    assert [[span['name'] for span in batch] for batch in batches] == [['span-0', 'span-1'], ['span-2']]
+    span = batches[1][0]
+    assert span['attributes'] == [{'key': 'attempt', 'value': {'intValue': '2'}}]
+    assert len(span['traceId']) == 32 and len(span['spanId']) == 16